@@ -1,4 +1,7 @@
+import logging
 import os
+from urllib.parse import urlsplit
+
 from dotenv import load_dotenv
 
 
@@ -15,16 +18,192 @@ class AppSettings:
     ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin")
     HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
     number_of_tasks = os.getenv("NUMBER_OF_TASKS", "50")  # Default to 50 tasks if not set
+    try:
+        CONCURRENT_PAGES = int(os.getenv("CONCURRENT_PAGES", "3"))
+    except (ValueError, TypeError):
+        CONCURRENT_PAGES = 3
     try:
         SLOW_MO = int(os.getenv("SLOW_MO", "0"))
     except (ValueError, TypeError):
         SLOW_MO = 0
 
+    # --- Logging settings ---
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_JSON = os.getenv("LOG_JSON", "false").lower() == "true"
+
+    # --- Browser context pool settings ---
+    CONTEXT_POOL = os.getenv("CONTEXT_POOL", "false").lower() == "true"
+    try:
+        CONTEXT_POOL_SIZE = int(os.getenv("CONTEXT_POOL_SIZE", "2"))
+    except (ValueError, TypeError):
+        CONTEXT_POOL_SIZE = 2
+
+    # --- Network profile settings ---
+    NETWORK_PROFILE = os.getenv("NETWORK_PROFILE", "full").lower()  # "full" or "lean"
+    BLOCKED_RESOURCE_TYPES = os.getenv("BLOCKED_RESOURCE_TYPES", "image,font,media")
+    BLOCKED_URL_PATTERNS = os.getenv("BLOCKED_URL_PATTERNS", "avatar")
+    BLOCK_THIRD_PARTY = os.getenv("BLOCK_THIRD_PARTY", "true").lower() == "true"
+    BLOCK_ACTION = os.getenv("BLOCK_ACTION", "abort").lower()  # "abort" or "stub"
+    MEASURE_BLOCKED_BYTES = os.getenv("MEASURE_BLOCKED_BYTES", "false").lower() == "true"
+
+    # --- Browser performance instrumentation ---
+    BROWSER_METRICS = os.getenv("BROWSER_METRICS", "false").lower() == "true"
+
+    # --- Database settings ---
+    DB_HOST = os.getenv("DB_HOST", "localhost")
+    DB_PORT = os.getenv("DB_PORT", "5432")
+    DB_NAME = os.getenv("DB_NAME", "kanboard")
+    DB_USER = os.getenv("DB_USER", "kanboard")
+    DB_PASSWORD = os.getenv("DB_PASSWORD", "kanboard123")
+    DB_DSN = os.getenv("DB_DSN", "")  # Overrides the individual DB_* settings when set
+    try:
+        DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+        DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+    except (ValueError, TypeError):
+        DB_POOL_MIN, DB_POOL_MAX = 1, 10
+    try:
+        DB_READY_TIMEOUT = float(os.getenv("DB_READY_TIMEOUT", "30"))
+    except (ValueError, TypeError):
+        DB_READY_TIMEOUT = 30.0
+
+    # --- Database state waiting settings ---
+    DB_WAIT_NOTIFY = os.getenv("DB_WAIT_NOTIFY", "false").lower() == "true"
+    DB_WAIT_TABLES = os.getenv("DB_WAIT_TABLES", "tasks,projects,columns")
+    try:
+        DB_WAIT_TIMEOUT = float(os.getenv("DB_WAIT_TIMEOUT", "10"))
+    except (ValueError, TypeError):
+        DB_WAIT_TIMEOUT = 10.0
+
+    # --- Test data cleanup settings ---
+    TEST_DATA_CLEANUP = os.getenv("TEST_DATA_CLEANUP", "db").lower()  # "db", "api" or "off"
+    try:
+        ORPHAN_MAX_AGE_HOURS = float(os.getenv("ORPHAN_MAX_AGE_HOURS", "24"))
+    except (ValueError, TypeError):
+        ORPHAN_MAX_AGE_HOURS = 24.0
+
+    # --- Failure artifact settings ---
+    TRACE_MODE = os.getenv("TRACE_MODE", "failure").lower()  # "failure" (keep traces of failed tests) or "off"
+    TRACE_SCREENSHOTS = os.getenv("TRACE_SCREENSHOTS", "false").lower() == "true"
+    SCREENSHOT_DIR = os.getenv("SCREENSHOT_DIR", "screenshots")
+    ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "artifacts")
+    try:
+        ARTIFACT_MAX_MB = int(os.getenv("ARTIFACT_MAX_MB", "500"))
+    except (ValueError, TypeError):
+        ARTIFACT_MAX_MB = 500
+
+    # --- Authentication settings ---
+    AUTH_MODE = os.getenv("AUTH_MODE", "http").lower()  # "http" (browserless login) or "ui"
+    try:
+        TEST_USER_COUNT = int(os.getenv("TEST_USER_COUNT", "0"))  # 0 keeps every scenario on ADMIN_USER
+    except (ValueError, TypeError):
+        TEST_USER_COUNT = 0
+    TEST_USER_PREFIX = os.getenv("TEST_USER_PREFIX", "perf_user")
+    TEST_USER_PASSWORD = os.getenv("TEST_USER_PASSWORD", "perf-password")
+
+    # --- Seeded dataset cache settings ---
+    DATASET_CACHE = os.getenv("DATASET_CACHE", "true").lower() == "true"
+    try:
+        DATASET_CACHE_MAX_AGE_HOURS = float(os.getenv("DATASET_CACHE_MAX_AGE_HOURS", "168"))
+    except (ValueError, TypeError):
+        DATASET_CACHE_MAX_AGE_HOURS = 168.0
+    try:
+        DATASET_CACHE_MAX_ROWS = int(os.getenv("DATASET_CACHE_MAX_ROWS", "2000000"))
+    except (ValueError, TypeError):
+        DATASET_CACHE_MAX_ROWS = 2000000
+    try:
+        DATASET_CACHE_MAX_PROJECTS = int(os.getenv("DATASET_CACHE_MAX_PROJECTS", "20"))
+    except (ValueError, TypeError):
+        DATASET_CACHE_MAX_PROJECTS = 20
+
+    # --- Database snapshot settings ---
+    DB_SNAPSHOT_PRESERVE_TABLES = os.getenv("DB_SNAPSHOT_PRESERVE_TABLES", "sessions")
+
+    # --- Local Kanboard stand-in settings ---
+    KANBOARD_STANDIN = os.getenv("KANBOARD_STANDIN", "false").lower() == "true"
+    try:
+        KANBOARD_STANDIN_PORT = int(os.getenv("KANBOARD_STANDIN_PORT", "0"))  # 0 picks a free port
+    except (ValueError, TypeError):
+        KANBOARD_STANDIN_PORT = 0
+
+    # --- Test scheduling settings ---
+    DURATION_SCHEDULING = os.getenv("DURATION_SCHEDULING", "true").lower() == "true"
+    TEST_DURATIONS_FILE = os.getenv("TEST_DURATIONS_FILE", os.path.join("temp", "durations.json"))
+
+    # --- JSON-RPC API settings (used for seeding test data) ---
+    API_URL = os.getenv("API_URL", f"{BASE_URL.rstrip('/')}/jsonrpc.php")
+    API_USER = os.getenv("API_USER", ADMIN_USER)
+    API_TOKEN = os.getenv("API_TOKEN", ADMIN_PASSWORD)
+    SEED_MODE = os.getenv("SEED_MODE", "api").lower()  # "api", "db" or "ui"
+    try:
+        API_BATCH_SIZE = int(os.getenv("API_BATCH_SIZE", "100"))
+    except (ValueError, TypeError):
+        API_BATCH_SIZE = 100
+    try:
+        SEED_CHUNK_SIZE = int(os.getenv("SEED_CHUNK_SIZE", "10000"))
+    except (ValueError, TypeError):
+        SEED_CHUNK_SIZE = 10000
+
+    # --- Benchmark settings ---
+    try:
+        BENCHMARK_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "30"))
+        BENCHMARK_WARMUP_ROUNDS = int(os.getenv("BENCHMARK_WARMUP_ROUNDS", "3"))
+    except (ValueError, TypeError):
+        BENCHMARK_ROUNDS, BENCHMARK_WARMUP_ROUNDS = 30, 3
+    PERF_STORE_PATH = os.getenv("PERF_STORE_PATH", os.path.join("temp", "perf", "results.sqlite"))
+    try:
+        PERF_BASELINE_RUNS = int(os.getenv("PERF_BASELINE_RUNS", "5"))
+    except (ValueError, TypeError):
+        PERF_BASELINE_RUNS = 5
+
+    # --- Query plan capture settings ---
+    EXPLAIN_CAPTURE = os.getenv("EXPLAIN_CAPTURE", "false").lower() == "true"
+    EXPLAIN_HOT_QUERIES = os.getenv("EXPLAIN_HOT_QUERIES", r"FROM tasks WHERE project_id")  # ';'-separated regexes
+    EXPLAIN_SEQ_SCAN_ACTION = os.getenv("EXPLAIN_SEQ_SCAN_ACTION", "warn").lower()  # "warn" or "fail"
+    try:
+        EXPLAIN_SEQ_SCAN_MIN_ROWS = int(os.getenv("EXPLAIN_SEQ_SCAN_MIN_ROWS", "10000"))
+    except (ValueError, TypeError):
+        EXPLAIN_SEQ_SCAN_MIN_ROWS = 10000
+
+    # --- Server-side query statistics settings ---
+    PG_STATS = os.getenv("PG_STATS", "off").lower()  # "off", "test" or "step"
+    try:
+        PG_STATS_SETTLE_TIME = float(os.getenv("PG_STATS_SETTLE_TIME", "0.6"))
+        PG_STATS_N_PLUS_ONE_CALLS = int(os.getenv("PG_STATS_N_PLUS_ONE_CALLS", "20"))
+        PG_STATS_TOP = int(os.getenv("PG_STATS_TOP", "20"))
+    except (ValueError, TypeError):
+        PG_STATS_SETTLE_TIME = 0.6
+        PG_STATS_N_PLUS_ONE_CALLS = 20
+        PG_STATS_TOP = 20
+
+    # --- Scaling sweep settings ---
+    SCALING_SWEEP = os.getenv("SCALING_SWEEP", "false").lower() == "true"
+    SCALING_TASK_SIZES = os.getenv("SCALING_TASK_SIZES", "10,100,1000,10000,100000")
+    SCALING_PROJECT_COUNTS = os.getenv("SCALING_PROJECT_COUNTS", "1,10,100,1000")
+    try:
+        SCALING_SLA = float(os.getenv("SCALING_SLA", "1.0"))
+    except (ValueError, TypeError):
+        SCALING_SLA = 1.0
+
+    # --- UI load test settings ---
+    try:
+        LOAD_USERS = int(os.getenv("LOAD_USERS", "0"))  # 0 skips the load test in regular runs
+        LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", "5"))
+        LOAD_THINK_TIME = float(os.getenv("LOAD_THINK_TIME", "1"))
+        LOAD_DURATION = float(os.getenv("LOAD_DURATION", "60"))
+    except (ValueError, TypeError):
+        LOAD_USERS, LOAD_RAMP_UP, LOAD_THINK_TIME, LOAD_DURATION = 0, 5.0, 1.0, 60.0
+
     @staticmethod
     def get_base_url():
         """Returns the base URL for the application."""
         return AppSettings.BASE_URL
 
+    @staticmethod
+    def get_app_root_url(base_url=None):
+        """Returns the scheme and host of BASE_URL (or `base_url`), where Kanboard's controller routes live."""
+        url = urlsplit(base_url or AppSettings.get_base_url())
+        return f"{url.scheme}://{url.netloc}"
+
     @staticmethod
     def get_admin_password():
         """Returns the admin password."""
@@ -47,3 +226,282 @@ class AppSettings:
             return int(AppSettings.number_of_tasks)
         except ValueError:
             return 50  # Default to 50 if conversion fails
+
+    @staticmethod
+    def get_concurrent_pages():
+        """Returns how many pages the concurrency tests drive at once in one event loop."""
+        return max(1, AppSettings.CONCURRENT_PAGES)
+
+    @staticmethod
+    def get_log_level():
+        """Returns the numeric log level of the run (defaults to INFO for unknown names)."""
+        level = logging.getLevelName(AppSettings.LOG_LEVEL)
+        return level if isinstance(level, int) else logging.INFO
+
+    @staticmethod
+    def is_json_logging_enabled():
+        """Returns whether a JSON-lines copy of the run log is written next to the text log."""
+        return AppSettings.LOG_JSON
+
+    @staticmethod
+    def is_context_pool_enabled():
+        """Returns whether test pages come from a pool of warm, reusable browser contexts."""
+        return AppSettings.CONTEXT_POOL
+
+    @staticmethod
+    def get_context_pool_size():
+        """Returns how many warm browser contexts each worker keeps."""
+        return max(1, AppSettings.CONTEXT_POOL_SIZE)
+
+    @staticmethod
+    def get_network_profile():
+        """Returns the network profile: 'full' loads everything, 'lean' blocks unneeded resources."""
+        return AppSettings.NETWORK_PROFILE
+
+    @staticmethod
+    def get_blocked_resource_types():
+        """Returns the Playwright resource types blocked by the 'lean' network profile."""
+        return [t.strip() for t in AppSettings.BLOCKED_RESOURCE_TYPES.split(",") if t.strip()]
+
+    @staticmethod
+    def get_blocked_url_patterns():
+        """Returns the URL regular expressions blocked by the 'lean' network profile."""
+        return [p.strip() for p in AppSettings.BLOCKED_URL_PATTERNS.split(",") if p.strip()]
+
+    @staticmethod
+    def is_browser_metrics_enabled():
+        """Returns whether page navigations collect client-side performance metrics."""
+        return AppSettings.BROWSER_METRICS
+
+    @staticmethod
+    def get_db_dsn():
+        """Returns the libpq connection string of the Kanboard database."""
+        if AppSettings.DB_DSN:
+            return AppSettings.DB_DSN
+        return (f"dbname={AppSettings.DB_NAME} user={AppSettings.DB_USER} password={AppSettings.DB_PASSWORD} "
+                f"host={AppSettings.DB_HOST} port={AppSettings.DB_PORT}")
+
+    @staticmethod
+    def get_db_pool_min():
+        """Returns the number of connections the database pool keeps open."""
+        return max(0, AppSettings.DB_POOL_MIN)
+
+    @staticmethod
+    def get_db_pool_max():
+        """Returns the maximum number of connections the database pool may open."""
+        return max(1, AppSettings.DB_POOL_MIN, AppSettings.DB_POOL_MAX)
+
+    @staticmethod
+    def get_db_ready_timeout():
+        """Returns how many seconds to wait for the database to accept connections."""
+        return AppSettings.DB_READY_TIMEOUT
+
+    @staticmethod
+    def is_db_wait_notify_enabled():
+        """Returns whether wait_for_db_condition is woken by LISTEN/NOTIFY triggers (it polls otherwise)."""
+        return AppSettings.DB_WAIT_NOTIFY
+
+    @staticmethod
+    def get_db_wait_tables():
+        """Returns the tables whose row changes notify wait_for_db_condition."""
+        return [table.strip() for table in AppSettings.DB_WAIT_TABLES.split(",") if table.strip()]
+
+    @staticmethod
+    def get_db_wait_timeout():
+        """Returns the default deadline of wait_for_db_condition in seconds."""
+        return max(0.0, AppSettings.DB_WAIT_TIMEOUT)
+
+    @staticmethod
+    def get_test_data_cleanup():
+        """Returns how test-created data is removed at the end of the session: 'db', 'api' or 'off'."""
+        return AppSettings.TEST_DATA_CLEANUP if AppSettings.TEST_DATA_CLEANUP in ("db", "api", "off") else "db"
+
+    @staticmethod
+    def get_orphan_max_age_hours():
+        """Returns how long a test project must be untouched before the orphan sweep removes it (hours)."""
+        return max(0.0, AppSettings.ORPHAN_MAX_AGE_HOURS)
+
+    @staticmethod
+    def get_trace_mode():
+        """Returns whether Playwright traces are recorded and kept for failed tests ('failure') or not ('off')."""
+        return AppSettings.TRACE_MODE if AppSettings.TRACE_MODE in ("failure", "off") else "failure"
+
+    @staticmethod
+    def is_trace_screenshots_enabled():
+        """Returns whether traces also record the screencast (a frame per paint), on top of DOM snapshots."""
+        return AppSettings.TRACE_SCREENSHOTS
+
+    @staticmethod
+    def get_screenshot_dir():
+        """Returns the directory of screenshots taken with take_screenshot; it is never pruned."""
+        return AppSettings.SCREENSHOT_DIR
+
+    @staticmethod
+    def get_artifact_dir():
+        """Returns the directory failure artifacts (traces and screenshots) are written to."""
+        return AppSettings.ARTIFACT_DIR
+
+    @staticmethod
+    def get_artifact_max_mb():
+        """Returns the disk budget of the artifact directory; the oldest artifacts are removed beyond it (MB)."""
+        return max(1, AppSettings.ARTIFACT_MAX_MB)
+
+    @staticmethod
+    def get_auth_mode():
+        """Returns how the session's login state is created: 'http' (browserless) or 'ui'."""
+        return AppSettings.AUTH_MODE if AppSettings.AUTH_MODE in ("http", "ui") else "http"
+
+    @staticmethod
+    def get_test_user_count():
+        """Returns how many test users the credential pool creates per worker (0 disables the pool)."""
+        return max(0, AppSettings.TEST_USER_COUNT)
+
+    @staticmethod
+    def is_dataset_cache_enabled():
+        """Returns whether seeded performance datasets are kept and reused across runs."""
+        return AppSettings.DATASET_CACHE
+
+    @staticmethod
+    def get_dataset_cache_max_age_hours():
+        """Returns how long a cached dataset may go unused before it is evicted (hours)."""
+        return max(0.0, AppSettings.DATASET_CACHE_MAX_AGE_HOURS)
+
+    @staticmethod
+    def get_dataset_cache_max_rows():
+        """Returns the total number of cached tasks above which the least recently used datasets are evicted."""
+        return max(0, AppSettings.DATASET_CACHE_MAX_ROWS)
+
+    @staticmethod
+    def get_dataset_cache_max_projects():
+        """Returns the number of cached projects above which the least recently used datasets are evicted."""
+        return max(0, AppSettings.DATASET_CACHE_MAX_PROJECTS)
+
+    @staticmethod
+    def get_db_snapshot_preserve_tables():
+        """Returns the tables whose rows survive a snapshot restore (login sessions by default)."""
+        return [table.strip() for table in AppSettings.DB_SNAPSHOT_PRESERVE_TABLES.split(",") if table.strip()]
+
+    @staticmethod
+    def is_kanboard_standin_enabled():
+        """Returns whether the session runs against the local SQLite-backed Kanboard stand-in."""
+        return AppSettings.KANBOARD_STANDIN
+
+    @staticmethod
+    def get_kanboard_standin_port():
+        """Returns the port the Kanboard stand-in listens on (0 picks a free port per worker)."""
+        return max(0, AppSettings.KANBOARD_STANDIN_PORT)
+
+    @staticmethod
+    def is_duration_scheduling_enabled():
+        """Returns whether tests are recorded and handed out longest-first across pytest-xdist workers."""
+        return AppSettings.DURATION_SCHEDULING
+
+    @staticmethod
+    def get_test_durations_file():
+        """Returns the JSON file holding the per-test durations of previous runs."""
+        return AppSettings.TEST_DURATIONS_FILE
+
+    @staticmethod
+    def get_api_url():
+        """Returns the URL of Kanboard's JSON-RPC endpoint."""
+        return AppSettings.API_URL
+
+    @staticmethod
+    def get_api_credentials():
+        """Returns the (username, token) pair used to authenticate JSON-RPC calls."""
+        return AppSettings.API_USER, AppSettings.API_TOKEN
+
+    @staticmethod
+    def get_api_batch_size():
+        """Returns the maximum number of calls sent in a single JSON-RPC batch request."""
+        return max(1, AppSettings.API_BATCH_SIZE)
+
+    @staticmethod
+    def get_seed_mode():
+        """Returns how fixtures seed test data: 'api' (JSON-RPC batches), 'db' (direct COPY) or 'ui' (page objects)."""
+        return AppSettings.SEED_MODE
+
+    @staticmethod
+    def get_seed_chunk_size():
+        """Returns the number of rows written per transaction by the direct-to-database data factory."""
+        return max(1, AppSettings.SEED_CHUNK_SIZE)
+
+    @staticmethod
+    def get_benchmark_rounds():
+        """Returns the number of timed rounds per benchmark."""
+        return max(1, AppSettings.BENCHMARK_ROUNDS)
+
+    @staticmethod
+    def get_benchmark_warmup_rounds():
+        """Returns the number of untimed warm-up rounds per benchmark."""
+        return max(0, AppSettings.BENCHMARK_WARMUP_ROUNDS)
+
+    @staticmethod
+    def get_perf_store_path():
+        """Returns the path of the SQLite database that stores benchmark results across runs."""
+        return AppSettings.PERF_STORE_PATH
+
+    @staticmethod
+    def get_perf_baseline_runs():
+        """Returns how many of the latest accepted runs are pooled into a benchmark's baseline."""
+        return max(1, AppSettings.PERF_BASELINE_RUNS)
+
+    @staticmethod
+    def is_explain_capture_enabled():
+        """Returns whether db_connection cursors capture EXPLAIN (ANALYZE, BUFFERS) plans of their SELECTs."""
+        return AppSettings.EXPLAIN_CAPTURE
+
+    @staticmethod
+    def get_explain_hot_queries():
+        """Returns the regular expressions of hot queries that must not scan large tables sequentially."""
+        return [q.strip() for q in AppSettings.EXPLAIN_HOT_QUERIES.split(";") if q.strip()]
+
+    @staticmethod
+    def get_explain_seq_scan_min_rows():
+        """Returns the table size from which a sequential scan by a hot query is reported."""
+        return max(0, AppSettings.EXPLAIN_SEQ_SCAN_MIN_ROWS)
+
+    @staticmethod
+    def get_pg_stats_mode():
+        """Returns when server-side query statistics are diffed: 'off', per 'test' or per Allure 'step'."""
+        return AppSettings.PG_STATS if AppSettings.PG_STATS in ("off", "test", "step") else "off"
+
+    @staticmethod
+    def get_pg_stats_settle_time():
+        """Returns how long to wait for table statistics to reach the views before a snapshot (seconds)."""
+        return max(0.0, AppSettings.PG_STATS_SETTLE_TIME)
+
+    @staticmethod
+    def get_pg_stats_n_plus_one_calls():
+        """Returns the calls from which a statement returning at most one row per call is a possible N+1."""
+        return max(2, AppSettings.PG_STATS_N_PLUS_ONE_CALLS)
+
+    @staticmethod
+    def get_pg_stats_top():
+        """Returns how many statements and tables each ranking of the query statistics report shows."""
+        return max(1, AppSettings.PG_STATS_TOP)
+
+    @staticmethod
+    def is_scaling_sweep_enabled():
+        """Returns whether the dataset scaling sweep runs (it seeds up to 100k tasks, so it is opt-in)."""
+        return AppSettings.SCALING_SWEEP
+
+    @staticmethod
+    def get_scaling_task_sizes():
+        """Returns the tasks-per-project sizes of the scaling sweep, ascending."""
+        return sorted({int(size) for size in AppSettings.SCALING_TASK_SIZES.split(",") if size.strip()})
+
+    @staticmethod
+    def get_scaling_project_counts():
+        """Returns the project counts of the scaling sweep, ascending."""
+        return sorted({int(count) for count in AppSettings.SCALING_PROJECT_COUNTS.split(",") if count.strip()})
+
+    @staticmethod
+    def get_scaling_sla():
+        """Returns the p95 latency in seconds that the scaling sweep measures and extrapolates against."""
+        return AppSettings.SCALING_SLA
+
+    @staticmethod
+    def get_load_users():
+        """Returns how many virtual users the UI load test drives (0 disables the load test)."""
+        return max(0, AppSettings.LOAD_USERS)
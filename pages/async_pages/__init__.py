@@ -0,0 +1,13 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.async_pages.dashboard_page import AsyncDashboardPage
+from pages.async_pages.login_page import AsyncLoginPage
+from pages.async_pages.project_page import AsyncProjectPage
+from pages.async_pages.task_page import AsyncTaskPage
+
+__all__ = [
+    "AsyncBasePage",
+    "AsyncDashboardPage",
+    "AsyncLoginPage",
+    "AsyncProjectPage",
+    "AsyncTaskPage",
+]
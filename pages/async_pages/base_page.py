@@ -0,0 +1,98 @@
+from playwright.async_api import Page
+from utils.artifacts import screenshot_store
+from utils.logger import setup_logger
+
+
+class AsyncBasePage:
+    """
+    asyncio mirror of pages.base_page.BasePage.
+    Method names and behaviour match the synchronous version; every method that talks to
+    the browser is a coroutine, while locator factories (locate, get_by_role) stay synchronous
+    because Playwright builds locators lazily.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.logger = setup_logger(self.__class__.__name__)
+
+    async def navigate_to(self, url):
+        self.logger.info("Navigating to %s", url)
+        await self.page.goto(url)
+
+    def get_by_role(self, role, name=None, exact=False):
+        self.logger.debug("Getting element by role: %s, name: %s, exact: %s", role, name, exact)
+        return self.page.get_by_role(role, name=name, exact=exact)
+
+    async def navigate_back(self):
+        self.logger.info("Navigating to the previous page")
+        await self.page.go_back()
+
+    async def click_element(self, element, timeout=None):
+        """
+           Click an element using either a CSS selector or a Playwright Locator.
+           Relies on Playwright's actionability wait instead of re-clicking (see BasePage.click_element).
+        """
+        try:
+            if isinstance(element, str):
+                self.logger.info("Clicking element by selector: %s", element)
+                await self.page.click(element, timeout=timeout)
+            else:
+                self.logger.info("Clicking element by locator: %s", element)
+                await element.click(timeout=timeout)
+        except Exception as e:
+            self.logger.error("Failed to click element %s: %s", element, e)
+            raise
+
+    async def write_on_element(self, element, string_to_write):
+        try:
+            if isinstance(element, str):
+                self.logger.info("Writing on element by selector: %s", element)
+                await self.page.fill(element, string_to_write)
+            else:
+                self.logger.info("Writing on Locator: %s", element)
+                await element.fill(string_to_write)
+        except Exception as e:
+            self.logger.error("Failed to write on element: %s", e)
+
+    def locate(self, selector):
+        self.logger.debug("Getting locator for selector: %s", selector)
+        return self.page.locator(selector)
+
+    async def wait_for(self, element, timeout=10000):
+        self.logger.info("Waiting for element to appear: %s", element)
+        try:
+            if isinstance(element, str):
+                await self.page.wait_for_selector(element, state="visible", timeout=timeout)
+            else:
+                await element.wait_for(state="visible", timeout=timeout)
+        except Exception as e:
+            self.logger.error("Failed to wait for element: %s", e)
+            raise
+
+    async def is_text_visible(self, text):
+        self.logger.info("Checking if text '%s' is visible on the page.", text)
+        try:
+            locator = self.locate(f"text={text}")
+            return await locator.is_visible()
+        except Exception as e:
+            self.logger.error("Error while checking text visibility: %s", e)
+            return False
+
+    async def get_text(self, element):
+        try:
+            if isinstance(element, str):
+                self.logger.info("Retrieving text from element by selector: %s", element)
+                return await self.page.locator(element).text_content()
+            else:
+                self.logger.info("Retrieving text from element by Locator: %s", element)
+                return await element.text_content()
+        except Exception as e:
+            self.logger.error("Failed to retrieve text: %s", e)
+            raise
+
+    async def take_screenshot(self, filename):
+        """Captures the page and queues the PNG for the background screenshot writer; returns its final path."""
+        png = await self.page.screenshot()
+        path = screenshot_store().save_bytes(filename, png)
+        self.logger.info("Taking screenshot: %s", path)
+        return path
@@ -0,0 +1,92 @@
+import asyncio
+from typing import List, Optional
+from playwright.async_api import Page, expect
+from pages.async_pages.base_page import AsyncBasePage
+from pages.locators import DashboardLocators
+from config.app_settings import AppSettings
+from utils.project_resolver import ProjectResolver
+
+
+class AsyncDashboardPage(AsyncBasePage):
+    """
+    asyncio mirror of pages.dashboard_page.DashboardPage.
+    """
+
+    def __init__(self, page: Page, base_url: Optional[str] = None,
+                 resolver: Optional[ProjectResolver] = None):
+        super().__init__(page)
+        self.base_url = base_url or AppSettings.get_app_root_url()
+        self.resolver = resolver
+        self.new_project_button = self.locate(DashboardLocators.NEW_PROJECT_BUTTON)
+        self.project_list_section = self.locate(DashboardLocators.PROJECT_LIST_SECTION)
+        self.project_links = self.project_list_section.locator(DashboardLocators.PROJECT_LINKS)
+        self.next_page_link = self.locate(DashboardLocators.NEXT_PAGE_LINK)
+
+    async def navigate(self):
+        """Navigate to the main dashboard."""
+        await self.navigate_to(f"{self.base_url}/dashboard")
+
+    async def navigate_to_project(self, project_name: str, verify_ui: bool = False):
+        """
+        Navigates to a specific project.
+        When a resolver is available, the project ID is looked up (off the event loop, since the
+        lookup is a blocking query) and the board is opened directly. With verify_ui=True (or without
+        a resolver) it walks the paginated dashboard instead.
+        """
+        if self.resolver is not None and not verify_ui:
+            project_id = await asyncio.get_running_loop().run_in_executor(None, self.resolver.resolve, project_name)
+            if project_id is None:
+                self.logger.error("Project '%s' could not be resolved to an ID.", project_name)
+                raise ValueError(f"Project '{project_name}' not found.")
+            await self.navigate_to(f"{self.base_url}/board/{project_id}")
+            await expect(self.locate(DashboardLocators.PROJECT_TITLE)).to_contain_text(project_name)
+            return
+
+        await self.navigate()
+        while True:
+            project_link = self.project_list_section.locator(DashboardLocators.project_link(project_name))
+            if await project_link.is_visible():
+                self.logger.info("Found project '%s', clicking it.", project_name)
+                await self.click_element(project_link)
+                # Verify navigation was successful
+                await expect(self.locate(DashboardLocators.PROJECT_TITLE)).to_contain_text(project_name)
+                return
+
+            if await self.next_page_link.is_visible():
+                self.logger.info("Project '%s' not on this page, clicking 'Next'.", project_name)
+                await self.click_element(self.next_page_link)
+                await self.project_list_section.wait_for(state="visible")
+            else:
+                self.logger.error("Project '%s' not found after checking all pages.", project_name)
+                raise ValueError(f"Project '{project_name}' not found after checking all pages.")
+
+    async def click_new_project(self):
+        """Clicks the 'New project' button."""
+        await self.click_element(self.new_project_button)
+        await expect(self.locate(DashboardLocators.PAGE_HEADING)).to_contain_text("New project")
+
+    async def get_project_names(self) -> List[str]:
+        """Gets a list of all project names on the page."""
+        if not await self.project_list_section.is_visible():
+            return []
+        return await self.project_links.all_text_contents()
+
+    async def is_project_listed(self, project_name: str) -> bool:
+        """
+        Checks if a project is listed on the dashboard UI, handling pagination.
+        This is a UI verification and always walks the pages, even when a resolver is available.
+        """
+        await self.navigate()
+        while True:
+            current_projects = await self.get_project_names()
+            if project_name in current_projects:
+                self.logger.info("Found project '%s' on the current page.", project_name)
+                return True
+
+            if await self.next_page_link.is_visible():
+                self.logger.info("Project not found on this page, clicking 'Next' to check the next page.")
+                await self.click_element(self.next_page_link)
+                await self.project_list_section.wait_for(state="visible")
+            else:
+                self.logger.info("Project '%s' not found after checking all pages.", project_name)
+                return False
@@ -0,0 +1,46 @@
+from playwright.async_api import Page, expect
+from pages.async_pages.base_page import AsyncBasePage
+from pages.locators import LoginLocators
+from config.app_settings import AppSettings
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """
+    asyncio mirror of pages.login_page.LoginPage.
+    """
+    def __init__(self, page: Page):
+        super().__init__(page)
+        # --- Locators ---
+        self.username_input = self.locate(LoginLocators.USERNAME_INPUT)
+        self.password_input = self.locate(LoginLocators.PASSWORD_INPUT)
+        self.login_button = self.locate(LoginLocators.LOGIN_BUTTON)
+        self.dashboard_header = self.locate(LoginLocators.DASHBOARD_HEADER)
+
+    async def navigate(self):
+        """Navigates to the application's login page."""
+        self.logger.info("Navigating to the login page at %s", AppSettings.get_base_url())
+        await self.navigate_to(AppSettings.get_base_url())
+
+    async def login(self, username, password):
+        """Fills the login form and submits it."""
+        self.logger.info("Attempting to log in with username: %s", username)
+        try:
+            await self.write_on_element(self.username_input, username)
+            await self.write_on_element(self.password_input, password)
+            await self.click_element(self.login_button)
+            self.logger.info("Login form submitted successfully.")
+        except Exception as e:
+            self.logger.error("An error occurred during the login process: %s", e)
+            await self.take_screenshot("login_error.png")
+            raise
+
+    async def verify_login_successful(self):
+        """Verifies that the login was successful by checking for a key element on the dashboard."""
+        self.logger.info("Verifying that login was successful by checking for the Dashboard header.")
+        try:
+            await expect(self.dashboard_header).to_be_visible(timeout=10000)
+            self.logger.info("Login verification successful: Dashboard header is visible.")
+        except Exception as e:
+            self.logger.error("Login verification failed. Dashboard header was not found: %s", e)
+            await self.take_screenshot("login_verification_failed.png")
+            raise
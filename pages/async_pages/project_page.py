@@ -0,0 +1,90 @@
+import re
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.async_pages.base_page import AsyncBasePage
+from pages.locators import ProjectLocators
+from config.app_settings import AppSettings
+from utils.project_resolver import ProjectResolver
+
+
+class AsyncProjectPage(AsyncBasePage):
+    """
+    asyncio mirror of pages.project_page.ProjectPage.
+    """
+
+    def __init__(self, page: Page, base_url: Optional[str] = None,
+                 resolver: Optional[ProjectResolver] = None):
+        super().__init__(page)
+        self.base_url = base_url or AppSettings.get_app_root_url()
+        self.resolver = resolver
+
+        # --- Locators ---
+        self.project_name_input = self.locate(ProjectLocators.PROJECT_NAME_INPUT)
+        self.submit_button = self.locate(ProjectLocators.SUBMIT_BUTTON)
+        self.project_header_title = self.locate(ProjectLocators.PROJECT_HEADER_TITLE)
+
+        # Task related locators
+        self.add_task_link_to_ready = self.locate(ProjectLocators.READY_COLUMN_HEADER)
+        self.task_title_input = self.locate(ProjectLocators.TASK_TITLE_INPUT)
+        self.description_input_placeholder = ProjectLocators.DESCRIPTION_INPUT_PLACEHOLDER
+
+        # Board related locators
+        self.done_column = self.locate(ProjectLocators.DONE_COLUMN)
+
+        # Project deletion locators
+        self.settings_link = self.locate(ProjectLocators.SETTINGS_LINK)
+        self.configure_project_link = self.locate(ProjectLocators.CONFIGURE_PROJECT_LINK)
+        self.remove_link = self.get_by_role(*ProjectLocators.REMOVE_LINK)
+        self.confirm_yes_button = self.get_by_role(*ProjectLocators.CONFIRM_YES_BUTTON)
+
+    async def create_project(self, name: str):
+        """Fills out and submits the new project form."""
+        await self.write_on_element(self.project_name_input, name)
+        await self.click_element(self.submit_button)
+        # Verify that the page has navigated to the new project board
+        await expect(self.project_header_title).to_contain_text(name)
+        if self.resolver is not None:
+            self.resolver.invalidate(name=name)
+
+    async def add_task(self, title: str):
+        """Navigates to the new task form and creates a task."""
+        add_task_button = self.add_task_link_to_ready.locator(ProjectLocators.ADD_TASK_ICON)
+        await self.click_element(add_task_button)
+        # Verify navigation to the new task page
+        await expect(self.locate(ProjectLocators.PAGE_HEADING)).to_contain_text("New task")
+        await self.write_on_element(self.task_title_input, title)
+        await self.write_on_element(self.locate(ProjectLocators.description_input()), "This is a test task.")
+
+        await self.click_element(self.submit_button)
+        # Verify the task appears on the board
+        await expect(self.locate(ProjectLocators.task_title(title))).to_be_visible()
+
+    async def navigate_to_task(self, task_name: str):
+        """
+        Navigates to the task detail page by finding and clicking the task on the board.
+
+        Args:
+            task_name: The exact title of the task to click on.
+        """
+        await self.click_element(self.locate(ProjectLocators.task_link(task_name)))
+
+    async def delete_project(self):
+        """
+        Deletes the current project by navigating through the UI menus and confirming.
+        """
+        # Remember which project is being deleted so its cached ID can be invalidated afterwards.
+        project_id_match = re.search(r"/(?:board|project)/(\d+)", self.page.url)
+
+        await self.click_element(self.settings_link)
+        await self.click_element(self.configure_project_link)
+        await self.click_element(self.remove_link)
+        await self.click_element(self.confirm_yes_button)
+
+        # Verify that we are redirected back to the main project list.
+        await self.page.wait_for_url(ProjectLocators.PROJECT_LIST_URL)
+        if self.resolver is not None:
+            if project_id_match:
+                self.resolver.invalidate(project_id=int(project_id_match.group(1)))
+            else:
+                self.resolver.invalidate()
+        self.logger.info("Successfully deleted project and confirmed redirect to the dashboard.")
@@ -0,0 +1,59 @@
+from typing import Optional
+from playwright.async_api import Page, expect
+from pages.async_pages.base_page import AsyncBasePage
+from pages.locators import TaskLocators
+from config.app_settings import AppSettings
+
+
+class AsyncTaskPage(AsyncBasePage):
+    """
+    asyncio mirror of pages.task_page.TaskPage.
+    """
+
+    def __init__(self, page: Page, base_url: Optional[str] = None):
+        super().__init__(page)
+        self.base_url = base_url or AppSettings.get_app_root_url()
+
+        # Main task view elements
+        self.task_summary_title = self.locate(TaskLocators.TASK_SUMMARY_TITLE)
+        self.task_description = self.locate(TaskLocators.TASK_DESCRIPTION)
+
+        # Sidebar action links
+        self.close_task_link = self.locate(TaskLocators.CLOSE_TASK_LINK)
+        self.remove_task_link = self.locate(TaskLocators.REMOVE_TASK_LINK)
+
+        # Comment form elements
+        self.comment_textarea = self.locate(TaskLocators.COMMENT_TEXTAREA)
+        self.save_comment_button = self.locate(TaskLocators.SAVE_COMMENT_BUTTON)
+
+        # Confirmation modal button (for closing or deleting)
+        self.confirm_button = self.locate(TaskLocators.CONFIRM_BUTTON)
+
+    async def get_task_title(self) -> str:
+        """Gets the task title from the task summary view."""
+        return await self.get_text(self.task_summary_title)
+
+    async def get_task_description(self) -> str:
+        """Gets the task description from the accordion section."""
+        if await self.task_description.is_visible():
+            return await self.get_text(self.task_description)
+        return ""
+
+    async def move_task_to_done(self):
+        """
+        Moves the task to the 'Done' column through the "Move position" form.
+        """
+        await self.click_element(self.get_by_role(*TaskLocators.MOVE_POSITION_LINK))
+        await self.locate(TaskLocators.COLUMNS_SELECT).select_option(value=TaskLocators.DONE_COLUMN_NAME)
+        await self.click_element(self.locate(TaskLocators.SAVE_BUTTON).nth(TaskLocators.SAVE_BUTTON_INDEX))
+        # Verify that the task is now in the Done column
+        await expect(self.locate(TaskLocators.TASK_SUMMARY_COLUMN)).to_contain_text(TaskLocators.DONE_COLUMN_NAME)
+
+    async def delete_task(self):
+        """
+        Deletes the current task from the sidebar actions.
+        """
+        await self.click_element(self.get_by_role(*TaskLocators.REMOVE_LINK))
+        await self.click_element(self.confirm_button)
+        # After deleting, the user is returned to the board view.
+        await expect(self.locate(TaskLocators.BOARD)).to_be_visible()
@@ -1,5 +1,6 @@
-import os
 from playwright.sync_api import Page
+from utils.artifacts import screenshot_store
+from utils.browser_metrics import collector_for
 from utils.logger import setup_logger
 
 class BasePage:
@@ -8,89 +9,93 @@ class BasePage:
         self.logger = setup_logger(self.__class__.__name__)
 
     def navigate_to(self, url):
-        self.logger.info(f"Navigating to {url}")
+        self.logger.info("Navigating to %s", url)
         self.page.goto(url)
+        metrics = collector_for(self.page)
+        if metrics is not None:
+            metrics.collect(self.page, f"{self.__class__.__name__} navigate")
 
     def get_by_role(self, role, name=None, exact=False):
-        self.logger.info(f"Getting element by role: {role}, name: {name}, exact: {exact}")
+        self.logger.debug("Getting element by role: %s, name: %s, exact: %s", role, name, exact)
         return self.page.get_by_role(role, name=name, exact=exact)
 
     def navigate_back(self):
         self.logger.info("Navigating to the previous page")
         self.page.go_back()
 
-    def click_element(self, element, retries=3):
+    def click_element(self, element, timeout=None):
         """
-           Click an element using either a CSS selector or a Playwright Locator, with retry logic.
+           Click an element using either a CSS selector or a Playwright Locator.
+           Playwright waits until the element is attached, visible, stable and enabled (up to `timeout` ms,
+           default: the context's timeout) and re-resolves the locator if it is re-rendered, so a failed
+           click is not retried: re-clicking blindly could submit a form twice or triple the wait.
+           With browser metrics enabled, a click that loads a new document records its metrics.
         """
-        for attempt in range(1, retries + 1):
-            try:
-                if isinstance(element, str):
-                    self.logger.info(
-                        f"Attempting to click element by selector: {element} (Attempt {attempt}/{retries})"
-                    )
-                    self.page.click(element)
-                else:
-                    self.logger.info(f"Attempting to click element by locator: {element} (Attempt {attempt}/{retries})")
-                    element.click()
-                return
-            except Exception as e:
-                self.logger.error(f"Click attempt {attempt} failed: {e}")
-                if attempt == retries:
-                    self.logger.error(f"All {retries} attempts to click element failed. Taking a screenshot.")
-                    raise
+        metrics = collector_for(self.page)
+        time_origin = metrics.time_origin(self.page) if metrics is not None else None
+        try:
+            if isinstance(element, str):
+                self.logger.info("Clicking element by selector: %s", element)
+                self.page.click(element, timeout=timeout)
+            else:
+                self.logger.info("Clicking element by locator: %s", element)
+                element.click(timeout=timeout)
+        except Exception as e:
+            self.logger.error("Failed to click element %s: %s", element, e)
+            raise
+        if metrics is not None:
+            metrics.collect_if_navigated(self.page, time_origin, f"{self.__class__.__name__} click")
 
     def write_on_element(self, element, string_to_write):
         try:
             if isinstance(element, str):
-                self.logger.info(f"Writing on element by selector: {element}")
+                self.logger.info("Writing on element by selector: %s", element)
                 self.page.fill(element, string_to_write)
             else:
-                self.logger.info(f"Writing on Locator: {element}")
+                self.logger.info("Writing on Locator: %s", element)
                 element.fill(string_to_write)
         except Exception as e:
-            self.logger.error(f"Failed to write on element: {e}")
+            self.logger.error("Failed to write on element: %s", e)
 
     def locate(self, selector):
-        self.logger.info(f"Getting locator for selector: {selector}")
+        self.logger.debug("Getting locator for selector: %s", selector)
         return self.page.locator(selector)
 
     def wait_for(self, element, timeout=10000):
-        self.logger.info(f"Waiting for element to appear: {element}")
+        self.logger.info("Waiting for element to appear: %s", element)
         try:
             if isinstance(element, str):
                 self.page.wait_for_selector(element, state="visible", timeout=timeout)
             else:
                 element.wait_for(state="visible", timeout=timeout)
         except Exception as e:
-            self.logger.error(f"Failed to wait for element: {e}")
+            self.logger.error("Failed to wait for element: %s", e)
             raise
 
     def is_text_visible(self, text):
-        self.logger.info(f"Checking if text '{text}' is visible on the page.")
+        self.logger.info("Checking if text '%s' is visible on the page.", text)
         try:
             locator = self.locate(f"text={text}")
             return locator.is_visible()
         except Exception as e:
-            self.logger.error(f"Error while checking text visibility: {e}")
+            self.logger.error("Error while checking text visibility: %s", e)
             return False
 
     def get_text(self, element):
         try:
             if isinstance(element, str):
-                self.logger.info(f"Retrieving text from element by selector: {element}")
+                self.logger.info("Retrieving text from element by selector: %s", element)
                 return self.page.locator(element).text_content()
             else:
-                self.logger.info(f"Retrieving text from element by Locator: {element}")
+                self.logger.info("Retrieving text from element by Locator: %s", element)
                 return element.text_content()
         except Exception as e:
-            self.logger.error(f"Failed to retrieve text: {e}")
+            self.logger.error("Failed to retrieve text: %s", e)
             raise
 
     def take_screenshot(self, filename):
-        default_screenshot_dir = "screenshots"
-        if not os.path.exists(default_screenshot_dir):
-            os.makedirs(default_screenshot_dir)
-        path = os.path.join(default_screenshot_dir, filename)
-        self.logger.info(f"Taking screenshot: {path}")
-        self.page.screenshot(path=path)
\ No newline at end of file
+        """Captures the page and queues the PNG for the background screenshot writer; returns its final path."""
+        png = self.page.screenshot()
+        path = screenshot_store().save_bytes(filename, png)
+        self.logger.info("Taking screenshot: %s", path)
+        return path
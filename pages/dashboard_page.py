@@ -1,6 +1,9 @@
-from typing import List
+from typing import List, Optional
 from playwright.sync_api import Page, expect, Locator
 from pages.base_page import BasePage
+from pages.locators import DashboardLocators
+from config.app_settings import AppSettings
+from utils.project_resolver import ProjectResolver
 
 
 class DashboardPage(BasePage):
@@ -8,48 +11,61 @@ class DashboardPage(BasePage):
     Represents the main Dashboard page with synchronous interactions.
     """
 
-    def __init__(self, page: Page, base_url: str = "http://localhost:8080"):
+    def __init__(self, page: Page, base_url: Optional[str] = None,
+                 resolver: Optional[ProjectResolver] = None):
         super().__init__(page)
-        self.base_url = base_url
-        self.new_project_button = self.locate('.page-header a[href="/project/create"]')
-        self.project_list_section = self.locate('div.table-list')
-        self.project_links = self.project_list_section.locator('.table-list-title a')
-        self.next_page_link = self.locate('span.pagination-next a')
+        self.base_url = base_url or AppSettings.get_app_root_url()
+        self.resolver = resolver
+        self.new_project_button = self.locate(DashboardLocators.NEW_PROJECT_BUTTON)
+        self.project_list_section = self.locate(DashboardLocators.PROJECT_LIST_SECTION)
+        self.project_links = self.project_list_section.locator(DashboardLocators.PROJECT_LINKS)
+        self.next_page_link = self.locate(DashboardLocators.NEXT_PAGE_LINK)
 
     def navigate(self):
         """Navigate to the main dashboard."""
         self.navigate_to(f"{self.base_url}/dashboard")
 
-    def navigate_to_project(self, project_name: str):
+    def navigate_to_project(self, project_name: str, verify_ui: bool = False):
         """
-        Navigates to a specific project, handling pagination.
-        It searches through pages until it finds the project link and clicks it.
+        Navigates to a specific project.
+        When a resolver is available, the project ID is looked up and the board is opened directly.
+        With verify_ui=True (or without a resolver) it walks the paginated dashboard instead,
+        searching through pages until it finds the project link and clicks it.
         """
+        if self.resolver is not None and not verify_ui:
+            project_id = self.resolver.resolve(project_name)
+            if project_id is None:
+                self.logger.error("Project '%s' could not be resolved to an ID.", project_name)
+                raise ValueError(f"Project '{project_name}' not found.")
+            self.navigate_to(f"{self.base_url}/board/{project_id}")
+            expect(self.locate(DashboardLocators.PROJECT_TITLE)).to_contain_text(project_name)
+            return
+
         self.navigate()
         while True:
-            project_link = self.project_list_section.locator(f'a:has-text("{project_name}")')
+            project_link = self.project_list_section.locator(DashboardLocators.project_link(project_name))
             # Use a short timeout to quickly check for visibility on the current page.
             if project_link.is_visible():
-                self.logger.info(f"Found project '{project_name}', clicking it.")
+                self.logger.info("Found project '%s', clicking it.", project_name)
                 self.click_element(project_link)
                 # Verify navigation was successful
-                expect(self.locate('span.title')).to_contain_text(project_name)
+                expect(self.locate(DashboardLocators.PROJECT_TITLE)).to_contain_text(project_name)
                 return
 
             # Use a short timeout to prevent long waits on the last page.
             if self.next_page_link.is_visible():
-                self.logger.info(f"Project '{project_name}' not on this page, clicking 'Next'.")
+                self.logger.info("Project '%s' not on this page, clicking 'Next'.", project_name)
                 self.click_element(self.next_page_link)
                 self.project_list_section.wait_for(state="visible")
             else:
-                self.logger.error(f"Project '{project_name}' not found after checking all pages.")
+                self.logger.error("Project '%s' not found after checking all pages.", project_name)
                 raise ValueError(f"Project '{project_name}' not found after checking all pages.")
 
 
     def click_new_project(self):
         """Clicks the 'New project' button."""
         self.click_element(self.new_project_button)
-        expect(self.locate('h2')).to_contain_text("New project")
+        expect(self.locate(DashboardLocators.PAGE_HEADING)).to_contain_text("New project")
 
     def get_project_names(self) -> List[str]:
         """Gets a list of all project names on the page."""
@@ -59,7 +75,8 @@ class DashboardPage(BasePage):
 
     def is_project_listed(self, project_name: str) -> bool:
         """
-        Checks if a project is listed on the dashboard, handling pagination.
+        Checks if a project is listed on the dashboard UI, handling pagination.
+        This is a UI verification and always walks the pages, even when a resolver is available.
         It iterates through all pages of the project list until the project is found
         or there are no more pages.
         """
@@ -67,7 +84,7 @@ class DashboardPage(BasePage):
         while True:
             current_projects = self.get_project_names()
             if project_name in current_projects:
-                self.logger.info(f"Found project '{project_name}' on the current page.")
+                self.logger.info("Found project '%s' on the current page.", project_name)
                 return True
 
             # Use a short timeout to prevent long waits on the last page.
@@ -76,5 +93,5 @@ class DashboardPage(BasePage):
                 self.click_element(self.next_page_link)
                 self.project_list_section.wait_for(state="visible")
             else:
-                self.logger.info(f"Project '{project_name}' not found after checking all pages.")
+                self.logger.info("Project '%s' not found after checking all pages.", project_name)
                 return False
@@ -0,0 +1,91 @@
+"""
+Selector definitions shared by the synchronous page objects (pages/*.py) and their asyncio
+mirrors (pages/async_pages/*.py). Keeping them in one place means the two layers cannot drift apart.
+
+Plain strings are CSS/Playwright selectors, (role, name) tuples are get_by_role() arguments,
+and static methods build selectors from runtime data.
+"""
+
+
+class LoginLocators:
+    USERNAME_INPUT = "#form-username"
+    PASSWORD_INPUT = "#form-password"
+    LOGIN_BUTTON = "button[type='submit']"
+    DASHBOARD_HEADER = "h1:has-text('Dashboard')"
+
+
+class DashboardLocators:
+    NEW_PROJECT_BUTTON = '.page-header a[href="/project/create"]'
+    PROJECT_LIST_SECTION = 'div.table-list'
+    PROJECT_LINKS = '.table-list-title a'
+    NEXT_PAGE_LINK = 'span.pagination-next a'
+    PAGE_HEADING = 'h2'
+    PROJECT_TITLE = 'span.title'
+
+    @staticmethod
+    def project_link(project_name: str) -> str:
+        return f'a:has-text("{project_name}")'
+
+
+class ProjectLocators:
+    PROJECT_NAME_INPUT = '#form-name'
+    SUBMIT_BUTTON = 'button[type="submit"]'
+    PROJECT_HEADER_TITLE = "span.title"
+    PAGE_HEADING = 'h2'
+
+    # Task related locators
+    READY_COLUMN_HEADER = 'th.board-column-header:has-text("Ready")'
+    ADD_TASK_ICON = '.board-add-icon a'
+    TASK_TITLE_INPUT = 'input#form-title'
+    DESCRIPTION_INPUT_PLACEHOLDER = 'Write your text in Markdown'
+
+    # Board related locators
+    DONE_COLUMN = 'td.board-column-done'
+
+    # Project deletion locators
+    SETTINGS_LINK = 'a.action-menu.dropdown-menu'
+    CONFIGURE_PROJECT_LINK = '#dropdown a:has-text("Configure this project")'
+    REMOVE_LINK = ("link", "Remove")
+    CONFIRM_YES_BUTTON = ("button", "Yes")
+    PROJECT_LIST_URL = "**/projects"
+
+    @staticmethod
+    def description_input() -> str:
+        return f'textarea[placeholder="{ProjectLocators.DESCRIPTION_INPUT_PLACEHOLDER}"]'
+
+    @staticmethod
+    def task_title(title: str) -> str:
+        return f'.task-board-title:has-text("{title}")'
+
+    @staticmethod
+    def task_link(title: str) -> str:
+        return f'.task-board-title:has-text("{title}") a'
+
+
+class TaskLocators:
+    # Main task view elements
+    TASK_SUMMARY_TITLE = '#task-summary h2'
+    TASK_DESCRIPTION = 'details.accordion-section:has-text("Description") .markdown'
+    TASK_SUMMARY_COLUMN = 'div.task-summary-column'
+
+    # Sidebar action links
+    CLOSE_TASK_LINK = '.sidebar a[href*="/close"]'
+    REMOVE_TASK_LINK = '.sidebar a[href*="/remove"]'
+    MOVE_POSITION_LINK = ("link", "Move position")
+    REMOVE_LINK = ("link", "Remove")
+
+    # Move position form
+    COLUMNS_SELECT = 'select#form-columns'
+    SAVE_BUTTON = 'button[type="submit"]'
+    SAVE_BUTTON_INDEX = 1
+    DONE_COLUMN_NAME = "Done"
+
+    # Comment form elements
+    COMMENT_TEXTAREA = 'textarea[name="comment"]'
+    SAVE_COMMENT_BUTTON = '#comments .form-actions button[type="submit"]'
+
+    # Confirmation modal button (for closing or deleting)
+    CONFIRM_BUTTON = 'button#modal-confirm-button'
+
+    # The board, shown again after a task is deleted
+    BOARD = '#board'
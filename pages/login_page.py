@@ -1,4 +1,5 @@
 from pages.base_page import BasePage
+from pages.locators import LoginLocators
 from playwright.sync_api import Page, expect
 from config.app_settings import AppSettings
 from utils.logger import setup_logger
@@ -13,26 +14,26 @@ class LoginPage(BasePage):
         super().__init__(page)
         self.logger = setup_logger(self.__class__.__name__)
         # --- Locators ---
-        self.username_input = self.locate("#form-username")
-        self.password_input = self.locate("#form-password")
-        self.login_button = self.locate("button[type='submit']")
-        self.dashboard_header = self.locate("h1:has-text('Dashboard')")
+        self.username_input = self.locate(LoginLocators.USERNAME_INPUT)
+        self.password_input = self.locate(LoginLocators.PASSWORD_INPUT)
+        self.login_button = self.locate(LoginLocators.LOGIN_BUTTON)
+        self.dashboard_header = self.locate(LoginLocators.DASHBOARD_HEADER)
 
     def navigate(self):
         """Navigates to the application's login page."""
-        self.logger.info(f"Navigating to the login page at {AppSettings.get_base_url()}")
+        self.logger.info("Navigating to the login page at %s", AppSettings.get_base_url())
         self.navigate_to(AppSettings.get_base_url())
 
     def login(self, username, password):
         """Fills the login form and submits it."""
-        self.logger.info(f"Attempting to log in with username: {username}")
+        self.logger.info("Attempting to log in with username: %s", username)
         try:
             self.write_on_element(self.username_input, username)
             self.write_on_element(self.password_input, password)
             self.click_element(self.login_button)
             self.logger.info("Login form submitted successfully.")
         except Exception as e:
-            self.logger.error(f"An error occurred during the login process: {e}")
+            self.logger.error("An error occurred during the login process: %s", e)
             self.take_screenshot("login_error.png")
             raise
 
@@ -43,6 +44,6 @@ class LoginPage(BasePage):
             expect(self.dashboard_header).to_be_visible(timeout=10000)
             self.logger.info("Login verification successful: Dashboard header is visible.")
         except Exception as e:
-            self.logger.error(f"Login verification failed. Dashboard header was not found: {e}")
+            self.logger.error("Login verification failed. Dashboard header was not found: %s", e)
             self.take_screenshot("login_verification_failed.png")
             raise
\ No newline at end of file
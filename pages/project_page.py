@@ -1,5 +1,10 @@
+import re
+from typing import Optional
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.locators import ProjectLocators
+from config.app_settings import AppSettings
+from utils.project_resolver import ProjectResolver
 
 
 class ProjectPage(BasePage):
@@ -7,29 +12,31 @@ class ProjectPage(BasePage):
     Represents project-related pages (creation, board, settings) with synchronous methods.
     """
 
-    def __init__(self, page: Page, base_url: str = "http://localhost:8080"):
+    def __init__(self, page: Page, base_url: Optional[str] = None,
+                 resolver: Optional[ProjectResolver] = None):
         super().__init__(page)
-        self.base_url = base_url
+        self.base_url = base_url or AppSettings.get_app_root_url()
+        self.resolver = resolver
 
         # --- Locators ---
-        self.project_name_input = self.locate('#form-name')
-        self.submit_button = self.locate('button[type="submit"]')
-        self.project_header_title = self.locate("span.title")
+        self.project_name_input = self.locate(ProjectLocators.PROJECT_NAME_INPUT)
+        self.submit_button = self.locate(ProjectLocators.SUBMIT_BUTTON)
+        self.project_header_title = self.locate(ProjectLocators.PROJECT_HEADER_TITLE)
 
         # Task related locators
-        self.add_task_link_to_ready = self.locate('th.board-column-header:has-text("Ready")')
-        self.task_title_input = self.locate('input#form-title')
-        self.description_input_placeholder = 'Write your text in Markdown'
+        self.add_task_link_to_ready = self.locate(ProjectLocators.READY_COLUMN_HEADER)
+        self.task_title_input = self.locate(ProjectLocators.TASK_TITLE_INPUT)
+        self.description_input_placeholder = ProjectLocators.DESCRIPTION_INPUT_PLACEHOLDER
 
         # Board related locators
-        self.done_column = self.locate('td.board-column-done')
+        self.done_column = self.locate(ProjectLocators.DONE_COLUMN)
 
         # Project deletion locators
-        self.settings_link = self.locate('a.action-menu.dropdown-menu')
+        self.settings_link = self.locate(ProjectLocators.SETTINGS_LINK)
         # UPDATED: More specific locator for the "Configure this project" link inside the dropdown.
-        self.configure_project_link = self.locate('#dropdown a:has-text("Configure this project")')
-        self.remove_link = self.get_by_role("link", name="Remove")
-        self.confirm_yes_button = self.get_by_role("button", name="Yes")
+        self.configure_project_link = self.locate(ProjectLocators.CONFIGURE_PROJECT_LINK)
+        self.remove_link = self.get_by_role(*ProjectLocators.REMOVE_LINK)
+        self.confirm_yes_button = self.get_by_role(*ProjectLocators.CONFIRM_YES_BUTTON)
 
 
     def create_project(self, name: str):
@@ -38,21 +45,23 @@ class ProjectPage(BasePage):
         self.click_element(self.submit_button)
         # Verify that the page has navigated to the new project board
         expect(self.project_header_title).to_contain_text(name)
+        if self.resolver is not None:
+            self.resolver.invalidate(name=name)
 
     def add_task(self, title: str):
         """Navigates to the new task form and creates a task."""
-        add_task_button = self.add_task_link_to_ready.locator('.board-add-icon a')
+        add_task_button = self.add_task_link_to_ready.locator(ProjectLocators.ADD_TASK_ICON)
         # Use the click method from BasePage
         self.click_element(add_task_button)
         # Verify navigation to the new task page
-        expect(self.locate('h2')).to_contain_text("New task")
+        expect(self.locate(ProjectLocators.PAGE_HEADING)).to_contain_text("New task")
         self.write_on_element(self.task_title_input, title)
         # Fill in the description if needed
-        self.write_on_element(self.locate('textarea[placeholder="' + self.description_input_placeholder + '"]'), "This is a test task.")
+        self.write_on_element(self.locate(ProjectLocators.description_input()), "This is a test task.")
 
         self.click_element(self.submit_button)
         # Verify the task appears on the board
-        new_task_locator = self.locate(f'.task-board-title:has-text("{title}")')
+        new_task_locator = self.locate(ProjectLocators.task_title(title))
         expect(new_task_locator).to_be_visible()
 
     def navigate_to_task(self, task_name: str):
@@ -64,7 +73,7 @@ class ProjectPage(BasePage):
         """
         # This locator specifically targets the link within an element that has the task title.
         # This is more robust than a generic text selector.
-        task_link_locator = self.locate(f'.task-board-title:has-text("{task_name}") a')
+        task_link_locator = self.locate(ProjectLocators.task_link(task_name))
         self.click_element(task_link_locator)
         # Verify that we've landed on the correct task detail page.
 
@@ -73,6 +82,9 @@ class ProjectPage(BasePage):
         Deletes the current project by navigating through the UI menus and confirming.
         This implementation follows the user's specified click sequence.
         """
+        # Remember which project is being deleted so its cached ID can be invalidated afterwards.
+        project_id_match = re.search(r"/(?:board|project)/(\d+)", self.page.url)
+
         # First, click on settings to open the dropdown.
         self.click_element(self.settings_link)
 
@@ -86,5 +98,10 @@ class ProjectPage(BasePage):
         self.click_element(self.confirm_yes_button)
 
         # Verify that we are redirected back to the main project list.
-        self.page.wait_for_url("**/projects")
+        self.page.wait_for_url(ProjectLocators.PROJECT_LIST_URL)
+        if self.resolver is not None:
+            if project_id_match:
+                self.resolver.invalidate(project_id=int(project_id_match.group(1)))
+            else:
+                self.resolver.invalidate()
         self.logger.info("Successfully deleted project and confirmed redirect to the dashboard.")
@@ -1,5 +1,8 @@
+from typing import Optional
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.locators import TaskLocators
+from config.app_settings import AppSettings
 
 
 class TaskPage(BasePage):
@@ -7,26 +10,26 @@ class TaskPage(BasePage):
     Represents the task detail view and its associated actions with synchronous methods.
     """
 
-    def __init__(self, page: Page, base_url: str = "http://localhost:8080"):
+    def __init__(self, page: Page, base_url: Optional[str] = None):
         super().__init__(page)
-        self.base_url = base_url
+        self.base_url = base_url or AppSettings.get_app_root_url()
 
         # --- Locators based on the provided HTML ---
 
         # Main task view elements
-        self.task_summary_title = self.locate('#task-summary h2')
-        self.task_description = self.locate('details.accordion-section:has-text("Description") .markdown')
+        self.task_summary_title = self.locate(TaskLocators.TASK_SUMMARY_TITLE)
+        self.task_description = self.locate(TaskLocators.TASK_DESCRIPTION)
 
         # Sidebar action links
-        self.close_task_link = self.locate('.sidebar a[href*="/close"]')
-        self.remove_task_link = self.locate('.sidebar a[href*="/remove"]')
+        self.close_task_link = self.locate(TaskLocators.CLOSE_TASK_LINK)
+        self.remove_task_link = self.locate(TaskLocators.REMOVE_TASK_LINK)
 
         # Comment form elements
-        self.comment_textarea = self.locate('textarea[name="comment"]')
-        self.save_comment_button = self.locate('#comments .form-actions button[type="submit"]')
+        self.comment_textarea = self.locate(TaskLocators.COMMENT_TEXTAREA)
+        self.save_comment_button = self.locate(TaskLocators.SAVE_COMMENT_BUTTON)
 
         # Confirmation modal button (for closing or deleting)
-        self.confirm_button = self.locate('button#modal-confirm-button')
+        self.confirm_button = self.locate(TaskLocators.CONFIRM_BUTTON)
 
     def get_task_title(self) -> str:
         """Gets the task title from the task summary view."""
@@ -45,22 +48,24 @@ class TaskPage(BasePage):
         """
 
         #click the move task status link in the sidebar
-        move_task_status = self.page.get_by_role("link", name="Move position")
+        role, name = TaskLocators.MOVE_POSITION_LINK
+        move_task_status = self.page.get_by_role(role, name=name)
         self.click_element(move_task_status)
         #from dropdown menu, select "Done"
-        dropdown_menu = self.locate('select#form-columns')
-        dropdown_menu.select_option(value="Done")
+        dropdown_menu = self.locate(TaskLocators.COLUMNS_SELECT)
+        dropdown_menu.select_option(value=TaskLocators.DONE_COLUMN_NAME)
         #click the save button
-        save_button = self.locate('button[type="submit"]').nth(1)
+        save_button = self.locate(TaskLocators.SAVE_BUTTON).nth(TaskLocators.SAVE_BUTTON_INDEX)
         self.click_element(save_button)
         # Verify that the task is now in the Done column
-        expect(self.locate('div.task-summary-column')).to_contain_text("Done")
+        expect(self.locate(TaskLocators.TASK_SUMMARY_COLUMN)).to_contain_text(TaskLocators.DONE_COLUMN_NAME)
 
     def delete_task(self):
         """
         Deletes the current task from the sidebar actions.
         """
-        delete_task = self.page.get_by_role("link", name="Remove")
+        role, name = TaskLocators.REMOVE_LINK
+        delete_task = self.page.get_by_role(role, name=name)
 
         # Click the "Remove" link in the sidebar
         self.click_element(delete_task)
@@ -69,4 +74,4 @@ class TaskPage(BasePage):
         self.click_element(self.confirm_button)
 
         # After deleting, the user is returned to the board view.
-        expect(self.locate('#board')).to_be_visible()
+        expect(self.locate(TaskLocators.BOARD)).to_be_visible()
@@ -1,36 +1,272 @@
+import json
 import os
+import re
 import time
+import allure
+import allure_commons
 import pytest
-import psycopg2
-from playwright.sync_api import Page, Playwright, BrowserContext
+from playwright.sync_api import Page, BrowserContext
 from pages.login_page import LoginPage
 from config.app_settings import AppSettings
+from utils.artifacts import TraceRecorder, artifact_store
+from utils.async_browser import AsyncBrowserRunner
+from utils.benchmark import Benchmark
+from utils.browser_metrics import BrowserMetricsCollector, BrowserProfiler, benchmark_results
+from utils.context_pool import CONTEXT_SETUP_HISTORY_PATH, BrowserContextPool, ContextSetupStats
+from utils.db import DatabasePool, DatabaseNotReadyError
+from utils.data_registry import TestDataRegistry
+from utils.dataset_cache import DatasetCache
+from utils.db_snapshot import DatabaseSnapshots
+from utils.db_wait import DbStateAwaiter
+from utils.duration_scheduler import register as register_duration_scheduler
+from utils.explain import ExplainCollector
+from utils.http_auth import CredentialPool, http_login, write_storage_state
+from utils.kanboard_api import KanboardApiClient
+from utils.kanboard_standin import KanboardStandIn
+from utils.network_profile import ResourceBlocker
+from utils.perf_store import PerfStore, compare
+from utils.pg_stats import PgStatsCollector, PgStatsStepTracker
+from utils.project_resolver import ProjectResolver
+from utils.workers import get_worker_id, is_parallel_run, unique_name, worker_file_path
 
-AUTH_FILE = "auth.json"
+AUTH_DIR = os.path.join("temp", "auth")
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance baselines")
+    group.addoption("--perf-compare", action="store_true", default=False,
+                    help="Compare benchmarks with the stored baseline and fail on significant regressions.")
+    group.addoption("--perf-baseline", default=None, metavar="REVISION",
+                    help="Git revision to use as the baseline (default: the latest stored run).")
+    group.addoption("--perf-alpha", type=float, default=0.01,
+                    help="Significance level of the one-sided Mann-Whitney U test (default: 0.01).")
+    group.addoption("--perf-min-slowdown", type=float, default=0.05,
+                    help="Smallest relative slowdown of the median that counts as a regression (default: 0.05).")
+    group.addoption("--browser-profile", default=None, metavar="TEST_ID",
+                    help="Profile the browser during tests whose node ID contains TEST_ID (Chromium only).")
+    group.addoption("--browser-profile-kind", choices=("trace", "cpu"), default="trace",
+                    help="'trace' records a DevTools performance trace, 'cpu' a JavaScript CPU profile.")
+
+def pytest_configure(config):
+    # Records test durations and, under pytest -n, hands tests out longest-first (utils/duration_scheduler.py).
+    register_duration_scheduler(config)
+
+@pytest.fixture(scope="session", autouse=True)
+def kanboard_standin():
+    """
+    With KANBOARD_STANDIN=true, starts the local SQLite-backed Kanboard stand-in (utils/kanboard_standin.py)
+    for the session, one per pytest-xdist worker, and points BASE_URL, API_URL and db_pool at it.
+    Yields None when the session runs against the real application.
+    Defined first so that it is set up before every other session fixture reads the settings it changes.
+    """
+    if not AppSettings.is_kanboard_standin_enabled():
+        yield None
+        return
+    start = time.perf_counter()
+    standin = KanboardStandIn.from_settings().start()
+    standin.apply_settings()
+    print(f"\nKanboard stand-in listening on {standin.base_url} (started in {time.perf_counter() - start:.3f}s)")
+    yield standin
+    standin.stop()
+
+@pytest.fixture(scope="session")
+def db_pool(kanboard_standin):
+    """
+    Creates a session-wide, thread-safe PostgreSQL connection pool.
+    The DSN and pool size come from AppSettings, and the fixture waits for the database with
+    exponential backoff before handing the pool out. Under pytest-xdist every worker is its own
+    session, so each worker gets its own pool, tagged with the worker ID in pg_stat_activity.
+    With KANBOARD_STANDIN=true it is the stand-in's SQLite pool instead.
+    """
+    if kanboard_standin is not None:
+        yield kanboard_standin.db_pool
+        return
+    pool = DatabasePool(application_name=f"kanboard-tests-{get_worker_id()}")
+    try:
+        pool.wait_until_ready()
+    except DatabaseNotReadyError as e:
+        pytest.fail(str(e))
+    print("\nDatabase connection pool ready.")
+    yield pool
+    pool.close()
+    print("\nDatabase connection pool closed.")
 
 @pytest.fixture(scope="session")
-def db_connection():
+def wait_for_db_condition(db_pool, kanboard_standin):
+    """
+    Returns a callable that waits until a query's first row satisfies a predicate and returns a DbWaitResult, e.g.
+    wait_for_db_condition("SELECT column_id FROM tasks WHERE id = %s", (task_id,), lambda row: row[0] == done_id).
+    It is woken by LISTEN/NOTIFY triggers installed for the session (DB_WAIT_NOTIFY) and otherwise polls with
+    exponential backoff; after DB_WAIT_TIMEOUT seconds it fails the test with the last row and the changes it saw.
+    """
+    awaiter = DbStateAwaiter.from_settings(
+        connection_factory=kanboard_standin.db_pool.connect if kanboard_standin is not None else None).start()
+    yield awaiter.wait_for
+    awaiter.close()
+
+@pytest.fixture(scope="session")
+def explain_collector():
+    """
+    Provides the session's query plan collector, or None unless EXPLAIN_CAPTURE=true.
+    Every captured plan is attached to the current Allure step as a text tree and as JSON.
+    """
+    def attach(capture):
+        allure.attach(capture.summary(), name=f"EXPLAIN: {capture.short_query}",
+                      attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(capture.as_dict(), indent=2), name=f"EXPLAIN JSON: {capture.short_query}",
+                      attachment_type=allure.attachment_type.JSON)
+
+    return ExplainCollector.from_settings(on_capture=attach)
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_explain_capture(explain_collector):
+    """Lets every test capture the plans of its own statements."""
+    if explain_collector is not None:
+        explain_collector.reset()
+
+def _attach_pg_stats(diff, title):
+    allure.attach(diff.summary(top=AppSettings.get_pg_stats_top()), name=f"Query Statistics: {title}",
+                  attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps(diff.as_dict(), indent=2), name=f"Query Statistics JSON: {title}",
+                  attachment_type=allure.attachment_type.JSON)
+
+@pytest.fixture(scope="session")
+def pg_stats_collector(db_pool):
+    """
+    Provides the server-side query statistics collector (pg_stat_statements and table statistics).
+    With PG_STATS=step it also diffs the statistics around every Allure step and attaches the report to the step.
+    """
+    collector = PgStatsCollector.from_settings(db_pool)
+    tracker = None
+    if AppSettings.get_pg_stats_mode() == "step":
+        tracker = PgStatsStepTracker(collector, attach=_attach_pg_stats)
+        allure_commons.plugin_manager.register(tracker)
+    yield collector
+    if tracker is not None:
+        allure_commons.plugin_manager.unregister(tracker)
+
+@pytest.fixture(scope="function", autouse=True)
+def _pg_stats_per_test(request):
+    """
+    With PG_STATS=test or step, marks tests that use the database for a query statistics diff around their body
+    (see pytest_runtest_call). Tests without database fixtures never open a connection for it.
+    """
+    if AppSettings.get_pg_stats_mode() != "off" and "db_pool" in request.fixturenames:
+        request.node.pg_stats_collector = request.getfixturevalue("pg_stats_collector")
+
+@pytest.fixture(scope="function")
+def db_connection(db_pool, explain_collector):
     """
-    Creates and manages a standard synchronous connection to the PostgreSQL database.
-    Includes a retry mechanism to handle race conditions during startup.
+    Provides a pooled, read-only connection in autocommit mode for database assertions.
+    Every query sees the latest committed data, so tests never need to call commit().
+    Writes go through db_pool.transaction() instead.
+    With EXPLAIN_CAPTURE=true its cursors explain every distinct SELECT once per test.
+    The connection is borrowed per test, so a snapshot restore between tests never leaves it dead.
     """
-    conn = None
-    last_exception = None
-    for _ in range(15):
-        try:
-            conn = psycopg2.connect(
-                dsn="dbname=kanboard user=kanboard password=kanboard123 host=localhost port=5432"
-            )
-            print("\nSynchronous database connection successful.")
-            yield conn
-            conn.close()
-            print("\nDatabase connection closed.")
-            return
-        except psycopg2.OperationalError as e:
-            print(f"\nDatabase connection attempt failed: {e}. Retrying in 2 seconds...")
-            last_exception = e
-            time.sleep(2)
-    pytest.fail(f"Database connection failed after multiple retries: {last_exception}")
+    conn = db_pool.acquire(readonly=True)
+    default_cursor_factory = conn.cursor_factory
+    if explain_collector is not None:
+        conn.cursor_factory = explain_collector.cursor_factory
+    yield conn
+    conn.cursor_factory = default_cursor_factory
+    db_pool.release(conn)
+
+@pytest.fixture(scope="session")
+def db_snapshots(db_pool, project_resolver, kanboard_standin):
+    """
+    Provides the template-database snapshot manager (see utils/db_snapshot.py), e.g. to freeze a seeded state
+    with db_snapshots.ensure("baseline", seed). Restores clear the project resolver's cache.
+    Snapshots are PostgreSQL templates, so tests that need them are skipped against the stand-in.
+    """
+    if kanboard_standin is not None:
+        pytest.skip("Database snapshots need PostgreSQL and are not available with KANBOARD_STANDIN=true")
+    snapshots = DatabaseSnapshots.from_settings(db_pool)
+    snapshots.on_restore.append(project_resolver.invalidate)
+    return snapshots
+
+@pytest.fixture(scope="session")
+def _restored_snapshots():
+    """Remembers which snapshot each module was last restored from, for db_snapshot(per="module")."""
+    return {}
+
+@pytest.fixture(scope="function", autouse=True)
+def _restore_db_snapshot(request, _restored_snapshots):
+    """
+    Recreates the working database from the snapshot named by `@pytest.mark.db_snapshot("name")` before the
+    test, or only before the module's first such test with per="module". Create the snapshot beforehand with
+    `python -m utils.db_snapshot create name`. A restore replaces the whole database, so it refuses to run
+    under pytest-xdist, where other workers' data would vanish mid-test.
+    """
+    marker = request.node.get_closest_marker("db_snapshot")
+    if marker is None:
+        return
+    name = marker.args[0] if marker.args else marker.kwargs.get("name", "baseline")
+    per = marker.kwargs.get("per", "test")
+    if per not in ("test", "module"):
+        pytest.fail(f"db_snapshot per='{per}' is not supported; use 'test' or 'module'.")
+    if is_parallel_run():
+        pytest.fail("db_snapshot restores the whole database and cannot run under pytest-xdist; "
+                    "run the marked tests with a single worker (-p no:xdist or -n 0).")
+    module = request.node.module.__name__
+    if per == "module" and _restored_snapshots.get(module) == name:
+        return
+    snapshots = request.getfixturevalue("db_snapshots")
+    if not snapshots.exists(name):
+        pytest.fail(f"Database snapshot '{name}' does not exist; create it with "
+                    f"`python -m utils.db_snapshot create {name}`.")
+    with allure.step(f"SETUP: Restore database snapshot '{name}'"):
+        elapsed = snapshots.restore(name)
+    _restored_snapshots[module] = name
+    print(f"\nRestored database snapshot '{name}' in {elapsed:.3f}s")
+
+@pytest.fixture(scope="session")
+def test_data_registry(request):
+    """
+    Records the projects and tasks the session creates and removes them all in one pass when it ends:
+    set-based SQL with TEST_DATA_CLEANUP=db (the default), batched JSON-RPC calls with 'api', nothing with 'off'.
+    """
+    registry = TestDataRegistry()
+    mode = AppSettings.get_test_data_cleanup()
+    db_pool = request.getfixturevalue("db_pool") if mode == "db" else None
+    yield registry
+    if mode == "off" or not len(registry):
+        return
+    if mode == "db":
+        report = registry.purge(db_pool)
+    else:
+        with KanboardApiClient() as client:
+            report = registry.purge_via_api(client)
+    print(f"\nTest data cleanup: {report.summary()}")
+
+@pytest.fixture(scope="session")
+def dataset_cache(db_pool):
+    """
+    Provides the cache of seeded datasets that are kept across runs (see utils/dataset_cache.py).
+    At the end of the session, datasets past DATASET_CACHE_MAX_AGE_HOURS or DATASET_CACHE_MAX_ROWS are evicted.
+    """
+    cache = DatasetCache.from_settings(db_pool)
+    yield cache
+    evicted = cache.evict()
+    if evicted:
+        print(f"\nDataset cache: evicted {evicted} datasets.")
+
+@pytest.fixture(scope="session")
+def kanboard_api(test_data_registry):
+    """
+    Provides a session-wide JSON-RPC client for seeding test data.
+    The client keeps a single keep-alive HTTP session open for the whole test session,
+    and registers what it creates for removal at the end of the session.
+    """
+    client = KanboardApiClient(registry=test_data_registry)
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def project_resolver(db_pool):
+    """
+    Provides a session-wide project name -> ID resolver backed by the database.
+    Page objects use it to open boards directly instead of paging through the dashboard.
+    """
+    return ProjectResolver.from_db(db_pool)
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args():
@@ -45,36 +281,295 @@ def browser_type_launch_args():
     return options
 
 @pytest.fixture(scope="session")
-def authenticated_state_fixture(playwright: Playwright):
+def authenticated_state_fixture(request):
     """
-    A session-scoped fixture that logs in ONCE via the UI.
+    A session-scoped fixture that logs in ONCE as ADMIN_USER.
+    With AUTH_MODE=http (the default) it posts the login form over plain HTTP, without launching a browser;
+    with AUTH_MODE=ui it logs in through the login page in a throwaway Chromium.
     It saves the authentication state to a file and yields the path to that file.
+    The file is private to the current pytest-xdist worker, so parallel workers never
+    share, overwrite or delete each other's state.
+    """
+    auth_file = worker_file_path(AUTH_DIR, "auth", "json")
+    if not os.path.exists(auth_file):
+        start = time.perf_counter()
+        if AppSettings.get_auth_mode() == "http":
+            print(f"\nPerforming one-time HTTP login for worker '{get_worker_id()}'...")
+            write_storage_state(http_login(AppSettings.ADMIN_USER, AppSettings.ADMIN_PASSWORD), auth_file)
+        else:
+            print(f"\nPerforming one-time UI login for worker '{get_worker_id()}'...")
+            browser = request.getfixturevalue("playwright").chromium.launch()
+            page = browser.new_page()
+            login_page = LoginPage(page)
+            login_page.navigate()
+            login_page.login(AppSettings.ADMIN_USER, AppSettings.ADMIN_PASSWORD)
+            login_page.verify_login_successful()
+            page.context.storage_state(path=auth_file)
+            browser.close()
+        print(f"Authentication state saved to {auth_file} in {time.perf_counter() - start:.3f}s")
+
+    yield auth_file
+
+    if os.path.exists(auth_file):
+        os.remove(auth_file)
+        print(f"\nSession finished. Cleaned up and removed {auth_file}.")
+
+@pytest.fixture(scope="session")
+def credential_pool(kanboard_api):
+    """
+    Provides this worker's pool of TEST_USER_COUNT test users, created in one JSON-RPC batch on first use and
+    kept for later runs, or None while TEST_USER_COUNT is 0. Hand out pool.credential(i) per virtual user,
+    or pool.storage_state(i) for a browser context already logged in as that user.
+    """
+    if AppSettings.get_test_user_count() == 0:
+        yield None
+        return
+    pool = CredentialPool.from_settings(kanboard_api).ensure()
+    yield pool
+    pool.cleanup()
+
+@pytest.fixture(scope="session")
+def project_name_factory(test_data_registry):
+    """
+    Returns a callable that builds unique, worker-tagged project names,
+    e.g. project_name_factory("Test Project") -> "Test Project gw0 <uuid>".
+    Every name is registered, so the project is removed at the end of the session however it was created.
     """
-    if not os.path.exists(AUTH_FILE):
-        print("\nPerforming one-time UI login for the session...")
-        browser = playwright.chromium.launch()
-        page = browser.new_page()
-        login_page = LoginPage(page)
-        login_page.navigate()
-        login_page.login(AppSettings.ADMIN_USER, AppSettings.ADMIN_PASSWORD)
-        login_page.verify_login_successful()
-        page.context.storage_state(path=AUTH_FILE)
-        print(f"Authentication state saved to {AUTH_FILE}")
-        browser.close()
+    return lambda prefix: test_data_registry.project_name(unique_name(prefix))
 
-    yield AUTH_FILE
+@pytest.fixture(scope="session")
+def perf_store():
+    """Opens the persistent benchmark results store (PERF_STORE_PATH) for the session."""
+    store = PerfStore()
+    yield store
+    store.close()
 
-    if os.path.exists(AUTH_FILE):
-        os.remove(AUTH_FILE)
-        print(f"\nSession finished. Cleaned up and removed {AUTH_FILE}.")
+@pytest.fixture(scope="session")
+def browser_metrics_records(perf_store):
+    """
+    Collects the browser metrics of every test in the session. They are recorded in the results store when the
+    session ends, one run per action and metric holding all of the session's samples.
+    """
+    records = []
+    yield records
+    for result in benchmark_results(records):
+        perf_store.record(result)
 
 @pytest.fixture(scope="function")
-def admin_page_fixture(browser, authenticated_state_fixture) -> Page:
+def benchmark_runner(request, perf_store):
+    """
+    Returns a callable that benchmarks a function with utils.benchmark.Benchmark and attaches the
+    statistics and raw samples to the Allure report as JSON, e.g.
+    benchmark_runner("fetch tasks", lambda: fetch(project_id), size=50) -> BenchmarkResult.
+    Rounds and warm-up rounds default to BENCHMARK_ROUNDS and BENCHMARK_WARMUP_ROUNDS.
+
+    Every result is recorded in the results store. With --perf-compare it is first compared with the pooled
+    baseline of the latest accepted runs of the same benchmark, dataset size and environment, and the test fails
+    on a significant regression. A regressed run is stored as rejected, so it never becomes part of a baseline.
+    """
+    config = request.config
+
+    def run(name, func, size=None, **options):
+        options.setdefault("rounds", AppSettings.get_benchmark_rounds())
+        options.setdefault("warmup_rounds", AppSettings.get_benchmark_warmup_rounds())
+        result = Benchmark(name, **options).run(func)
+        allure.attach(json.dumps(result.as_dict(), indent=2), name=f"Benchmark: {name}",
+                      attachment_type=allure.attachment_type.JSON)
+        print(f"\n{result.summary()}")
+
+        comparison = None
+        if config.getoption("--perf-compare"):
+            baseline = perf_store.baseline(name, size, git_revision=config.getoption("--perf-baseline"))
+            if baseline is None:
+                print(f"No stored baseline for '{name}' (size {size}); this run becomes the baseline.")
+            else:
+                comparison = compare(result, baseline, alpha=config.getoption("--perf-alpha"),
+                                     min_slowdown=config.getoption("--perf-min-slowdown"))
+                allure.attach(json.dumps(comparison.baseline.as_dict(), indent=2), name=f"Baseline: {name}",
+                              attachment_type=allure.attachment_type.JSON)
+                print(comparison.summary())
+        perf_store.record(result, dataset_size=size, accepted=comparison is None or not comparison.regression)
+
+        if comparison is not None and comparison.regression:
+            pytest.fail(f"Performance regression in '{name}': {comparison.summary()}")
+        return result
+    return run
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Stores each phase's report on the test item (item.rep_setup, item.rep_call, ...) for fixtures to inspect."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Diffs the server's query statistics around the test body of tests marked by _pg_stats_per_test."""
+    collector = getattr(item, "pg_stats_collector", None)
+    before = collector.snapshot() if collector is not None else None
+    yield
+    if before is not None:
+        _attach_pg_stats(collector.diff(before), item.name)
+
+def _test_failed(request) -> bool:
+    reports = (getattr(request.node, "rep_setup", None), getattr(request.node, "rep_call", None))
+    return any(report is not None and report.failed for report in reports)
+
+@pytest.fixture(scope="session")
+def async_browser():
+    """
+    Provides an AsyncBrowserRunner: an async Playwright browser on its own event loop thread.
+    Tests build coroutines with the page objects in pages.async_pages and pass them to
+    async_browser.run() or async_browser.run_concurrently() to drive many pages at once.
+    """
+    runner = AsyncBrowserRunner(headless=AppSettings.is_headless(), slow_mo=AppSettings.get_slow_mo()).start()
+    yield runner
+    runner.stop()
+
+@pytest.fixture(scope="session")
+def context_setup_stats():
+    """
+    Collects per-test browser context setup and teardown times and prints a fresh-vs-pooled comparison at the
+    end of the session. The per-mode totals are kept in temp/context_setup.json, so a session in one mode is
+    compared with earlier sessions in the other.
+    """
+    stats = ContextSetupStats(history_path=CONTEXT_SETUP_HISTORY_PATH)
+    yield stats
+    print(f"\n{stats.summary()}")
+    stats.save()
+
+@pytest.fixture(scope="session")
+def resource_blocker():
+    """
+    Provides the routing layer of the 'lean' network profile (None for the 'full' profile)
+    and prints how many requests and bytes it avoided at the end of the session.
+    """
+    blocker = ResourceBlocker.from_settings()
+    yield blocker
+    if blocker is not None:
+        print(f"\n{blocker.totals.summary()}")
+
+def _setup_context(context, resource_blocker):
+    """
+    Applies the per-context layers: the lean network profile, the browser metrics script and, unless
+    TRACE_MODE=off, Playwright tracing (chunked per test by admin_page_fixture).
+    """
+    if resource_blocker is not None:
+        resource_blocker.apply(context)
+    if AppSettings.is_browser_metrics_enabled():
+        BrowserMetricsCollector.install(context)
+    if AppSettings.get_trace_mode() != "off":
+        TraceRecorder.start_tracing(context, screenshots=AppSettings.is_trace_screenshots_enabled())
+
+@pytest.fixture(scope="session")
+def failure_artifacts():
+    """
+    Provides the artifact store that writes failure traces and screenshots under ARTIFACT_DIR on a background
+    thread, within ARTIFACT_MAX_MB. Pending artifacts are written when the session ends.
+    """
+    store = artifact_store()
+    yield store
+    store.close()
+    if store.written:
+        print(f"\n{store.summary()}")
+
+def _save_failure_artifacts(request, page, trace, store):
+    """Attaches the failed test's trace and a final screenshot to Allure and queues them for the artifact store."""
+    name = re.sub(r"[^\w.-]", "_", request.node.name)
+    trace_path = trace.stop(keep=True) if trace is not None else None
+    if trace_path is not None:
+        allure.attach.file(trace_path, name="Playwright Trace", extension="zip")
+        store.save_file(os.path.join("traces", f"{name}.zip"), trace_path, recompress=True)
+    try:
+        png = page.screenshot()
+    except Exception as e:
+        print(f"\nCould not capture the failure screenshot: {e}")
+        return
+    allure.attach(png, name="Failure Screenshot", attachment_type=allure.attachment_type.PNG)
+    store.save_bytes(os.path.join("screenshots", f"{name}.png"), png)
+
+def _start_profiler(request, browser, context, page):
+    """Starts a browser profile when --browser-profile selects the current test; returns the profiler or None."""
+    selected = request.config.getoption("--browser-profile")
+    if not selected or selected not in request.node.nodeid:
+        return None
+    if browser.browser_type.name != "chromium":
+        print(f"\nBrowser profiling needs Chromium; skipped for {browser.browser_type.name}.")
+        return None
+    profiler = BrowserProfiler(browser, context, page, kind=request.config.getoption("--browser-profile-kind"))
+    profiler.start(request.node.name)
+    return profiler
+
+@pytest.fixture(scope="session")
+def context_pool(browser, authenticated_state_fixture, resource_blocker, context_setup_stats):
+    """
+    A session-scoped pool of warm, authenticated browser contexts (one pool per xdist worker).
+    Only used when CONTEXT_POOL is enabled. Its warm-up time counts towards the pooled setup cost.
+    """
+    pool = BrowserContextPool(browser, authenticated_state_fixture, size=AppSettings.get_context_pool_size(),
+                              context_setup=lambda context: _setup_context(context, resource_blocker))
+    context_setup_stats.record_warm_up(pool.warm_up())
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="function")
+def admin_page_fixture(request, browser, authenticated_state_fixture, context_setup_stats, resource_blocker,
+                       failure_artifacts) -> Page:
     """
     A function-scoped fixture that provides a fresh, authenticated page for each test.
+    With CONTEXT_POOL=true the page comes from a pool of warm contexts that are reset between tests;
+    a context used by a failed test is discarded, so the next test falls back to a fresh context.
+    With NETWORK_PROFILE=lean unneeded resources are blocked and the avoided requests are attached to the report.
+    With BROWSER_METRICS=true every page object navigation records client-side timings, which are attached to
+    the report and stored in the benchmark results store; --browser-profile records a trace or CPU profile.
+    Unless TRACE_MODE=off, a Playwright trace chunk is recorded for the test and kept only if the test fails;
+    a failed test's trace and final screenshot are attached to the report and written to ARTIFACT_DIR.
     """
-    context: BrowserContext = browser.new_context(storage_state=authenticated_state_fixture)
-    page = context.new_page()
+    pooled_mode = AppSettings.is_context_pool_enabled()
+    if resource_blocker is not None:
+        resource_blocker.begin()
+    start_time = time.perf_counter()
+    if pooled_mode:
+        pool: BrowserContextPool = request.getfixturevalue("context_pool")
+        context, page, _ = pool.acquire()
+    else:
+        context: BrowserContext = browser.new_context(storage_state=authenticated_state_fixture)
+        _setup_context(context, resource_blocker)
+        page = context.new_page()
     page.goto(AppSettings.get_base_url())
+    setup_time = time.perf_counter() - start_time
+    metrics = None
+    if AppSettings.is_browser_metrics_enabled():
+        metrics_records = request.getfixturevalue("browser_metrics_records")
+        metrics = BrowserMetricsCollector()
+        metrics.register(page)
+    profiler = _start_profiler(request, browser, context, page)
+    trace = TraceRecorder(context, request.node.name).start() if AppSettings.get_trace_mode() != "off" else None
+
     yield page
-    context.close()
\ No newline at end of file
+
+    if _test_failed(request):
+        _save_failure_artifacts(request, page, trace, failure_artifacts)
+    elif trace is not None:
+        trace.stop(keep=False)
+
+    if profiler is not None:
+        profile_path = profiler.stop()
+        allure.attach.file(profile_path, name=f"Browser Profile ({profiler.kind})",
+                           extension=os.path.splitext(profile_path)[1].lstrip("."))
+    if metrics is not None:
+        metrics.unregister(page)
+        allure.attach(json.dumps(metrics.as_dict(), indent=2), name="Browser Performance Metrics",
+                      attachment_type=allure.attachment_type.JSON)
+        metrics_records.extend(metrics.records)
+
+    start_time = time.perf_counter()
+    if pooled_mode:
+        pool.release(context, page, discard=_test_failed(request))
+    else:
+        context.close()
+    context_setup_stats.record(setup_time + time.perf_counter() - start_time, pooled=pooled_mode)
+    if resource_blocker is not None:
+        network_stats = resource_blocker.end()
+        allure.attach(json.dumps(network_stats.as_dict(), indent=2), name="Blocked Network Requests",
+                      attachment_type=allure.attachment_type.JSON)
@@ -0,0 +1,115 @@
+import json
+import os
+import zipfile
+
+import allure
+
+from pages.dashboard_page import DashboardPage
+from utils.artifacts import ArtifactStore, TraceRecorder
+from utils.workers import get_worker_id
+
+NAVIGATION_ROUNDS = 10  # Timed dashboard navigations per tracing mode
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Failure Artifacts")
+class TestArtifactStore:
+    """
+    Offline tests for the background artifact writer: queued writes, trace re-compression and the disk cap.
+    """
+
+    @allure.title("Artifacts are written on the background thread at the returned paths")
+    def test_background_write(self, tmp_path):
+        store = ArtifactStore(str(tmp_path), max_bytes=1024 ** 2)
+
+        path = store.save_bytes(os.path.join("screenshots", "page.png"), b"png-bytes")
+        store.flush()
+
+        with open(path, "rb") as f:
+            assert f.read() == b"png-bytes"
+        # Under pytest-xdist the file name carries the worker ID.
+        assert os.path.dirname(path) == os.path.join(str(tmp_path), "screenshots")
+        assert os.path.basename(path) in ("page.png", f"{get_worker_id()}_page.png")
+        store.close()
+        assert store.written == 1 and store.evicted == 0
+
+    @allure.title("Trace archives are moved into the store and re-compressed")
+    def test_recompressed_trace(self, tmp_path):
+        source = str(tmp_path / "chunk.zip")
+        with zipfile.ZipFile(source, "w", zipfile.ZIP_STORED) as trace:
+            trace.writestr("trace.trace", "event\n" * 10000)
+        store = ArtifactStore(str(tmp_path / "artifacts"), max_bytes=1024 ** 2)
+
+        path = store.save_file(os.path.join("traces", "test.zip"), source, recompress=True)
+        store.close()
+
+        assert not os.path.exists(source), "Expected the temporary trace to be moved."
+        assert os.path.getsize(path) < len("event\n" * 10000) // 10
+        with zipfile.ZipFile(path) as trace:
+            assert trace.read("trace.trace") == b"event\n" * 10000
+
+    @allure.title("The oldest artifacts are removed once the directory exceeds its cap")
+    def test_disk_cap(self, tmp_path):
+        store = ArtifactStore(str(tmp_path), max_bytes=2500)
+
+        paths = [store.save_bytes(f"artifact_{index}.bin", b"x" * 1000) for index in range(4)]
+        store.close()
+
+        assert [os.path.exists(path) for path in paths] == [False, False, True, True]
+        assert store.evicted == 2
+        assert sum(os.path.getsize(path) for path in paths[2:]) <= 2500
+
+    @allure.title("A store without a cap, as used for explicit screenshots, never removes files")
+    def test_uncapped_store(self, tmp_path):
+        store = ArtifactStore(str(tmp_path), max_bytes=None)
+
+        paths = [store.save_bytes(f"screenshot_{index}.png", b"x" * 1000) for index in range(4)]
+        store.close()
+
+        assert all(os.path.exists(path) for path in paths) and store.evicted == 0
+        assert "no cap" in store.summary()
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Failure Artifacts")
+class TestTraceOverhead:
+    """
+    Measures what recording a trace chunk costs a passing test.
+    """
+
+    @allure.title("Dashboard navigation without tracing, with the default trace and with the screencast")
+    @allure.description(
+        "Benchmarks DashboardPage.navigate in a context without tracing, one recording DOM snapshots and sources "
+        "(TRACE_MODE=failure) and one that also records the screencast (TRACE_SCREENSHOTS=true). Each timed round "
+        "runs inside a trace chunk that is dropped, as for a passing test. The change of the median against the "
+        "untraced context is attached."
+    )
+    def test_tracing_overhead(self, browser, authenticated_state_fixture, benchmark_runner):
+        results = {}
+        for mode, screenshots in (("off", None), ("default", False), ("screencast", True)):
+            with allure.step(f"Benchmark dashboard navigation with tracing {mode}"):
+                context = browser.new_context(storage_state=authenticated_state_fixture)
+                if screenshots is not None:
+                    TraceRecorder.start_tracing(context, screenshots=screenshots)
+                dashboard_page = DashboardPage(context.new_page())
+
+                def navigate():
+                    trace = TraceRecorder(context, "overhead").start() if screenshots is not None else None
+                    dashboard_page.navigate()
+                    if trace is not None:
+                        trace.stop(keep=False)
+
+                try:
+                    results[mode] = benchmark_runner(f"Dashboard navigation (tracing {mode})", navigate,
+                                                     rounds=NAVIGATION_ROUNDS, warmup_rounds=1, iterations=1)
+                finally:
+                    context.close()
+
+        overhead = {mode: results[mode].median / results["off"].median - 1 for mode in ("default", "screencast")}
+        allure.attach(json.dumps({"median_change": overhead,
+                                  **{mode: result.as_dict() for mode, result in results.items()}}, indent=2),
+                      name="Tracing Overhead", attachment_type=allure.attachment_type.JSON)
+        print(f"\nTracing overhead per navigation: default {overhead['default']:+.1%}, "
+              f"screencast {overhead['screencast']:+.1%}")
@@ -0,0 +1,88 @@
+import allure
+
+from utils.benchmark import Benchmark, BenchmarkResult
+from utils.perf_store import PerfStore, compare, format_trends
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Benchmark Harness")
+class TestBenchmarkHarness:
+    """
+    Offline tests for the benchmark harness statistics; no application is needed.
+    """
+
+    @allure.title("Statistics, confidence intervals and outliers of known samples")
+    def test_statistics(self):
+        samples_ns = [1_000_000 + i * 1_000 for i in range(29)] + [50_000_000]  # 1.000-1.028ms plus one 50ms spike
+        result = BenchmarkResult("known samples", samples_ns, iterations=1, warmup_rounds=0)
+
+        assert result.min == 0.001 and result.max == 0.05
+        assert abs(result.median - 0.0010145) < 1e-9
+        assert result.p95 > result.median and result.p99 > result.p95
+        low, high = result.median_ci95()
+        assert low <= result.median <= high
+        assert result.iqr_outliers() == [0.05] and result.mad_outliers() == [0.05]
+        assert result.as_dict()["outliers"] == {"iqr": 1, "mad": 1}
+
+    @allure.title("Warm-up rounds, fixed iterations and the last result")
+    def test_run_counts_calls(self):
+        calls = []
+        result = Benchmark("append", rounds=5, warmup_rounds=2, iterations=3).run(lambda: calls.append(1) or len(calls))
+
+        assert len(calls) == 2 + 5 * 3
+        assert result.rounds == 5 and result.iterations == 3
+        assert result.last_result == len(calls)
+
+    @allure.title("Calibration raises the iterations until a round reaches the minimum round time")
+    def test_calibration(self):
+        benchmark = Benchmark("noop", rounds=3, warmup_rounds=0, min_round_time=0.001)
+
+        iterations = benchmark.calibrate(lambda: None)
+
+        assert iterations > 1 and iterations & (iterations - 1) == 0, "Expected a power of two above one."
+
+    @allure.title("Stored baselines: a 30% slower run is a regression, an equal run is not")
+    def test_baseline_store_and_regression_gate(self, tmp_path):
+        baseline_ns = [1_000_000 + (i % 10) * 10_000 for i in range(30)]
+        store = PerfStore(str(tmp_path / "results.sqlite"))
+        try:
+            store.record(BenchmarkResult("query", baseline_ns, iterations=1, warmup_rounds=0), dataset_size=50)
+            baseline = store.baseline("query", 50)
+
+            assert baseline is not None and store.baseline("query", 100) is None
+            slower = BenchmarkResult("query", [sample * 1.3 for sample in baseline_ns], iterations=1, warmup_rounds=0)
+            equal = BenchmarkResult("query", list(reversed(baseline_ns)), iterations=1, warmup_rounds=0)
+            assert compare(slower, baseline).regression
+            assert not compare(equal, baseline).regression
+            assert [run.benchmark for run in store.history("query")] == ["query"]
+        finally:
+            store.close()
+
+    @allure.title("Rejected runs never join the baseline, and a slowdown spread over several runs is still caught")
+    def test_baseline_does_not_ratchet(self, tmp_path):
+        baseline_ns = [1_000_000 + (i % 10) * 10_000 for i in range(30)]
+
+        def run(factor):
+            return BenchmarkResult("query", [sample * factor for sample in baseline_ns], iterations=1, warmup_rounds=0)
+
+        store = PerfStore(str(tmp_path / "results.sqlite"))
+        try:
+            store.record(run(1.0))
+            store.record(run(1.3), accepted=False)
+            assert compare(run(1.3), store.baseline("query")).regression, "Expected the rejected run to stay out."
+
+            for factor in (1.04, 1.08, 1.12, 1.16):
+                store.record(run(factor))
+            latest_only = store.baseline("query", runs=1)
+            pooled = store.baseline("query", runs=5)
+            assert not compare(run(1.2), latest_only).regression
+            assert compare(run(1.2), pooled).regression
+            assert len(pooled.runs) == 5 and len(pooled.samples) == 5 * len(baseline_ns)
+            history = store.history("query")
+            assert [run.accepted for run in history] == [True, False, True, True, True, True]
+            trends = format_trends(history).splitlines()
+            assert "rejected  query" in trends[2] and "+30.0%" in trends[2]
+            assert "+4.0%" in trends[3], "Expected the change to skip the rejected run."
+        finally:
+            store.close()
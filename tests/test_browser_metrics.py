@@ -0,0 +1,73 @@
+import allure
+import pytest
+
+from utils.browser_metrics import BrowserMetricsCollector, benchmark_results
+
+RAW_METRICS = {
+    "url": "http://localhost:8080/board/42", "timeOrigin": 2000.0, "ttfb": 35.0, "domContentLoaded": 120.0,
+    "load": 180.5, "fcp": 140.0, "lcp": None, "cls": 0.01, "longTasks": 1, "longTaskTime": 62.0,
+    "resources": 14, "transferBytes": 52000, "slowestResources": [],
+}
+
+
+class FakePage:
+    """Answers the two evaluate() calls the collector makes, as a page whose document changes on navigation."""
+
+    def __init__(self, time_origin):
+        self.time_origin = time_origin
+        self.load_waits = 0
+
+    def wait_for_load_state(self, state):
+        self.load_waits += 1
+
+    def evaluate(self, expression):
+        if expression == "performance.timeOrigin":
+            return self.time_origin
+        return dict(RAW_METRICS, timeOrigin=self.time_origin)
+
+
+def _record(action, load_ms, lcp_ms=None):
+    return {"action": action, "ttfb_ms": None, "dom_content_loaded_ms": None, "load_ms": load_ms, "fcp_ms": None,
+            "lcp_ms": lcp_ms, "long_task_ms": None}
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Browser Performance Metrics")
+class TestBrowserMetrics:
+    """
+    Offline tests of navigation detection and of the results derived from canned metric records.
+    """
+
+    @allure.title("Metrics are collected only when a click loaded a new document")
+    def test_collect_if_navigated(self):
+        collector = BrowserMetricsCollector()
+        page = FakePage(time_origin=1000.0)
+
+        assert collector.collect_if_navigated(page, previous_origin=1000.0, action="ProjectPage click") is None
+        assert collector.collect_if_navigated(page, previous_origin=None, action="ProjectPage click") is None
+        assert page.load_waits == 0 and collector.records == []
+
+        page.time_origin = 2000.0
+        record = collector.collect_if_navigated(page, previous_origin=1000.0, action="ProjectPage click")
+
+        assert record["action"] == "ProjectPage click /board/{id}"
+        assert (record["load_ms"], record["lcp_ms"], record["long_task_ms"]) == (180.5, None, 62.0)
+        assert page.load_waits == 1 and collector.records == [record]
+
+    @allure.title("Records are pooled into one result per action and timed metric, skipping missing metrics")
+    def test_benchmark_results(self):
+        records = [_record("DashboardPage navigate /dashboard", 100.0, lcp_ms=150.0),
+                   _record("DashboardPage navigate /dashboard", 300.0),
+                   _record("ProjectPage click /board/{id}", 200.0)]
+
+        results = {result.name: result for result in benchmark_results(records)}
+
+        assert sorted(results) == ["UI DashboardPage navigate /dashboard lcp_ms",
+                                   "UI DashboardPage navigate /dashboard load_ms",
+                                   "UI ProjectPage click /board/{id} load_ms"]
+        dashboard_load = results["UI DashboardPage navigate /dashboard load_ms"]
+        assert dashboard_load.samples_ns == [100.0 * 1e6, 300.0 * 1e6]
+        assert dashboard_load.median == pytest.approx(0.2)
+        assert results["UI DashboardPage navigate /dashboard lcp_ms"].rounds == 1
+        assert benchmark_results([]) == []
@@ -0,0 +1,51 @@
+import math
+
+import allure
+import pytest
+
+from utils.complexity import complexity_report, fit_complexity
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Dataset Scaling")
+class TestComplexityFit:
+    """
+    Offline tests of the curve fitting behind the scaling sweep, on synthetic latencies.
+    """
+
+    @allure.title("The generating model of synthetic latencies is chosen: {expected}")
+    @pytest.mark.parametrize("expected, latency", [
+        ("O(1)", lambda n: 0.002 * (1 + 0.01 * math.sin(n))),
+        ("O(log n)", lambda n: 0.001 + 0.0005 * math.log(n)),
+        ("O(n)", lambda n: 0.001 + 0.00001 * n),
+        ("O(n log n)", lambda n: 0.001 + 0.000001 * n * math.log(n)),
+    ])
+    def test_best_model(self, expected, latency):
+        fits = fit_complexity(SIZES, [latency(n) for n in SIZES])
+
+        assert fits[0].name == expected, f"Expected {expected}, got {[str(fit) for fit in fits]}"
+
+    @allure.title("The SLA break point is extrapolated from the best fit")
+    def test_break_point(self):
+        report = complexity_report(SIZES, [0.001 + 0.00001 * n for n in SIZES], sla=0.5)
+
+        assert report["best_fit"] == "O(n)"
+        # 0.001 + 0.00001 * n > 0.5 from n = 49,900 on.
+        assert report["sla_break_size"] == pytest.approx(49_900, rel=0.002)
+
+    @allure.title("A flat curve never breaks the SLA; one already above it breaks at n = 1")
+    def test_break_point_bounds(self):
+        flat = fit_complexity(SIZES, [0.002] * len(SIZES))[0]
+
+        assert flat.break_point(0.5) is None
+        assert flat.break_point(0.001) == 1.0
+
+    @allure.title("Too few points or non-positive latencies are rejected")
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            fit_complexity([10, 100], [0.1, 0.2])
+        with pytest.raises(ValueError):
+            fit_complexity([10, 100, 1000], [0.1, 0.0, 0.2])
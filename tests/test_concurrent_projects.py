@@ -0,0 +1,50 @@
+import allure
+from pages.async_pages import AsyncDashboardPage, AsyncProjectPage
+from config.app_settings import AppSettings
+
+CONCURRENT_PAGES = AppSettings.get_concurrent_pages()  # Number of pages driven at once in one event loop
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Project Management")
+@allure.story("Concurrent Project Creation")
+class TestConcurrentProjectCreation:
+    """
+    Drives several authenticated pages concurrently in one event loop with the async page objects.
+    """
+
+    @allure.title("Create projects concurrently from several pages and validate them in the database")
+    @allure.description(
+        "Opens one browser context per page, creates a project with a task from every page at the same time, "
+        "and verifies that every project and task was stored in the database."
+    )
+    def test_concurrent_project_creation(self, async_browser, authenticated_state_fixture, db_connection,
+                                         project_name_factory, project_resolver):
+        project_names = [project_name_factory("Concurrent Project") for _ in range(CONCURRENT_PAGES)]
+
+        async def create_project_with_task(project_name):
+            context, page = await async_browser.new_page(storage_state=authenticated_state_fixture,
+                                                         base_url=AppSettings.get_base_url())
+            try:
+                dashboard_page = AsyncDashboardPage(page, resolver=project_resolver)
+                project_page = AsyncProjectPage(page, resolver=project_resolver)
+                await dashboard_page.click_new_project()
+                await project_page.create_project(project_name)
+                await project_page.add_task("Concurrent Task")
+            finally:
+                await context.close()
+
+        with allure.step(f"Step 1: Create {CONCURRENT_PAGES} projects concurrently via UI"):
+            async_browser.run_concurrently(*(create_project_with_task(name) for name in project_names))
+
+        with allure.step("Step 2: Verify every project and its task in the database"):
+            with db_connection.cursor() as cur:
+                cur.execute(
+                    "SELECT p.name, COUNT(t.id) FROM projects p LEFT JOIN tasks t ON t.project_id = p.id "
+                    "WHERE p.name = ANY(%s) GROUP BY p.name",
+                    (project_names,))
+                task_counts = dict(cur.fetchall())
+
+            assert set(task_counts) == set(project_names), \
+                f"Missing projects in the database: {set(project_names) - set(task_counts)}"
+            assert all(count == 1 for count in task_counts.values()), f"Unexpected task counts: {task_counts}"
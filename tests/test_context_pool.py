@@ -0,0 +1,46 @@
+import allure
+import pytest
+
+from utils.context_pool import ContextSetupStats
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Browser Context Pooling")
+class TestContextSetupStats:
+    """
+    Offline tests for the fresh-vs-pooled setup report; no browser is needed.
+    """
+
+    @allure.title("A pooled session is compared with the fresh-mode history, warm-up included")
+    def test_savings_against_history(self, tmp_path):
+        path = str(tmp_path / "context_setup.json")
+        fresh_run = ContextSetupStats(history_path=path)
+        for _ in range(4):
+            fresh_run.record(0.200, pooled=False)
+        assert "Run once with CONTEXT_POOL=true" in fresh_run.summary()
+        fresh_run.save()
+
+        pooled_run = ContextSetupStats(history_path=path)
+        pooled_run.record_warm_up(0.400)
+        for _ in range(4):
+            pooled_run.record(0.050, pooled=True)
+        summary = pooled_run.summary()
+
+        assert pooled_run.totals()["pooled"] == (4, pytest.approx(0.6))
+        assert "Pooled context setup (incl. reset, warm-up): 4 tests, avg 150.0 ms" in summary
+        assert "Pooled mode saves 50.0 ms per test, 0.20s over this session's 4 tests" in summary
+        assert "fresh: 4 tests in earlier fresh runs; pooled: this session" in summary
+
+    @allure.title("The history keeps the latest sessions per mode")
+    def test_history_is_bounded(self, tmp_path):
+        path = str(tmp_path / "context_setup.json")
+        for seconds in range(12):
+            stats = ContextSetupStats(history_path=path)
+            stats.record(float(seconds), pooled=False)
+            stats.save()
+
+        tests, average = ContextSetupStats(history_path=path).history_average("fresh")
+
+        assert tests == 10 and average == sum(range(2, 12)) / 10
+        assert ContextSetupStats(history_path=path).history_average("pooled") == (0, None)
@@ -0,0 +1,149 @@
+import csv
+import io
+import re
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from utils.data_factory import TASK_COPY_COLUMNS, BulkDataFactory, SeedReport, encode_csv_rows
+
+OWNER_ID = 7
+
+
+class RecordingCursor:
+    """
+    Records what the factory sends to PostgreSQL: the rows of each INSERT built by execute_values (which renders
+    every row with mogrify()), the COPY statements and their CSV payloads. INSERTs return sequential IDs.
+    """
+
+    connection = SimpleNamespace(encoding="UTF8")
+
+    def __init__(self):
+        self.inserted = {}
+        self.copies = []
+        self.next_id = 100
+        self._pending = []
+        self._result = []
+
+    def mogrify(self, template, args):
+        self._pending.append(tuple(args))
+        return b"(...)"
+
+    def execute(self, query, params=None):
+        query = query.decode() if isinstance(query, bytes) else query
+        table = re.match(r"INSERT INTO (\w+)", query)
+        self._result = []
+        if table:
+            rows = self._pending or [tuple(params)]
+            self.inserted.setdefault(table.group(1), []).extend(rows)
+            if "RETURNING id" in query:
+                self._result = [(self.next_id + index,) for index in range(len(rows))]
+                self.next_id += len(rows)
+            self._pending = []
+        elif query.startswith("SELECT id FROM users"):
+            self._result = [(OWNER_ID,)]
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+    def copy_expert(self, sql, file):
+        self.copies.append((sql, file.read()))
+
+
+class RecordingPool:
+    """The DatabasePool interface around one RecordingCursor, counting transactions."""
+
+    def __init__(self):
+        self.cursor = RecordingCursor()
+        self.transactions = 0
+
+    @contextmanager
+    def transaction(self, cursor_factory=None):
+        self.transactions += 1
+        yield self.cursor
+
+
+def _task_row(title, description):
+    return (title, description, 1700000000, 1700000000, 1700000000, "yellow", 7, 21, 3, 0, 1, 1)
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Bulk Data Factory")
+class TestBulkDataFactory:
+    """
+    Offline tests of the seeding report and the CSV rows streamed to COPY; no database is needed.
+    """
+
+    @allure.title("The seeding report sums rows per table and computes the throughput")
+    def test_seed_report(self):
+        report = SeedReport()
+        assert report.rows_per_second == 0.0
+
+        report.add("projects", 1)
+        report.add("tasks", 10000)
+        report.add("tasks", 5000)
+        report.elapsed = 2.0
+
+        assert report.rows == {"projects": 1, "tasks": 15000}
+        assert (report.total_rows, report.rows_per_second) == (15001, 7500.5)
+        assert str(report) == "15001 rows (projects=1, tasks=15000) in 2.00s (7,500 rows/s)"
+
+    @allure.title("Strings are quoted, so an empty description is not read as NULL by COPY")
+    def test_empty_description_is_quoted(self):
+        encoded = encode_csv_rows([_task_row("Perf Task 1", "")])
+
+        assert encoded == '"Perf Task 1","",1700000000,1700000000,1700000000,"yellow",7,21,3,0,1,1\r\n'
+        assert len(next(csv.reader(io.StringIO(encoded)))) == len(TASK_COPY_COLUMNS)
+
+    @allure.title("Commas, quotes and line breaks survive the CSV encoding: {title!r}")
+    @pytest.mark.parametrize("title", ['Task, with comma', 'Task "quoted"', "Multi\nline", "Ünïcode ✓"])
+    def test_special_characters(self, title):
+        encoded = encode_csv_rows([_task_row(title, "a, \"b\"\nc")])
+
+        row = next(csv.reader(io.StringIO(encoded)))
+        assert row[:2] == [title, "a, \"b\"\nc"]
+
+    @allure.title("create_project builds the board and streams the tasks with COPY, chunk by chunk")
+    def test_create_project(self):
+        pool = RecordingPool()
+        factory = BulkDataFactory(pool, chunk_size=4)
+
+        result = factory.create_project("Seeded Project", 10, swimlanes=("Default swimlane", "Expedite"),
+                                        owner_username="admin", spread_across_columns=True)
+
+        cursor = pool.cursor
+        project_id, column_ids, swimlane_ids = result["project_id"], result["column_ids"], result["swimlane_ids"]
+        assert cursor.inserted["projects"][0][0] == "Seeded Project"
+        assert cursor.inserted["project_has_users"] == [(project_id, OWNER_ID, "project-manager")]
+        assert cursor.inserted["columns"] == [("Backlog", 1, project_id), ("Ready", 2, project_id),
+                                              ("Work in progress", 3, project_id), ("Done", 4, project_id)]
+        assert [row[0] for row in cursor.inserted["swimlanes"]] == ["Default swimlane", "Expedite"]
+        assert len(set([project_id] + column_ids + swimlane_ids)) == 7
+
+        assert [len(payload.splitlines()) for _, payload in cursor.copies] == [4, 4, 2]
+        assert pool.transactions == 1 + 3  # The board, then one transaction per chunk
+        tasks = []
+        for sql, payload in cursor.copies:
+            columns = re.fullmatch(r"COPY tasks \((.+)\) FROM STDIN WITH \(FORMAT csv\)", sql).group(1).split(", ")
+            assert columns == ["title", "description", "date_creation", "date_modification", "date_moved",
+                               "color_id", "project_id", "column_id", "swimlane_id", "owner_id", "creator_id",
+                               "position"]
+            tasks += [dict(zip(columns, row)) for row in csv.reader(io.StringIO(payload))]
+
+        assert [task["title"] for task in tasks] == [f"Perf Task {number}" for number in range(1, 11)]
+        assert {(task["description"], task["project_id"], task["creator_id"]) for task in tasks} == {
+            ("", str(project_id), str(OWNER_ID))}
+        assert [int(task["column_id"]) for task in tasks] == [column_ids[index % 4] for index in range(10)]
+        assert [int(task["swimlane_id"]) for task in tasks] == [swimlane_ids[index % 2] for index in range(10)]
+        # Positions count up per (column, swimlane) cell; with 4 columns and 2 swimlanes every 4th task shares one.
+        assert [int(task["position"]) for task in tasks] == [1, 1, 1, 1, 2, 2, 2, 2, 3, 3]
+        assert '"Perf Task 1","",' in cursor.copies[0][1]
+
+        assert result["report"].rows == {"projects": 1, "project_has_users": 1, "columns": 4, "swimlanes": 2,
+                                         "tasks": 10}
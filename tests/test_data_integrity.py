@@ -1,6 +1,5 @@
 import pytest
 import allure
-import uuid
 from playwright.sync_api import Page
 from pages.dashboard_page import DashboardPage
 from pages.project_page import ProjectPage
@@ -19,18 +18,19 @@ class TestDataIntegrity:
         "Creates a project with tasks, deletes the project via the UI, "
         "and verifies the project and its related tasks are removed from the database."
     )
-    def test_project_and_task_deletion(self, admin_page_fixture: Page, db_connection):
+    def test_project_and_task_deletion(self, admin_page_fixture: Page, db_connection, project_name_factory,
+                                       project_resolver, wait_for_db_condition):
         """
         Tests that deleting a project also removes its associated tasks from the database.
         """
         # --- 1. Setup Test Data ---
-        project_name = f"Integrity Test Project {uuid.uuid4()}"
+        project_name = project_name_factory("Integrity Test Project")
         task_1_title = "Task One for Deletion"
         task_2_title = "Task Two for Deletion"
 
         # --- 2. Instantiate Page Objects ---
-        dashboard_page = DashboardPage(admin_page_fixture)
-        project_page = ProjectPage(admin_page_fixture)
+        dashboard_page = DashboardPage(admin_page_fixture, resolver=project_resolver)
+        project_page = ProjectPage(admin_page_fixture, resolver=project_resolver)
 
         # --- 3. UI Action: Create Project and Tasks ---
         with allure.step("Step 1: Create a project and two tasks"):
@@ -43,16 +43,15 @@ class TestDataIntegrity:
 
         # --- 4. DB Verification (Before Deletion) ---
         with allure.step("Step 2: Verify project and tasks exist in DB before deletion"):
-            with db_connection.cursor() as cur:
-                cur.execute("SELECT id FROM projects WHERE name = %s", (project_name,))
-                project_id_result = cur.fetchone()
-                assert project_id_result is not None, "Project was not created successfully in the database."
-                project_id = project_id_result[0]
+            project_id_result = wait_for_db_condition("SELECT id FROM projects WHERE name = %s", (project_name,),
+                                                      description=f"project '{project_name}' exists").row
+            assert project_id_result is not None, "Project was not created successfully in the database."
+            project_id = project_id_result[0]
 
-                cur.execute("SELECT COUNT(*) FROM tasks WHERE project_id = %s", (project_id,))
-                task_count = cur.fetchone()[0]
-                assert task_count == 2, f"Expected 2 tasks in the DB, but found {task_count}."
-            db_connection.commit()
+            task_count = wait_for_db_condition("SELECT COUNT(*) FROM tasks WHERE project_id = %s", (project_id,),
+                                               predicate=lambda row: row[0] == 2,
+                                               description="both tasks exist").row[0]
+            assert task_count == 2, f"Expected 2 tasks in the DB, but found {task_count}."
 
         # --- 5. UI Action: Delete the Project ---
         with allure.step("Step 3: Delete the project via UI"):
@@ -65,6 +64,8 @@ class TestDataIntegrity:
 
         # --- 6. DB Verification (After Deletion) ---
         with allure.step("Step 4: Verify project and tasks are deleted from DB"):
+            wait_for_db_condition("SELECT id FROM projects WHERE id = %s", (project_id,),
+                                  predicate=lambda row: row is None, description=f"project {project_id} is deleted")
             with db_connection.cursor() as cur:
                 cur.execute("SELECT id FROM projects WHERE id = %s", (project_id,))
                 project_result = cur.fetchone()
@@ -73,4 +74,3 @@ class TestDataIntegrity:
                 cur.execute("SELECT COUNT(*) FROM tasks WHERE project_id = %s", (project_id,))
                 remaining_task_count = cur.fetchone()[0]
                 assert remaining_task_count == 0, "Tasks associated with the project were not deleted."
-            db_connection.commit()
@@ -0,0 +1,110 @@
+import time
+
+import allure
+import pytest
+
+from utils.data_registry import OrphanSweeper, TestDataRegistry
+from utils.kanboard_api import KanboardApiClient
+from utils.kanboard_standin import KanboardStandIn
+from utils.workers import unique_name
+
+TASKS_PER_PROJECT = 3
+
+
+@pytest.fixture(scope="function")
+def standin():
+    with KanboardStandIn() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def api(standin):
+    with KanboardApiClient(url=standin.api_url, username=standin.username, token=standin.token) as client:
+        yield client
+
+
+def _project_names(standin):
+    with standin.db_pool.read_cursor() as cur:
+        cur.execute("SELECT name FROM projects ORDER BY name")
+        return [row[0] for row in cur.fetchall()]
+
+
+def _task_count(standin):
+    with standin.db_pool.read_cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM tasks")
+        return cur.fetchone()[0]
+
+
+def _age(standin, name, hours):
+    with standin.db_pool.transaction() as cur:
+        cur.execute("UPDATE projects SET last_modified = %s WHERE name = %s", (int(time.time() - hours * 3600), name))
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Test Data Cleanup")
+class TestDataCleanup:
+    """
+    Offline tests of the registry's purge and of the orphan sweeper against the Kanboard stand-in's SQLite database.
+    """
+
+    @allure.title("purge removes registered names, IDs and loose tasks, with their tasks, and nothing else")
+    def test_purge(self, standin, api):
+        by_name, _ = api.seed_project("Registered By Name", TASKS_PER_PROJECT)
+        by_id, _ = api.seed_project("Registered By ID", TASKS_PER_PROJECT)
+        _, (loose_task, kept_task, _) = api.seed_project("Unregistered", TASKS_PER_PROJECT)
+
+        registry = TestDataRegistry()
+        registry.register_project(name="Registered By Name")
+        registry.register_project(project_id=by_id)
+        registry.register_tasks([loose_task])
+        report = registry.purge(standin.db_pool)
+
+        assert (report.projects, report.tasks) == (2, 2 * TASKS_PER_PROJECT + 1)
+        assert _project_names(standin) == ["Unregistered"]
+        assert _task_count(standin) == TASKS_PER_PROJECT - 1
+        assert api.call("getTask", task_id=kept_task) is not None
+        assert len(registry) == 0 and registry.purge(standin.db_pool).projects == 0
+
+    @allure.title("purge_via_api removes the same data with batched JSON-RPC calls")
+    def test_purge_via_api(self, standin, api):
+        api.seed_project("Registered By Name", TASKS_PER_PROJECT)
+        _, (loose_task, _, _) = api.seed_project("Unregistered", TASKS_PER_PROJECT)
+
+        registry = TestDataRegistry()
+        registry.register_project(name="Registered By Name")
+        registry.register_tasks([loose_task])
+        report = registry.purge_via_api(api)
+
+        assert (report.projects, report.tasks) == (1, TASKS_PER_PROJECT + 1)
+        assert _project_names(standin) == ["Unregistered"]
+        assert _task_count(standin) == TASKS_PER_PROJECT - 1
+
+    @allure.title("The sweeper removes only old projects with the unique_name() suffix")
+    def test_sweeper_requires_suffix_and_age(self, standin, api):
+        orphan, recent = unique_name("Performance Test Project"), unique_name("Performance Test Project")
+        for name in (orphan, recent, "Performance Test Project", "Performance Test Project gw1 not-a-uuid"):
+            api.seed_project(name, TASKS_PER_PROJECT)
+        for name in (orphan, "Performance Test Project", "Performance Test Project gw1 not-a-uuid"):
+            _age(standin, name, hours=48)
+
+        sweeper = OrphanSweeper(standin.db_pool, max_age_hours=24)
+        assert [(row[1], row[3]) for row in sweeper.find()] == [(orphan, TASKS_PER_PROJECT)]
+        report = sweeper.sweep()
+
+        assert (report.projects, report.tasks) == (1, TASKS_PER_PROJECT)
+        assert orphan not in _project_names(standin) and len(_project_names(standin)) == 3
+
+    @allure.title("The sweeper only removes projects whose name starts with a given prefix, taken literally")
+    def test_sweeper_prefix(self, standin, api):
+        names = [unique_name("Performance Test Project"), unique_name("Scaling 100 Tasks"),
+                 unique_name("Performance_Test_Project"), unique_name("Other")]
+        for name in names:
+            api.seed_project(name, 1)
+            _age(standin, name, hours=48)
+
+        sweeper = OrphanSweeper(standin.db_pool, prefixes=["Performance_Test", "Scaling"], max_age_hours=24)
+
+        assert sorted(row[1] for row in sweeper.find()) == sorted(names[1:3])
+        assert sweeper.sweep().projects == 2
+        assert sorted(_project_names(standin)) == sorted([names[0], names[3]])
@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import allure
+import psycopg2
+import psycopg2.errors
+import pytest
+
+from config.app_settings import AppSettings
+from tests.test_db import DSN, FakeConnect
+from utils.data_factory import BulkDataFactory
+from utils.db import DatabasePool
+from utils.db_snapshot import DatabaseSnapshotError, DatabaseSnapshots
+from utils.workers import is_parallel_run
+
+SNAPSHOT_NAME = "test_reset"
+NUMBER_OF_TASKS = 100000
+RESTORE_SLA = 1.0  # Seconds to bring a 100k-task state back
+
+pytestmark = pytest.mark.skipif(is_parallel_run(),
+                                reason="Restoring a snapshot replaces the database other workers are using")
+
+
+@pytest.fixture(scope="module")
+def seeded_snapshot(db_pool, db_snapshots, project_name_factory, test_data_registry):
+    """Seeds a project with NUMBER_OF_TASKS tasks, freezes the database into a snapshot and drops it afterwards."""
+    project_name = project_name_factory("Snapshot Project")
+    with allure.step(f"SETUP: Seed {NUMBER_OF_TASKS} tasks and create snapshot '{SNAPSHOT_NAME}'"):
+        factory = BulkDataFactory(db_pool, chunk_size=AppSettings.get_seed_chunk_size(), registry=test_data_registry)
+        project_id = factory.create_project(project_name, NUMBER_OF_TASKS, owner_username=AppSettings.ADMIN_USER,
+                                            spread_across_columns=True)["project_id"]
+        elapsed = db_snapshots.snapshot(SNAPSHOT_NAME, replace=True)
+        print(f"Snapshot '{SNAPSHOT_NAME}' created in {elapsed:.3f}s")
+    yield project_id
+    db_snapshots.drop(SNAPSHOT_NAME)
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Database Snapshots")
+class TestDatabaseSnapshot:
+
+    @allure.title("Restore a 100k-task database state from a template snapshot")
+    @allure.description("Changes the seeded state, restores the snapshot and checks that the original state is back "
+                        f"within {RESTORE_SLA}s.")
+    def test_restore_snapshot(self, seeded_snapshot, db_pool, db_snapshots, project_name_factory):
+        project_id = seeded_snapshot
+        extra_project = project_name_factory("Snapshot Extra Project")
+
+        with allure.step("Change the database after the snapshot"):
+            with db_pool.transaction() as cur:
+                cur.execute("DELETE FROM tasks WHERE project_id = %s", (project_id,))
+                cur.execute("INSERT INTO projects (name) VALUES (%s)", (extra_project,))
+
+        with allure.step(f"Restore snapshot '{SNAPSHOT_NAME}'"):
+            elapsed = db_snapshots.restore(SNAPSHOT_NAME)
+            allure.attach(f"{elapsed:.3f}s", name="Restore Time", attachment_type=allure.attachment_type.TEXT)
+            print(f"Snapshot '{SNAPSHOT_NAME}' restored in {elapsed:.3f}s")
+
+        with allure.step("Verify the snapshot state is back"):
+            with db_pool.read_cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM tasks WHERE project_id = %s", (project_id,))
+                assert cur.fetchone()[0] == NUMBER_OF_TASKS, "The restored project should have all its tasks"
+                cur.execute("SELECT COUNT(*) FROM projects WHERE name = %s", (extra_project,))
+                assert cur.fetchone()[0] == 0, "A project created after the snapshot should be gone"
+            assert elapsed < RESTORE_SLA, f"Restoring took {elapsed:.3f}s, more than {RESTORE_SLA}s"
+
+
+class FailingMaintenanceCursor:
+    """A maintenance cursor on PostgreSQL 16 whose DROP DATABASE fails."""
+
+    def execute(self, query, params=None):
+        if query.startswith("DROP DATABASE"):
+            raise psycopg2.errors.InsufficientPrivilege("must be owner of database kanboard")
+
+    def fetchone(self):
+        return (160000,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Database Snapshots")
+class TestFailedRestore:
+    """
+    Offline test of the failure path of restore(), with psycopg2.connect patched; no database is needed.
+    """
+
+    @allure.title("A failed restore raises DatabaseSnapshotError and leaves the pool open")
+    def test_pool_reopened(self, monkeypatch):
+        connect = FakeConnect()
+        monkeypatch.setattr(psycopg2, "connect", connect)
+        maintenance = SimpleNamespace(cursor=FailingMaintenanceCursor, closed=False)
+        maintenance.close = lambda: setattr(maintenance, "closed", True)
+        monkeypatch.setattr(DatabaseSnapshots, "_maintenance", lambda self: maintenance)
+        pool = DatabasePool(DSN, minconn=1, maxconn=1)
+        snapshots = DatabaseSnapshots(pool, preserve_tables=())
+        try:
+            with pytest.raises(DatabaseSnapshotError, match="Could not restore snapshot 'baseline'"):
+                snapshots.restore("baseline")
+
+            assert maintenance.closed
+            assert len(connect.connections) == 1, "Expected the pool to be reopened right after the failure."
+            with pool.read_cursor() as cur:
+                cur.execute("SELECT 1")
+        finally:
+            pool.close()
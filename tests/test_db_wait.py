@@ -0,0 +1,96 @@
+import threading
+
+import allure
+import pytest
+
+from utils.db_wait import DbConditionTimeout, DbStateAwaiter
+from utils.kanboard_api import KanboardApiClient
+from utils.kanboard_standin import KanboardStandIn
+
+TASK_COLUMN_QUERY = "SELECT column_id FROM tasks WHERE id = %s"
+
+
+class FakeClock:
+    """Replaces the time module in utils.db_wait: sleeping advances a virtual clock and is recorded."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture(scope="function")
+def standin_task():
+    """A stand-in with one task; yields the stand-in, the task ID and the ID of a second column."""
+    with KanboardStandIn() as standin:
+        with KanboardApiClient(url=standin.api_url, username=standin.username, token=standin.token) as api:
+            project_id, (task_id,) = api.seed_project("Db Wait Project", 1)
+            columns = api.get_columns(project_id)
+        yield standin, task_id, columns[-1]["id"]
+
+
+@pytest.fixture(scope="function")
+def awaiter(standin_task):
+    standin, _, _ = standin_task
+    awaiter = DbStateAwaiter(default_timeout=5.0, connection_factory=standin.db_pool.connect).start()
+    yield awaiter
+    awaiter.close()
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Waiting for Database State")
+class TestDbStateAwaiter:
+    """
+    Offline tests of the polling awaiter against the Kanboard stand-in's SQLite database.
+    """
+
+    @allure.title("A condition is met once a delayed write commits")
+    def test_condition_met_after_delayed_write(self, standin_task, awaiter):
+        standin, task_id, done_column_id = standin_task
+
+        def move_task():
+            with standin.db_pool.transaction() as cur:
+                cur.execute("UPDATE tasks SET column_id = %s WHERE id = %s", (done_column_id, task_id))
+
+        writer = threading.Timer(0.3, move_task)
+        writer.start()
+        try:
+            result = awaiter.wait_for(TASK_COLUMN_QUERY, (task_id,), predicate=lambda row: row[0] == done_column_id)
+        finally:
+            writer.join()
+
+        assert result.row == (done_column_id,) and result.mode == "poll"
+        assert result.checks > 1 and 0.3 <= result.elapsed < 2.0
+
+    @allure.title("Re-checks back off exponentially up to the maximum interval and stop at the deadline")
+    def test_backoff_intervals(self, standin_task, awaiter, monkeypatch):
+        _, task_id, _ = standin_task
+        clock = FakeClock()
+        monkeypatch.setattr("utils.db_wait.time", clock)
+
+        with pytest.raises(DbConditionTimeout):
+            awaiter.wait_for(TASK_COLUMN_QUERY, (task_id,), predicate=lambda row: False, timeout=3.0)
+
+        assert clock.sleeps == [0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 0.45]
+
+    @allure.title("A timeout reports the query, parameters, last row and number of checks")
+    def test_timeout_diagnostics(self, standin_task, awaiter):
+        _, task_id, _ = standin_task
+
+        with pytest.raises(DbConditionTimeout) as error:
+            awaiter.wait_for(TASK_COLUMN_QUERY, (task_id,), predicate=lambda row: row[0] == -1, timeout=0.2,
+                             description="task is in column -1")
+
+        message = str(error.value)
+        assert message.startswith("Database condition 'task is in column -1' not met within 0.2s.")
+        assert f"query: {TASK_COLUMN_QUERY}" in message
+        assert f"params: ({task_id},)" in message
+        assert "last row: (" in message
+        assert "(poll mode)" in message and "changes observed: 0" in message
@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+from xdist.remote import Producer
+
+from utils.duration_scheduler import (DEFAULT_DURATION, DurationHistory, DurationScheduling, estimate_run,
+                                      makespan)
+
+
+class FakeNode:
+    """Stands in for xdist's WorkerController: records the test indices it is sent."""
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.sent = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+@pytest.fixture(scope="function")
+def history(tmp_path):
+    return DurationHistory(str(tmp_path / "durations.json"))
+
+
+def _scheduler(history, collection, workers=2):
+    config = SimpleNamespace(getvalue=lambda name: [f"{workers}*popen"], getoption=lambda name: None)
+    scheduler = DurationScheduling(config, Producer("test", enabled=False), history)
+    nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Duration-Aware Scheduling")
+class TestDurationScheduler:
+    """
+    Offline tests for the duration history, the run estimate and the longest-first xdist scheduler.
+    """
+
+    @allure.title("Recorded durations are merged into the history file, keeping the latest samples")
+    def test_history_round_trip(self, history):
+        history.save({"tests/test_a.py::test_one": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]})
+        DurationHistory(history.path).save({"tests/test_a.py::test_two": [0.5]})
+
+        reloaded = DurationHistory(history.path).load()
+        assert reloaded.samples["tests/test_a.py::test_one"] == [2.0, 3.0, 4.0, 5.0, 6.0]
+        assert reloaded.known("tests/test_a.py::test_one") == 4.0
+        assert reloaded.known("tests/test_a.py::test_two") == 0.5
+
+        with open(history.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert DurationHistory(history.path).load().samples == {}
+
+    @allure.title("Tests without history fall back to their module's median, then to the overall median")
+    def test_estimate_fallback(self, history):
+        assert history.estimates(["tests/test_a.py::test_new"]) == {"tests/test_a.py::test_new": DEFAULT_DURATION}
+
+        history.samples = {"tests/test_a.py::test_one": [2.0], "tests/test_a.py::test_two": [4.0],
+                           "tests/test_b.py::test_one": [10.0]}
+        estimates = history.estimates(["tests/test_a.py::test_new", "tests/test_c.py::test_new"])
+        assert estimates == {"tests/test_a.py::test_new": 3.0, "tests/test_c.py::test_new": 4.0}
+
+    @allure.title("The estimate is the longest-first makespan over the workers")
+    def test_run_estimate(self, history):
+        assert makespan([2.0, 3.0, 4.0, 3.0], 2) == 6.0
+        assert makespan([1.0, 1.0], 1) == 2.0
+
+        history.samples = {"tests/test_a.py::test_one": [4.0], "tests/test_a.py::test_two": [2.0]}
+        estimate = estimate_run(history, ["tests/test_a.py::test_one", "tests/test_a.py::test_two",
+                                          "tests/test_b.py::test_new"], workers=2)
+        assert (estimate.wall_time, estimate.total, estimate.without_history) == (5.0, 9.0, 1)
+        assert "1 of 3 tests without history" in estimate.summary()
+
+    @allure.title("Workers receive the longest tests first and one more test whenever they finish one")
+    def test_longest_first(self, history):
+        collection = [f"tests/test_a.py::test_{index}" for index in range(6)]
+        history.samples = {nodeid: [float(index)] for index, nodeid in enumerate(collection)}
+
+        scheduler, (first, second) = _scheduler(history, collection)
+        assert (first.sent, second.sent) == ([5, 3], [4, 2])
+        assert scheduler.estimate.wall_time == makespan(range(6), 2)
+
+        scheduler.mark_test_complete(second, 4)
+        assert second.sent == [4, 2, 1]
+        scheduler.mark_test_complete(first, 5)
+        assert first.sent == [5, 3, 0] and scheduler.pending == []
+        scheduler.mark_test_complete(first, 3)
+        assert first.shutting_down and not second.shutting_down
+
+    @allure.title("Without any history the collection order is kept")
+    def test_no_history(self, history):
+        collection = [f"tests/test_a.py::test_{index}" for index in range(5)]
+
+        scheduler, (first, second) = _scheduler(history, collection)
+
+        assert (first.sent, second.sent) == ([0, 2], [1, 3]) and scheduler.pending == [4]
+        assert "no duration history yet" in scheduler.estimate.summary()
+        assert history.samples == {}
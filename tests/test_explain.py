@@ -0,0 +1,97 @@
+import json
+
+import allure
+import pytest
+
+from utils.explain import ExplainCollector, SeqScanError, SeqScanWarning
+
+BOARD_QUERY = "SELECT t.id, c.title FROM tasks t JOIN columns c ON c.id = t.column_id WHERE t.project_id = %s"
+TABLE_ROWS = {"tasks": 250000, "columns": 40}
+
+# EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output of BOARD_QUERY on an unindexed tasks table, as psycopg2 returns it.
+CANNED_PLAN = json.dumps([{
+    "Plan": {
+        "Node Type": "Hash Join", "Actual Rows": 120, "Actual Loops": 1, "Actual Total Time": 41.2,
+        "Shared Hit Blocks": 1850, "Shared Read Blocks": 12,
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "tasks", "Actual Rows": 120, "Actual Loops": 1,
+             "Rows Removed by Filter": 249880, "Actual Total Time": 39.8},
+            {"Node Type": "Hash", "Actual Rows": 40, "Actual Loops": 1, "Actual Total Time": 0.1, "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "columns", "Actual Rows": 40, "Actual Loops": 1,
+                 "Actual Total Time": 0.05},
+            ]},
+        ],
+    },
+    "Planning Time": 0.31,
+    "Execution Time": 41.5,
+}])
+
+
+def _collector(action):
+    return ExplainCollector(hot_queries=[r"FROM tasks t JOIN columns"], seq_scan_min_rows=10000, action=action)
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Query Plan Capture")
+class TestExplainCollector:
+    """
+    Offline tests of plan parsing and sequential scan detection on a canned EXPLAIN (FORMAT JSON) plan.
+    """
+
+    @allure.title("A canned plan is parsed into timings, buffers, seq scans and a rendered tree")
+    def test_parse_plan(self):
+        collector = _collector("warn")
+
+        with pytest.warns(SeqScanWarning, match="scans 'tasks' sequentially"):
+            capture = collector.record_plan(BOARD_QUERY, (7,), CANNED_PLAN, TABLE_ROWS.get)
+
+        assert (capture.planning_time_ms, capture.execution_time_ms) == (0.31, 41.5)
+        assert (capture.shared_hit_blocks, capture.shared_read_blocks) == (1850, 12)
+        assert [node["Node Type"] for node in capture.nodes()] == ["Hash Join", "Seq Scan", "Hash", "Seq Scan"]
+        assert capture.render_plan().splitlines()[1] == "  -> Seq Scan on tasks (rows=120 loops=1 time=39.8ms)"
+        assert collector.totals()["statements"] == 1
+
+    @allure.title("Only the seq scan over the large table is a violation; the small table is ignored")
+    def test_seq_scan_detection(self):
+        collector = _collector("warn")
+
+        with pytest.warns(SeqScanWarning):
+            capture = collector.record_plan(BOARD_QUERY, (7,), CANNED_PLAN, TABLE_ROWS.get)
+
+        assert capture.seq_scans == [{"relation": "tasks", "rows_scanned": 250000, "table_rows": 250000},
+                                     {"relation": "columns", "rows_scanned": 40, "table_rows": 40}]
+        assert capture.violations == ["Hot query scans 'tasks' sequentially (250000 rows >= 10000)"]
+
+    @allure.title("Never-analysed tables fall back to the rows the scan touched")
+    def test_unanalysed_table(self):
+        collector = _collector("warn")
+
+        with pytest.warns(SeqScanWarning):
+            capture = collector.record_plan(BOARD_QUERY, (7,), CANNED_PLAN, lambda relation: -1)
+
+        assert capture.seq_scans[0]["table_rows"] == 250000
+
+    @allure.title("Queries that are not hot are never violations")
+    def test_cold_query(self):
+        collector = ExplainCollector(hot_queries=[r"FROM projects"], seq_scan_min_rows=10000, action="fail")
+
+        capture = collector.record_plan(BOARD_QUERY, (7,), CANNED_PLAN, TABLE_ROWS.get)
+
+        assert capture.violations == [] and len(capture.seq_scans) == 2
+
+    @allure.title("With the 'fail' action, a hot seq scan over a large table raises SeqScanError")
+    def test_fail_action(self):
+        with pytest.raises(SeqScanError, match="scans 'tasks' sequentially") as error:
+            _collector("fail").record_plan(BOARD_QUERY, (7,), CANNED_PLAN, TABLE_ROWS.get)
+
+        assert "-> Seq Scan on tasks" in str(error.value)
+
+    @allure.title("Each distinct SELECT is explained once until reset")
+    def test_should_explain(self):
+        collector = _collector("warn")
+
+        assert collector.should_explain(BOARD_QUERY) and not collector.should_explain(BOARD_QUERY)
+        assert not collector.should_explain("UPDATE tasks SET title = %s")
+        collector.reset()
+        assert collector.should_explain(BOARD_QUERY)
@@ -0,0 +1,95 @@
+import json
+
+import allure
+import httpx
+import pytest
+
+from utils.http_auth import CredentialPool, HttpLoginError, http_login
+from utils.http_load import DASHBOARD_URL, HttpLoadGenerator
+from utils.kanboard_api import KanboardApiClient
+from utils.kanboard_stub import StubKanboardServer
+
+
+@pytest.fixture(scope="function")
+def stub_server():
+    """
+    Starts a local stub server that serves Kanboard's login form and JSON-RPC endpoint,
+    so the browserless login and the credential pool can be tested without a running Kanboard instance.
+    """
+    with StubKanboardServer(ui_username="admin", ui_password="admin") as stub:
+        yield stub
+
+
+@pytest.fixture(scope="function")
+def stub_api(stub_server):
+    with KanboardApiClient(url=stub_server.api_url, username=stub_server.username, token=stub_server.token) as client:
+        yield client
+
+
+def _logged_in_user(stub_server, state):
+    """Returns the user the stub associates with the storage state's session cookie."""
+    cookies = {cookie["name"]: cookie["value"] for cookie in state["cookies"]}
+    response = httpx.get(f"{stub_server.base_url}{DASHBOARD_URL}", cookies=cookies)
+    assert response.status_code == 200, "Expected the storage state's session cookie to be logged in."
+    return stub_server.ui.sessions[cookies["KB_SID"]]["user"]
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Browserless Login")
+class TestHttpAuth:
+    """
+    Offline tests for the HTTP login and the credential pool, run against the local stub server.
+    """
+
+    @allure.title("HTTP login writes a Playwright storage state with a logged-in session cookie")
+    def test_http_login(self, stub_server):
+        state = http_login("admin", "admin", base_url=stub_server.base_url)
+
+        cookie = next(cookie for cookie in state["cookies"] if cookie["name"] == "KB_SID")
+        assert cookie["domain"] == "127.0.0.1" and cookie["path"] == "/" and cookie["httpOnly"]
+        assert state["origins"] == []
+        assert _logged_in_user(stub_server, state) == "admin"
+
+    @allure.title("HTTP login with rejected credentials raises")
+    def test_http_login_rejected(self, stub_server):
+        with pytest.raises(HttpLoginError, match="rejected"):
+            http_login("admin", "wrong-password", base_url=stub_server.base_url)
+
+    @allure.title("The credential pool creates its users in one batch and logs each one into its own session")
+    def test_credential_pool(self, stub_server, stub_api, tmp_path):
+        pool = CredentialPool(stub_api, 3, prefix="pool_user", state_dir=str(tmp_path))
+
+        with allure.step("Create the pool's users"):
+            requests_before = stub_server.http_requests
+            pool.ensure()
+            assert stub_server.http_requests - requests_before == 2, "Expected one lookup and one create batch."
+            assert sorted(user["username"] for user in stub_server.store.users.values()) == pool.usernames
+
+        with allure.step("Reuse the existing users"):
+            pool.ensure()
+            assert len(stub_server.store.users) == 3
+
+        with allure.step("Log every user in over HTTP"):
+            paths = [pool.storage_state(index, base_url=stub_server.base_url) for index in range(4)]
+            assert paths[3] == paths[0], "Expected the fourth virtual user to reuse the first user's state."
+            users = []
+            for path in paths[:3]:
+                with open(path, encoding="utf-8") as f:
+                    users.append(_logged_in_user(stub_server, json.load(f)))
+            assert users == pool.usernames
+
+        pool.cleanup()
+        assert not list(tmp_path.iterdir())
+
+    @allure.title("HTTP load virtual users log in as the pool's users")
+    def test_load_with_credentials(self, stub_server, stub_api, tmp_path):
+        pool = CredentialPool(stub_api, 2, prefix="load_user", state_dir=str(tmp_path)).ensure()
+        generator = HttpLoadGenerator(stub_server.base_url, "admin", "admin", users=2, duration=0.3,
+                                      credentials=pool.credentials(2))
+
+        result = generator.run_sync()
+
+        assert result["iterations"]["ok"] >= 2 and result["iterations"]["failed"] == 0
+        logged_in = {session["user"] for session in stub_server.ui.sessions.values() if session["user"]}
+        assert logged_in == set(pool.usernames)
@@ -0,0 +1,64 @@
+import allure
+import pytest
+
+from utils.http_load import HttpLoadGenerator
+from utils.kanboard_stub import StubKanboardServer
+
+WORKFLOW_ENDPOINTS = {"dashboard", "project_create_form", "project_create", "board", "task_create_form",
+                      "task_create", "task_move", "project_remove_confirm", "project_remove"}
+
+
+@pytest.fixture(scope="function")
+def stub_server():
+    """
+    Starts a local stub server that serves Kanboard's controller pages,
+    so the HTTP load generator can be tested without a running Kanboard instance.
+    """
+    with StubKanboardServer(ui_username="admin", ui_password="admin") as stub:
+        yield stub
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Protocol-Level HTTP Load")
+class TestHttpLoadGenerator:
+    """
+    Offline tests for the HTTP load generator, run against the local stub server.
+    """
+
+    @allure.title("Closed model: every virtual user logs in once and completes the workflow on one connection")
+    def test_closed_model(self, stub_server):
+        generator = HttpLoadGenerator(stub_server.base_url, "admin", "admin", users=3, duration=0.5)
+
+        with allure.step("Run 3 virtual users for half a second"):
+            result = generator.run_sync()
+
+        with allure.step("Verify the report, the sessions and the cleanup"):
+            assert result["iterations"]["ok"] >= 3 and result["iterations"]["failed"] == 0
+            assert WORKFLOW_ENDPOINTS <= set(result["endpoints"])
+            assert result["endpoints"]["login"]["requests"] == 3, "Expected exactly one login per virtual user."
+            assert all(stats["errors"] == 0 for stats in result["endpoints"].values())
+            assert len(stub_server.connections) == 3, "Expected every virtual user to reuse one keep-alive connection."
+            assert not stub_server.store.projects, "Expected every workflow to remove its project."
+
+    @allure.title("Open model: workflows arrive at a fixed rate on shared logged-in sessions")
+    def test_open_model(self, stub_server):
+        generator = HttpLoadGenerator(stub_server.base_url, "admin", "admin", users=2, duration=0.5,
+                                      model="open", arrival_rate=20)
+
+        with allure.step("Run 20 arrivals/s for half a second"):
+            result = generator.run_sync()
+
+        with allure.step("Verify the arrivals completed without errors"):
+            assert result["iterations"]["ok"] > 0 and result["iterations"]["failed"] == 0
+            assert result["endpoints"]["task_move"]["latency_ms"]["count"] == result["iterations"]["ok"]
+            assert sum(result["endpoints"]["task_move"]["histogram_ms"].values()) == result["iterations"]["ok"]
+
+    @allure.title("Rejected credentials stop the virtual user before any workflow runs")
+    def test_login_failure(self, stub_server):
+        generator = HttpLoadGenerator(stub_server.base_url, "admin", "wrong-password", users=1, duration=0.5)
+
+        result = generator.run_sync()
+
+        assert result["iterations"] == {"ok": 0, "failed": 0}
+        assert set(result["endpoints"]) == {"login_form", "login"}
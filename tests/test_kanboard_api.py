@@ -0,0 +1,71 @@
+import allure
+import pytest
+
+from utils.kanboard_api import KanboardApiClient, KanboardApiError
+from utils.kanboard_stub import StubKanboardServer, DEFAULT_COLUMNS
+
+
+@pytest.fixture(scope="function")
+def stub_api_client():
+    """
+    Starts a local stub JSON-RPC server and yields a client bound to it,
+    so the seeding client can be tested without a running Kanboard instance.
+    """
+    with StubKanboardServer() as stub:
+        client = KanboardApiClient(url=stub.api_url, username=stub.username, token=stub.token, batch_size=25)
+        yield client, stub
+        client.close()
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Data Seeding")
+@allure.story("JSON-RPC Seeding Client")
+class TestKanboardApiClient:
+    """
+    Offline tests for the JSON-RPC seeding client, run against the local stub server.
+    """
+
+    @allure.title("Seed a project with tasks using batched JSON-RPC calls")
+    def test_seed_project_uses_batches_and_one_connection(self, stub_api_client):
+        client, stub = stub_api_client
+
+        with allure.step("Seed a project with 60 tasks"):
+            project_id, task_ids = client.seed_project("Seeded Project", 60)
+
+        with allure.step("Verify the data and the number of HTTP round trips"):
+            assert len(task_ids) == 60
+            assert len(stub.store.rpc_getAllTasks(project_id)) == 60
+            # 1 createProject call + ceil(60 / 25) batch requests.
+            assert stub.http_requests == 4
+            assert len(stub.connections) == 1, "Expected all calls to reuse one keep-alive connection."
+
+    @allure.title("Extra columns are appended after the default columns")
+    def test_seed_project_with_extra_columns(self, stub_api_client):
+        client, _ = stub_api_client
+
+        project_id, task_ids = client.seed_project("Columns Project", 3, columns=["QA"], column_title="QA")
+
+        columns = client.get_columns(project_id)
+        assert [column["title"] for column in columns] == list(DEFAULT_COLUMNS) + ["QA"]
+        qa_column_id = columns[-1]["id"]
+        assert all(client.call("getTask", task_id=task_id)["column_id"] == qa_column_id for task_id in task_ids)
+
+    @allure.title("JSON-RPC errors and refused operations raise KanboardApiError")
+    def test_errors_are_raised(self, stub_api_client):
+        client, _ = stub_api_client
+
+        with pytest.raises(KanboardApiError, match="Method not found"):
+            client.call("unknownProcedure")
+
+        client.create_project("Duplicate Project")
+        with pytest.raises(KanboardApiError):
+            client.create_project("Duplicate Project")
+
+    @allure.title("Removing a project removes its tasks")
+    def test_remove_project(self, stub_api_client):
+        client, stub = stub_api_client
+
+        project_id, _ = client.seed_project("Removable Project", 5)
+        assert client.remove_project(project_id)
+        assert client.get_project_by_name("Removable Project") is None
+        assert stub.store.rpc_getAllTasks(project_id) == []
@@ -0,0 +1,132 @@
+import time
+
+import allure
+import httpx
+import pytest
+
+from config.app_settings import AppSettings
+from utils.data_registry import TestDataRegistry
+from utils.http_auth import http_login
+from utils.http_load import CSRF_INPUT_PATTERN, HttpLoadGenerator
+from utils.kanboard_api import KanboardApiClient
+from utils.kanboard_standin import KanboardStandIn
+
+STARTUP_SLA = 1.0  # Seconds from construction to a served request
+
+
+@pytest.fixture(scope="function")
+def standin():
+    with KanboardStandIn(ui_username="admin", ui_password="admin") as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def ui_client(standin):
+    """An HTTP client with a logged-in admin session, following redirects like the browser."""
+    state = http_login("admin", "admin", base_url=standin.base_url)
+    cookies = {cookie["name"]: cookie["value"] for cookie in state["cookies"]}
+    with httpx.Client(base_url=standin.base_url, cookies=cookies, follow_redirects=True) as client:
+        yield client
+
+
+def _submit(client, form_url, action_url, **fields):
+    """Opens a form, takes its CSRF token and posts `fields`; returns the final response."""
+    token = CSRF_INPUT_PATTERN.search(client.get(form_url).text).group(1)
+    return client.post(action_url, data={"csrf_token": token, **fields})
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Local Kanboard Stand-In")
+class TestKanboardStandIn:
+    """
+    Offline tests of the stand-in: start-up time, JSON-RPC and SQLite access, and the pages the page objects drive.
+    """
+
+    @allure.title("The stand-in starts in under a second and JSON-RPC writes are visible through its pool")
+    def test_startup_and_json_rpc(self):
+        start = time.perf_counter()
+        with KanboardStandIn() as standin:
+            assert httpx.get(f"{standin.base_url}/login").status_code == 200
+            elapsed = time.perf_counter() - start
+            assert elapsed < STARTUP_SLA, f"Start-up took {elapsed:.3f}s"
+
+            with KanboardApiClient(url=standin.api_url, username=standin.username, token=standin.token) as api:
+                project_id, task_ids = api.seed_project("Stand-In Project", 25, column_title="Ready")
+
+            with standin.db_pool.read_cursor() as cur:
+                cur.execute("SELECT p.name, COUNT(t.id) FROM projects p JOIN tasks t ON t.project_id = p.id "
+                            "JOIN columns c ON c.id = t.column_id WHERE c.title = %s AND p.id = ANY(%s) "
+                            "GROUP BY p.name", ("Ready", [project_id]))
+                assert cur.fetchall() == [("Stand-In Project", 25)]
+
+            registry = TestDataRegistry()
+            registry.register_project(project_id=project_id)
+            report = registry.purge(standin.db_pool)
+            assert (report.projects, report.tasks) == (1, len(task_ids))
+
+    @allure.title("Project and task pages carry the page objects' selectors and write to the database")
+    def test_page_workflow(self, standin, ui_client):
+        with allure.step("Create a project through the form"):
+            assert 'id="form-name"' in ui_client.get("/project/create").text
+            board = _submit(ui_client, "/project/create", "/project/create", name="Workflow Project")
+            project_id = int(board.url.path.rsplit("/", 1)[1])
+            assert '<span class="title">Workflow Project</span>' in board.text
+            assert 'class="board-column-header' in board.text and 'class="board-add-icon"' in board.text
+
+        with allure.step("Add a task to the Ready column"):
+            with standin.db_pool.read_cursor() as cur:
+                cur.execute("SELECT id FROM columns WHERE project_id = %s AND title = %s", (project_id, "Ready"))
+                ready_id = cur.fetchone()[0]
+            form_url = f"/project/{project_id}/task/create?column_id={ready_id}"
+            board = _submit(ui_client, form_url, form_url, title="Workflow Task", description="Details")
+            assert 'class="task-board-title"><a href="/task/1">Workflow Task</a>' in board.text
+
+        with allure.step("Move the task to Done and remove it"):
+            task = _submit(ui_client, "/task/1/move", "/task/1/move", column="Done", position="1")
+            assert 'id="form-columns"' in ui_client.get("/task/1/move").text
+            assert "<span>Done</span>" in task.text
+            assert 'id="modal-confirm-button"' in ui_client.get("/task/1/remove").text
+            board = _submit(ui_client, "/task/1/remove", "/task/1/remove")
+            assert 'id="board"' in board.text and "Workflow Task" not in board.text
+
+        with allure.step("Remove the project"):
+            projects = _submit(ui_client, f"/project/{project_id}/remove", f"/project/{project_id}/remove")
+            assert projects.url.path == "/projects"
+            with standin.db_pool.read_cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM projects")
+                assert cur.fetchone()[0] == 0
+
+    @allure.title("The dashboard paginates the project list")
+    def test_dashboard_pagination(self, standin, ui_client):
+        with KanboardApiClient(url=standin.api_url, username=standin.username, token=standin.token) as api:
+            for index in range(standin.ui.PAGE_SIZE + 2):
+                api.create_project(f"Project {index:02d}")
+
+        first_page = ui_client.get("/dashboard").text
+        assert first_page.count('class="table-list-title"') == standin.ui.PAGE_SIZE
+        assert '<span class="pagination-next"><a href="/dashboard?page=2">' in first_page
+        last_page = ui_client.get("/dashboard?page=2").text
+        assert last_page.count('class="table-list-title"') == 2 and "pagination-next" not in last_page
+
+    @allure.title("Unauthenticated requests are sent to the login page, and the HTTP load workflow still runs")
+    def test_login_and_controller_routes(self, standin):
+        assert httpx.get(f"{standin.base_url}/dashboard").headers["Location"] == "/login"
+
+        result = HttpLoadGenerator(standin.base_url, "admin", "admin", users=2, duration=0.3).run_sync()
+
+        assert result["iterations"]["ok"] >= 2 and result["iterations"]["failed"] == 0
+
+    @allure.title("apply_settings points the framework at the stand-in and stop restores the previous settings")
+    def test_settings_restored(self, monkeypatch):
+        monkeypatch.setattr(AppSettings, "BASE_URL", "http://kanboard.example:8080/index.php")
+        monkeypatch.setattr(AppSettings, "SEED_MODE", "db")
+        monkeypatch.setattr(AppSettings, "PG_STATS", "session")
+
+        with KanboardStandIn() as standin:
+            standin.apply_settings()
+            assert AppSettings.get_app_root_url() == standin.base_url.rstrip("/")
+            assert (AppSettings.SEED_MODE, AppSettings.PG_STATS) == ("api", "off")
+
+        assert AppSettings.get_app_root_url() == "http://kanboard.example:8080"
+        assert (AppSettings.SEED_MODE, AppSettings.PG_STATS) == ("db", "session")
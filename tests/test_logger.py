@@ -0,0 +1,74 @@
+import io
+import logging
+
+import allure
+
+from utils.logger import LoggingPipeline
+
+
+class FakeLocator:
+    """Counts how often it is rendered, like a Playwright Locator passed to a log call."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __repr__(self):
+        self.formatted += 1
+        return "<Locator selector='#save'>"
+
+
+def _log_through_pipeline(tmp_path, emit):
+    """Runs `emit(logger)` through a pipeline whose console output is captured; returns the messages."""
+    stream = io.StringIO()
+    pipeline = LoggingPipeline(str(tmp_path / "test.log"), level=logging.INFO, stream=stream)
+    logger = logging.getLogger(f"test_logger.{tmp_path.name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(pipeline.handler)
+    # Not started yet: the records wait in the queue until every mutation below has happened.
+    try:
+        emit(logger)
+    finally:
+        pipeline.start()
+        pipeline.stop()
+        logger.removeHandler(pipeline.handler)
+    return [line.split(" - ", 3)[3] for line in stream.getvalue().splitlines()]
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Test Infrastructure")
+@allure.story("Logging")
+class TestDeferredLogging:
+    """
+    Offline tests of the queued logging pipeline: messages are formatted on the listener thread.
+    """
+
+    @allure.title("Mutable arguments are logged with their value at the time of the call")
+    def test_mutable_args_are_frozen(self, tmp_path):
+        def emit(logger):
+            options = {"rounds": 5}
+            names = ["a"]
+            logger.info("Options %s, names %r, %d rounds, ratio %.1f", options, names, 5, 0.25)
+            options["rounds"] = 50
+            names.append("b")
+            logger.info("By name: %(options)s", {"options": options})
+
+        assert _log_through_pipeline(tmp_path, emit) == [
+            "Options {'rounds': 5}, names ['a'], 5 rounds, ratio 0.2",
+            "By name: {'rounds': 50}",
+        ]
+
+    @allure.title("Other arguments are passed to the listener unchanged, without formatting them at the call")
+    def test_other_args_formatted_once(self, tmp_path):
+        locator = FakeLocator()
+        records, formatted_at_call = [], []
+
+        def emit(logger):
+            logger.addFilter(lambda record: records.append(record) or True)
+            logger.info("Clicking %s (%s, %d)", locator, "text", 3)
+            formatted_at_call.append(locator.formatted)
+
+        assert _log_through_pipeline(tmp_path, emit) == ["Clicking <Locator selector='#save'> (text, 3)"]
+        assert records[0].args == (locator, "text", 3)
+        assert formatted_at_call == [0], "Expected the calling thread not to format the locator."
+        assert locator.formatted == 2  # Once by the listener for each output: the console and the log file
@@ -0,0 +1,77 @@
+import json
+
+import allure
+
+from pages.dashboard_page import DashboardPage
+from utils.network_profile import ResourceBlocker
+
+APP_URL = "http://localhost:8080"
+NAVIGATION_ROUNDS = 10  # Timed walks of the dashboard per profile
+
+
+def _routed(blocker, url):
+    return any(pattern.search(url) for pattern in blocker.route_patterns())
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Lean Network Profile")
+class TestNetworkProfile:
+    """
+    Offline tests of which URLs the lean profile routes, and a full-vs-lean timing of dashboard navigation.
+    """
+
+    @allure.title("Only URLs a rule can block are routed; the application's pages and assets are not")
+    def test_route_patterns(self):
+        blocker = ResourceBlocker(resource_types=["image", "font", "media"], url_patterns=["avatar"],
+                                  block_third_party=True, app_host="localhost")
+
+        for url in (f"{APP_URL}/dashboard", f"{APP_URL}/board/3", f"{APP_URL}/assets/css/app.min.css?1",
+                    f"{APP_URL}/assets/js/app.min.js", f"{APP_URL}/jsonrpc.php"):
+            assert not _routed(blocker, url), f"Expected {url} to bypass the routing layer."
+        for url in (f"{APP_URL}/assets/img/favicon.png", f"{APP_URL}/assets/fonts/fa.woff2?v=4",
+                    f"{APP_URL}/?controller=AvatarFileController&action=image&user_id=1",
+                    "https://fonts.example.com/css?family=Roboto", "http://localhost.example.com/x.js"):
+            assert _routed(blocker, url), f"Expected {url} to be routed."
+
+    @allure.title("A resource type without a known URL shape falls back to routing every request")
+    def test_unknown_resource_type(self):
+        blocker = ResourceBlocker(resource_types=["other"], app_host="localhost")
+
+        assert [pattern.pattern for pattern in blocker.route_patterns()] == [".*"]
+
+    @allure.title("Dashboard navigation with the full and the lean network profile")
+    @allure.description(
+        "Walks the paginated dashboard to a project (navigate_to_project with verify_ui=True) in a context "
+        "without routing and in one with the lean profile's routes, benchmarks both and attaches the change "
+        "of the median. Both results are stored in the benchmark results store."
+    )
+    def test_lean_vs_full_navigation(self, browser, authenticated_state_fixture, kanboard_api, project_name_factory,
+                                     benchmark_runner):
+        project_name = project_name_factory("Network Profile Project")
+        kanboard_api.create_project(project_name)
+
+        results = {}
+        for profile in ("full", "lean"):
+            with allure.step(f"Benchmark dashboard navigation with the {profile} profile"):
+                context = browser.new_context(storage_state=authenticated_state_fixture)
+                blocker = ResourceBlocker.from_settings(profile)
+                if blocker is not None:
+                    blocker.apply(context)
+                dashboard_page = DashboardPage(context.new_page())
+                try:
+                    results[profile] = benchmark_runner(
+                        f"Dashboard navigation ({profile} network profile)",
+                        lambda: dashboard_page.navigate_to_project(project_name, verify_ui=True),
+                        rounds=NAVIGATION_ROUNDS, warmup_rounds=1, iterations=1)
+                finally:
+                    context.close()
+                if blocker is not None:
+                    print(f"\n{blocker.stats.summary()}")
+
+        change = results["lean"].median / results["full"].median - 1
+        comparison = {profile: result.as_dict() for profile, result in results.items()}
+        comparison["lean_median_change"] = change
+        allure.attach(json.dumps(comparison, indent=2), name="Full vs Lean Network Profile",
+                      attachment_type=allure.attachment_type.JSON)
+        print(f"Lean profile changes the median dashboard navigation time by {change:+.1%}")
@@ -0,0 +1,96 @@
+import allure
+import pytest
+
+from utils.pg_stats import STATEMENT_COUNTERS, TABLE_COUNTERS, PgStatsDiff, PgStatsSnapshot
+
+
+def _statement(query, calls, total_time_ms, rows, hit=0, read=0):
+    return {"query": query, **dict(zip(STATEMENT_COUNTERS, (calls, total_time_ms, rows, hit, read)))}
+
+
+def _table(**counters):
+    return {counter: counters.get(counter, 0) for counter in TABLE_COUNTERS}
+
+
+BEFORE = PgStatsSnapshot(10.0, statements={
+    1: _statement("SELECT * FROM tasks WHERE id = $1", 100, 50.0, 100),
+    2: _statement("SELECT * FROM projects", 5, 10.0, 50),
+    3: _statement("SELECT * FROM users WHERE id = $1", 1000, 100.0, 1000),
+}, tables={
+    "tasks": _table(seq_scan=1, seq_tup_read=10, idx_scan=100),
+    "users": _table(seq_scan=2, seq_tup_read=20),
+})
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Query Statistics")
+class TestPgStatsDiff:
+    """
+    Offline tests of the snapshot diff on hand-built snapshots; no database is needed.
+    """
+
+    @allure.title("Counters are subtracted, unchanged entries dropped and new entries counted from zero")
+    def test_diff(self):
+        after = PgStatsSnapshot(12.5, statements={
+            **BEFORE.statements,
+            1: _statement("SELECT * FROM tasks WHERE id = $1", 130, 65.0, 130),
+            4: _statement("INSERT INTO tasks VALUES ($1)", 2, 3.0, 2),
+        }, tables={
+            **BEFORE.tables,
+            "tasks": _table(seq_scan=1, seq_tup_read=10, idx_scan=130, idx_tup_fetch=30),
+            "comments": _table(n_tup_ins=4),
+        })
+
+        diff = PgStatsDiff(BEFORE, after)
+
+        assert diff.elapsed_s == 2.5
+        assert [(statement["query"], statement["calls"], statement["rows"]) for statement in diff.statements] == [
+            ("SELECT * FROM tasks WHERE id = $1", 30, 30), ("INSERT INTO tasks VALUES ($1)", 2, 2)]
+        assert diff.statements[0]["total_time_ms"] == pytest.approx(15.0)
+        assert diff.statements[0]["mean_time_ms"] == pytest.approx(0.5)
+        assert [table["table"] for table in diff.tables] == ["tasks", "comments"]
+        assert diff.tables[0]["idx_scan"] == 30 and diff.tables[1]["n_tup_ins"] == 4
+        assert diff.totals()["calls"] == 32
+
+    @allure.title("An entry evicted and recorded again counts from zero instead of being dropped")
+    def test_evicted_entry(self):
+        after = PgStatsSnapshot(11.0, statements={
+            **BEFORE.statements, 3: _statement("SELECT * FROM users WHERE id = $1", 40, 4.0, 40)}, tables={})
+
+        diff = PgStatsDiff(BEFORE, after)
+
+        assert [(statement["query"], statement["calls"]) for statement in diff.statements] == [
+            ("SELECT * FROM users WHERE id = $1", 40)]
+        assert diff.tables == []
+
+    @allure.title("Statements called at least n_plus_one_calls times with at most one row per call are flagged")
+    def test_n_plus_one_threshold(self):
+        after = PgStatsSnapshot(11.0, statements={
+            1: _statement("SELECT * FROM tasks WHERE id = $1", 119, 51.0, 119),  # 19 calls: below the threshold
+            2: _statement("SELECT * FROM projects", 25, 12.0, 250),  # 20 calls, 10 rows per call
+            3: _statement("SELECT * FROM users WHERE id = $1", 1020, 101.0, 1020),  # 20 calls, 1 row per call
+        }, tables={})
+
+        diff = PgStatsDiff(BEFORE, after, n_plus_one_calls=20)
+
+        assert [statement["query"] for statement in diff.n_plus_one] == ["SELECT * FROM users WHERE id = $1"]
+        assert "[possible N+1]" in diff.summary()
+
+    @allure.title("Statements are ranked by total time and tables by tuples read, then sequential scans")
+    def test_sort_order(self):
+        after = PgStatsSnapshot(11.0, statements={
+            1: _statement("SELECT * FROM tasks WHERE id = $1", 101, 51.0, 101),  # 1ms
+            2: _statement("SELECT * FROM projects", 6, 30.0, 60),  # 20ms
+            3: _statement("SELECT * FROM users WHERE id = $1", 1005, 105.0, 1005),  # 5ms
+        }, tables={
+            "tasks": _table(seq_scan=2, seq_tup_read=15, idx_scan=100),  # 5 tuples, 1 scan
+            "users": _table(seq_scan=4, seq_tup_read=25),  # 5 tuples, 2 scans
+            "projects": _table(seq_scan=1, seq_tup_read=50),  # 50 tuples
+        })
+
+        diff = PgStatsDiff(BEFORE, after)
+
+        assert [statement["query"] for statement in diff.statements] == [
+            "SELECT * FROM projects", "SELECT * FROM users WHERE id = $1", "SELECT * FROM tasks WHERE id = $1"]
+        assert [table["table"] for table in diff.tables] == ["projects", "users", "tasks"]
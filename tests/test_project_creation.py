@@ -1,6 +1,5 @@
 import pytest
 import allure
-import uuid
 from playwright.sync_api import Page
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
@@ -21,18 +20,19 @@ class TestProjectCreation:
         "all using synchronous operations."
     )
     # The test now correctly depends on the 'page' fixture from pytest-playwright.
-    def test_project_creation_and_db_validation(self, admin_page_fixture: Page, db_connection):
+    def test_project_creation_and_db_validation(self, admin_page_fixture: Page, db_connection,
+                                                project_name_factory, project_resolver):
         """
         This test uses the standard synchronous 'page' fixture and performs
         login steps at the beginning of the test.
         """
         # --- 1. Setup & Login ---
-        project_name = f"Test Project {uuid.uuid4()}"
+        project_name = project_name_factory("Test Project")
 
         # The login steps are now part of the test itself.
         # Instantiate the other page objects after login
-        dashboard_page = DashboardPage(admin_page_fixture)
-        project_page = ProjectPage(admin_page_fixture)
+        dashboard_page = DashboardPage(admin_page_fixture, resolver=project_resolver)
+        project_page = ProjectPage(admin_page_fixture, resolver=project_resolver)
 
         # --- 2. UI Actions (Synchronous) ---
         with allure.step("Step 1: Create a new project via UI"):
@@ -47,10 +47,7 @@ class TestProjectCreation:
                 cur.execute("SELECT name, is_active, owner_id FROM projects WHERE name = %s", (project_name,))
                 result = cur.fetchone()
 
-        # --- 4. Commit transaction to avoid open transactions
-        db_connection.commit()
-
-        # --- 5. Assertions ---
+        # --- 4. Assertions ---
         with allure.step("Step 3: Assert database records are correct and properly stored"):
             assert result is not None, f"Project '{project_name}' was not found in the database."
             print(f"Database record for project '{project_name}': {result}")
@@ -0,0 +1,199 @@
+import json
+
+import allure
+import httpx
+import pytest
+
+from config.app_settings import AppSettings
+from utils.complexity import complexity_report, format_complexity_report
+from utils.data_factory import BulkDataFactory
+from utils.dataset_cache import DatasetSpec
+from utils.http_auth import http_login
+from utils.http_load import BOARD_URL
+
+TASK_SIZES = AppSettings.get_scaling_task_sizes()  # Tasks per project, log-spaced (10 -> 100k by default)
+PROJECT_COUNTS = AppSettings.get_scaling_project_counts()  # Projects visible to the admin (1 -> 1000 by default)
+SLA = AppSettings.get_scaling_sla()  # p95 latency in seconds
+TASKS_PER_SWEEP_PROJECT = 10
+
+# The queries behind the measured views: the task list of a project, the board's tasks in column,
+# swimlane and position order (the query alone; the rendered view is measured by test_board_view_scaling)
+# and the dashboard's list of the user's active projects.
+TASK_QUERIES = {
+    "task_retrieval": "SELECT id, title FROM tasks WHERE project_id = %s",
+    "board_query": (
+        "SELECT t.id, t.title, t.position, c.title, s.name FROM tasks t "
+        "JOIN columns c ON c.id = t.column_id JOIN swimlanes s ON s.id = t.swimlane_id "
+        "WHERE t.project_id = %s AND t.is_active = 1 ORDER BY c.position, s.position, t.position"
+    ),
+}
+PROJECT_LIST_QUERY = (
+    "SELECT p.id, p.name FROM projects p JOIN project_has_users pu ON pu.project_id = p.id "
+    "JOIN users u ON u.id = pu.user_id WHERE u.username = %s AND p.is_active = 1 ORDER BY p.name"
+)
+
+pytestmark = [
+    pytest.mark.scaling,
+    pytest.mark.skipif(not AppSettings.is_scaling_sweep_enabled(), reason="Set SCALING_SWEEP=true to run the sweep"),
+]
+
+
+class ScalingDatasets:
+    """
+    Seeds the sweep's datasets on first use and hands the same data to every later parametrisation:
+    one project per task size, and a growing pool of small projects for the project-count sweep.
+    With a dataset cache the per-size projects are reused across runs and kept at the end of the session.
+    The project-count sweep never uses the cache: its projects are what it measures, so they are seeded
+    for the session and always removed, and the cache never holds hundreds of tiny projects.
+    """
+
+    def __init__(self, db_pool, project_name_factory, cache=None):
+        self.db_pool = db_pool
+        self.factory = BulkDataFactory(db_pool, chunk_size=AppSettings.get_seed_chunk_size())
+        self.project_name_factory = project_name_factory
+        self.cache = cache
+        self.projects_by_size = {}
+        self.sweep_projects = []
+
+    def project_with_tasks(self, number_of_tasks: int) -> int:
+        if number_of_tasks not in self.projects_by_size:
+            if self.cache is not None:
+                dataset = self.cache.get(DatasetSpec(number_of_tasks, spread_across_columns=True))
+                allure.attach(dataset.summary(), name=f"Dataset Cache ({number_of_tasks} tasks)",
+                              attachment_type=allure.attachment_type.TEXT)
+                self.projects_by_size[number_of_tasks] = dataset.project_id
+            else:
+                result = self.factory.create_project(self.project_name_factory(f"Scaling {number_of_tasks} Tasks"),
+                                                     number_of_tasks, owner_username=AppSettings.ADMIN_USER,
+                                                     spread_across_columns=True)
+                allure.attach(str(result["report"]), name=f"Seeding Report ({number_of_tasks} tasks)",
+                              attachment_type=allure.attachment_type.TEXT)
+                self.projects_by_size[number_of_tasks] = result["project_id"]
+        return self.projects_by_size[number_of_tasks]
+
+    def ensure_projects(self, count: int):
+        while len(self.sweep_projects) < count:
+            result = self.factory.create_project(self.project_name_factory("Scaling Project"),
+                                                 TASKS_PER_SWEEP_PROJECT, owner_username=AppSettings.ADMIN_USER)
+            self.sweep_projects.append(result["project_id"])
+
+    def remove_all(self):
+        """Removes the sweep projects, and the per-size projects unless they belong to the dataset cache."""
+        project_ids = self.sweep_projects + (list(self.projects_by_size.values()) if self.cache is None else [])
+        if project_ids:
+            with self.db_pool.transaction() as cur:
+                cur.execute("DELETE FROM projects WHERE id = ANY(%s)", (project_ids,))
+
+
+@pytest.fixture(scope="session")
+def board_client():
+    """An HTTP client logged in as the admin, for timing the board view as the server renders it."""
+    state = http_login(AppSettings.ADMIN_USER, AppSettings.ADMIN_PASSWORD)
+    cookies = httpx.Cookies()
+    for cookie in state["cookies"]:
+        cookies.set(cookie["name"], cookie["value"])
+    with httpx.Client(base_url=AppSettings.get_app_root_url(), cookies=cookies, follow_redirects=False, timeout=60.0) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def scaling_datasets(request, db_pool, project_name_factory):
+    """
+    Provides the sweep's datasets, seeded once per session. With DATASET_CACHE=true the per-size projects are
+    reused across runs; everything else is removed at the end of the session.
+    """
+    cache = request.getfixturevalue("dataset_cache") if AppSettings.is_dataset_cache_enabled() else None
+    datasets = ScalingDatasets(db_pool, project_name_factory, cache=cache)
+    yield datasets
+    datasets.remove_all()
+    print("\nScaling datasets removed.")
+
+
+def _report_fit(title, sizes, p95s):
+    report = complexity_report(sizes, p95s, SLA)
+    text = format_complexity_report(report)
+    print(f"\n{title}\n{text}")
+    allure.attach(json.dumps(report, indent=2), name=f"Complexity Fit: {title}",
+                  attachment_type=allure.attachment_type.JSON)
+    allure.attach(text, name=f"Complexity Summary: {title}", attachment_type=allure.attachment_type.TEXT)
+    return report
+
+
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Dataset Scaling")
+class TestDatasetScaling:
+    """
+    Measures how query latency grows with the dataset, fits the curve to O(1)/O(log n)/O(n)/O(n log n)
+    and extrapolates the size at which the p95 would exceed the SLA.
+    """
+
+    @allure.title("Scaling of {measurement} with the number of tasks per project")
+    @pytest.mark.parametrize("measurement", sorted(TASK_QUERIES))
+    def test_task_scaling(self, measurement, scaling_datasets, db_connection, benchmark_runner):
+        query = TASK_QUERIES[measurement]
+        p95s = []
+        for size in TASK_SIZES:
+            with allure.step(f"Measure {measurement} with {size} tasks"):
+                project_id = scaling_datasets.project_with_tasks(size)
+                with db_connection.cursor() as cur:
+                    def run_query():
+                        cur.execute(query, (project_id,))
+                        return cur.fetchall()
+
+                    result = benchmark_runner(f"Scaling {measurement}", run_query, size=size)
+                assert len(result.last_result) == size, f"Expected {size} tasks, got {len(result.last_result)}."
+                p95s.append(result.p95)
+
+        with allure.step("Fit the complexity model and extrapolate the SLA"):
+            _report_fit(f"{measurement} vs tasks per project", TASK_SIZES, p95s)
+
+        with allure.step(f"Verify every measured p95 is within the {SLA}s SLA"):
+            slow = {size: p95 for size, p95 in zip(TASK_SIZES, p95s) if p95 >= SLA}
+            assert not slow, f"p95 above the {SLA}s SLA at sizes: {slow}"
+
+    @allure.title("Scaling of the board view with the number of tasks per project")
+    def test_board_view_scaling(self, scaling_datasets, board_client, benchmark_runner):
+        p95s = []
+        for size in TASK_SIZES:
+            with allure.step(f"Measure the board view with {size} tasks"):
+                url = BOARD_URL.format(project_id=scaling_datasets.project_with_tasks(size))
+
+                def load_board():
+                    response = board_client.get(url)
+                    assert response.status_code == 200, f"Board view returned HTTP {response.status_code}"
+                    return response
+
+                result = benchmark_runner("Scaling board_view", load_board, size=size)
+                p95s.append(result.p95)
+
+        with allure.step("Fit the complexity model and extrapolate the SLA"):
+            _report_fit("board view vs tasks per project", TASK_SIZES, p95s)
+
+        with allure.step(f"Verify every measured p95 is within the {SLA}s SLA"):
+            slow = {size: p95 for size, p95 in zip(TASK_SIZES, p95s) if p95 >= SLA}
+            assert not slow, f"p95 above the {SLA}s SLA at sizes: {slow}"
+
+    @allure.title("Scaling of the dashboard project list with the number of projects")
+    def test_project_count_scaling(self, scaling_datasets, db_connection, benchmark_runner):
+        sizes, p95s = [], []
+        for count in PROJECT_COUNTS:
+            with allure.step(f"Measure the project list with {count} sweep projects"):
+                scaling_datasets.ensure_projects(count)
+                with db_connection.cursor() as cur:
+                    def run_query():
+                        cur.execute(PROJECT_LIST_QUERY, (AppSettings.ADMIN_USER,))
+                        return cur.fetchall()
+
+                    # The admin may own other projects as well, so the size is the number actually listed.
+                    listed = len(run_query())
+                    result = benchmark_runner("Scaling project_list", run_query, size=listed)
+                sizes.append(listed)
+                p95s.append(result.p95)
+
+        with allure.step("Fit the complexity model and extrapolate the SLA"):
+            _report_fit("project list vs projects", sizes, p95s)
+
+        with allure.step(f"Verify every measured p95 is within the {SLA}s SLA"):
+            slow = {size: p95 for size, p95 in zip(sizes, p95s) if p95 >= SLA}
+            assert not slow, f"p95 above the {SLA}s SLA at sizes: {slow}"
@@ -0,0 +1,43 @@
+import json
+import allure
+import pytest
+from config.app_settings import AppSettings
+from utils.ui_load import ACTIONS, LoadTestConfig, UiLoadTest, format_report
+from utils.stats import write_json_report
+
+
+@pytest.mark.load
+@pytest.mark.skipif(AppSettings.get_load_users() == 0, reason="Set LOAD_USERS to run the UI load test")
+@allure.epic("Kanboard Application")
+@allure.feature("Performance")
+@allure.story("Multi-User UI Load")
+class TestUiLoad:
+    """
+    Drives LOAD_USERS concurrent virtual users through the UI workflows and reports
+    per-action throughput and latency percentiles. Skipped while LOAD_USERS is 0.
+    """
+
+    @allure.title("Concurrent virtual users: login, create project, add task, move to done, delete task and project")
+    @allure.description(
+        "Every virtual user logs in in its own browser context and repeats the project/task workflow, removing "
+        "its project at the end of each iteration, until LOAD_DURATION has passed. With TEST_USER_COUNT set, the virtual users log in as the pool's test "
+        "users instead of sharing ADMIN_USER. The per-action report is written to temp/load/ and attached."
+    )
+    def test_ui_load(self, async_browser, credential_pool, test_data_registry):
+        config = LoadTestConfig.from_settings()
+        credentials = credential_pool.credentials(config.users) if credential_pool else None
+        with allure.step(f"Step 1: Run {config.users} virtual users for {config.duration:.0f}s"):
+            result = UiLoadTest(async_browser, config, credentials=credentials, registry=test_data_registry).run()
+
+        with allure.step("Step 2: Write and attach the load report"):
+            report_path = write_json_report(result, "ui_load")
+            table = format_report(result)
+            print(f"\n{table}\nReport written to {report_path}")
+            allure.attach(json.dumps(result, indent=2), name="UI Load Report",
+                          attachment_type=allure.attachment_type.JSON)
+            allure.attach(table, name="UI Load Summary", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Step 3: Verify every action completed at least once"):
+            actions = result["actions"]
+            missing = [action for action in ACTIONS if actions.get(action, {}).get("ok", 0) == 0]
+            assert not missing, f"Actions that never succeeded under load: {missing}"
@@ -0,0 +1,206 @@
+"""
+Failure artifacts (Playwright traces and screenshots), written off the test thread.
+
+Test threads hand bytes or temporary files to the shared ArtifactStore and carry on; one background thread
+writes them under ARTIFACT_DIR, re-compresses trace archives, and deletes the oldest artifacts whenever the
+directory would grow past ARTIFACT_MAX_MB. Screenshots a page object takes on purpose (`take_screenshot`) go
+through a separate, uncapped store in SCREENSHOT_DIR, so the cap never removes them.
+
+Traces are recorded in chunks: `TraceRecorder.start()` opens a chunk for the test on a context that is already
+tracing, and `stop(keep=False)` drops it inside Playwright without writing anything, so passing tests only pay
+for the recording itself. By default that is DOM snapshots and sources; the screencast (TRACE_SCREENSHOTS) costs
+the browser a frame capture on every paint and is opt-in.
+"""
+import atexit
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Dict, List, Optional
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+from utils.workers import get_worker_id, is_parallel_run
+
+
+class ArtifactStore:
+    """
+    Writes artifacts under `directory` on a background thread and keeps the directory below `max_bytes`
+    by deleting the oldest files first (`max_bytes=None` never deletes anything). `save_bytes()` and
+    `save_file()` return the final path at once; the file exists there after `flush()`.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int], compress_level: int = 9):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.logger = setup_logger(self.__class__.__name__)
+        self.written = 0
+        self.evicted = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._files: List[tuple] = []  # (mtime, path, size) of the files in the directory, oldest first
+        self._total = 0
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    self._files.append((stat.st_mtime, path, stat.st_size))
+            self._files.sort()
+            self._total = sum(size for _, _, size in self._files)
+            self._thread = threading.Thread(target=self._run, name="ArtifactStore", daemon=True)
+            self._thread.start()
+
+    def _target(self, name: str) -> str:
+        if is_parallel_run():
+            # Keep parallel workers from overwriting each other's artifacts.
+            head, tail = os.path.split(name)
+            name = os.path.join(head, f"{get_worker_id()}_{tail}")
+        return os.path.join(self.directory, name)
+
+    def save_bytes(self, name: str, data: bytes) -> str:
+        """Queues `data` to be written to `name` (relative to the store's directory); returns the final path."""
+        self._start()
+        path = self._target(name)
+        self._queue.put((self._write_bytes, path, data))
+        return path
+
+    def save_file(self, name: str, source: str, recompress: bool = False) -> str:
+        """Queues `source` to be moved to `name`, re-packing zip archives at `compress_level` with `recompress`."""
+        self._start()
+        path = self._target(name)
+        self._queue.put((self._move_file, path, (source, recompress)))
+        return path
+
+    def flush(self):
+        """Blocks until every queued artifact is written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Writes the remaining artifacts and stops the background thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                write, path, payload = job
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                write(path, payload)
+                self._account(path)
+            except Exception as e:
+                self.logger.error("Could not write artifact: %s", e)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write_bytes(path: str, data: bytes):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _move_file(self, path: str, payload):
+        source, recompress = payload
+        if recompress and zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as original, \
+                    zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compress_level) as packed:
+                for entry in original.infolist():
+                    # The entry's own compression (often none) would win over the archive's default.
+                    packed.writestr(entry, original.read(entry), compress_type=zipfile.ZIP_DEFLATED,
+                                    compresslevel=self.compress_level)
+            os.remove(source)
+        else:
+            shutil.move(source, path)
+
+    def _account(self, path: str):
+        """Records a new file and deletes the oldest artifacts while the directory is over its cap."""
+        size = os.path.getsize(path)
+        self._files.append((time.time(), path, size))
+        self._total += size
+        self.written += 1
+        while self.max_bytes is not None and self._total > self.max_bytes and self._files:
+            _, oldest, oldest_size = self._files.pop(0)
+            if os.path.exists(oldest):
+                os.remove(oldest)
+            self._total -= oldest_size
+            self.evicted += 1
+            self.logger.info("Artifact cap of %.0f MB reached; removed %s", self.max_bytes / 1024 ** 2, oldest)
+
+    def summary(self) -> str:
+        cap = f"the {self.max_bytes / 1024 ** 2:.0f} MB cap" if self.max_bytes is not None else "no cap"
+        return (f"Artifacts: {self.written} written, {self.evicted} evicted by {cap}, "
+                f"{self._total / 1024 ** 2:.1f} MB in {self.directory}")
+
+
+_stores: Dict[str, ArtifactStore] = {}
+_store_lock = threading.Lock()
+
+
+def _shared_store(directory: str, max_bytes: Optional[int]) -> ArtifactStore:
+    with _store_lock:
+        if directory not in _stores:
+            _stores[directory] = ArtifactStore(directory, max_bytes)
+            atexit.register(_stores[directory].close)
+        return _stores[directory]
+
+
+def artifact_store() -> ArtifactStore:
+    """Returns the process-wide artifact store (ARTIFACT_DIR, ARTIFACT_MAX_MB), flushed when the process exits."""
+    return _shared_store(AppSettings.get_artifact_dir(), AppSettings.get_artifact_max_mb() * 1024 ** 2)
+
+
+def screenshot_store() -> ArtifactStore:
+    """Returns the process-wide, uncapped store of screenshots page objects take on purpose (SCREENSHOT_DIR)."""
+    return _shared_store(AppSettings.get_screenshot_dir(), None)
+
+
+class TraceRecorder:
+    """
+    Records one Playwright trace chunk per test on a context started with `start_tracing(context)`.
+    `stop(keep=True)` saves the chunk to a temporary file, which the caller attaches to the report and then
+    hands to the artifact store with `save_file(..., recompress=True)`.
+    """
+
+    def __init__(self, context, title: str):
+        self.context = context
+        self.title = title
+        self.active = False
+
+    @staticmethod
+    def start_tracing(context, screenshots: bool = False):
+        """Starts recording DOM snapshots and sources, plus the screencast with `screenshots`, on a new context."""
+        context.tracing.start(screenshots=screenshots, snapshots=True, sources=True)
+
+    def start(self) -> "TraceRecorder":
+        self.context.tracing.start_chunk(title=self.title)
+        self.active = True
+        return self
+
+    def stop(self, keep: bool) -> Optional[str]:
+        """Ends the chunk; with `keep`, returns the path of the saved chunk, otherwise discards it."""
+        if not self.active:
+            return None
+        self.active = False
+        if not keep:
+            self.context.tracing.stop_chunk()
+            return None
+        handle, path = tempfile.mkstemp(prefix="trace_", suffix=".zip")
+        os.close(handle)
+        self.context.tracing.stop_chunk(path=path)
+        return path
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from typing import Awaitable, Optional, Tuple
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from utils.logger import setup_logger
+
+
+class AsyncBrowserRunner:
+    """
+    Owns an asyncio event loop and an async Playwright browser on a dedicated thread.
+
+    Synchronous tests hand coroutines to `run()` (or several at once to `run_concurrently()`),
+    so many pages can be driven concurrently in one event loop without the suite having to become
+    async. Running the loop on its own thread keeps it independent of the synchronous Playwright
+    instance that pytest-playwright drives on the main thread.
+    """
+
+    def __init__(self, headless: bool = True, slow_mo: int = 0, browser_name: str = "chromium"):
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.browser_name = browser_name
+        self.logger = setup_logger(self.__class__.__name__)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="AsyncBrowserRunner", daemon=True)
+        self._playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+
+    def start(self) -> "AsyncBrowserRunner":
+        self._thread.start()
+        self.run(self._launch())
+        self.logger.info("Async %s browser started (headless=%s)", self.browser_name, self.headless)
+        return self
+
+    async def _launch(self):
+        self._playwright = await async_playwright().start()
+        browser_type = getattr(self._playwright, self.browser_name)
+        self.browser = await browser_type.launch(headless=self.headless, slow_mo=self.slow_mo)
+
+    def run(self, coroutine: Awaitable, timeout: Optional[float] = None):
+        """Runs a coroutine on the runner's event loop and returns its result (re-raising its exception)."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def run_concurrently(self, *coroutines: Awaitable, timeout: Optional[float] = None) -> list:
+        """Runs the coroutines concurrently on the event loop and returns their results in order."""
+        async def gather():
+            return await asyncio.gather(*coroutines)
+        return self.run(gather(), timeout=timeout)
+
+    async def new_page(self, storage_state: Optional[str] = None,
+                       base_url: Optional[str] = None) -> Tuple[BrowserContext, Page]:
+        """Creates an isolated context (optionally authenticated and opened at base_url) and returns it with its page."""
+        context = await self.browser.new_context(storage_state=storage_state)
+        page = await context.new_page()
+        if base_url:
+            await page.goto(base_url)
+        return context, page
+
+    async def _shutdown(self):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def stop(self):
+        """Closes the browser and stops the event loop thread."""
+        try:
+            self.run(self._shutdown(), timeout=30)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.logger.info("Async browser stopped")
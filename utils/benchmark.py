@@ -0,0 +1,192 @@
+import math
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import setup_logger
+from utils.stats import percentile
+
+# Two-sided 95% critical values of Student's t distribution by degrees of freedom; 1.96 beyond the table.
+_T_CRITICAL_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+                  10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000,
+                  120: 1.980}
+_Z_95 = 1.96
+
+
+def _t_critical_95(df: int) -> float:
+    """Returns the 95% t critical value for df degrees of freedom (the next smaller tabulated df, conservatively)."""
+    if df > 120:
+        return _Z_95
+    return _T_CRITICAL_95[max(key for key in _T_CRITICAL_95 if key <= df)]
+
+
+class BenchmarkResult:
+    """
+    Per-iteration timings of one benchmark (one sample per measurement round, in nanoseconds)
+    and the statistics derived from them.
+    """
+
+    def __init__(self, name: str, samples_ns: List[float], iterations: int, warmup_rounds: int,
+                 last_result: Any = None):
+        if not samples_ns:
+            raise ValueError("A benchmark result needs at least one sample")
+        self.name = name
+        self.samples_ns = samples_ns
+        self.iterations = iterations
+        self.warmup_rounds = warmup_rounds
+        self.last_result = last_result
+
+    @property
+    def rounds(self) -> int:
+        return len(self.samples_ns)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples_ns) / 1e9
+
+    @property
+    def max(self) -> float:
+        return max(self.samples_ns) / 1e9
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples_ns) / 1e9
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples_ns) / 1e9
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples_ns) / 1e9 if self.rounds > 1 else 0.0
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples_ns, 95) / 1e9
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.samples_ns, 99) / 1e9
+
+    def mean_ci95(self) -> tuple:
+        """Returns the 95% confidence interval of the mean (Student's t) in seconds."""
+        if self.rounds < 2:
+            return self.mean, self.mean
+        half_width = _t_critical_95(self.rounds - 1) * self.stdev / math.sqrt(self.rounds)
+        return self.mean - half_width, self.mean + half_width
+
+    def median_ci95(self) -> tuple:
+        """
+        Returns a distribution-free 95% confidence interval of the median in seconds, taken from the
+        order statistics at ranks n/2 -/+ 1.96*sqrt(n)/2 (normal approximation of the binomial).
+        """
+        ordered = sorted(self.samples_ns)
+        n = len(ordered)
+        half_width = _Z_95 * math.sqrt(n) / 2
+        lower = max(0, math.floor(n / 2 - half_width) - 1)
+        upper = min(n - 1, math.ceil(n / 2 + half_width))
+        return ordered[lower] / 1e9, ordered[upper] / 1e9
+
+    def iqr_outliers(self) -> List[float]:
+        """Returns the samples (seconds) outside [Q1 - 1.5*IQR, Q3 + 1.5*IQR]."""
+        q1, q3 = percentile(self.samples_ns, 25), percentile(self.samples_ns, 75)
+        low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        return [sample / 1e9 for sample in self.samples_ns if sample < low or sample > high]
+
+    def mad_outliers(self, threshold: float = 3.5) -> List[float]:
+        """Returns the samples (seconds) whose modified z-score (based on the median absolute deviation) exceeds threshold."""
+        median = statistics.median(self.samples_ns)
+        mad = statistics.median(abs(sample - median) for sample in self.samples_ns)
+        if mad == 0:
+            return []
+        return [sample / 1e9 for sample in self.samples_ns if 0.6745 * abs(sample - median) / mad > threshold]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the configuration, statistics (seconds) and raw samples as JSON-serialisable data."""
+        return {
+            "name": self.name,
+            "rounds": self.rounds,
+            "iterations_per_round": self.iterations,
+            "warmup_rounds": self.warmup_rounds,
+            "unit": "seconds per iteration",
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "p95": self.p95,
+            "p99": self.p99,
+            "max": self.max,
+            "mean_ci95": list(self.mean_ci95()),
+            "median_ci95": list(self.median_ci95()),
+            "outliers": {"iqr": len(self.iqr_outliers()), "mad": len(self.mad_outliers())},
+            "samples": [sample / 1e9 for sample in self.samples_ns],
+        }
+
+    def summary(self) -> str:
+        low, high = self.median_ci95()
+        return (f"{self.name}: median {self.median * 1000:.3f}ms (95% CI {low * 1000:.3f}-{high * 1000:.3f}ms), "
+                f"min {self.min * 1000:.3f}ms, p95 {self.p95 * 1000:.3f}ms, p99 {self.p99 * 1000:.3f}ms, "
+                f"stdev {self.stdev * 1000:.3f}ms, {self.rounds} rounds x {self.iterations} iterations, "
+                f"outliers IQR {len(self.iqr_outliers())} / MAD {len(self.mad_outliers())}")
+
+    def __str__(self):
+        return self.summary()
+
+
+class Benchmark:
+    """
+    Times a callable with time.perf_counter_ns.
+
+    Each run performs `warmup_rounds` untimed rounds, then `rounds` timed rounds of `iterations` calls.
+    One sample per round is recorded: the round's time divided by its iterations. When `iterations` is
+    None it is calibrated by doubling until a round takes at least `min_round_time` seconds, so very
+    fast operations are not dominated by timer resolution.
+
+    Usage:
+        result = Benchmark("fetch tasks", rounds=30).run(lambda: fetch_tasks(project_id))
+    """
+
+    def __init__(self, name: str, rounds: int = 30, warmup_rounds: int = 3, iterations: Optional[int] = None,
+                 min_round_time: float = 0.005, max_iterations: int = 1_000_000):
+        self.name = name
+        self.rounds = max(1, rounds)
+        self.warmup_rounds = max(0, warmup_rounds)
+        self.iterations = iterations
+        self.min_round_time_ns = int(min_round_time * 1e9)
+        self.max_iterations = max(1, max_iterations)
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @staticmethod
+    def _time_round(func: Callable[[], Any], iterations: int) -> tuple:
+        result = None
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            result = func()
+        return time.perf_counter_ns() - start, result
+
+    def calibrate(self, func: Callable[[], Any]) -> int:
+        """Returns the number of iterations per round needed to reach min_round_time."""
+        iterations = 1
+        while iterations < self.max_iterations:
+            elapsed_ns, _ = self._time_round(func, iterations)
+            if elapsed_ns >= self.min_round_time_ns:
+                break
+            iterations *= 2
+        return min(iterations, self.max_iterations)
+
+    def run(self, func: Callable[[], Any]) -> BenchmarkResult:
+        """Warms up, calibrates (unless iterations is fixed) and measures func; returns a BenchmarkResult."""
+        result = None
+        for _ in range(self.warmup_rounds):
+            result = func()
+        iterations = self.iterations or self.calibrate(func)
+        self.logger.debug("Benchmark '%s': %d rounds x %d iterations", self.name, self.rounds, iterations)
+
+        samples_ns = []
+        for _ in range(self.rounds):
+            elapsed_ns, result = self._time_round(func, iterations)
+            samples_ns.append(elapsed_ns / iterations)
+
+        benchmark_result = BenchmarkResult(self.name, samples_ns, iterations, self.warmup_rounds, last_result=result)
+        self.logger.info("%s", benchmark_result)
+        return benchmark_result
@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import weakref
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from utils.benchmark import BenchmarkResult
+from utils.logger import setup_logger
+from utils.workers import get_worker_id
+
+# Installed in every document before its own scripts run. The observers use buffered: true, so entries
+# recorded before they were registered are delivered as well. Unsupported entry types are skipped.
+INIT_SCRIPT = """
+(() => {
+  if (window.__perfMetrics) return;
+  const metrics = window.__perfMetrics = {paint: {}, lcp: null, cls: 0, longTasks: [], resources: []};
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+    } catch (e) { /* entry type not supported by this browser */ }
+  };
+  observe('paint', e => { metrics.paint[e.name] = e.startTime; });
+  observe('largest-contentful-paint', e => { metrics.lcp = e.renderTime || e.loadTime || e.startTime; });
+  observe('layout-shift', e => { if (!e.hadRecentInput) metrics.cls += e.value; });
+  observe('longtask', e => { metrics.longTasks.push(e.duration); });
+  observe('resource', e => {
+    metrics.resources.push({name: e.name, type: e.initiatorType, duration: e.duration, size: e.transferSize || 0});
+  });
+  window.__collectPerfMetrics = () => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const slowest = [...metrics.resources].sort((a, b) => b.duration - a.duration).slice(0, 5);
+    return {
+      url: location.href,
+      timeOrigin: performance.timeOrigin,
+      ttfb: nav ? nav.responseStart : null,
+      domContentLoaded: nav ? nav.domContentLoadedEventEnd : null,
+      load: nav ? nav.loadEventEnd : null,
+      fcp: metrics.paint['first-contentful-paint'] ?? null,
+      lcp: metrics.lcp,
+      cls: metrics.cls,
+      longTasks: metrics.longTasks.length,
+      longTaskTime: metrics.longTasks.reduce((sum, duration) => sum + duration, 0),
+      resources: metrics.resources.length,
+      transferBytes: metrics.resources.reduce((sum, r) => sum + r.size, 0) + (nav ? nav.transferSize || 0 : 0),
+      slowestResources: slowest.map(r => ({name: r.name, type: r.type, duration: r.duration})),
+    };
+  };
+})();
+"""
+
+# Metrics (milliseconds) that are recorded in the benchmark results store.
+TIMED_METRICS = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms", "lcp_ms", "long_task_ms")
+
+_collectors: "weakref.WeakKeyDictionary[Page, BrowserMetricsCollector]" = weakref.WeakKeyDictionary()
+_instrumented_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+def collector_for(page: Page) -> Optional["BrowserMetricsCollector"]:
+    """Returns the metrics collector registered for a page, or None when instrumentation is off."""
+    return _collectors.get(page)
+
+
+def benchmark_results(records: Iterable[Dict]) -> List[BenchmarkResult]:
+    """
+    Returns one result per (action, timed metric) over `records`, in the results store format (samples in ns).
+    Pass the records of a whole session, so each stored run holds every sample of the action, not one.
+    """
+    samples: Dict[str, List[float]] = {}
+    for record in records:
+        for metric in TIMED_METRICS:
+            if record.get(metric) is not None:
+                samples.setdefault(f"UI {record['action']} {metric}", []).append(record[metric] * 1e6)
+    return [BenchmarkResult(name, values, iterations=1, warmup_rounds=0) for name, values in samples.items()]
+
+
+def _action_path(url: str) -> str:
+    """Returns the URL path and query with IDs replaced, so the same view always gets the same name."""
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    return re.sub(r"\d+", "{id}", path) or "/"
+
+
+class BrowserMetricsCollector:
+    """
+    Collects client-side timings (Navigation Timing, FCP, LCP, CLS, long tasks and resource timing)
+    for every navigation a page object performs.
+
+    `install(context)` adds the PerformanceObserver script to a context (once per context, so pooled
+    contexts can be reused), and `register(page)` makes BasePage report its navigations and navigating
+    clicks to this collector.
+    """
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @staticmethod
+    def install(context: BrowserContext):
+        if context not in _instrumented_contexts:
+            context.add_init_script(INIT_SCRIPT)
+            _instrumented_contexts.add(context)
+
+    def register(self, page: Page):
+        _collectors[page] = self
+
+    @staticmethod
+    def unregister(page: Page):
+        _collectors.pop(page, None)
+
+    @staticmethod
+    def time_origin(page: Page) -> Optional[float]:
+        """Returns the current document's performance.timeOrigin; it changes when a navigation loads a new document."""
+        try:
+            return page.evaluate("performance.timeOrigin")
+        except Exception:
+            return None
+
+    def collect(self, page: Page, action: str) -> Optional[Dict]:
+        """Waits for the load event and records the current document's metrics under `action`."""
+        try:
+            page.wait_for_load_state("load")
+            raw = page.evaluate("window.__collectPerfMetrics ? window.__collectPerfMetrics() : null")
+        except Exception as e:
+            self.logger.warning("Could not collect browser metrics for '%s': %s", action, e)
+            return None
+        if raw is None:
+            self.logger.debug("No instrumentation in the document for '%s'", action)
+            return None
+        record = {
+            "action": f"{action} {_action_path(raw['url'])}",
+            "url": raw["url"],
+            "ttfb_ms": raw["ttfb"],
+            "dom_content_loaded_ms": raw["domContentLoaded"],
+            "load_ms": raw["load"],
+            "fcp_ms": raw["fcp"],
+            "lcp_ms": raw["lcp"],
+            "cls": raw["cls"],
+            "long_tasks": raw["longTasks"],
+            "long_task_ms": raw["longTaskTime"],
+            "resources": raw["resources"],
+            "transfer_bytes": raw["transferBytes"],
+            "slowest_resources": raw["slowestResources"],
+        }
+        self.records.append(record)
+        self.logger.debug("Browser metrics for %s: load %sms, LCP %sms", record["action"], record["load_ms"],
+                          record["lcp_ms"])
+        return record
+
+    def collect_if_navigated(self, page: Page, previous_origin: Optional[float], action: str) -> Optional[Dict]:
+        """Records metrics when the document changed since `previous_origin` was read (i.e. the click navigated)."""
+        current_origin = self.time_origin(page)
+        if previous_origin is None or current_origin is None or current_origin == previous_origin:
+            return None
+        return self.collect(page, action)
+
+    def as_dict(self) -> Dict:
+        return {"actions": self.records}
+
+
+class BrowserProfiler:
+    """
+    Records a Chrome DevTools performance trace ('trace') or a JavaScript CPU profile ('cpu') for one page.
+    Both need Chromium. The output opens in the DevTools Performance panel.
+    """
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page, kind: str = "trace",
+                 directory: str = os.path.join("temp", "profiles")):
+        if kind not in ("trace", "cpu"):
+            raise ValueError(f"Unknown profile kind '{kind}', expected 'trace' or 'cpu'")
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.kind = kind
+        self.directory = directory
+        self.logger = setup_logger(self.__class__.__name__)
+        self._cdp = None
+        self.path: Optional[str] = None
+
+    def start(self, name: str):
+        os.makedirs(self.directory, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]+", "_", name)[:120]
+        extension = "json" if self.kind == "trace" else "cpuprofile"
+        self.path = os.path.join(self.directory, f"{safe_name}_{get_worker_id()}.{extension}")
+        if self.kind == "trace":
+            self.browser.start_tracing(page=self.page, path=self.path, screenshots=True)
+        else:
+            self._cdp = self.context.new_cdp_session(self.page)
+            self._cdp.send("Profiler.enable")
+            self._cdp.send("Profiler.start")
+        self.logger.info("Started %s profiling for %s", self.kind, name)
+
+    def stop(self) -> Optional[str]:
+        """Stops profiling, writes the output file and returns its path."""
+        if self.kind == "trace":
+            self.browser.stop_tracing()
+        else:
+            profile = self._cdp.send("Profiler.stop")["profile"]
+            self._cdp.detach()
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(profile, f)
+        self.logger.info("Wrote %s profile to %s", self.kind, self.path)
+        return self.path
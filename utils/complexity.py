@@ -0,0 +1,126 @@
+import math
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Growth functions f(n) of the candidate models t(n) = a + b * f(n). O(1) has no b term.
+MODELS: Dict[str, Optional[Callable[[float], float]]] = {
+    "O(1)": None,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+}
+
+
+class ModelFit:
+    """A fitted latency model t(n) = a + b * f(n), with its goodness of fit."""
+
+    def __init__(self, name: str, a: float, b: float, rss: float, aic: float, r_squared: float):
+        self.name = name
+        self.a = a
+        self.b = b
+        self.rss = rss
+        self.aic = aic
+        self.r_squared = r_squared
+
+    def predict(self, n: float) -> float:
+        growth = MODELS[self.name]
+        return self.a + (self.b * growth(n) if growth else 0.0)
+
+    def break_point(self, sla: float, max_n: float = 1e15) -> Optional[float]:
+        """
+        Returns the smallest size n >= 1 at which the model predicts a latency above `sla`:
+        1 if it already exceeds it, None if it never does (flat or decreasing models, or beyond max_n).
+        """
+        if self.predict(1) > sla:
+            return 1.0
+        if MODELS[self.name] is None or self.b <= 0 or self.predict(max_n) <= sla:
+            return None
+        # Every candidate growth function is increasing, so bisect on a log scale.
+        low, high = 1.0, max_n
+        while high / low > 1.001:
+            middle = math.sqrt(low * high)
+            if self.predict(middle) > sla:
+                high = middle
+            else:
+                low = middle
+        return high
+
+    def as_dict(self) -> dict:
+        return {"model": self.name, "a": self.a, "b": self.b, "rss": self.rss, "aic": self.aic,
+                "r_squared": self.r_squared}
+
+    def __str__(self):
+        return f"{self.name}: t(n) = {self.a:.4g} + {self.b:.4g} * f(n) (R^2={self.r_squared:.3f}, AIC={self.aic:.1f})"
+
+
+def _weighted_fit(xs: Sequence[float], ts: Sequence[float], weights: Sequence[float]):
+    """Weighted least squares for t = a + b * x; returns (a, b)."""
+    sw = sum(weights)
+    mean_x = sum(w * x for w, x in zip(weights, xs)) / sw
+    mean_t = sum(w * t for w, t in zip(weights, ts)) / sw
+    sxx = sum(w * (x - mean_x) ** 2 for w, x in zip(weights, xs))
+    if sxx == 0:
+        return mean_t, 0.0
+    b = sum(w * (x - mean_x) * (t - mean_t) for w, x, t in zip(weights, xs, ts)) / sxx
+    return mean_t - b * mean_x, b
+
+
+def fit_complexity(sizes: Sequence[float], latencies: Sequence[float]) -> List[ModelFit]:
+    """
+    Fits every model in MODELS to the (size, latency) points and returns the fits, best first.
+
+    Residuals are relative (weights 1/t^2), so the small sizes of a log-spaced sweep count as much as
+    the large ones. Models are ranked by AIC, which penalises the extra slope parameter: a constant
+    wins unless a growth model explains the data clearly better. Fits with a negative slope are
+    physically meaningless and are ranked last.
+    """
+    if len(sizes) != len(latencies) or len(sizes) < 3:
+        raise ValueError("fit_complexity() needs at least three (size, latency) points")
+    if min(sizes) < 1 or min(latencies) <= 0:
+        raise ValueError("Sizes must be >= 1 and latencies must be positive")
+
+    weights = [1 / t ** 2 for t in latencies]
+    sw = sum(weights)
+    mean_t = sum(w * t for w, t in zip(weights, latencies)) / sw
+    total = sum(w * (t - mean_t) ** 2 for w, t in zip(weights, latencies))
+    count = len(sizes)
+
+    fits = []
+    for name, growth in MODELS.items():
+        if growth is None:
+            a, b, parameters = mean_t, 0.0, 1
+            predictions = [a] * count
+        else:
+            xs = [growth(n) for n in sizes]
+            a, b = _weighted_fit(xs, latencies, weights)
+            parameters = 2
+            predictions = [a + b * x for x in xs]
+        rss = sum(w * (t - p) ** 2 for w, t, p in zip(weights, latencies, predictions))
+        aic = count * math.log(max(rss, 1e-300) / count) + 2 * parameters
+        r_squared = 1 - rss / total if total else 1.0
+        fits.append(ModelFit(name, a, b, rss, aic, r_squared))
+
+    return sorted(fits, key=lambda fit: (fit.b < 0, fit.aic))
+
+
+def complexity_report(sizes: Sequence[float], latencies: Sequence[float], sla: float) -> dict:
+    """Returns the fitted models, the best one and the size at which it predicts the SLA will be broken."""
+    fits = fit_complexity(sizes, latencies)
+    best = fits[0]
+    return {
+        "points": [{"size": n, "latency": t} for n, t in zip(sizes, latencies)],
+        "sla": sla,
+        "best_fit": best.name,
+        "sla_break_size": best.break_point(sla),
+        "fits": [fit.as_dict() for fit in fits],
+    }
+
+
+def format_complexity_report(report: dict) -> str:
+    break_size = report["sla_break_size"]
+    verdict = (f"SLA of {report['sla'] * 1000:.1f}ms breaks at ~{break_size:,.0f}" if break_size
+               else f"SLA of {report['sla'] * 1000:.1f}ms is never broken by the best fit")
+    lines = [f"Best fit: {report['best_fit']}; {verdict}"]
+    lines += [f"  n={point['size']:>10,.0f}  t={point['latency'] * 1000:10.3f}ms" for point in report["points"]]
+    lines += [f"  {fit['model']:<11} a={fit['a']:.4g} b={fit['b']:.4g} R^2={fit['r_squared']:.3f} AIC={fit['aic']:.1f}"
+              for fit in report["fits"]]
+    return "\n".join(lines)
@@ -0,0 +1,193 @@
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from utils.logger import setup_logger
+
+CONTEXT_SETUP_HISTORY_PATH = os.path.join("temp", "context_setup.json")
+HISTORY_SESSIONS = 10  # Sessions kept per mode in the history file
+
+
+class ContextSetupStats:
+    """
+    Collects per-test page setup and teardown times in fresh and pooled mode (CONTEXT_POOL).
+
+    A session normally runs in one mode only, so the per-mode totals of the last HISTORY_SESSIONS sessions
+    are kept in a JSON file at `history_path`; the savings report compares this session's mode with the
+    other mode's history. The pool's warm-up time is spread over the pooled tests that used it.
+    """
+
+    MODES = ("fresh", "pooled")
+
+    def __init__(self, history_path: Optional[str] = None):
+        self.history_path = history_path
+        self.logger = setup_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self.fresh: List[float] = []
+        self.pooled: List[float] = []
+        self.warm_up = 0.0
+
+    def record(self, seconds: float, pooled: bool):
+        """Records one test's setup and teardown time in pooled mode (`pooled`) or fresh mode."""
+        with self._lock:
+            (self.pooled if pooled else self.fresh).append(seconds)
+
+    def record_warm_up(self, seconds: float):
+        with self._lock:
+            self.warm_up += seconds
+
+    def totals(self) -> Dict[str, Tuple[int, float]]:
+        """Returns this session's (tests, seconds) per mode; pooled seconds include the warm-up."""
+        return {"fresh": (len(self.fresh), sum(self.fresh)),
+                "pooled": (len(self.pooled), sum(self.pooled) + (self.warm_up if self.pooled else 0.0))}
+
+    def _read_history(self) -> Dict[str, List[List[float]]]:
+        if not self.history_path or not os.path.exists(self.history_path):
+            return {}
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            return {mode: [list(entry) for entry in stored.get(mode, [])] for mode in self.MODES}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning("Ignoring unreadable context setup history %s: %s", self.history_path, e)
+            return {}
+
+    def history_average(self, mode: str) -> Tuple[int, Optional[float]]:
+        """Returns (tests, average seconds per test) of `mode` over the stored sessions."""
+        entries = self._read_history().get(mode, [])
+        tests = sum(int(count) for count, _ in entries)
+        return tests, (sum(seconds for _, seconds in entries) / tests if tests else None)
+
+    def save(self):
+        """Appends this session's per-mode totals to the history file, keeping the latest HISTORY_SESSIONS."""
+        if not self.history_path:
+            return
+        history = self._read_history()
+        for mode, (tests, seconds) in self.totals().items():
+            if tests:
+                history[mode] = (history.get(mode, []) + [[tests, round(seconds, 4)]])[-HISTORY_SESSIONS:]
+        directory = os.path.dirname(self.history_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.history_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(history, f)
+        os.replace(temporary, self.history_path)
+
+    def summary(self) -> str:
+        """
+        Returns this session's setup times per mode and what pooled mode saves per test, measured against
+        this session's other mode when it has both, otherwise against the other mode's history.
+        """
+        totals = self.totals()
+        lines = []
+        averages = {}
+        for mode, label in (("fresh", "Fresh context setup"), ("pooled", "Pooled context setup (incl. reset, warm-up)")):
+            tests, seconds = totals[mode]
+            if tests:
+                averages[mode] = seconds / tests
+                lines.append(f"{label}: {tests} tests, avg {averages[mode] * 1000:.1f} ms")
+        if not lines:
+            return "No browser context setups recorded."
+
+        reference = {}
+        for mode in self.MODES:
+            if mode in averages:
+                reference[mode] = (averages[mode], "this session")
+            else:
+                tests, average = self.history_average(mode)
+                if average is not None:
+                    reference[mode] = (average, f"{tests} tests in earlier {mode} runs")
+        if len(reference) < 2:
+            other = "true" if "fresh" in averages else "false"
+            lines.append(f"Run once with CONTEXT_POOL={other} to compare fresh and pooled setup times.")
+            return "\n".join(lines)
+        (fresh_avg, fresh_source), (pooled_avg, pooled_source) = reference["fresh"], reference["pooled"]
+        saved = fresh_avg - pooled_avg
+        pooled_tests = totals["pooled"][0] or totals["fresh"][0]
+        lines.append(f"Pooled mode saves {saved * 1000:.1f} ms per test, {saved * pooled_tests:.2f}s over this "
+                     f"session's {pooled_tests} tests (fresh: {fresh_source}; pooled: {pooled_source})")
+        return "\n".join(lines)
+
+
+class BrowserContextPool:
+    """
+    Keeps a set of warm, authenticated browser contexts for one worker.
+
+    Between tests a context is reset instead of recreated: extra pages are closed, local and session
+    storage are cleared, cookies are restored to the authenticated state, and the remaining page is
+    parked on about:blank. A context that served a failed test is discarded and replaced by a fresh one,
+    so a broken state never leaks into the next test.
+    """
+
+    def __init__(self, browser: Browser, storage_state: str, size: int = 2,
+                 context_setup: Optional[Callable[[BrowserContext], None]] = None):
+        self.browser = browser
+        self.storage_state = storage_state
+        self.size = max(1, size)
+        self.context_setup = context_setup
+        self.logger = setup_logger(self.__class__.__name__)
+        self._idle: List[Tuple[BrowserContext, Page]] = []
+        with open(storage_state, encoding="utf-8") as f:
+            self._auth_cookies = json.load(f).get("cookies", [])
+
+    def _new_context(self) -> Tuple[BrowserContext, Page]:
+        context = self.browser.new_context(storage_state=self.storage_state)
+        if self.context_setup is not None:
+            self.context_setup(context)
+        return context, context.new_page()
+
+    def warm_up(self) -> float:
+        """Creates contexts until the pool holds `size` idle contexts; returns the time it took (seconds)."""
+        start = time.perf_counter()
+        while len(self._idle) < self.size:
+            self._idle.append(self._new_context())
+        elapsed = time.perf_counter() - start
+        self.logger.info("Context pool warmed up with %d contexts in %.3fs", len(self._idle), elapsed)
+        return elapsed
+
+    def acquire(self) -> Tuple[BrowserContext, Page, bool]:
+        """
+        Returns a (context, page, reused) tuple. `reused` is False when the pool was empty
+        and a fresh context had to be created.
+        """
+        if self._idle:
+            context, page = self._idle.pop()
+            return context, page, True
+        context, page = self._new_context()
+        return context, page, False
+
+    def _reset(self, context: BrowserContext, page: Page):
+        for extra_page in context.pages:
+            if extra_page is not page:
+                extra_page.close()
+        if page.url.startswith("http"):
+            page.evaluate("() => { window.localStorage.clear(); window.sessionStorage.clear(); }")
+        context.clear_cookies()
+        if self._auth_cookies:
+            context.add_cookies(self._auth_cookies)
+        page.goto("about:blank")
+
+    def release(self, context: BrowserContext, page: Page, discard: bool = False):
+        """
+        Resets a context and returns it to the pool. Contexts that are marked `discard`, cannot be reset,
+        or exceed the pool size are closed instead.
+        """
+        if not discard and len(self._idle) < self.size and not page.is_closed():
+            try:
+                self._reset(context, page)
+                self._idle.append((context, page))
+                return
+            except Exception as e:
+                self.logger.warning("Failed to reset pooled context, discarding it: %s", e)
+        context.close()
+
+    def close(self):
+        """Closes every idle context."""
+        while self._idle:
+            context, _ = self._idle.pop()
+            context.close()
@@ -0,0 +1,156 @@
+import csv
+import io
+import time
+from typing import Dict, List, Optional, Sequence
+
+from psycopg2.extras import execute_values
+
+from utils.logger import setup_logger
+
+DEFAULT_COLUMNS = ("Backlog", "Ready", "Work in progress", "Done")
+DEFAULT_SWIMLANE = "Default swimlane"
+
+TASK_COPY_COLUMNS = (
+    "title", "description", "date_creation", "date_modification", "date_moved", "color_id",
+    "project_id", "column_id", "swimlane_id", "owner_id", "creator_id", "position",
+)
+
+
+def encode_csv_rows(rows: Sequence[tuple]) -> str:
+    """
+    Encodes rows for `COPY ... FROM STDIN WITH (FORMAT csv)`. Every string is quoted, because COPY reads an
+    unquoted empty field as NULL and a quoted one ("") as the empty string; numbers are written bare.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(rows)
+    return buffer.getvalue()
+
+
+class SeedReport:
+    """Row counts and timings of a bulk seeding run."""
+
+    def __init__(self):
+        self.rows: Dict[str, int] = {}
+        self.elapsed = 0.0
+
+    def add(self, table: str, count: int):
+        self.rows[table] = self.rows.get(table, 0) + count
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total_rows / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        tables = ", ".join(f"{table}={count}" for table, count in self.rows.items())
+        return f"{self.total_rows} rows ({tables}) in {self.elapsed:.2f}s ({self.rows_per_second:,.0f} rows/s)"
+
+
+class BulkDataFactory:
+    """
+    Writes projects, columns, swimlanes and tasks straight into the Kanboard schema.
+
+    Parent rows are inserted with `execute_values ... RETURNING id` so their generated IDs can be used
+    as foreign keys, and tasks are streamed with `COPY FROM STDIN` in chunks, one transaction per chunk.
+    Positions are assigned the same way Kanboard does: 1..n per project for columns and swimlanes,
+    and 1..n per (column, swimlane) cell for tasks.
+    """
+
+    def __init__(self, db_pool, chunk_size: int = 10000, registry=None):
+        self.db_pool = db_pool
+        self.chunk_size = max(1, chunk_size)
+        self.registry = registry  # Optional TestDataRegistry that records created projects
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def _get_owner_id(self, cur, username: Optional[str]) -> int:
+        if username:
+            cur.execute("SELECT id FROM users WHERE username = %s", (username,))
+            row = cur.fetchone()
+            if row:
+                return row[0]
+        return 1
+
+    def _insert_returning_ids(self, cur, table: str, columns: Sequence[str], rows: List[tuple]) -> List[int]:
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s RETURNING id"
+        # execute_values pages the VALUES list; fetch=True collects RETURNING rows from every page in order.
+        return [row[0] for row in execute_values(cur, query, rows, page_size=self.chunk_size, fetch=True)]
+
+    def _copy_tasks(self, cur, rows: List[tuple]):
+        buffer = io.StringIO(encode_csv_rows(rows))
+        cur.copy_expert(f"COPY tasks ({', '.join(TASK_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def create_project(self, name: str, number_of_tasks: int, columns: Sequence[str] = DEFAULT_COLUMNS,
+                       swimlanes: Sequence[str] = (DEFAULT_SWIMLANE,), owner_username: Optional[str] = None,
+                       task_title_template: str = "Perf Task {}", description: str = "",
+                       spread_across_columns: bool = False) -> dict:
+        """
+        Creates one project with its columns, swimlanes and tasks.
+
+        Args:
+            name: The project name.
+            number_of_tasks: How many tasks to create.
+            columns: Column titles in board order.
+            swimlanes: Swimlane names in board order; tasks are distributed round-robin across them.
+            owner_username: Owner and creator of the data (defaults to user ID 1, the Kanboard admin).
+            task_title_template: Format string receiving the 1-based task number.
+            description: Description given to every task.
+            spread_across_columns: Distribute tasks round-robin across columns instead of the first column only.
+
+        Returns:
+            A dict with 'project_id', 'column_ids', 'swimlane_ids' and 'report' (a SeedReport).
+        """
+        if not columns or not swimlanes:
+            raise ValueError("A project needs at least one column and one swimlane.")
+
+        report = SeedReport()
+        start_time = time.perf_counter()
+        now = int(time.time())
+
+        # --- Parent rows: one transaction so a failure never leaves a half-built board ---
+        with self.db_pool.transaction() as cur:
+            owner_id = self._get_owner_id(cur, owner_username)
+            project_id = self._insert_returning_ids(
+                cur, "projects", ("name", "description", "owner_id", "last_modified"),
+                [(name, description, owner_id, now)])[0]
+            cur.execute("INSERT INTO project_has_users (project_id, user_id, role) VALUES (%s, %s, %s)",
+                        (project_id, owner_id, "project-manager"))
+            column_ids = self._insert_returning_ids(
+                cur, "columns", ("title", "position", "project_id"),
+                [(title, position, project_id) for position, title in enumerate(columns, start=1)])
+            swimlane_ids = self._insert_returning_ids(
+                cur, "swimlanes", ("name", "position", "project_id"),
+                [(swimlane, position, project_id) for position, swimlane in enumerate(swimlanes, start=1)])
+        if self.registry is not None:
+            self.registry.register_project(name=name, project_id=project_id)
+        report.add("projects", 1)
+        report.add("project_has_users", 1)
+        report.add("columns", len(column_ids))
+        report.add("swimlanes", len(swimlane_ids))
+
+        # --- Tasks: streamed with COPY, committed chunk by chunk ---
+        positions: Dict[tuple, int] = {}
+        chunk: List[tuple] = []
+        for i in range(number_of_tasks):
+            column_id = column_ids[i % len(column_ids)] if spread_across_columns else column_ids[0]
+            swimlane_id = swimlane_ids[i % len(swimlane_ids)]
+            cell = (column_id, swimlane_id)
+            positions[cell] = positions.get(cell, 0) + 1
+            chunk.append((task_title_template.format(i + 1), description, now, now, now, "yellow",
+                          project_id, column_id, swimlane_id, 0, owner_id, positions[cell]))
+            if len(chunk) >= self.chunk_size:
+                self._flush_tasks(chunk, report)
+                chunk = []
+        if chunk:
+            self._flush_tasks(chunk, report)
+
+        report.elapsed = time.perf_counter() - start_time
+        self.logger.info("Seeded project '%s' (ID %s): %s", name, project_id, report)
+        return {"project_id": project_id, "column_ids": column_ids, "swimlane_ids": swimlane_ids, "report": report}
+
+    def _flush_tasks(self, rows: List[tuple], report: SeedReport):
+        with self.db_pool.transaction() as cur:
+            self._copy_tasks(cur, rows)
+        report.add("tasks", len(rows))
@@ -0,0 +1,195 @@
+"""
+Registry of the projects and tasks tests create, removed in one set-based pass when the session ends,
+and a sweeper for data left behind by crashed or interrupted runs.
+
+Projects are removed with a single `DELETE ... WHERE id = ANY(...)`; Kanboard's foreign keys cascade to
+their columns, swimlanes, tasks and the rest. With the 'api' cleanup mode they are removed with batched
+removeProject/removeTask JSON-RPC calls instead.
+
+Usage:
+    python -m utils.data_registry sweep --dry-run
+    python -m utils.data_registry sweep --older-than 6 --prefix "Performance Test Project"
+"""
+import argparse
+import threading
+import time
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+from config.app_settings import AppSettings
+from utils.db import DatabasePool
+from utils.logger import setup_logger
+from utils.workers import UNIQUE_NAME_SUFFIX_PATTERN
+
+# The escape character is explicit, so the prefix's escaped '%' and '_' also match literally in SQLite.
+PREFIX_CONDITION = r"name LIKE %s ESCAPE '\'"
+
+
+class PurgeReport(NamedTuple):
+    projects: int
+    tasks: int  # Tasks removed, including those removed together with their project
+    elapsed: float
+
+    def summary(self) -> str:
+        return f"Removed {self.projects} projects and {self.tasks} tasks in {self.elapsed:.2f}s"
+
+
+def _delete_projects(cur, project_ids: List[int], loose_task_ids: List[int]) -> PurgeReport:
+    """Deletes the projects (cascading to their children) and the given tasks of other projects, set-based."""
+    start = time.perf_counter()
+    cur.execute("SELECT COUNT(*) FROM tasks WHERE project_id = ANY(%s) OR id = ANY(%s)",
+                (project_ids, loose_task_ids))
+    tasks = cur.fetchone()[0]
+    cur.execute("DELETE FROM tasks WHERE id = ANY(%s) AND NOT project_id = ANY(%s)", (loose_task_ids, project_ids))
+    cur.execute("DELETE FROM projects WHERE id = ANY(%s)", (project_ids,))
+    return PurgeReport(cur.rowcount, tasks, time.perf_counter() - start)
+
+
+class TestDataRegistry:
+    """
+    Records what tests create: project names (project_name_factory registers every name it hands out, so
+    projects created through the UI are covered), and project and task IDs from the API client and the
+    bulk data factory. `purge()` resolves the names and removes everything in one pass.
+    Thread-safe, so concurrent page objects and benchmarks can register from any thread.
+    """
+
+    __test__ = False  # Not a test class, despite the name
+
+    def __init__(self):
+        self._project_names: Set[str] = set()
+        self._project_ids: Set[int] = set()
+        self._task_ids: Set[int] = set()
+        self._lock = threading.Lock()
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def register_project(self, name: Optional[str] = None, project_id: Optional[int] = None):
+        with self._lock:
+            if name is not None:
+                self._project_names.add(name)
+            if project_id is not None:
+                self._project_ids.add(int(project_id))
+
+    def register_tasks(self, task_ids: Iterable[int]):
+        with self._lock:
+            self._task_ids.update(int(task_id) for task_id in task_ids)
+
+    def project_name(self, name: str) -> str:
+        """Registers a project name and returns it, e.g. registry.project_name(unique_name("Test Project"))."""
+        self.register_project(name=name)
+        return name
+
+    def __len__(self):
+        with self._lock:
+            return len(self._project_names) + len(self._project_ids) + len(self._task_ids)
+
+    def _take(self):
+        with self._lock:
+            taken = (sorted(self._project_names), sorted(self._project_ids), sorted(self._task_ids))
+            self._project_names.clear()
+            self._project_ids.clear()
+            self._task_ids.clear()
+        return taken
+
+    def purge(self, db_pool) -> PurgeReport:
+        """Removes every registered project and task in one transaction and forgets them."""
+        names, project_ids, task_ids = self._take()
+        start = time.perf_counter()
+        with db_pool.transaction() as cur:
+            if names:
+                cur.execute("SELECT id FROM projects WHERE name = ANY(%s)", (names,))
+                project_ids = sorted(set(project_ids) | {row[0] for row in cur.fetchall()})
+            report = _delete_projects(cur, project_ids, task_ids)
+        report = report._replace(elapsed=time.perf_counter() - start)
+        self.logger.info("Test data purge: %s", report.summary())
+        return report
+
+    def purge_via_api(self, api_client) -> PurgeReport:
+        """Removes every registered project and task with batched JSON-RPC calls and forgets them."""
+        names, project_ids, task_ids = self._take()
+        start = time.perf_counter()
+        if names:
+            projects = api_client.batch(("getProjectByName", {"name": name}) for name in names)
+            project_ids = sorted(set(project_ids) | {int(project["id"]) for project in projects if project})
+        tasks = 0
+        if project_ids:
+            counts = api_client.batch(("getAllTasks", {"project_id": project_id, "status_id": status})
+                                      for project_id in project_ids for status in (0, 1))
+            tasks = sum(len(found or []) for found in counts)
+        removed = api_client.batch(("removeProject", {"project_id": project_id}) for project_id in project_ids)
+        loose = api_client.batch(("removeTask", {"task_id": task_id}) for task_id in task_ids)
+        report = PurgeReport(sum(1 for result in removed if result), tasks + sum(1 for result in loose if result),
+                             time.perf_counter() - start)
+        self.logger.info("Test data purge via API: %s", report.summary())
+        return report
+
+
+class OrphanSweeper:
+    """
+    Finds and removes test projects that no session cleaned up: projects whose name carries the
+    unique_name() suffix, starts with one of `prefixes` (when given) and that were not modified
+    for `max_age_hours`. Names without the suffix are never touched, so real projects are safe.
+    """
+
+    def __init__(self, db_pool, prefixes: Iterable[str] = (), max_age_hours: float = 24.0):
+        self.db_pool = db_pool
+        self.prefixes = list(prefixes)
+        self.max_age_hours = max_age_hours
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def _where(self):
+        where, params = "name ~ %s AND COALESCE(last_modified, 0) < %s", [
+            UNIQUE_NAME_SUFFIX_PATTERN, int(time.time() - self.max_age_hours * 3600)]
+        if self.prefixes:
+            where += f" AND ({' OR '.join([PREFIX_CONDITION] * len(self.prefixes))})"
+            params += [prefix.replace("%", r"\%").replace("_", r"\_") + "%" for prefix in self.prefixes]
+        return where, params
+
+    def find(self) -> List[tuple]:
+        """Returns (id, name, last_modified, task count) of every orphaned project."""
+        where, params = self._where()
+        with self.db_pool.read_cursor() as cur:
+            cur.execute(f"SELECT p.id, p.name, p.last_modified, COUNT(t.id) FROM projects p "
+                        f"LEFT JOIN tasks t ON t.project_id = p.id "
+                        f"WHERE p.id IN (SELECT id FROM projects WHERE {where}) "
+                        f"GROUP BY p.id, p.name, p.last_modified ORDER BY p.id", params)
+            return cur.fetchall()
+
+    def sweep(self) -> PurgeReport:
+        """Removes every orphaned project in one transaction."""
+        where, params = self._where()
+        start = time.perf_counter()
+        with self.db_pool.transaction() as cur:
+            cur.execute(f"SELECT id FROM projects WHERE {where}", params)
+            report = _delete_projects(cur, [row[0] for row in cur.fetchall()], [])
+        report = report._replace(elapsed=time.perf_counter() - start)
+        self.logger.info("Orphan sweep: %s", report.summary())
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove test data left behind by crashed or interrupted runs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sweep = commands.add_parser("sweep", help="remove orphaned test projects")
+    sweep.add_argument("--older-than", type=float, default=AppSettings.get_orphan_max_age_hours(),
+                       help="only projects not modified for this many hours (default: ORPHAN_MAX_AGE_HOURS)")
+    sweep.add_argument("--prefix", action="append", default=[],
+                       help="only projects whose name starts with this prefix (repeatable)")
+    sweep.add_argument("--dry-run", action="store_true", help="list the projects without removing them")
+    args = parser.parse_args()
+
+    pool = DatabasePool(application_name="kanboard-tests-sweeper").wait_until_ready()
+    try:
+        sweeper = OrphanSweeper(pool, prefixes=args.prefix, max_age_hours=args.older_than)
+        if args.dry_run:
+            orphans = sweeper.find()
+            for project_id, name, last_modified, tasks in orphans:
+                modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_modified or 0))
+                print(f"{project_id:>8}  {modified}  {tasks:>7} tasks  {name}")
+            print(f"{len(orphans)} orphaned projects with {sum(row[3] for row in orphans)} tasks")
+        else:
+            print(sweeper.sweep().summary())
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Cache of seeded datasets that survives test runs.
+
+Every dataset is described by a DatasetSpec, whose fingerprint (a hash of the generator parameters) keys a row
+in the `test_dataset_cache` marker table next to the Kanboard schema. A later run that asks for the same spec
+finds the project through that row, checks its row counts and reuses it read-only; it is rebuilt only when the
+check fails. Entries unused for `max_age_hours`, and the least recently used entries beyond `max_total_rows`
+tasks or `max_projects` projects, are evicted. Every cached project shows up on the admin's dashboard, so the
+project cap keeps the cache from growing the pages the UI tests walk.
+
+Cached projects are named 'Dataset <fingerprint>' without the unique_name() suffix, so neither the session
+cleanup nor the orphan sweep removes them.
+
+Usage:
+    python -m utils.dataset_cache list
+    python -m utils.dataset_cache evict
+    python -m utils.dataset_cache clear
+"""
+import argparse
+import hashlib
+import json
+import random
+import string
+import time
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from config.app_settings import AppSettings
+from utils.data_factory import DEFAULT_COLUMNS, DEFAULT_SWIMLANE, BulkDataFactory
+from utils.db import DatabasePool
+from utils.logger import setup_logger
+
+CACHE_TABLE = "test_dataset_cache"
+# Bump when BulkDataFactory changes the shape of the data it writes, so old datasets stop matching.
+DATASET_FORMAT_VERSION = 1
+
+
+class DatasetSpec(NamedTuple):
+    """The generator parameters of a seeded project; equal specs produce equal datasets."""
+    number_of_tasks: int
+    columns: Tuple[str, ...] = DEFAULT_COLUMNS
+    swimlanes: Tuple[str, ...] = (DEFAULT_SWIMLANE,)
+    description_size: int = 0
+    spread_across_columns: bool = False
+    seed: int = 0  # Seeds the generated descriptions; also tells apart otherwise identical datasets
+
+    def fingerprint(self) -> str:
+        params = {**self._asdict(), "columns": list(self.columns), "swimlanes": list(self.swimlanes),
+                  "version": DATASET_FORMAT_VERSION}
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+    def description(self) -> str:
+        generator = random.Random(self.seed)
+        return "".join(generator.choice(string.ascii_letters + " ") for _ in range(self.description_size))
+
+
+class CachedDataset(NamedTuple):
+    project_id: int
+    name: str
+    fingerprint: str
+    reused: bool
+    elapsed: float  # Seconds spent finding or building the dataset
+
+    def summary(self) -> str:
+        return (f"{'Reused' if self.reused else 'Built'} dataset '{self.name}' (project {self.project_id}) "
+                f"in {self.elapsed:.2f}s")
+
+
+class DatasetCache:
+    """
+    Finds or builds seeded projects by DatasetSpec. Building is serialised per fingerprint with an advisory
+    lock, so parallel pytest-xdist workers asking for the same dataset build it once.
+    """
+
+    def __init__(self, db_pool, chunk_size: int = 10000, max_age_hours: float = 168.0,
+                 max_total_rows: int = 2000000, max_projects: int = 20, owner_username: Optional[str] = None):
+        self.db_pool = db_pool
+        self.factory = BulkDataFactory(db_pool, chunk_size=chunk_size)  # No registry: cached data outlives the run
+        self.max_age_hours = max_age_hours
+        self.max_total_rows = max_total_rows
+        self.max_projects = max_projects
+        self.owner_username = owner_username
+        self.logger = setup_logger(self.__class__.__name__)
+        self._table_ready = False
+        self.used: Set[str] = set()  # Fingerprints handed out by this process, never evicted by it
+
+    @classmethod
+    def from_settings(cls, db_pool) -> "DatasetCache":
+        return cls(db_pool, chunk_size=AppSettings.get_seed_chunk_size(),
+                   max_age_hours=AppSettings.get_dataset_cache_max_age_hours(),
+                   max_total_rows=AppSettings.get_dataset_cache_max_rows(),
+                   max_projects=AppSettings.get_dataset_cache_max_projects(), owner_username=AppSettings.ADMIN_USER)
+
+    def _ensure_table(self):
+        if self._table_ready:
+            return
+        with self.db_pool.transaction() as cur:
+            # Parallel workers would race on CREATE TABLE IF NOT EXISTS otherwise.
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (CACHE_TABLE,))
+            # Entries go away with their project, whoever deletes it.
+            cur.execute(f"""
+                CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+                    fingerprint TEXT PRIMARY KEY,
+                    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+                    params TEXT NOT NULL,
+                    task_count INTEGER NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    last_used_at INTEGER NOT NULL
+                )""")
+        self._table_ready = True
+
+    @staticmethod
+    def project_name(fingerprint: str) -> str:
+        return f"Dataset {fingerprint}"
+
+    def _is_intact(self, cur, project_id: int, spec: DatasetSpec) -> bool:
+        """Checks the project's task, column and swimlane counts against the spec."""
+        cur.execute("SELECT "
+                    "(SELECT COUNT(*) FROM tasks WHERE project_id = p.id), "
+                    "(SELECT COUNT(*) FROM columns WHERE project_id = p.id), "
+                    "(SELECT COUNT(*) FROM swimlanes WHERE project_id = p.id) "
+                    "FROM projects p WHERE id = %s", (project_id,))
+        row = cur.fetchone()
+        return row is not None and row == (spec.number_of_tasks, len(spec.columns), len(spec.swimlanes))
+
+    def get(self, spec: DatasetSpec) -> CachedDataset:
+        """Returns the cached project for `spec`, building it if it is missing or fails the integrity check."""
+        self._ensure_table()
+        fingerprint = spec.fingerprint()
+        name = self.project_name(fingerprint)
+        start = time.perf_counter()
+        with self.db_pool.connection() as conn:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_lock(hashtext(%s))", (f"{CACHE_TABLE}:{fingerprint}",))
+                try:
+                    cur.execute(f"SELECT project_id FROM {CACHE_TABLE} WHERE fingerprint = %s", (fingerprint,))
+                    row = cur.fetchone()
+                    if row and self._is_intact(cur, row[0], spec):
+                        cur.execute(f"UPDATE {CACHE_TABLE} SET last_used_at = %s WHERE fingerprint = %s",
+                                    (int(time.time()), fingerprint))
+                        dataset = CachedDataset(row[0], name, fingerprint, True, time.perf_counter() - start)
+                    else:
+                        if row:
+                            self.logger.warning("Dataset %s failed its integrity check; rebuilding it.", fingerprint)
+                        dataset = self._build(cur, spec, fingerprint, name, start)
+                finally:
+                    cur.execute("SELECT pg_advisory_unlock(hashtext(%s))", (f"{CACHE_TABLE}:{fingerprint}",))
+        self.used.add(fingerprint)
+        self.logger.info(dataset.summary())
+        return dataset
+
+    def _build(self, cur, spec: DatasetSpec, fingerprint: str, name: str, start: float) -> CachedDataset:
+        # Removes the broken dataset, and a leftover project of the same name from an interrupted build.
+        cur.execute("DELETE FROM projects WHERE name = %s", (name,))
+        result = self.factory.create_project(name, spec.number_of_tasks, columns=spec.columns,
+                                             swimlanes=spec.swimlanes, owner_username=self.owner_username,
+                                             description=spec.description(),
+                                             spread_across_columns=spec.spread_across_columns)
+        now = int(time.time())
+        cur.execute(f"INSERT INTO {CACHE_TABLE} (fingerprint, project_id, params, task_count, created_at, "
+                    f"last_used_at) VALUES (%s, %s, %s, %s, %s, %s)",
+                    (fingerprint, result["project_id"], json.dumps(spec._asdict()), spec.number_of_tasks, now, now))
+        return CachedDataset(result["project_id"], name, fingerprint, False, time.perf_counter() - start)
+
+    def entries(self) -> List[tuple]:
+        """Returns (fingerprint, project ID, task count, created at, last used at, params) by last use."""
+        self._ensure_table()
+        with self.db_pool.read_cursor() as cur:
+            cur.execute(f"SELECT fingerprint, project_id, task_count, created_at, last_used_at, params "
+                        f"FROM {CACHE_TABLE} ORDER BY last_used_at DESC")
+            return cur.fetchall()
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """
+        Removes datasets unused for `max_age_hours`, then the least recently used ones until the cache holds at
+        most `max_total_rows` tasks and `max_projects` projects. Datasets this process used and fingerprints in
+        `keep` are never removed, even beyond the caps. Returns the number of datasets removed.
+        """
+        keep = self.used | set(keep)
+        cutoff = int(time.time() - self.max_age_hours * 3600)
+        evicted, total, kept = [], 0, 0
+        for fingerprint, project_id, task_count, _, last_used_at, _ in self.entries():
+            over_cap = total + task_count > self.max_total_rows or kept + 1 > self.max_projects
+            if fingerprint not in keep and (last_used_at < cutoff or over_cap):
+                evicted.append(project_id)
+            else:
+                total += task_count
+                kept += 1
+        if evicted:
+            with self.db_pool.transaction() as cur:
+                cur.execute("DELETE FROM projects WHERE id = ANY(%s)", (evicted,))
+            self.logger.info("Evicted %d cached datasets; %d datasets with %d tasks remain cached.",
+                             len(evicted), kept, total)
+        return len(evicted)
+
+    def clear(self) -> int:
+        """Removes every cached dataset."""
+        project_ids = [entry[1] for entry in self.entries()]
+        with self.db_pool.transaction() as cur:
+            cur.execute("DELETE FROM projects WHERE id = ANY(%s)", (project_ids,))
+        return len(project_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and prune the cache of seeded test datasets.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list cached datasets")
+    commands.add_parser("evict", help="remove datasets past DATASET_CACHE_MAX_AGE_HOURS, DATASET_CACHE_MAX_ROWS "
+                                      "or DATASET_CACHE_MAX_PROJECTS")
+    commands.add_parser("clear", help="remove every cached dataset")
+    args = parser.parse_args()
+
+    pool = DatabasePool(application_name="kanboard-tests-dataset-cache").wait_until_ready()
+    try:
+        cache = DatasetCache.from_settings(pool)
+        if args.command == "list":
+            for fingerprint, project_id, task_count, _, last_used_at, params in cache.entries():
+                used = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used_at))
+                print(f"{fingerprint}  {project_id:>8}  {task_count:>9} tasks  {used}  {params}")
+        elif args.command == "evict":
+            print(f"Evicted {cache.evict()} datasets")
+        else:
+            print(f"Removed {cache.clear()} datasets")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+
+class DatabaseNotReadyError(Exception):
+    """Raised when the database does not accept connections before the readiness deadline."""
+
+
+class DatabasePool:
+    """
+    A thread-safe PostgreSQL connection pool for tests and benchmarks.
+
+    Connections are created once and shared, so concurrent benchmarks do not pay connection setup
+    on every query and do not serialise on a single handle. Use `transaction()` for writes
+    (committed or rolled back automatically) and `read_cursor()` for assertions (autocommit, read-only,
+    so every read sees the latest committed data and no test has to remember to call commit()).
+    """
+
+    def __init__(self, dsn: Optional[str] = None, minconn: Optional[int] = None, maxconn: Optional[int] = None,
+                 application_name: Optional[str] = None):
+        self.dsn = dsn or AppSettings.get_db_dsn()
+        self.minconn = minconn if minconn is not None else AppSettings.get_db_pool_min()
+        self.maxconn = maxconn if maxconn is not None else AppSettings.get_db_pool_max()
+        self.application_name = application_name
+        self.logger = setup_logger(self.__class__.__name__)
+        self._pool: Optional[ThreadedConnectionPool] = None
+
+    def _connect_kwargs(self) -> dict:
+        return {"application_name": self.application_name} if self.application_name else {}
+
+    def wait_until_ready(self, timeout: Optional[float] = None, initial_delay: float = 0.1,
+                         max_delay: float = 5.0) -> "DatabasePool":
+        """
+        Probes the database with exponential backoff until it accepts connections, then opens the pool.
+
+        Raises:
+            DatabaseNotReadyError: If the database is still unavailable when `timeout` seconds have elapsed.
+        """
+        timeout = timeout if timeout is not None else AppSettings.get_db_ready_timeout()
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                probe = psycopg2.connect(self.dsn, connect_timeout=max(1, int(max_delay)), **self._connect_kwargs())
+                try:
+                    with probe.cursor() as cur:
+                        cur.execute("SELECT 1")
+                finally:
+                    probe.close()
+                break
+            except psycopg2.OperationalError as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseNotReadyError(
+                        f"Database not ready after {attempt} attempts in {timeout:.0f}s: {e}") from e
+                sleep_for = min(delay, remaining)
+                self.logger.warning("Database not ready (attempt %d): %s. Retrying in %.2fs...",
+                                    attempt, e, sleep_for)
+                time.sleep(sleep_for)
+                delay = min(delay * 2, max_delay)
+
+        self.open()
+        self.logger.info("Database ready after %d attempt(s); pool opened (min=%d, max=%d).",
+                         attempt, self.minconn, self.maxconn)
+        return self
+
+    def open(self):
+        """Opens the connection pool (no-op if it is already open)."""
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(self.minconn, self.maxconn, self.dsn, **self._connect_kwargs())
+
+    def close(self):
+        """Closes every pooled connection."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+            self.logger.info("Database pool closed.")
+
+    def reset(self):
+        """
+        Closes every connection, including borrowed ones, and opens a fresh pool. Used after the database
+        was dropped and recreated (see utils.db_snapshot), which terminates the existing connections.
+        """
+        self.close()
+        self.open()
+
+    def acquire(self, readonly: bool = False):
+        """
+        Borrows a connection from the pool. Read-only connections run in autocommit mode with
+        `default_transaction_read_only` enabled. Every acquired connection must be given back with `release()`.
+        """
+        self.open()
+        conn = self._pool.getconn()
+        if readonly:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("SET default_transaction_read_only = on")
+        return conn
+
+    def release(self, conn):
+        """Returns a connection to the pool, discarding it if it is broken."""
+        if self._pool is None:
+            conn.close()
+            return
+        broken = conn.closed != 0
+        if not broken:
+            try:
+                if conn.autocommit:
+                    with conn.cursor() as cur:
+                        cur.execute("RESET default_transaction_read_only")
+                    conn.autocommit = False
+                else:
+                    conn.rollback()
+            except psycopg2.Error:
+                broken = True
+        self._pool.putconn(conn, close=broken)
+
+    @contextmanager
+    def connection(self, readonly: bool = False):
+        """Context manager that borrows a connection and always returns it to the pool."""
+        conn = self.acquire(readonly=readonly)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def transaction(self, cursor_factory=None):
+        """Yields a cursor inside a transaction that is committed on success and rolled back on error."""
+        with self.connection() as conn:
+            try:
+                with conn.cursor(cursor_factory=cursor_factory) as cur:
+                    yield cur
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def read_cursor(self, cursor_factory=None):
+        """Yields an autocommit, read-only cursor for assertions."""
+        with self.connection(readonly=True) as conn:
+            with conn.cursor(cursor_factory=cursor_factory) as cur:
+                yield cur
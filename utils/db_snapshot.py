@@ -0,0 +1,252 @@
+"""
+Template-database snapshots of the Kanboard database, for resetting it to a known state between tests.
+
+`snapshot(name)` freezes the current contents of the working database into a template database
+(CREATE DATABASE ... TEMPLATE), and `restore(name)` drops the working database and recreates it from the
+template. PostgreSQL copies the template's files, so a 100k-task state is back in a fraction of a second
+instead of minutes of seeding. Rows of `preserve_tables` (Kanboard's login sessions by default) are carried
+over a restore, so authenticated browser states stay valid.
+
+Both operations need every other connection to the database closed: the app's connections are terminated
+(DROP DATABASE ... WITH (FORCE) on PostgreSQL 13+), and the test pool is reset afterwards.
+
+Usage:
+    python -m utils.db_snapshot create baseline --projects 10 --tasks 10000
+    python -m utils.db_snapshot restore baseline
+    python -m utils.db_snapshot list
+    python -m utils.db_snapshot drop baseline
+"""
+import argparse
+import re
+import time
+from typing import Callable, Dict, List, Sequence
+
+import psycopg2
+from psycopg2 import errors
+from psycopg2.extensions import make_dsn, parse_dsn
+from psycopg2.extras import execute_values
+
+from config.app_settings import AppSettings
+from utils.data_factory import BulkDataFactory
+from utils.db import DatabasePool
+from utils.logger import setup_logger
+
+
+class DatabaseSnapshotError(Exception):
+    """Raised when a snapshot cannot be created or restored."""
+
+
+class DatabaseSnapshots:
+    """
+    Creates, restores, lists and drops template-database snapshots of the database `db_pool` points at.
+    Statements run on a separate connection to `maintenance_db`, since a database cannot be dropped or
+    copied while connected to it.
+    """
+
+    def __init__(self, db_pool: DatabasePool, maintenance_db: str = "postgres",
+                 preserve_tables: Sequence[str] = ("sessions",), terminate_retries: int = 5):
+        self.db_pool = db_pool
+        dsn = parse_dsn(db_pool.dsn)
+        self.database = dsn["dbname"]
+        self.maintenance_dsn = make_dsn(db_pool.dsn, dbname=maintenance_db)
+        self.preserve_tables = list(preserve_tables)
+        self.terminate_retries = terminate_retries
+        self.logger = setup_logger(self.__class__.__name__)
+        self.on_restore: List[Callable[[], None]] = []  # Called after every restore, e.g. to clear caches
+
+    @classmethod
+    def from_settings(cls, db_pool: DatabasePool) -> "DatabaseSnapshots":
+        return cls(db_pool, preserve_tables=AppSettings.get_db_snapshot_preserve_tables())
+
+    def template_name(self, name: str) -> str:
+        """Returns the template database of a snapshot, e.g. 'kanboard_tpl_baseline' (at most 63 characters)."""
+        if not re.fullmatch(r"[A-Za-z0-9_]+", name):
+            raise ValueError(f"Snapshot names may only contain letters, digits and underscores: '{name}'")
+        return f"{self.database}_tpl_{name.lower()}"[:63]
+
+    def _maintenance(self):
+        connection = psycopg2.connect(self.maintenance_dsn, application_name="kanboard-tests-snapshots")
+        connection.autocommit = True
+        return connection
+
+    def _terminate(self, cur, database: str) -> int:
+        cur.execute("SELECT COUNT(pg_terminate_backend(pid)) FROM pg_stat_activity "
+                    "WHERE datname = %s AND pid <> pg_backend_pid()", (database,))
+        return cur.fetchone()[0]
+
+    def exists(self, name: str) -> bool:
+        connection = self._maintenance()
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (self.template_name(name),))
+                return cur.fetchone() is not None
+        finally:
+            connection.close()
+
+    def list(self) -> List[tuple]:
+        """Returns (snapshot name, size in bytes) of every snapshot of the database."""
+        prefix = f"{self.database}_tpl_"
+        connection = self._maintenance()
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT datname, pg_database_size(datname) FROM pg_database "
+                            "WHERE datname LIKE %s ORDER BY datname",
+                            (prefix.replace("_", r"\_") + "%",))
+                return [(datname[len(prefix):], size) for datname, size in cur.fetchall()]
+        finally:
+            connection.close()
+
+    def snapshot(self, name: str, replace: bool = False) -> float:
+        """Freezes the working database into the snapshot `name`; returns the seconds it took."""
+        template = self.template_name(name)
+        start = time.perf_counter()
+        self.db_pool.close()
+        connection = self._maintenance()
+        try:
+            with connection.cursor() as cur:
+                if replace:
+                    self._drop_template(cur, template)
+                for attempt in range(1, self.terminate_retries + 1):
+                    terminated = self._terminate(cur, self.database)
+                    try:
+                        cur.execute(f'CREATE DATABASE "{template}" TEMPLATE "{self.database}"')
+                        break
+                    except errors.ObjectInUse:
+                        # The app reconnected between the termination and the copy.
+                        self.logger.debug("Database busy after terminating %d connections (attempt %d)",
+                                          terminated, attempt)
+                        if attempt == self.terminate_retries:
+                            raise
+                # Nobody may connect to the template, or CREATE DATABASE ... TEMPLATE would fail.
+                cur.execute(f'ALTER DATABASE "{template}" WITH IS_TEMPLATE true ALLOW_CONNECTIONS false')
+        except psycopg2.Error as e:
+            raise DatabaseSnapshotError(f"Could not create snapshot '{name}': {e}") from e
+        finally:
+            connection.close()
+            self.db_pool.open()
+        elapsed = time.perf_counter() - start
+        self.logger.info("Created snapshot '%s' (%s) in %.3fs", name, template, elapsed)
+        return elapsed
+
+    def restore(self, name: str) -> float:
+        """Recreates the working database from the snapshot `name`; returns the seconds it took."""
+        template = self.template_name(name)
+        start = time.perf_counter()
+        preserved = self._read_preserved()
+        self.db_pool.close()
+        try:
+            connection = self._maintenance()
+            try:
+                with connection.cursor() as cur:
+                    cur.execute("SELECT current_setting('server_version_num')::int")
+                    force = cur.fetchone()[0] >= 130000
+                    if force:
+                        cur.execute(f'DROP DATABASE IF EXISTS "{self.database}" WITH (FORCE)')
+                    else:
+                        for attempt in range(1, self.terminate_retries + 1):
+                            self._terminate(cur, self.database)
+                            try:
+                                cur.execute(f'DROP DATABASE IF EXISTS "{self.database}"')
+                                break
+                            except errors.ObjectInUse:
+                                if attempt == self.terminate_retries:
+                                    raise
+                    cur.execute(f'CREATE DATABASE "{self.database}" TEMPLATE "{template}"')
+            finally:
+                connection.close()
+        except psycopg2.Error as e:
+            raise DatabaseSnapshotError(f"Could not restore snapshot '{name}': {e}") from e
+        finally:
+            # Reopen the pool even when the restore failed, so later tests see the real error, not a closed pool.
+            self.db_pool.reset()
+        self._write_preserved(preserved)
+        for callback in self.on_restore:
+            callback()
+        elapsed = time.perf_counter() - start
+        self.logger.info("Restored snapshot '%s' in %.3fs", name, elapsed)
+        return elapsed
+
+    def ensure(self, name: str, seed: Callable[[], None]) -> bool:
+        """Creates the snapshot by running `seed` on the working database unless it already exists."""
+        if self.exists(name):
+            return False
+        seed()
+        self.snapshot(name)
+        return True
+
+    def drop(self, name: str):
+        connection = self._maintenance()
+        try:
+            with connection.cursor() as cur:
+                self._drop_template(cur, self.template_name(name))
+        finally:
+            connection.close()
+        self.logger.info("Dropped snapshot '%s'", name)
+
+    @staticmethod
+    def _drop_template(cur, template: str):
+        cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (template,))
+        if cur.fetchone():
+            cur.execute(f'ALTER DATABASE "{template}" WITH IS_TEMPLATE false')
+            cur.execute(f'DROP DATABASE "{template}"')
+
+    def _read_preserved(self) -> Dict[str, tuple]:
+        """Returns {table: (column names, rows)} of the preserved tables that exist."""
+        preserved = {}
+        if not self.preserve_tables:
+            return preserved
+        with self.db_pool.read_cursor() as cur:
+            cur.execute("SELECT table_name FROM information_schema.tables "
+                        "WHERE table_schema = current_schema() AND table_name = ANY(%s)", (self.preserve_tables,))
+            for (table,) in cur.fetchall():
+                cur.execute(f'SELECT * FROM "{table}"')
+                preserved[table] = ([column.name for column in cur.description], cur.fetchall())
+        return preserved
+
+    def _write_preserved(self, preserved: Dict[str, tuple]):
+        if not preserved:
+            return
+        with self.db_pool.transaction() as cur:
+            for table, (columns, rows) in preserved.items():
+                cur.execute(f'DELETE FROM "{table}"')
+                if rows:
+                    execute_values(cur, f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES %s', rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage template-database snapshots of the Kanboard database.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create", help="seed the working database (optional) and snapshot it")
+    create.add_argument("name")
+    create.add_argument("--projects", type=int, default=0, help="projects to seed before the snapshot")
+    create.add_argument("--tasks", type=int, default=0, help="tasks per seeded project")
+    create.add_argument("--replace", action="store_true", help="replace an existing snapshot of that name")
+    restore = commands.add_parser("restore", help="recreate the working database from a snapshot")
+    restore.add_argument("name")
+    drop = commands.add_parser("drop", help="remove a snapshot")
+    drop.add_argument("name")
+    commands.add_parser("list", help="list snapshots")
+    args = parser.parse_args()
+
+    pool = DatabasePool(application_name="kanboard-tests-snapshots").wait_until_ready()
+    try:
+        snapshots = DatabaseSnapshots.from_settings(pool)
+        if args.command == "create":
+            factory = BulkDataFactory(pool, chunk_size=AppSettings.get_seed_chunk_size())
+            for index in range(args.projects):
+                factory.create_project(f"Snapshot {args.name} Project {index + 1}", args.tasks,
+                                       owner_username=AppSettings.ADMIN_USER, spread_across_columns=True)
+            print(f"Snapshot '{args.name}' created in {snapshots.snapshot(args.name, replace=args.replace):.3f}s")
+        elif args.command == "restore":
+            print(f"Snapshot '{args.name}' restored in {snapshots.restore(args.name):.3f}s")
+        elif args.command == "drop":
+            snapshots.drop(args.name)
+        else:
+            for name, size in snapshots.list():
+                print(f"{name:<40}{size / 1024 ** 2:>10.1f} MB")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
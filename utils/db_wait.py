@@ -0,0 +1,226 @@
+import json
+import select
+import time
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import psycopg2
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+NOTIFY_CHANNEL = "kanboard_test_changes"
+NOTIFY_FUNCTION = "kanboard_test_notify_change"
+# Held shared by every session that uses the triggers and taken exclusively to remove them, so one pytest-xdist
+# worker never drops the triggers while another one still relies on them.
+TRIGGER_LOCK_KEY = 0x6B62_7477  # "kbtw"
+# Serialises concurrent installs by parallel workers (CREATE OR REPLACE FUNCTION races otherwise).
+TRIGGER_INSTALL_LOCK_KEY = 0x6B62_7469  # "kbti"
+
+
+class DbConditionTimeout(AssertionError):
+    """Raised when a database condition is still false at the deadline; the message carries the diagnostics."""
+
+
+class DbWaitResult(NamedTuple):
+    row: Optional[tuple]
+    elapsed: float
+    checks: int
+    notifications: int
+    mode: str  # "notify" or "poll"
+
+
+class DbStateAwaiter:
+    """
+    Waits for a row in the database to satisfy a predicate, e.g. for a task's column_id to change after a UI move.
+
+    With `use_notify`, row-level triggers on the watched tables send a NOTIFY for every change, and the awaiter
+    re-checks its condition as soon as one arrives instead of sleeping a fixed time. Between notifications it
+    still re-checks with exponential backoff (starting at `initial_interval`, capped at `max_interval`), which
+    is also the whole strategy when the triggers cannot be installed.
+
+    The triggers are installed on `start()` and dropped on `close()` by the last session using them. Triggers
+    left behind by a killed session are dropped on `start()` when notifications are off and no session holds them.
+    `connection_factory` replaces `psycopg2.connect(dsn)`, e.g. with the Kanboard stand-in's SQLite connections,
+    which only support polling.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, tables: Sequence[str] = ("tasks", "projects", "columns"),
+                 use_notify: bool = False, default_timeout: float = 10.0, initial_interval: float = 0.05,
+                 max_interval: float = 1.0, connection_factory: Optional[Callable] = None):
+        self.dsn = dsn or AppSettings.get_db_dsn()
+        self.connection_factory = connection_factory
+        self.tables = list(tables)
+        self.use_notify = use_notify
+        self.default_timeout = default_timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.logger = setup_logger(self.__class__.__name__)
+        self.connection = None
+        self.listening = False
+
+    @classmethod
+    def from_settings(cls, connection_factory: Optional[Callable] = None) -> "DbStateAwaiter":
+        return cls(tables=AppSettings.get_db_wait_tables(), use_notify=AppSettings.is_db_wait_notify_enabled(),
+                   default_timeout=AppSettings.get_db_wait_timeout(), connection_factory=connection_factory)
+
+    def start(self) -> "DbStateAwaiter":
+        """Opens the awaiter's own autocommit connection and, with `use_notify`, installs the triggers and LISTENs."""
+        if self.connection_factory is not None:
+            self.connection = self.connection_factory()
+        else:
+            self.connection = psycopg2.connect(self.dsn, application_name="kanboard-tests-db-wait")
+        self.connection.autocommit = True
+        if self.use_notify and self.connection_factory is None:
+            try:
+                self._install_triggers()
+                with self.connection.cursor() as cur:
+                    cur.execute("SELECT pg_advisory_lock_shared(%s)", (TRIGGER_LOCK_KEY,))
+                    cur.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                self.listening = True
+            except psycopg2.Error as e:
+                self.logger.warning("Could not install change notification triggers (%s); "
+                                    "falling back to polling.", str(e).strip())
+        elif self.connection_factory is None:
+            self._drop_stale_triggers()
+        self.logger.info("Database state awaiter ready (%s mode).", "notify" if self.listening else "poll")
+        return self
+
+    def _install_triggers(self):
+        with self.connection.cursor() as cur:
+            cur.execute("BEGIN")
+            try:
+                cur.execute("SELECT pg_advisory_xact_lock(%s)", (TRIGGER_INSTALL_LOCK_KEY,))
+                cur.execute(f"""
+                    CREATE OR REPLACE FUNCTION {NOTIFY_FUNCTION}() RETURNS trigger AS $$
+                    BEGIN
+                        PERFORM pg_notify('{NOTIFY_CHANNEL}', json_build_object(
+                            'table', TG_TABLE_NAME, 'op', TG_OP,
+                            'id', CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END)::text);
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql""")
+                for table in self.tables:
+                    cur.execute(f"DROP TRIGGER IF EXISTS {NOTIFY_FUNCTION} ON {table}")
+                    cur.execute(f"CREATE TRIGGER {NOTIFY_FUNCTION} AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                                f"FOR EACH ROW EXECUTE PROCEDURE {NOTIFY_FUNCTION}()")
+                cur.execute("COMMIT")
+            except psycopg2.Error:
+                cur.execute("ROLLBACK")
+                raise
+
+    def _drop_triggers(self, cur, tables: Sequence[str]):
+        for table in tables:
+            cur.execute(f"DROP TRIGGER IF EXISTS {NOTIFY_FUNCTION} ON {table}")
+        cur.execute(f"DROP FUNCTION IF EXISTS {NOTIFY_FUNCTION}()")
+
+    def _drop_stale_triggers(self):
+        """Drops triggers left behind by a killed session, unless a live session still holds the shared lock."""
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute("SELECT DISTINCT tgrelid::regclass::text FROM pg_trigger WHERE tgname = %s",
+                            (NOTIFY_FUNCTION,))
+                tables = [row[0] for row in cur.fetchall()]
+                if not tables:
+                    return
+                cur.execute("SELECT pg_try_advisory_lock(%s)", (TRIGGER_LOCK_KEY,))
+                if cur.fetchone()[0]:
+                    self._drop_triggers(cur, tables)
+                    cur.execute("SELECT pg_advisory_unlock(%s)", (TRIGGER_LOCK_KEY,))
+                    self.logger.info("Removed stale change notification triggers on %s.", ", ".join(tables))
+        except psycopg2.Error as e:
+            self.logger.warning("Could not remove stale change notification triggers: %s", str(e).strip())
+
+    def close(self):
+        """Drops the triggers unless another session still holds the shared lock, then closes the connection."""
+        if self.connection is None:
+            return
+        try:
+            if self.listening:
+                with self.connection.cursor() as cur:
+                    cur.execute(f"UNLISTEN {NOTIFY_CHANNEL}")
+                    cur.execute("SELECT pg_advisory_unlock_shared(%s)", (TRIGGER_LOCK_KEY,))
+                    cur.execute("SELECT pg_try_advisory_lock(%s)", (TRIGGER_LOCK_KEY,))
+                    if cur.fetchone()[0]:
+                        self._drop_triggers(cur, self.tables)
+                        cur.execute("SELECT pg_advisory_unlock(%s)", (TRIGGER_LOCK_KEY,))
+                        self.logger.info("Change notification triggers removed.")
+        except psycopg2.Error as e:
+            self.logger.warning("Could not remove the change notification triggers: %s", str(e).strip())
+        finally:
+            self.connection.close()
+            self.connection = None
+            self.listening = False
+
+    def _fetch(self, query: str, params) -> Optional[tuple]:
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(query, params)
+                return cur.fetchone()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # The database was recreated under the awaiter (see utils.db_snapshot): reconnect once and retry.
+            self.logger.warning("Awaiter connection lost (%s); reconnecting.", str(e).strip())
+            self.connection.close()
+            self.listening = False
+            self.start()
+            with self.connection.cursor() as cur:
+                cur.execute(query, params)
+                return cur.fetchone()
+
+    def _wait_for_change(self, timeout: float) -> List[dict]:
+        """Blocks until a change notification arrives or `timeout` passes; returns the notifications received."""
+        if not self.listening:
+            time.sleep(timeout)
+            return []
+        if not self.connection.notifies:
+            select.select([self.connection], [], [], timeout)
+            self.connection.poll()
+        received = []
+        while self.connection.notifies:
+            payload = self.connection.notifies.pop(0).payload
+            try:
+                received.append(json.loads(payload))
+            except ValueError:
+                received.append({"payload": payload})
+        return received
+
+    def wait_for(self, query: str, params=None, predicate: Optional[Callable[[Optional[tuple]], bool]] = None,
+                 timeout: Optional[float] = None, description: Optional[str] = None) -> DbWaitResult:
+        """
+        Runs `query` until `predicate(row)` is true for its first row (default: until the query returns a row)
+        and returns the row with the wait's statistics.
+
+        Raises:
+            DbConditionTimeout: If the condition is still false after `timeout` seconds. The message contains the
+                query, its parameters, the last row seen, the number of checks and the changes observed.
+        """
+        predicate = predicate or (lambda row: row is not None)
+        timeout = timeout if timeout is not None else self.default_timeout
+        description = description or " ".join(query.split())
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = self.initial_interval
+        checks, changes = 0, []
+        while True:
+            checks += 1
+            row = self._fetch(query, params)
+            if predicate(row):
+                result = DbWaitResult(row, time.monotonic() - start, checks, len(changes),
+                                      "notify" if self.listening else "poll")
+                self.logger.info("Condition '%s' met after %.3fs (%d checks, %d notifications).",
+                                 description, result.elapsed, checks, len(changes))
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DbConditionTimeout(self._diagnostics(description, query, params, row, timeout, checks, changes))
+            changes += self._wait_for_change(min(interval, remaining))
+            interval = min(interval * 2, self.max_interval)
+
+    def _diagnostics(self, description, query, params, row, timeout, checks, changes) -> str:
+        tables = sorted({change.get("table", "?") for change in changes})
+        return (f"Database condition '{description}' not met within {timeout:.1f}s.\n"
+                f"  query: {' '.join(query.split())}\n"
+                f"  params: {params!r}\n"
+                f"  last row: {row!r}\n"
+                f"  checks: {checks} ({'notify' if self.listening else 'poll'} mode)\n"
+                f"  changes observed: {len(changes)}" + (f" on {', '.join(tables)}" if tables else "") +
+                (f"; last: {changes[-1]}" if changes else ""))
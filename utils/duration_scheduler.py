@@ -0,0 +1,244 @@
+"""
+Duration-aware scheduling of tests across pytest-xdist workers.
+
+Every session records how long each test took (setup, call and teardown) in a small JSON history
+(TEST_DURATIONS_FILE). The next parallel run hands tests out longest-first, one at a time as workers free
+up, so a slow browser test no longer starts last on a worker that is already busy and holds up the
+whole run. Before the first test starts, the session prints the wall-clock time it expects.
+
+Tests without history are estimated from the median of their module's known tests, then from the median
+of all known tests, and from DEFAULT_DURATION when there is no history at all; with no history the
+collection order is kept, so the first run behaves like xdist's own load scheduling.
+"""
+import heapq
+import json
+import os
+import statistics
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+DEFAULT_DURATION = 1.0  # Seconds assumed per test when nothing at all has been recorded yet
+MAX_SAMPLES = 5  # Durations kept per test; the estimate is their median
+PREFETCH = 2  # Tests queued per worker; an xdist worker only starts a test once it holds the next one
+
+
+class DurationHistory:
+    """
+    Per-test durations of previous runs, keyed by pytest node ID and stored as JSON at `path`.
+    """
+
+    def __init__(self, path: str, max_samples: int = MAX_SAMPLES):
+        self.path = path
+        self.max_samples = max_samples
+        self.samples: Dict[str, List[float]] = {}
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def load(self) -> "DurationHistory":
+        """Reads the history file; a missing or unreadable file leaves the history empty."""
+        self.samples = self._read()
+        return self
+
+    def _read(self) -> Dict[str, List[float]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                tests = json.load(f).get("tests", {})
+            return {nodeid: [float(value) for value in values] for nodeid, values in tests.items() if values}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning("Ignoring unreadable duration history %s: %s", self.path, e)
+            return {}
+
+    def record(self, nodeid: str, seconds: float):
+        """Adds a duration for `nodeid`, dropping its oldest samples beyond `max_samples`."""
+        samples = self.samples.setdefault(nodeid, [])
+        samples.append(round(seconds, 4))
+        del samples[:-self.max_samples]
+
+    def save(self, recorded: Dict[str, List[float]]):
+        """
+        Merges this session's `recorded` durations into the file as it is now, so that runs finishing
+        in between are not overwritten, and replaces it atomically.
+        """
+        self.samples = self._read()
+        for nodeid, values in recorded.items():
+            for seconds in values:
+                self.record(nodeid, seconds)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "tests": self.samples}, f, indent=1, sort_keys=True)
+        os.replace(temporary, self.path)
+
+    def known(self, nodeid: str) -> Optional[float]:
+        """Returns the median recorded duration of `nodeid`, or None without history."""
+        samples = self.samples.get(nodeid)
+        return statistics.median(samples) if samples else None
+
+    def estimates(self, nodeids: Iterable[str]) -> Dict[str, float]:
+        """Returns an expected duration for every node ID, falling back as described in the module docstring."""
+        known = {nodeid: self.known(nodeid) for nodeid in self.samples}
+        by_module: Dict[str, List[float]] = {}
+        for nodeid, seconds in known.items():
+            by_module.setdefault(_module(nodeid), []).append(seconds)
+        overall = statistics.median(known.values()) if known else DEFAULT_DURATION
+        module_medians = {module: statistics.median(values) for module, values in by_module.items()}
+        return {nodeid: known.get(nodeid, module_medians.get(_module(nodeid), overall)) for nodeid in nodeids}
+
+
+def _module(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
+
+
+def makespan(durations: Sequence[float], workers: int) -> float:
+    """Returns the wall-clock time of running `durations` longest-first on `workers` workers."""
+    loads = [0.0] * max(1, workers)
+    for seconds in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + seconds)
+    return max(loads)
+
+
+class RunEstimate(NamedTuple):
+    wall_time: float
+    total: float
+    tests: int
+    without_history: int
+    workers: int
+
+    def summary(self) -> str:
+        if self.tests and self.without_history == self.tests:
+            history = f"no duration history yet, {DEFAULT_DURATION:.1f}s assumed per test"
+        else:
+            history = f"{self.without_history} of {self.tests} tests without history"
+        return (f"Estimated wall-clock time: {self.wall_time:.1f}s for {self.tests} tests on {self.workers} "
+                f"worker(s), {self.total:.1f}s of test time ({history})")
+
+
+def estimate_run(history: DurationHistory, nodeids: Sequence[str], workers: int) -> RunEstimate:
+    """Estimates the wall-clock time of running `nodeids` on `workers` workers from the history."""
+    durations = history.estimates(nodeids)
+    return RunEstimate(wall_time=makespan(list(durations.values()), workers), total=sum(durations.values()),
+                       tests=len(nodeids), without_history=sum(1 for nodeid in nodeids if nodeid not in history.samples),
+                       workers=max(1, workers))
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    xdist's load scheduling, with the pending tests sorted longest-first and handed out PREFETCH at a time,
+    so each worker picks up the longest remaining test whenever it finishes one.
+    """
+
+    def __init__(self, config, log, history: DurationHistory, on_schedule=None):
+        super().__init__(config, log)
+        self.history = history
+        self.on_schedule = on_schedule
+        self.estimate: Optional[RunEstimate] = None
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        durations = self.history.estimates(self.collection)
+        # sorted() is stable, so tests with equal estimates (all of them on a first run) keep collection order.
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: -durations[self.collection[index]])
+        self.estimate = estimate_run(self.history, self.collection, len(self.nodes))
+        if self.on_schedule is not None:
+            self.on_schedule(self.estimate)
+        if not self.collection:
+            return
+
+        # Round-robin, so the longest tests start on different workers.
+        for _ in range(PREFETCH):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down:
+            return
+        if self.pending:
+            node_pending = self.node2pending[node]
+            if len(node_pending) < PREFETCH:
+                self._send_tests(node, PREFETCH - len(node_pending))
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
+
+
+class DurationSchedulerPlugin:
+    """
+    Records test durations on the controller process, reports the estimate before the first test and
+    installs DurationScheduling for `pytest -n` runs with the default `--dist load`.
+    """
+
+    def __init__(self, config, path: str):
+        self.config = config
+        self.history = DurationHistory(path).load()
+        self.recorded: Dict[str, List[float]] = {}
+        self.estimate: Optional[RunEstimate] = None
+        self._phases: Dict[str, float] = {}
+        self._started: Optional[float] = None
+
+    def _write_line(self, line: str):
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(line)
+
+    def _report_estimate(self, estimate: RunEstimate):
+        self.estimate = estimate
+        self._started = time.perf_counter()
+        self._write_line(estimate.summary())
+
+    @pytest.hookimpl(tryfirst=True, optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if config.getvalue("dist") != "load":
+            return None
+        return DurationScheduling(config, log, self.history, on_schedule=self._report_estimate)
+
+    def pytest_collection_finish(self, session):
+        # Without xdist this process runs the tests itself, one after the other.
+        if not session.config.getoption("collectonly", False) and session.items:
+            self._report_estimate(estimate_run(self.history, [item.nodeid for item in session.items], 1))
+
+    def pytest_runtest_logreport(self, report):
+        self._phases[report.nodeid] = self._phases.get(report.nodeid, 0.0) + report.duration
+        if report.when == "teardown":
+            self.recorded.setdefault(report.nodeid, []).append(self._phases.pop(report.nodeid))
+
+    def pytest_sessionfinish(self, session):
+        if self.recorded:
+            self.history.save(self.recorded)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.estimate is None or self._started is None:
+            return
+        terminalreporter.write_line(
+            f"Duration scheduling: estimated {self.estimate.wall_time:.1f}s, took "
+            f"{time.perf_counter() - self._started:.1f}s; {len(self.recorded)} durations recorded to {self.history.path}")
+
+
+def register(config):
+    """
+    Registers the plugin on the controller process (pytest-xdist workers only run the tests they are sent)
+    when DURATION_SCHEDULING is on.
+    """
+    if AppSettings.is_duration_scheduling_enabled() and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationSchedulerPlugin(config, AppSettings.get_test_durations_file()),
+                                      "duration_scheduler")
@@ -0,0 +1,212 @@
+import json
+import re
+import threading
+import warnings
+from typing import Callable, Dict, List, Optional, Sequence
+
+from psycopg2.extensions import cursor as PgCursor
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+
+
+class SeqScanWarning(UserWarning):
+    """Issued when a hot query scans a large table sequentially and the action is 'warn'."""
+
+
+class SeqScanError(AssertionError):
+    """Raised when a hot query scans a large table sequentially and the action is 'fail'."""
+
+
+class PlanCapture:
+    """The EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output of one statement, with the figures tests care about."""
+
+    def __init__(self, query: str, params, explain: dict):
+        self.query = query
+        self.params = params
+        self.explain = explain
+        self.plan = explain["Plan"]
+        self.planning_time_ms = explain.get("Planning Time", 0.0)
+        self.execution_time_ms = explain.get("Execution Time", 0.0)
+        # Buffer counts of a node include its children, so the root holds the statement's totals.
+        self.shared_hit_blocks = self.plan.get("Shared Hit Blocks", 0)
+        self.shared_read_blocks = self.plan.get("Shared Read Blocks", 0)
+        self.seq_scans: List[dict] = []  # [{"relation", "rows_scanned", "table_rows"}], filled by the collector
+        self.violations: List[str] = []
+
+    def nodes(self) -> List[dict]:
+        """Returns every plan node, depth first."""
+        stack, nodes = [self.plan], []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.get("Plans", [])))
+        return nodes
+
+    @property
+    def short_query(self) -> str:
+        query = " ".join(self.query.split())
+        return query if len(query) <= 80 else f"{query[:77]}..."
+
+    def render_plan(self) -> str:
+        """Renders the plan tree as indented text: node type, relation, index, actual rows and time."""
+        lines = []
+
+        def walk(node, depth):
+            target = f" on {node['Relation Name']}" if "Relation Name" in node else ""
+            index = f" using {node['Index Name']}" if "Index Name" in node else ""
+            lines.append(f"{'  ' * depth}-> {node['Node Type']}{index}{target} "
+                         f"(rows={node.get('Actual Rows', '?')} loops={node.get('Actual Loops', '?')} "
+                         f"time={node.get('Actual Total Time', '?')}ms)")
+            for child in node.get("Plans", []):
+                walk(child, depth + 1)
+
+        walk(self.plan, 0)
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict:
+        return {
+            "query": self.query,
+            "params": [str(param) for param in self.params] if isinstance(self.params, (list, tuple)) else self.params,
+            "planning_time_ms": self.planning_time_ms,
+            "execution_time_ms": self.execution_time_ms,
+            "shared_hit_blocks": self.shared_hit_blocks,
+            "shared_read_blocks": self.shared_read_blocks,
+            "seq_scans": self.seq_scans,
+            "violations": self.violations,
+            "plan": self.explain,
+        }
+
+    def summary(self) -> str:
+        return (f"{self.short_query}\nplanning {self.planning_time_ms:.3f}ms, execution {self.execution_time_ms:.3f}ms, "
+                f"buffers hit={self.shared_hit_blocks} read={self.shared_read_blocks}\n{self.render_plan()}"
+                + "".join(f"\n!! {violation}" for violation in self.violations))
+
+
+class ExplainCollector:
+    """
+    Captures query plans for SELECT statements run through its cursor factory.
+
+    Every distinct SELECT is explained once (per `reset()`), right before its first execution, so repeated
+    executions - benchmark rounds in particular - are not slowed down. A statement that matches one of the
+    `hot_queries` regular expressions and sequentially scans a table with at least `seq_scan_min_rows` rows
+    issues a SeqScanWarning ('warn') or raises SeqScanError ('fail').
+
+    Usage:
+        connection.cursor_factory = collector.cursor_factory
+    """
+
+    def __init__(self, hot_queries: Sequence[str] = (), seq_scan_min_rows: int = 10000, action: str = "warn",
+                 on_capture: Optional[Callable[[PlanCapture], None]] = None):
+        self.hot_queries = [re.compile(pattern, re.IGNORECASE) for pattern in hot_queries]
+        self.seq_scan_min_rows = seq_scan_min_rows
+        self.action = action
+        self.on_capture = on_capture
+        self.captures: List[PlanCapture] = []
+        self.logger = setup_logger(self.__class__.__name__)
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.cursor_factory = type("BoundExplainCursor", (ExplainCursor,), {"collector": self})
+
+    @classmethod
+    def from_settings(cls, on_capture: Optional[Callable[[PlanCapture], None]] = None) -> Optional["ExplainCollector"]:
+        """Returns a collector configured from AppSettings, or None when EXPLAIN capture is disabled."""
+        if not AppSettings.is_explain_capture_enabled():
+            return None
+        return cls(hot_queries=AppSettings.get_explain_hot_queries(),
+                   seq_scan_min_rows=AppSettings.get_explain_seq_scan_min_rows(),
+                   action=AppSettings.EXPLAIN_SEQ_SCAN_ACTION, on_capture=on_capture)
+
+    def reset(self):
+        """Forgets the captured statements, so the next execution of each one is explained again."""
+        with self._lock:
+            self._seen.clear()
+            self.captures = []
+
+    def should_explain(self, query: str) -> bool:
+        statement = query.lstrip().lower()
+        if not (statement.startswith("select") or statement.startswith("with")):
+            return False
+        with self._lock:
+            if query in self._seen:
+                return False
+            self._seen.add(query)
+            return True
+
+    def is_hot(self, query: str) -> bool:
+        normalized = " ".join(query.split())
+        return any(pattern.search(normalized) for pattern in self.hot_queries)
+
+    def _table_rows(self, cursor: "ExplainCursor", relation: str) -> int:
+        PgCursor.execute(cursor, "SELECT COALESCE(MAX(reltuples), -1)::bigint FROM pg_class WHERE relname = %s",
+                         (relation,))
+        return cursor.fetchone()[0]
+
+    def capture(self, cursor: "ExplainCursor", query: str, params) -> PlanCapture:
+        PgCursor.execute(cursor, EXPLAIN_PREFIX + query, params)
+        explain = cursor.fetchone()[0]
+        return self.record_plan(query, params, explain, lambda relation: self._table_rows(cursor, relation))
+
+    def record_plan(self, query: str, params, explain, table_rows: Callable[[str], int]) -> PlanCapture:
+        """
+        Records the EXPLAIN (FORMAT JSON) output of `query` (the parsed list or its JSON text), checks its
+        sequential scans against the table sizes `table_rows(relation)` returns, and warns or fails.
+
+        Raises:
+            SeqScanError: If the action is 'fail' and a hot query scans a large table sequentially.
+        """
+        capture = PlanCapture(query, params, explain[0] if isinstance(explain, list) else json.loads(explain)[0])
+
+        for node in capture.nodes():
+            if node["Node Type"] != "Seq Scan":
+                continue
+            loops = node.get("Actual Loops", 1)
+            rows_scanned = (node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)) * loops
+            # reltuples is -1 for tables that were never analysed; the rows the scan touched are a lower bound.
+            relation_rows = max(table_rows(node["Relation Name"]), rows_scanned)
+            capture.seq_scans.append({"relation": node["Relation Name"], "rows_scanned": rows_scanned,
+                                      "table_rows": relation_rows})
+            if self.is_hot(query) and relation_rows >= self.seq_scan_min_rows:
+                capture.violations.append(f"Hot query scans '{node['Relation Name']}' sequentially "
+                                          f"({relation_rows} rows >= {self.seq_scan_min_rows})")
+
+        with self._lock:
+            self.captures.append(capture)
+        self.logger.debug("Captured plan for %s: %.3fms", capture.short_query, capture.execution_time_ms)
+        if self.on_capture is not None:
+            self.on_capture(capture)
+        self._check(capture)
+        return capture
+
+    def _check(self, capture: PlanCapture):
+        for violation in capture.violations:
+            self.logger.warning("%s: %s", violation, capture.short_query)
+            if self.action == "fail":
+                raise SeqScanError(f"{violation}\n{capture.summary()}")
+            warnings.warn(f"{violation}: {capture.short_query}", SeqScanWarning, stacklevel=5)
+
+    def totals(self) -> Dict[str, float]:
+        """Returns the summed planning/execution time and buffer counts of the captured statements."""
+        return {
+            "statements": len(self.captures),
+            "planning_time_ms": sum(c.planning_time_ms for c in self.captures),
+            "execution_time_ms": sum(c.execution_time_ms for c in self.captures),
+            "shared_hit_blocks": sum(c.shared_hit_blocks for c in self.captures),
+            "shared_read_blocks": sum(c.shared_read_blocks for c in self.captures),
+        }
+
+
+class ExplainCursor(PgCursor):
+    """
+    psycopg2 cursor that lets its collector explain each SELECT once before running it.
+    Use the `cursor_factory` of an ExplainCollector, which binds the collector to this class.
+    """
+
+    collector: ExplainCollector = None
+
+    def execute(self, query, vars=None):
+        if self.collector is not None and isinstance(query, str) and self.collector.should_explain(query):
+            self.collector.capture(self, query, vars)
+        return super().execute(query, vars)
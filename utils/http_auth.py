@@ -0,0 +1,138 @@
+"""
+Browserless login and a pool of test users.
+
+`http_login` signs in over plain HTTP, the way the browser would: it fetches the login form, extracts the
+CSRF token, posts the credentials and returns the session cookie as a Playwright storage state, which
+`browser.new_context(storage_state=...)` accepts as is. It takes milliseconds instead of a browser launch.
+
+`CredentialPool` creates a set of test users with one JSON-RPC batch and hands them out per pytest-xdist
+worker and per virtual user, so concurrent scenarios no longer share the admin's session.
+"""
+import json
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config.app_settings import AppSettings
+from utils.http_load import CSRF_INPUT_PATTERN, LOGIN_FORM_URL, LOGIN_URL
+from utils.logger import setup_logger
+from utils.workers import get_worker_id
+
+
+class HttpLoginError(Exception):
+    """Raised when the login form cannot be read or Kanboard rejects the credentials."""
+
+
+class Credential(NamedTuple):
+    username: str
+    password: str
+
+
+def http_login(username: str, password: str, base_url: Optional[str] = None, timeout: float = 30.0) -> dict:
+    """
+    Logs in over HTTP and returns a Playwright storage state ({"cookies": [...], "origins": []}).
+
+    Raises:
+        HttpLoginError: If the login form has no CSRF token or the credentials are rejected.
+    """
+    root = AppSettings.get_app_root_url(base_url)
+    host = urlsplit(root).hostname
+    with httpx.Client(base_url=root, follow_redirects=False, timeout=timeout) as client:
+        form = client.get(LOGIN_FORM_URL)
+        match = CSRF_INPUT_PATTERN.search(form.text)
+        if form.status_code != 200 or match is None:
+            raise HttpLoginError(f"Could not read the login form at {root}{LOGIN_FORM_URL} (HTTP {form.status_code})")
+        response = client.post(LOGIN_URL, data={"username": username, "password": password,
+                                                "csrf_token": match.group(1)})
+        if response.status_code != 302 or "AuthController" in response.headers.get("Location", ""):
+            raise HttpLoginError(f"Kanboard rejected the login of user '{username}' (HTTP {response.status_code})")
+        cookies = [{
+            "name": cookie.name,
+            "value": cookie.value,
+            # The cookie jar records host-only cookies for 'localhost' as 'localhost.local'; the browser would not.
+            "domain": cookie.domain if cookie.domain_specified else host,
+            "path": cookie.path or "/",
+            "expires": cookie.expires if cookie.expires is not None else -1,
+            "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            "secure": cookie.secure,
+            "sameSite": "Lax",
+        } for cookie in client.cookies.jar]
+    return {"cookies": cookies, "origins": []}
+
+
+def write_storage_state(state: dict, path: str) -> str:
+    """Writes a storage state to `path` (creating its directory) and returns the path."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    return path
+
+
+class CredentialPool:
+    """
+    A fixed set of test users for the current worker, named '<prefix>_<worker>_<n>' so parallel workers never
+    share a user. `ensure()` looks them all up and creates the missing ones in one JSON-RPC batch; the users are
+    kept for later runs. `credential(i)` hands them out round-robin, and `storage_state(i)` logs one in over
+    HTTP once and caches the state file.
+    """
+
+    def __init__(self, api_client, size: int, prefix: str = "perf_user", password: str = "perf-password",
+                 role: str = "app-manager", state_dir: str = os.path.join("temp", "auth")):
+        if size < 1:
+            raise ValueError("A credential pool needs at least one user")
+        self.api_client = api_client
+        self.password = password
+        self.role = role
+        self.state_dir = state_dir
+        self.usernames = [f"{prefix}_{get_worker_id()}_{index}" for index in range(size)]
+        self.logger = setup_logger(self.__class__.__name__)
+        self._states: Dict[str, str] = {}
+
+    @classmethod
+    def from_settings(cls, api_client) -> "CredentialPool":
+        return cls(api_client, AppSettings.get_test_user_count(), prefix=AppSettings.TEST_USER_PREFIX,
+                   password=AppSettings.TEST_USER_PASSWORD)
+
+    def ensure(self) -> "CredentialPool":
+        """Creates the users that do not exist yet, all in one batch."""
+        start = time.perf_counter()
+        existing = self.api_client.batch(("getUserByName", {"username": name}) for name in self.usernames)
+        missing = [name for name, user in zip(self.usernames, existing) if not user]
+        created = self.api_client.batch(
+            ("createUser", {"username": name, "password": self.password, "name": name, "role": self.role})
+            for name in missing)
+        failed = [name for name, user_id in zip(missing, created) if not user_id]
+        if failed:
+            raise HttpLoginError(f"Kanboard refused to create the test users {failed}")
+        self.logger.info("Credential pool ready: %d users (%d created) in %.3fs",
+                         len(self.usernames), len(missing), time.perf_counter() - start)
+        return self
+
+    def __len__(self):
+        return len(self.usernames)
+
+    def credential(self, index: int) -> Credential:
+        return Credential(self.usernames[index % len(self.usernames)], self.password)
+
+    def credentials(self, count: int) -> List[Credential]:
+        """Returns one credential per virtual user; users are reused round-robin when there are fewer of them."""
+        return [self.credential(index) for index in range(count)]
+
+    def storage_state(self, index: int, base_url: Optional[str] = None) -> str:
+        """Returns the path of a storage state logged in as the index-th user, logging in on first use."""
+        credential = self.credential(index)
+        if credential.username not in self._states:
+            path = os.path.join(self.state_dir, f"auth_{credential.username}.json")
+            self._states[credential.username] = write_storage_state(
+                http_login(credential.username, credential.password, base_url), path)
+        return self._states[credential.username]
+
+    def cleanup(self):
+        """Removes the cached storage state files (the users themselves are kept)."""
+        for path in self._states.values():
+            if os.path.exists(path):
+                os.remove(path)
+        self._states.clear()
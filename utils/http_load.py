@@ -0,0 +1,365 @@
+"""
+Protocol-level HTTP load generator for Kanboard.
+
+Every virtual user is an httpx.AsyncClient with its own cookie jar and keep-alive connection pool.
+It logs in once and then repeats the workflow the page objects exercise through Kanboard's controller
+routes: dashboard, project creation, board view, task creation, task move (the board's AJAX save)
+and project removal. Form pages are fetched before every POST for a fresh single-use CSRF token;
+the task move reuses the token carried by the board's save URL.
+
+Two load models are supported:
+    closed - `users` virtual users loop over the workflow (with optional think time) for `duration` seconds.
+    open   - workflows arrive as a Poisson process at `arrival_rate` per second, independent of response
+             times, and run on `users` logged-in sessions; arrivals beyond `max_in_flight` are dropped.
+
+Usage:
+    python -m utils.http_load --model closed --users 50 --duration 60
+    python -m utils.http_load --model open --rate 20 --users 20 --duration 60
+"""
+import argparse
+import asyncio
+import html
+import itertools
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+from utils.stats import histogram, summarize_latencies, write_json_report
+from utils.workers import unique_name
+
+LOGIN_FORM_URL = "/?controller=AuthController&action=login"
+LOGIN_URL = "/?controller=AuthController&action=check"
+DASHBOARD_URL = "/?controller=DashboardController&action=show"
+PROJECT_FORM_URL = "/?controller=ProjectCreationController&action=create"
+PROJECT_SAVE_URL = "/?controller=ProjectCreationController&action=save"
+BOARD_URL = "/?controller=BoardViewController&action=show&project_id={project_id}"
+TASK_FORM_URL = "/?controller=TaskCreationController&action=show&project_id={project_id}"
+TASK_SAVE_URL = "/?controller=TaskCreationController&action=save&project_id={project_id}"
+TASK_MOVE_URL = "/?controller=BoardAjaxController&action=save&project_id={project_id}"
+PROJECT_REMOVE_CONFIRM_URL = "/?controller=ProjectStatusController&action=confirmRemove&project_id={project_id}"
+
+CSRF_INPUT_PATTERN = re.compile(r'name="csrf_token"\s+value="([^"]+)"')
+CSRF_PARAM_PATTERN = re.compile(r"csrf_token=([0-9A-Za-z]+)")
+PROJECT_ID_PATTERN = re.compile(r"(?:project_id=|/project/|/board/)(\d+)")
+SAVE_URL_PATTERN = re.compile(r'data-save-url="([^"]+)"')
+COLUMN_ID_PATTERN = re.compile(r'data-column-id="(\d+)"')
+TASK_ID_PATTERN = re.compile(r'data-task-id="(\d+)"')
+SWIMLANE_ID_PATTERN = re.compile(r'data-swimlane-id="(\d+)"')
+REMOVE_URL_PATTERN = re.compile(r'(?:href|action)="([^"]*action=remove[^"]*)"')
+
+
+class HttpLoadError(Exception):
+    """Raised when a request of the workflow fails (transport error, unexpected status or missing data)."""
+
+
+class RequestRecorder:
+    """Collects per-endpoint latencies, status codes and errors (one event loop, so no locking is needed)."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, status: Optional[int], ok: bool):
+        self.latencies.setdefault(endpoint, []).append(seconds * 1000)
+        key = str(status) if status is not None else "transport_error"
+        statuses = self.statuses.setdefault(endpoint, {})
+        statuses[key] = statuses.get(key, 0) + 1
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+    def report(self, elapsed: float) -> Dict[str, dict]:
+        """Returns per-endpoint request counts, errors, status codes, throughput, percentiles and histogram (ms)."""
+        return {
+            endpoint: {
+                "requests": len(samples),
+                "errors": self.errors.get(endpoint, 0),
+                "statuses": self.statuses[endpoint],
+                "requests_per_s": len(samples) / elapsed if elapsed else 0.0,
+                "latency_ms": summarize_latencies(samples),
+                "histogram_ms": histogram(samples),
+            }
+            for endpoint, samples in sorted(self.latencies.items())
+        }
+
+
+def _extract(pattern: re.Pattern, text: str, what: str) -> str:
+    match = pattern.search(text)
+    if match is None:
+        raise HttpLoadError(f"Could not find {what} in the response")
+    return html.unescape(match.group(1))
+
+
+class KanboardHttpUser:
+    """One logged-in Kanboard session driven over plain HTTP."""
+
+    def __init__(self, base_url: str, username: str, password: str, recorder: RequestRecorder,
+                 max_connections: int = 1, timeout: float = 30.0):
+        self.username = username
+        self.password = password
+        self.recorder = recorder
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.client = httpx.AsyncClient(base_url=base_url, follow_redirects=False, limits=limits, timeout=timeout)
+
+    async def request(self, endpoint: str, method: str, url: str, expected=(200, 302), **kwargs) -> httpx.Response:
+        """Sends a timed request; any status outside `expected` is recorded as an error and raises HttpLoadError."""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(endpoint, time.perf_counter() - start, None, ok=False)
+            raise HttpLoadError(f"{endpoint}: {e.__class__.__name__}: {e}") from e
+        ok = response.status_code in expected
+        self.recorder.record(endpoint, time.perf_counter() - start, response.status_code, ok)
+        if not ok:
+            raise HttpLoadError(f"{endpoint}: unexpected HTTP {response.status_code}")
+        return response
+
+    async def _form_token(self, endpoint: str, url: str) -> str:
+        response = await self.request(endpoint, "GET", url, expected=(200,))
+        return _extract(CSRF_INPUT_PATTERN, response.text, "a CSRF token")
+
+    async def login(self):
+        token = await self._form_token("login_form", LOGIN_FORM_URL)
+        response = await self.request("login", "POST", LOGIN_URL, data={
+            "username": self.username, "password": self.password, "csrf_token": token})
+        if response.status_code != 302 or "AuthController" in response.headers.get("Location", ""):
+            raise HttpLoadError(f"Login failed for user '{self.username}'")
+
+    async def dashboard(self):
+        await self.request("dashboard", "GET", DASHBOARD_URL, expected=(200,))
+
+    async def create_project(self, name: str) -> int:
+        token = await self._form_token("project_create_form", PROJECT_FORM_URL)
+        response = await self.request("project_create", "POST", PROJECT_SAVE_URL,
+                                      data={"name": name, "csrf_token": token}, expected=(302,))
+        return int(_extract(PROJECT_ID_PATTERN, response.headers.get("Location", ""), "the new project ID"))
+
+    async def board(self, project_id: int) -> str:
+        response = await self.request("board", "GET", BOARD_URL.format(project_id=project_id), expected=(200,))
+        return response.text
+
+    async def create_task(self, project_id: int, title: str):
+        token = await self._form_token("task_create_form", TASK_FORM_URL.format(project_id=project_id))
+        await self.request("task_create", "POST", TASK_SAVE_URL.format(project_id=project_id),
+                           data={"title": title, "project_id": project_id, "csrf_token": token}, expected=(302,))
+
+    async def move_task(self, project_id: int, board_html: str, task_id: int, column_id: int):
+        """Moves a task the way the board's drag and drop does: a JSON POST to the board's save URL."""
+        match = SAVE_URL_PATTERN.search(board_html)
+        url = html.unescape(match.group(1)) if match else TASK_MOVE_URL.format(project_id=project_id)
+        token = CSRF_PARAM_PATTERN.search(url)
+        headers = {"X-Requested-With": "XMLHttpRequest"}
+        if token:
+            headers["X-Csrf-Token"] = token.group(1)
+        swimlane = SWIMLANE_ID_PATTERN.search(board_html)
+        await self.request("task_move", "POST", url, headers=headers, json={
+            "task_id": task_id, "column_id": column_id, "position": 1,
+            "swimlane_id": int(swimlane.group(1)) if swimlane else 1}, expected=(200,))
+
+    async def remove_project(self, project_id: int):
+        response = await self.request("project_remove_confirm", "GET",
+                                      PROJECT_REMOVE_CONFIRM_URL.format(project_id=project_id), expected=(200,))
+        url = _extract(REMOVE_URL_PATTERN, response.text, "the project removal URL")
+        if f'action="{html.escape(url)}"' in response.text:
+            token = _extract(CSRF_INPUT_PATTERN, response.text, "a CSRF token")
+            await self.request("project_remove", "POST", url, data={"csrf_token": token}, expected=(302,))
+        else:
+            await self.request("project_remove", "GET", url, expected=(302,))
+
+    async def run_workflow(self, iteration: int, think_time: float = 0.0):
+        """Dashboard, create project, board, create task, move it to the last column and remove the project."""
+        async def think():
+            if think_time:
+                await asyncio.sleep(random.uniform(0, 2 * think_time))
+
+        await self.dashboard()
+        await think()
+        project_id = await self.create_project(unique_name("HTTP Load Project"))
+        try:
+            await think()
+            await self.create_task(project_id, f"HTTP Load Task {iteration}")
+            await think()
+            board_html = await self.board(project_id)
+            task_ids = [int(task_id) for task_id in TASK_ID_PATTERN.findall(board_html)]
+            column_ids = list(dict.fromkeys(int(column_id) for column_id in COLUMN_ID_PATTERN.findall(board_html)))
+            if not task_ids or not column_ids:
+                raise HttpLoadError("The board does not show the new task")
+            await self.move_task(project_id, board_html, max(task_ids), column_ids[-1])
+            await think()
+        finally:
+            await self.remove_project(project_id)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+class HttpLoadGenerator:
+    """
+    Runs the workflow under a closed (fixed concurrency) or open (Poisson arrival rate) load model.
+    Every virtual user logs in as `username`, or, with `credentials`, as credentials[i] (round-robin),
+    so the users do not all share one Kanboard session.
+    """
+
+    def __init__(self, base_url: str, username: str, password: str, users: int = 10, duration: float = 60.0,
+                 model: str = "closed", arrival_rate: float = 10.0, ramp_up: float = 0.0, think_time: float = 0.0,
+                 max_in_flight: int = 1000, timeout: float = 30.0,
+                 credentials: Optional[Sequence[Tuple[str, str]]] = None):
+        if model not in ("closed", "open"):
+            raise ValueError(f"Unknown load model '{model}', expected 'closed' or 'open'")
+        if model == "open" and arrival_rate <= 0:
+            raise ValueError("The open load model needs a positive arrival rate")
+        self.base_url = base_url
+        self.credentials = list(credentials or [(username, password)])
+        self.users = max(1, users)
+        self.duration = max(0.0, duration)
+        self.model = model
+        self.arrival_rate = arrival_rate
+        self.ramp_up = max(0.0, ramp_up)
+        self.think_time = max(0.0, think_time)
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self.recorder = RequestRecorder()
+        self.iterations = {"ok": 0, "failed": 0}
+        self.dropped_arrivals = 0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def _new_user(self, index: int, max_connections: int) -> KanboardHttpUser:
+        username, password = self.credentials[index % len(self.credentials)]
+        return KanboardHttpUser(self.base_url, username, password, self.recorder,
+                                max_connections=max_connections, timeout=self.timeout)
+
+    async def _iteration(self, user: KanboardHttpUser, iteration: int, think_time: float = 0.0):
+        try:
+            await user.run_workflow(iteration, think_time)
+            self.iterations["ok"] += 1
+        except HttpLoadError as e:
+            self.iterations["failed"] += 1
+            self.logger.debug("Iteration %d failed: %s", iteration, e)
+
+    async def _closed_user(self, index: int, deadline: float, counter):
+        await asyncio.sleep(self.ramp_up * index / self.users)
+        user = self._new_user(index, max_connections=1)
+        try:
+            await user.login()
+            while time.monotonic() < deadline:
+                await self._iteration(user, next(counter), self.think_time)
+        except HttpLoadError as e:
+            self.logger.warning("Virtual user %d could not log in: %s", index, e)
+        finally:
+            await user.aclose()
+
+    async def _run_closed(self):
+        deadline = time.monotonic() + self.duration
+        counter = itertools.count(1)
+        await asyncio.gather(*(self._closed_user(i, deadline, counter) for i in range(self.users)))
+
+    async def _run_open(self):
+        # Sessions may serve several overlapping workflows, so each gets a share of the in-flight budget.
+        connections = max(1, -(-self.max_in_flight // self.users))
+        users = [self._new_user(index, max_connections=connections) for index in range(self.users)]
+        try:
+            await asyncio.gather(*(user.login() for user in users))
+            in_flight = set()
+            start = time.monotonic()
+            next_arrival = start
+            for iteration in itertools.count(1):
+                next_arrival += random.expovariate(self.arrival_rate)
+                if next_arrival - start >= self.duration:
+                    break
+                await asyncio.sleep(max(0.0, next_arrival - time.monotonic()))
+                if len(in_flight) >= self.max_in_flight:
+                    self.dropped_arrivals += 1
+                    continue
+                task = asyncio.ensure_future(self._iteration(users[iteration % len(users)], iteration))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            await asyncio.gather(*(user.aclose() for user in users))
+
+    async def run(self) -> dict:
+        """Runs the load test and returns the report."""
+        self.logger.info("Starting %s-model HTTP load against %s (%d users, %.0fs)",
+                         self.model, self.base_url, self.users, self.duration)
+        start = time.monotonic()
+        await (self._run_closed() if self.model == "closed" else self._run_open())
+        elapsed = time.monotonic() - start
+        total = self.recorder.total_requests
+        self.logger.info("HTTP load finished: %d requests in %.1fs (%.0f req/s)",
+                         total, elapsed, total / elapsed if elapsed else 0.0)
+        return {
+            "config": {"model": self.model, "users": self.users, "duration_s": self.duration,
+                       "arrival_rate_per_s": self.arrival_rate if self.model == "open" else None,
+                       "ramp_up_s": self.ramp_up, "think_time_s": self.think_time,
+                       "max_in_flight": self.max_in_flight},
+            "elapsed_s": elapsed,
+            "requests": total,
+            "requests_per_s": total / elapsed if elapsed else 0.0,
+            "iterations": dict(self.iterations),
+            "dropped_arrivals": self.dropped_arrivals,
+            "endpoints": self.recorder.report(elapsed),
+        }
+
+    def run_sync(self) -> dict:
+        """
+        Runs the load test on a fresh event loop in its own thread and returns the report.
+        Works from synchronous code even while another loop runs in the calling thread
+        (pytest-playwright's sync API keeps one running for the whole session).
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="http-load") as executor:
+            return executor.submit(asyncio.run, self.run()).result()
+
+
+def format_report(result: dict) -> str:
+    """Renders an HTTP load result as a fixed-width text table."""
+    lines = [f"{result['requests']} requests in {result['elapsed_s']:.1f}s "
+             f"({result['requests_per_s']:.0f} req/s), iterations {result['iterations']}, "
+             f"dropped arrivals {result['dropped_arrivals']}",
+             f"{'endpoint':<24}{'reqs':>8}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for endpoint, stats in result["endpoints"].items():
+        latency = stats["latency_ms"]
+        lines.append(f"{endpoint:<24}{stats['requests']:>8}{stats['errors']:>8}{stats['requests_per_s']:>9.1f}"
+                     f"{latency.get('p50', 0):>9.1f}{latency.get('p95', 0):>9.1f}{latency.get('p99', 0):>9.1f}")
+    return "\n".join(lines)
+
+
+def main():
+    app_url = urlsplit(AppSettings.get_base_url())
+    parser = argparse.ArgumentParser(description="Generate protocol-level HTTP load against Kanboard.")
+    parser.add_argument("--base-url", default=f"{app_url.scheme}://{app_url.netloc}",
+                        help="application root (defaults to the scheme and host of BASE_URL)")
+    parser.add_argument("--model", choices=("closed", "open"), default="closed")
+    parser.add_argument("--users", type=int, default=max(1, AppSettings.get_load_users()),
+                        help="virtual users (closed) or logged-in sessions (open)")
+    parser.add_argument("--rate", type=float, default=10.0, help="workflow arrivals per second (open model)")
+    parser.add_argument("--duration", type=float, default=AppSettings.LOAD_DURATION)
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds until all closed-model users started")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean pause between requests (closed model)")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="open-model cap on concurrent workflows")
+    parser.add_argument("--output", help="path of the JSON report")
+    args = parser.parse_args()
+
+    generator = HttpLoadGenerator(args.base_url, AppSettings.ADMIN_USER, AppSettings.get_admin_password(),
+                                  users=args.users, duration=args.duration, model=args.model,
+                                  arrival_rate=args.rate, ramp_up=args.ramp_up, think_time=args.think_time,
+                                  max_in_flight=args.max_in_flight)
+    result = generator.run_sync()
+    print(format_report(result))
+    print(f"Report written to {write_json_report(result, 'http_load', args.output)}")
+
+
+if __name__ == "__main__":
+    main()
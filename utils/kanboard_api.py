@@ -0,0 +1,172 @@
+import itertools
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+
+class KanboardApiError(Exception):
+    """Raised when the JSON-RPC endpoint returns an error object or an unusable result."""
+
+
+class KanboardApiClient:
+    """
+    A small client for Kanboard's JSON-RPC endpoint (/jsonrpc.php), used to seed test data.
+
+    All calls go through one persistent keep-alive HTTP session, and bulk operations
+    (columns, tasks) are sent as JSON-RPC batch requests, so creating N tasks costs
+    roughly N / batch_size HTTP round trips instead of several browser round trips per task.
+    """
+
+    def __init__(self, url: Optional[str] = None, username: Optional[str] = None,
+                 token: Optional[str] = None, batch_size: Optional[int] = None, timeout: float = 30.0,
+                 registry=None):
+        default_user, default_token = AppSettings.get_api_credentials()
+        self.url = url or AppSettings.get_api_url()
+        self.batch_size = batch_size or AppSettings.get_api_batch_size()
+        self.registry = registry  # Optional TestDataRegistry that records created projects and tasks
+        self.logger = setup_logger(self.__class__.__name__)
+        self.client = httpx.Client(
+            auth=(username or default_user, token or default_token),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+        )
+        self._request_ids = itertools.count(1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the underlying keep-alive session."""
+        self.client.close()
+
+    # --- Transport ---
+
+    def _build_request(self, method: str, params: dict) -> dict:
+        return {"jsonrpc": "2.0", "method": method, "id": next(self._request_ids), "params": params}
+
+    def _post(self, payload):
+        response = self.client.post(self.url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _unwrap(method: str, reply: Optional[dict]):
+        if reply is None:
+            raise KanboardApiError(f"No response received for '{method}'.")
+        error = reply.get("error")
+        if error:
+            raise KanboardApiError(f"'{method}' failed with code {error.get('code')}: {error.get('message')}")
+        return reply.get("result")
+
+    def call(self, method: str, **params):
+        """Sends a single JSON-RPC call and returns its result."""
+        self.logger.debug("JSON-RPC call: %s", method)
+        return self._unwrap(method, self._post(self._build_request(method, params)))
+
+    def batch(self, calls: Iterable[Tuple[str, dict]]) -> list:
+        """
+        Sends the given (method, params) calls as JSON-RPC batch requests of at most
+        `batch_size` calls each, and returns the results in the same order as the calls.
+        """
+        calls = list(calls)
+        results = []
+        for start in range(0, len(calls), self.batch_size):
+            requests = [self._build_request(method, params) for method, params in calls[start:start + self.batch_size]]
+            self.logger.debug("JSON-RPC batch of %d calls", len(requests))
+            replies = self._post(requests)
+            if isinstance(replies, dict):
+                # A batch-level failure (e.g. a parse error) is reported as a single error object.
+                replies = [replies]
+            replies_by_id = {reply.get("id"): reply for reply in replies}
+            results.extend(self._unwrap(request["method"], replies_by_id.get(request["id"])) for request in requests)
+        return results
+
+    # --- Kanboard procedures ---
+
+    def create_project(self, name: str, description: Optional[str] = None) -> int:
+        """Creates a project and returns its ID."""
+        params = {"name": name}
+        if description is not None:
+            params["description"] = description
+        project_id = self.call("createProject", **params)
+        if not project_id:
+            raise KanboardApiError(f"Kanboard refused to create project '{name}'.")
+        if self.registry is not None:
+            self.registry.register_project(name=name, project_id=project_id)
+        self.logger.info("Created project '%s' with ID %s via API", name, project_id)
+        return project_id
+
+    def get_project_by_name(self, name: str) -> Optional[dict]:
+        """Returns the project with the given name, or None if it does not exist."""
+        return self.call("getProjectByName", name=name) or None
+
+    def remove_project(self, project_id: int) -> bool:
+        """Removes a project together with its columns and tasks."""
+        self.logger.info("Removing project %s via API", project_id)
+        return bool(self.call("removeProject", project_id=project_id))
+
+    def get_columns(self, project_id: int) -> List[dict]:
+        """Returns the columns of a project ordered by position."""
+        columns = self.call("getColumns", project_id=project_id) or []
+        return sorted(columns, key=lambda column: int(column["position"]))
+
+    def add_columns(self, project_id: int, titles: Sequence[str]) -> List[int]:
+        """Appends columns to a project in the given order and returns their IDs."""
+        column_ids = self.batch(("addColumn", {"project_id": project_id, "title": title}) for title in titles)
+        if not all(column_ids):
+            raise KanboardApiError(f"Kanboard refused to create some columns in project {project_id}.")
+        return column_ids
+
+    def create_tasks(self, project_id: int, titles: Sequence[str], column_id: Optional[int] = None,
+                     description: Optional[str] = None) -> List[int]:
+        """Creates tasks in batches and returns their IDs in the same order as `titles`."""
+        base_params = {"project_id": project_id}
+        if column_id is not None:
+            base_params["column_id"] = column_id
+        if description is not None:
+            base_params["description"] = description
+        task_ids = self.batch(("createTask", dict(base_params, title=title)) for title in titles)
+        if not all(task_ids):
+            raise KanboardApiError(f"Kanboard refused to create some tasks in project {project_id}.")
+        if self.registry is not None:
+            self.registry.register_tasks(task_ids)
+        self.logger.info("Created %d tasks in project %s via API", len(task_ids), project_id)
+        return task_ids
+
+    def seed_project(self, name: str, number_of_tasks: int, columns: Optional[Sequence[str]] = None,
+                     task_title_template: str = "Perf Task {}", description: Optional[str] = None,
+                     column_title: Optional[str] = None) -> Tuple[int, List[int]]:
+        """
+        Creates a project, optionally appends extra columns, and fills it with tasks.
+
+        Args:
+            name: The project name.
+            number_of_tasks: How many tasks to create.
+            columns: Extra column titles appended after Kanboard's default columns.
+            task_title_template: Format string receiving the 1-based task number.
+            description: Optional description given to every task.
+            column_title: Title of the column that receives the tasks (defaults to the first column).
+
+        Returns:
+            A (project_id, task_ids) tuple.
+        """
+        project_id = self.create_project(name)
+        if columns:
+            self.add_columns(project_id, columns)
+
+        column_id = None
+        if column_title is not None:
+            matching = [column for column in self.get_columns(project_id) if column["title"] == column_title]
+            if not matching:
+                raise KanboardApiError(f"Column '{column_title}' not found in project {project_id}.")
+            column_id = int(matching[0]["id"])
+
+        titles = [task_title_template.format(i + 1) for i in range(number_of_tasks)]
+        task_ids = self.create_tasks(project_id, titles, column_id=column_id, description=description)
+        return project_id, task_ids
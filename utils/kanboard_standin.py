@@ -0,0 +1,874 @@
+"""
+Hermetic local stand-in for Kanboard, for fast offline runs of the whole suite.
+
+`KanboardStandIn` serves the pages the page objects drive (login, dashboard with pagination, project creation,
+board, task view, move/close/remove dialogs, project settings and removal) with the selectors in
+pages/locators.py, Kanboard's controller routes for the HTTP load generator, and the JSON-RPC procedures the
+framework calls. Everything is stored in an embedded SQLite database whose tables and columns match what the
+database assertions query (projects, columns, swimlanes, tasks, users, comments), and `SqliteDatabasePool`
+gives tests the DatabasePool interface on top of it, translating psycopg2's `%s` and `= ANY(%s)` parameters
+and the `~` regular expression operator.
+
+It starts in milliseconds, so it gives a fast inner loop and a fixed baseline: the time a test spends against
+the stand-in is framework overhead, the rest of its time against the real stack is application latency.
+PostgreSQL-only features (LISTEN/NOTIFY, pg_stat_statements, EXPLAIN capture, snapshots, the COPY-based data
+factory and the dataset cache) are switched off or skipped while it is in use.
+
+Usage:
+    KANBOARD_STANDIN=true pytest
+    python -m utils.kanboard_standin --port 8080
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+from config.app_settings import AppSettings
+from utils.kanboard_stub import DEFAULT_COLUMNS, JsonRpcError, StubKanboardServer, StubKanboardUi
+from utils.logger import setup_logger
+
+DEFAULT_SWIMLANE = "Default swimlane"
+BUSY_TIMEOUT = 10.0  # Seconds a connection waits for another one's write lock
+# AppSettings attributes apply_settings() overrides and stop() restores.
+STANDIN_SETTINGS = ("BASE_URL", "API_URL", "DB_WAIT_NOTIFY", "PG_STATS", "EXPLAIN_CAPTURE", "DATASET_CACHE", "SEED_MODE")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    password TEXT,
+    name TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    role TEXT NOT NULL DEFAULT 'app-user',
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    identifier TEXT NOT NULL DEFAULT '',
+    is_active INTEGER NOT NULL DEFAULT 1,
+    is_public INTEGER NOT NULL DEFAULT 0,
+    owner_id INTEGER NOT NULL DEFAULT 0,
+    last_modified INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS columns (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    task_limit INTEGER NOT NULL DEFAULT 0,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS swimlanes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL DEFAULT 1,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    date_creation INTEGER NOT NULL DEFAULT 0,
+    date_modification INTEGER NOT NULL DEFAULT 0,
+    date_moved INTEGER NOT NULL DEFAULT 0,
+    color_id TEXT NOT NULL DEFAULT 'yellow',
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    column_id INTEGER NOT NULL REFERENCES columns(id) ON DELETE CASCADE,
+    swimlane_id INTEGER NOT NULL REFERENCES swimlanes(id) ON DELETE CASCADE,
+    owner_id INTEGER NOT NULL DEFAULT 0,
+    creator_id INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL DEFAULT 1,
+    is_active INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS tasks_project_idx ON tasks (project_id);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL DEFAULT 0,
+    date_creation INTEGER NOT NULL DEFAULT 0,
+    comment TEXT NOT NULL
+);
+"""
+
+# psycopg2 placeholders, including `= ANY(%s)` over a list and the escaped percent sign.
+_PLACEHOLDER_PATTERN = re.compile(r"=\s*ANY\s*\(\s*%s\s*\)|%s|%%", re.IGNORECASE)
+# PostgreSQL's regular expression match operator, e.g. `name ~ %s`.
+_REGEX_OPERATOR_PATTERN = re.compile(r"\s~\s")
+
+
+def _translate(query: str, params=None):
+    """
+    Rewrites a psycopg2 query for sqlite3: `%s` becomes `?`, `= ANY(%s)` becomes `IN (json_each(?))` and
+    `~` becomes `REGEXP`.
+    """
+    params = list(params or ())
+    converted = []
+
+    def replace(match):
+        if match.group(0) == "%%":
+            return "%"
+        value = params[len(converted)]
+        if match.group(0) == "%s":
+            converted.append(value)
+            return "?"
+        converted.append(json.dumps(list(value)))
+        return "IN (SELECT value FROM json_each(?))"
+
+    query = _REGEX_OPERATOR_PATTERN.sub(" REGEXP ", _PLACEHOLDER_PATTERN.sub(replace, query))
+    return query, converted
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    return value is not None and re.search(pattern, value) is not None
+
+
+def _connect(path: str, autocommit: bool = True) -> sqlite3.Connection:
+    # Write transactions take the lock up front, so two writers wait for each other instead of failing.
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                           isolation_level=None if autocommit else "IMMEDIATE")
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.create_function("regexp", 2, _regexp, deterministic=True)
+    return conn
+
+
+class SqliteCursor:
+    """A sqlite3 cursor that accepts psycopg2-style queries and works as a context manager."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, query: str, params=None):
+        self._cursor.execute(*_translate(query, params))
+        return self
+
+    def executemany(self, query: str, params_seq):
+        for params in params_seq:
+            self.execute(query, params)
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size: int = 1):
+        return self._cursor.fetchmany(size)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def close(self):
+        self._cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SqliteConnection:
+    """
+    The parts of a psycopg2 connection the fixtures use (cursor(), commit(), rollback(), autocommit, closed),
+    on top of a sqlite3 connection. `cursor_factory` is accepted and ignored.
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self._conn = _connect(path, autocommit=readonly)
+        self.cursor_factory = None
+        if readonly:
+            self._conn.execute("PRAGMA query_only = ON")
+
+    @property
+    def autocommit(self) -> bool:
+        return self._conn.isolation_level is None
+
+    @autocommit.setter
+    def autocommit(self, value: bool):
+        self._conn.isolation_level = None if value else "IMMEDIATE"
+
+    @property
+    def closed(self) -> int:
+        try:
+            self._conn.total_changes
+        except sqlite3.ProgrammingError:
+            return 1
+        return 0
+
+    def cursor(self, cursor_factory=None) -> SqliteCursor:
+        return SqliteCursor(self._conn.cursor())
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+
+class SqliteDatabasePool:
+    """
+    DatabasePool's interface (transaction(), read_cursor(), connection(), acquire()/release()) over the
+    stand-in's SQLite file. SQLite connections cost microseconds, so every borrow opens a new one.
+    """
+
+    def __init__(self, path: str):
+        self.dsn = path
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def wait_until_ready(self, timeout: Optional[float] = None, **_) -> "SqliteDatabasePool":
+        return self
+
+    def open(self):
+        """No-op: connections are opened per borrow."""
+
+    def close(self):
+        """No-op: connections are closed when they are released."""
+
+    def reset(self):
+        """No-op: the stand-in's database is never recreated under the pool."""
+
+    def connect(self, readonly: bool = False) -> SqliteConnection:
+        return SqliteConnection(self.dsn, readonly=readonly)
+
+    def acquire(self, readonly: bool = False) -> SqliteConnection:
+        """Opens a connection; read-only ones run in autocommit mode with `query_only` enabled."""
+        return self.connect(readonly=readonly)
+
+    def release(self, conn: SqliteConnection):
+        """Rolls back anything left uncommitted and closes the connection."""
+        if not conn.closed:
+            conn.rollback()
+            conn.close()
+
+    @contextmanager
+    def connection(self, readonly: bool = False):
+        conn = self.acquire(readonly=readonly)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def transaction(self, cursor_factory=None):
+        """Yields a cursor inside a transaction that is committed on success and rolled back on error."""
+        with self.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    yield cur
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def read_cursor(self, cursor_factory=None):
+        """Yields an autocommit, read-only cursor for assertions."""
+        with self.connection(readonly=True) as conn:
+            with conn.cursor() as cur:
+                yield cur
+
+
+class SqliteKanboardStore:
+    """
+    The JSON-RPC procedures of StubKanboardStore, plus the ones the stand-in's pages need (swimlanes, comments,
+    closing tasks), on the SQLite schema above. Every call runs in its own transaction; ID 1 is the admin user.
+    """
+
+    def __init__(self, path: str, admin_username: str = "admin", admin_password: str = "admin"):
+        self.lock = threading.Lock()
+        self.db = _connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA)
+        self.db.execute("INSERT OR IGNORE INTO users (id, username, password, name, role) "
+                        "VALUES (1, ?, ?, 'Administrator', 'app-admin')", (admin_username, admin_password))
+
+    def close(self):
+        self.db.close()
+
+    def dispatch(self, method, params):
+        handler = getattr(self, f"rpc_{method}", None)
+        if handler is None:
+            raise JsonRpcError(-32601, "Method not found")
+        if isinstance(params, list):
+            raise JsonRpcError(-32602, "Positional parameters are not supported by the stand-in")
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = handler(**(params or {}))
+            except TypeError as e:
+                self.db.execute("ROLLBACK")
+                raise JsonRpcError(-32602, f"Invalid params: {e}")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return result
+
+    def _one(self, query, params=()) -> Optional[dict]:
+        row = self.db.execute(query, params).fetchone()
+        return dict(row) if row is not None else None
+
+    def _all(self, query, params=()) -> List[dict]:
+        return [dict(row) for row in self.db.execute(query, params)]
+
+    def _touch(self, project_id):
+        self.db.execute("UPDATE projects SET last_modified = ? WHERE id = ?", (int(time.time()), project_id))
+
+    # --- Projects ---
+
+    def rpc_createProject(self, name, description=None, owner_id=0, identifier=None, **_):
+        if not name:
+            return False
+        project_id = self.db.execute(
+            "INSERT INTO projects (name, description, identifier, owner_id, last_modified) VALUES (?, ?, ?, ?, ?)",
+            (name, description, (identifier or "").upper(), int(owner_id), int(time.time()))).lastrowid
+        for title in DEFAULT_COLUMNS:
+            self.rpc_addColumn(project_id, title)
+        self.db.execute("INSERT INTO swimlanes (name, project_id) VALUES (?, ?)", (DEFAULT_SWIMLANE, project_id))
+        return project_id
+
+    def rpc_getProjectById(self, project_id):
+        return self._one("SELECT * FROM projects WHERE id = ?", (int(project_id),))
+
+    def rpc_getProjectByName(self, name):
+        return self._one("SELECT * FROM projects WHERE name = ? ORDER BY id LIMIT 1", (name,))
+
+    def rpc_getAllProjects(self):
+        return self._all("SELECT * FROM projects ORDER BY id")
+
+    def rpc_removeProject(self, project_id):
+        return self.db.execute("DELETE FROM projects WHERE id = ?", (int(project_id),)).rowcount > 0
+
+    def list_projects(self, offset: int, limit: int):
+        """Returns one page of projects sorted by name, and the total number of projects."""
+        with self.lock:
+            total = self.db.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+            return self._all("SELECT * FROM projects ORDER BY name, id LIMIT ? OFFSET ?", (limit, offset)), total
+
+    # --- Columns and swimlanes ---
+
+    def rpc_getColumns(self, project_id):
+        return self._all("SELECT * FROM columns WHERE project_id = ? ORDER BY position", (int(project_id),))
+
+    def rpc_addColumn(self, project_id, title, task_limit=0, description=""):
+        project_id = int(project_id)
+        if self.rpc_getProjectById(project_id) is None:
+            return False
+        position = self.db.execute("SELECT COALESCE(MAX(position), 0) + 1 FROM columns WHERE project_id = ?",
+                                   (project_id,)).fetchone()[0]
+        return self.db.execute("INSERT INTO columns (title, position, project_id, task_limit, description) "
+                               "VALUES (?, ?, ?, ?, ?)",
+                               (title, position, project_id, int(task_limit), description)).lastrowid
+
+    def rpc_getActiveSwimlanes(self, project_id):
+        return self._all("SELECT * FROM swimlanes WHERE project_id = ? AND is_active = 1 ORDER BY position, id",
+                         (int(project_id),))
+
+    # --- Tasks ---
+
+    def rpc_createTask(self, title, project_id, column_id=None, swimlane_id=None, description="", owner_id=0,
+                       creator_id=0, **_):
+        project_id = int(project_id)
+        columns = [column["id"] for column in self.rpc_getColumns(project_id)]
+        swimlanes = [swimlane["id"] for swimlane in self.rpc_getActiveSwimlanes(project_id)]
+        if not title or not columns or not swimlanes:
+            return False
+        column_id = int(column_id) if column_id else columns[0]
+        swimlane_id = int(swimlane_id) if swimlane_id else swimlanes[0]
+        if column_id not in columns or swimlane_id not in swimlanes:
+            return False
+        position = self.db.execute("SELECT COUNT(*) + 1 FROM tasks WHERE column_id = ? AND swimlane_id = ?",
+                                   (column_id, swimlane_id)).fetchone()[0]
+        now = int(time.time())
+        task_id = self.db.execute(
+            "INSERT INTO tasks (title, description, date_creation, date_modification, date_moved, project_id, "
+            "column_id, swimlane_id, owner_id, creator_id, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (title, description or "", now, now, now, project_id, column_id, swimlane_id, int(owner_id),
+             int(creator_id), position)).lastrowid
+        self._touch(project_id)
+        return task_id
+
+    def rpc_getTask(self, task_id):
+        return self._one("SELECT * FROM tasks WHERE id = ?", (int(task_id),))
+
+    def rpc_getAllTasks(self, project_id, status_id=1):
+        return self._all("SELECT * FROM tasks WHERE project_id = ? AND is_active = ? ORDER BY position, id",
+                         (int(project_id), int(status_id)))
+
+    def rpc_moveTaskPosition(self, project_id, task_id, column_id, position, swimlane_id=None):
+        task = self.rpc_getTask(task_id)
+        columns = {column["id"] for column in self.rpc_getColumns(project_id)}
+        swimlanes = {swimlane["id"] for swimlane in self.rpc_getActiveSwimlanes(project_id)}
+        if task is None or task["project_id"] != int(project_id) or int(column_id) not in columns \
+                or int(swimlane_id or task["swimlane_id"]) not in swimlanes:
+            return False
+        now = int(time.time())
+        self.db.execute("UPDATE tasks SET column_id = ?, position = ?, swimlane_id = ?, date_moved = ?, "
+                        "date_modification = ? WHERE id = ?",
+                        (int(column_id), int(position), int(swimlane_id or task["swimlane_id"]), now, now,
+                         task["id"]))
+        self._touch(task["project_id"])
+        return True
+
+    def rpc_closeTask(self, task_id):
+        return self.db.execute("UPDATE tasks SET is_active = 0, date_modification = ? WHERE id = ? AND is_active = 1",
+                               (int(time.time()), int(task_id))).rowcount > 0
+
+    def rpc_removeTask(self, task_id):
+        return self.db.execute("DELETE FROM tasks WHERE id = ?", (int(task_id),)).rowcount > 0
+
+    # --- Comments ---
+
+    def rpc_createComment(self, task_id, user_id, content):
+        if not content or self.rpc_getTask(task_id) is None:
+            return False
+        return self.db.execute("INSERT INTO comments (task_id, user_id, date_creation, comment) VALUES (?, ?, ?, ?)",
+                               (int(task_id), int(user_id), int(time.time()), content)).lastrowid
+
+    def rpc_getAllComments(self, task_id):
+        return self._all("SELECT * FROM comments WHERE task_id = ? ORDER BY id", (int(task_id),))
+
+    # --- Users ---
+
+    def rpc_createUser(self, username, password=None, name="", email="", role="app-user"):
+        if not username or self.rpc_getUserByName(username) is not None:
+            return False
+        return self.db.execute("INSERT INTO users (username, password, name, email, role) VALUES (?, ?, ?, ?, ?)",
+                               (username, password, name, email, role)).lastrowid
+
+    def rpc_getUserByName(self, username):
+        return self._one("SELECT id, username, name, email, role, is_active FROM users WHERE username = ?",
+                         (username,))
+
+    def rpc_removeUser(self, user_id):
+        return self.db.execute("DELETE FROM users WHERE id = ? AND id <> 1", (int(user_id),)).rowcount > 0
+
+    def check_password(self, username, password):
+        with self.lock:
+            return self.db.execute("SELECT 1 FROM users WHERE username = ? AND password = ? AND is_active = 1",
+                                   (username, password)).fetchone() is not None
+
+
+class _Request(NamedTuple):
+    method: str
+    session: dict
+    query: dict
+    form: dict
+
+
+class StandInKanboardUi(StubKanboardUi):
+    """
+    Kanboard's pages as the page objects see them, on pretty URLs (/dashboard, /board/{id}, /task/{id}, ...).
+    The controller routes of StubKanboardUi keep working for the HTTP load generator.
+    """
+
+    PAGE_SIZE = 10  # Projects per dashboard page
+    ROUTES = (
+        (r"/", "_home"),
+        (r"/dashboard", "_dashboard"),
+        (r"/projects", "_projects"),
+        (r"/project/create", "_project_create"),
+        (r"/board/(\d+)", "_board_view"),
+        (r"/project/(\d+)/edit", "_project_edit"),
+        (r"/project/(\d+)/remove", "_project_remove"),
+        (r"/project/(\d+)/task/create", "_task_create"),
+        (r"/task/(\d+)", "_task_view"),
+        (r"/task/(\d+)/move", "_task_move"),
+        (r"/task/(\d+)/close", "_task_close"),
+        (r"/task/(\d+)/remove", "_task_remove"),
+        (r"/task/(\d+)/comment", "_task_comment"),
+    )
+
+    def handle(self, method, path, headers, body=b""):
+        url, query, form = self._parse(path, headers, body)
+        if url.path == "/login" or query.get("controller") == "AuthController":
+            return self._auth(method, headers, form)
+        if query.get("controller"):
+            return super().handle(method, path, headers, body)
+
+        _, session, _ = self._session(headers)
+        if session is None or session["user"] is None:
+            return self._redirect("/login")
+        request = _Request(method, session, query, form)
+        if method == "POST" and not self._consume_token(session, form.get("csrf_token")):
+            return self._layout("Access Forbidden", "<p>Access Forbidden</p>", status=403)
+        for pattern, name in self.ROUTES:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                return getattr(self, name)(request, *(int(group) for group in match.groups()))
+        return self._not_found()
+
+    # --- Layout ---
+
+    def _layout(self, title, content, project=None, status=200, session_id=None):
+        menu = ""
+        if project is not None:
+            # Kanboard builds the dropdown with JavaScript when the menu is clicked; here it is only unhidden.
+            menu = ("<a href=\"#\" class=\"action-menu dropdown-menu\" "
+                    "onclick=\"document.getElementById('dropdown').hidden = false; return false;\">Menu</a>"
+                    f'<div id="dropdown" hidden><ul>'
+                    f'<li><a href="/board/{project["id"]}">Board</a></li>'
+                    f'<li><a href="/project/{project["id"]}/edit">Configure this project</a></li></ul></div>')
+        return self._page(status, f'<header><h1><span class="title">{html.escape(title)}</span></h1>{menu}</header>'
+                                  f'<section class="page">{content}</section>', session_id)
+
+    def _not_found(self):
+        return self._layout("Page not found", "<p>Page not found</p>", status=404)
+
+    def _csrf_input(self, session):
+        return f'<input type="hidden" name="csrf_token" value="{self._new_token(session)}">'
+
+    def _confirm(self, session, action_url, question):
+        return (f'<div class="confirm"><p class="alert alert-info">{html.escape(question)}</p>'
+                f'<form method="post" action="{action_url}">{self._csrf_input(session)}'
+                f'<div class="form-actions"><button type="submit" id="modal-confirm-button" class="btn btn-red">'
+                f'Yes</button></div></form></div>')
+
+    @staticmethod
+    def _modal(content):
+        return f'<div id="modal-overlay"><div id="modal-box"><div id="modal-content">{content}</div></div></div>'
+
+    def _user_id(self, session):
+        user = self.store.dispatch("getUserByName", {"username": session["user"]})
+        return user["id"] if user else 0
+
+    # --- Authentication ---
+
+    def _login_form(self, session, error=""):
+        return (f'{error}<form method="post" action="/?controller=AuthController&amp;action=check">'
+                f'{self._csrf_input(session)}'
+                f'<label for="form-username">Username</label>'
+                f'<input type="text" id="form-username" name="username" autofocus required>'
+                f'<label for="form-password">Password</label>'
+                f'<input type="password" id="form-password" name="password" required>'
+                f'<div class="form-actions"><button type="submit" class="btn btn-blue">Sign in</button></div></form>')
+
+    def _auth(self, method, headers, form):
+        session_id, session, created = self._session(headers, create=True)
+        new_cookie = session_id if created else None
+        if method != "POST":
+            return self._layout("Login", self._login_form(session), session_id=new_cookie)
+        if not self._consume_token(session, form.get("csrf_token")):
+            return self._layout("Access Forbidden", "<p>Access Forbidden</p>", status=403, session_id=new_cookie)
+        if not self.store.check_password(form.get("username"), form.get("password")):
+            error = '<p class="alert alert-error">Bad username or password</p>'
+            return self._layout("Login", self._login_form(session, error), session_id=new_cookie)
+        session["user"] = form["username"]
+        return self._redirect("/dashboard", new_cookie)
+
+    # --- Dashboard and project list ---
+
+    def _project_list(self, request, path, title):
+        page = max(1, int(request.query.get("page", 1) or 1))
+        projects, total = self.store.list_projects((page - 1) * self.PAGE_SIZE, self.PAGE_SIZE)
+        rows = "".join(f'<div class="table-list-row"><span class="table-list-title">'
+                       f'<a href="/board/{project["id"]}">{html.escape(project["name"])}</a></span></div>'
+                       for project in projects)
+        previous = (f'<span class="pagination-previous"><a href="{path}?page={page - 1}">&laquo; Previous</a></span>'
+                    if page > 1 else "")
+        following = (f'<span class="pagination-next"><a href="{path}?page={page + 1}">Next &raquo;</a></span>'
+                     if page * self.PAGE_SIZE < total else "")
+        return self._layout(title, f'<div class="page-header"><ul><li><a href="/project/create">New project</a>'
+                                   f'</li></ul></div><div class="table-list">{rows}</div>'
+                                   f'<div class="pagination">{previous}{following}</div>')
+
+    def _home(self, request):
+        return self._redirect("/dashboard")
+
+    def _dashboard(self, request):
+        return self._project_list(request, "/dashboard", "Dashboard")
+
+    def _projects(self, request):
+        return self._project_list(request, "/projects", "Projects")
+
+    # --- Projects ---
+
+    def _project_create(self, request):
+        if request.method == "POST":
+            project_id = self.store.dispatch("createProject", {"name": request.form.get("name", ""),
+                                                               "owner_id": self._user_id(request.session)})
+            if project_id:
+                return self._redirect(f"/board/{project_id}")
+        error = '<p class="alert alert-error">Unable to create this project.</p>' if request.method == "POST" else ""
+        return self._layout("New project", f'<div class="page-header"><h2>New project</h2></div>{error}'
+                                           f'<form method="post" action="/project/create">'
+                                           f'{self._csrf_input(request.session)}'
+                                           f'<label for="form-name">Name</label>'
+                                           f'<input type="text" id="form-name" name="name" required>'
+                                           f'<div class="form-actions"><button type="submit" class="btn btn-blue">'
+                                           f'Save</button></div></form>')
+
+    def _board_view(self, request, project_id):
+        project = self.store.dispatch("getProjectById", {"project_id": project_id})
+        if project is None:
+            return self._not_found()
+        columns = self.store.dispatch("getColumns", {"project_id": project_id})
+        swimlane_id = self.store.dispatch("getActiveSwimlanes", {"project_id": project_id})[0]["id"]
+        tasks = self.store.dispatch("getAllTasks", {"project_id": project_id})
+        headers, cells = [], []
+        for column in columns:
+            cards = [task for task in tasks if task["column_id"] == column["id"]]
+            headers.append(f'<th class="board-column-header board-column-header-{column["id"]}" '
+                           f'data-column-id="{column["id"]}"><div class="board-add-icon">'
+                           f'<a href="/project/{project_id}/task/create?column_id={column["id"]}'
+                           f'&amp;swimlane_id={swimlane_id}" title="Add a new task">+</a></div>'
+                           f'<span class="board-column-title">{html.escape(column["title"])}</span> '
+                           f'<span class="board-column-header-task-count">({len(cards)})</span></th>')
+            done = " board-column-done" if column["title"] == "Done" else ""
+            cells.append(f'<td class="board-column-{column["id"]}{done}" data-column-id="{column["id"]}">' + "".join(
+                f'<div class="task-board" data-task-id="{task["id"]}"><div class="task-board-title">'
+                f'<a href="/task/{task["id"]}">{html.escape(task["title"])}</a></div></div>' for task in cards) +
+                "</td>")
+        save_url = (f"/?controller=BoardAjaxController&action=save&project_id={project_id}"
+                    f"&csrf_token={request.session['reusable_token']}")
+        return self._layout(project["name"], f'<table id="board" data-project-id="{project_id}" '
+                                             f'data-save-url="{html.escape(save_url)}">'
+                                             f'<tr>{"".join(headers)}</tr>'
+                                             f'<tr data-swimlane-id="{swimlane_id}">{"".join(cells)}</tr></table>',
+                            project)
+
+    def _board(self, session, project_id):
+        # The controller routes of StubKanboardUi (board, AJAX moves) render the same board.
+        return self._board_view(_Request("GET", session, {}, {}), project_id)
+
+    def _project_edit(self, request, project_id):
+        project = self.store.dispatch("getProjectById", {"project_id": project_id})
+        if project is None:
+            return self._not_found()
+        return self._layout(project["name"], f'<div class="sidebar"><ul>'
+                                             f'<li><a href="/board/{project_id}">Back to the board</a></li>'
+                                             f'<li><a href="/project/{project_id}/remove">Remove</a></li></ul></div>'
+                                             f'<div class="page-header"><h2>Summary</h2></div>'
+                                             f'<ul class="panel"><li>{html.escape(project["name"])}</li></ul>',
+                            project)
+
+    def _project_remove(self, request, project_id):
+        project = self.store.dispatch("getProjectById", {"project_id": project_id})
+        if project is None:
+            return self._not_found()
+        if request.method == "POST":
+            self.store.dispatch("removeProject", {"project_id": project_id})
+            return self._redirect("/projects")
+        return self._layout(project["name"], self._modal(self._confirm(
+            request.session, f"/project/{project_id}/remove",
+            f'Do you really want to remove this project: "{project["name"]}"?')), project)
+
+    # --- Tasks ---
+
+    def _task_create(self, request, project_id):
+        project = self.store.dispatch("getProjectById", {"project_id": project_id})
+        if project is None:
+            return self._not_found()
+        values = {**request.query, **request.form}
+        if request.method == "POST":
+            task_id = self.store.dispatch("createTask", {
+                "title": values.get("title", ""), "project_id": project_id, "column_id": values.get("column_id"),
+                "swimlane_id": values.get("swimlane_id"), "description": values.get("description", ""),
+                "creator_id": self._user_id(request.session)})
+            if task_id:
+                return self._redirect(f"/board/{project_id}")
+        error = '<p class="alert alert-error">Unable to create your task.</p>' if request.method == "POST" else ""
+        hidden = "".join(f'<input type="hidden" name="{name}" value="{html.escape(str(values[name]))}">'
+                         for name in ("column_id", "swimlane_id") if values.get(name))
+        return self._layout(project["name"], f'<div class="page-header"><h2>New task</h2></div>{error}'
+                                             f'<form method="post" action="/project/{project_id}/task/create">'
+                                             f'{self._csrf_input(request.session)}{hidden}'
+                                             f'<label for="form-title">Title</label>'
+                                             f'<input type="text" id="form-title" name="title" required>'
+                                             f'<label for="form-description">Description</label>'
+                                             f'<textarea id="form-description" name="description" '
+                                             f'placeholder="Write your text in Markdown"></textarea>'
+                                             f'<div class="form-actions"><button type="submit" class="btn btn-blue">'
+                                             f'Save</button></div></form>', project)
+
+    def _task_page(self, request, task_id, modal=""):
+        """Renders the task view, optionally with a dialog on top of it; returns None for an unknown task."""
+        task = self.store.dispatch("getTask", {"task_id": task_id})
+        if task is None:
+            return None
+        project = self.store.dispatch("getProjectById", {"project_id": task["project_id"]})
+        column = next(column["title"] for column in self.store.dispatch("getColumns", {"project_id": project["id"]})
+                      if column["id"] == task["column_id"])
+        comments = "".join(f'<div class="comment" id="comment-{comment["id"]}"><div class="markdown">'
+                           f'<p>{html.escape(comment["comment"])}</p></div></div>'
+                           for comment in self.store.dispatch("getAllComments", {"task_id": task_id}))
+        return self._layout(project["name"], f'<div class="sidebar"><ul>'
+                                             f'<li><a href="/task/{task_id}/move">Move position</a></li>'
+                                             f'<li><a href="/task/{task_id}/close">Close this task</a></li>'
+                                             f'<li><a href="/task/{task_id}/remove">Remove</a></li></ul></div>'
+                                             f'<section id="task-summary"><h2>{html.escape(task["title"])}</h2>'
+                                             f'<div class="task-summary-column"><ul>'
+                                             f'<li><strong>Status:</strong> '
+                                             f'<span>{"open" if task["is_active"] else "closed"}</span></li>'
+                                             f'<li><strong>Column:</strong> <span>{html.escape(column)}</span></li>'
+                                             f'<li><strong>Position:</strong> <span>{task["position"]}</span></li>'
+                                             f'</ul></div></section>'
+                                             f'<details class="accordion-section" open><summary>Description</summary>'
+                                             f'<div class="markdown"><p>{html.escape(task["description"])}</p></div>'
+                                             f'</details>'
+                                             f'<div id="comments">{comments}'
+                                             f'<form method="post" action="/task/{task_id}/comment">'
+                                             f'{self._csrf_input(request.session)}'
+                                             f'<textarea name="comment" placeholder="Write your text in Markdown">'
+                                             f'</textarea><div class="form-actions"><button type="submit" '
+                                             f'class="btn btn-blue">Save</button></div></form></div>{modal}',
+                            project)
+
+    def _task_view(self, request, task_id):
+        return self._task_page(request, task_id) or self._not_found()
+
+    def _task_move(self, request, task_id):
+        task = self.store.dispatch("getTask", {"task_id": task_id})
+        if task is None:
+            return self._not_found()
+        columns = self.store.dispatch("getColumns", {"project_id": task["project_id"]})
+        if request.method == "POST":
+            column = next((column for column in columns if column["title"] == request.form.get("column")), None)
+            if column is not None:
+                self.store.dispatch("moveTaskPosition", {
+                    "project_id": task["project_id"], "task_id": task_id, "column_id": column["id"],
+                    "position": int(request.form.get("position") or 1)})
+            return self._redirect(f"/task/{task_id}")
+        options = "".join(f'<option value="{html.escape(column["title"])}"'
+                          f'{" selected" if column["id"] == task["column_id"] else ""}>'
+                          f'{html.escape(column["title"])}</option>' for column in columns)
+        return self._task_page(request, task_id, self._modal(
+            f'<div class="page-header"><h2>Move the task to another column</h2></div>'
+            f'<form method="post" action="/task/{task_id}/move">{self._csrf_input(request.session)}'
+            f'<label for="form-columns">Column</label><select id="form-columns" name="column">{options}</select>'
+            f'<label for="form-position">Position</label>'
+            f'<input type="number" id="form-position" name="position" value="{task["position"]}" min="1">'
+            f'<div class="form-actions"><button type="submit" class="btn btn-blue">Save</button></div></form>'))
+
+    def _task_close(self, request, task_id):
+        task = self.store.dispatch("getTask", {"task_id": task_id})
+        if task is None:
+            return self._not_found()
+        if request.method == "POST":
+            self.store.dispatch("closeTask", {"task_id": task_id})
+            return self._redirect(f"/task/{task_id}")
+        return self._task_page(request, task_id, self._modal(self._confirm(
+            request.session, f"/task/{task_id}/close", f'Do you really want to close the task "{task["title"]}"?')))
+
+    def _task_remove(self, request, task_id):
+        task = self.store.dispatch("getTask", {"task_id": task_id})
+        if task is None:
+            return self._not_found()
+        if request.method == "POST":
+            self.store.dispatch("removeTask", {"task_id": task_id})
+            return self._redirect(f"/board/{task['project_id']}")
+        return self._task_page(request, task_id, self._modal(self._confirm(
+            request.session, f"/task/{task_id}/remove", f'Do you really want to remove this task: "{task["title"]}"?')))
+
+    def _task_comment(self, request, task_id):
+        if request.method == "POST":
+            self.store.dispatch("createComment", {"task_id": task_id, "user_id": self._user_id(request.session),
+                                                  "content": request.form.get("comment", "")})
+        return self._redirect(f"/task/{task_id}")
+
+
+class KanboardStandIn(StubKanboardServer):
+    """
+    The stub server with StandInKanboardUi and SqliteKanboardStore on a SQLite file. Without `database` the
+    file lives in a temporary directory that `stop()` removes. `db_pool` reads and writes the same file.
+
+    Usage:
+        with KanboardStandIn() as standin:
+            http_login("admin", "admin", base_url=standin.base_url)
+            with standin.db_pool.read_cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM projects")
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, username="jsonrpc", token="stub-token",
+                 ui_username="admin", ui_password="admin", database: Optional[str] = None):
+        self._temp_dir = None if database else tempfile.mkdtemp(prefix="kanboard_standin_")
+        self.database = database or os.path.join(self._temp_dir, "kanboard.sqlite")
+        super().__init__(host, port, username, token, ui_username, ui_password)
+        self.db_pool = SqliteDatabasePool(self.database)
+        self._saved_settings: Optional[dict] = None
+
+    @classmethod
+    def from_settings(cls) -> "KanboardStandIn":
+        username, token = AppSettings.get_api_credentials()
+        return cls(port=AppSettings.get_kanboard_standin_port(), username=username, token=token,
+                   ui_username=AppSettings.ADMIN_USER, ui_password=AppSettings.ADMIN_PASSWORD)
+
+    def _create_store(self):
+        return SqliteKanboardStore(self.database)
+
+    def _create_ui(self, username, password):
+        return StandInKanboardUi(self.store, username, password)
+
+    def apply_settings(self):
+        """
+        Points BASE_URL and API_URL at the stand-in and switches off the PostgreSQL-only features.
+        `stop()` restores the previous values.
+        """
+        if self._saved_settings is None:
+            self._saved_settings = {name: getattr(AppSettings, name) for name in STANDIN_SETTINGS}
+        AppSettings.BASE_URL = self.base_url
+        AppSettings.API_URL = self.api_url
+        AppSettings.DB_WAIT_NOTIFY = False
+        AppSettings.PG_STATS = "off"
+        AppSettings.EXPLAIN_CAPTURE = False
+        AppSettings.DATASET_CACHE = False
+        if AppSettings.SEED_MODE == "db":
+            AppSettings.SEED_MODE = "api"  # The bulk data factory relies on COPY and execute_values
+
+    def stop(self):
+        super().stop()
+        self.store.close()
+        if self._saved_settings is not None:
+            for name, value in self._saved_settings.items():
+                setattr(AppSettings, name, value)
+            self._saved_settings = None
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local Kanboard stand-in until interrupted.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--database", default=None, help="SQLite file to keep (default: a temporary file)")
+    args = parser.parse_args()
+
+    username, token = AppSettings.get_api_credentials()
+    standin = KanboardStandIn(args.host, args.port, username, token, AppSettings.ADMIN_USER,
+                              AppSettings.ADMIN_PASSWORD, database=args.database).start()
+    print(f"Kanboard stand-in listening on {standin.base_url} (database: {standin.database}); Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
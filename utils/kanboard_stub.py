@@ -0,0 +1,465 @@
+import base64
+import html
+import itertools
+import json
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.logger import setup_logger
+
+DEFAULT_COLUMNS = ("Backlog", "Ready", "Work in progress", "Done")
+
+
+class JsonRpcError(Exception):
+    """An error that is reported to the caller as a JSON-RPC error object."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class StubKanboardStore:
+    """
+    In-memory implementation of the subset of Kanboard's JSON-RPC procedures used by the framework.
+    Default columns and return values follow the real application, so the same client code works against both.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.projects = {}
+        self.columns = {}
+        self.tasks = {}
+        self.users = {}
+        self._project_ids = itertools.count(1)
+        self._user_ids = itertools.count(2)  # ID 1 is the built-in admin
+        self._column_ids = itertools.count(1)
+        self._task_ids = itertools.count(1)
+
+    def dispatch(self, method, params):
+        handler = getattr(self, f"rpc_{method}", None)
+        if handler is None:
+            raise JsonRpcError(-32601, "Method not found")
+        if isinstance(params, list):
+            raise JsonRpcError(-32602, "Positional parameters are not supported by the stub")
+        with self.lock:
+            try:
+                return handler(**(params or {}))
+            except TypeError as e:
+                raise JsonRpcError(-32602, f"Invalid params: {e}")
+
+    def _project_columns(self, project_id):
+        columns = [column for column in self.columns.values() if column["project_id"] == project_id]
+        return sorted(columns, key=lambda column: column["position"])
+
+    def rpc_createProject(self, name, description=None, owner_id=0, identifier=None, **_):
+        if not name or any(project["name"] == name for project in self.projects.values()):
+            return False
+        project_id = next(self._project_ids)
+        self.projects[project_id] = {"id": project_id, "name": name, "description": description,
+                                     "owner_id": owner_id, "is_active": 1}
+        for title in DEFAULT_COLUMNS:
+            self.rpc_addColumn(project_id, title)
+        return project_id
+
+    def rpc_getProjectById(self, project_id):
+        return self.projects.get(int(project_id))
+
+    def rpc_getProjectByName(self, name):
+        return next((project for project in self.projects.values() if project["name"] == name), None)
+
+    def rpc_getAllProjects(self):
+        return list(self.projects.values())
+
+    def rpc_removeProject(self, project_id):
+        project_id = int(project_id)
+        if self.projects.pop(project_id, None) is None:
+            return False
+        self.columns = {k: v for k, v in self.columns.items() if v["project_id"] != project_id}
+        self.tasks = {k: v for k, v in self.tasks.items() if v["project_id"] != project_id}
+        return True
+
+    def rpc_getColumns(self, project_id):
+        return self._project_columns(int(project_id))
+
+    def rpc_addColumn(self, project_id, title, task_limit=0, description=""):
+        project_id = int(project_id)
+        if project_id not in self.projects:
+            return False
+        column_id = next(self._column_ids)
+        self.columns[column_id] = {"id": column_id, "title": title, "project_id": project_id,
+                                   "position": len(self._project_columns(project_id)) + 1,
+                                   "task_limit": task_limit, "description": description}
+        return column_id
+
+    def rpc_createTask(self, title, project_id, column_id=None, description="", **_):
+        project_id = int(project_id)
+        columns = self._project_columns(project_id)
+        if not title or not columns:
+            return False
+        if column_id is None:
+            column_id = columns[0]["id"]
+        elif int(column_id) not in {column["id"] for column in columns}:
+            return False
+        task_id = next(self._task_ids)
+        position = sum(1 for task in self.tasks.values() if task["column_id"] == int(column_id)) + 1
+        self.tasks[task_id] = {"id": task_id, "title": title, "project_id": project_id,
+                               "column_id": int(column_id), "description": description,
+                               "position": position, "is_active": 1}
+        return task_id
+
+    def rpc_getTask(self, task_id):
+        return self.tasks.get(int(task_id))
+
+    def rpc_getAllTasks(self, project_id, status_id=1):
+        return [task for task in self.tasks.values()
+                if task["project_id"] == int(project_id) and task["is_active"] == int(status_id)]
+
+    def rpc_moveTaskPosition(self, project_id, task_id, column_id, position, swimlane_id=1):
+        task = self.tasks.get(int(task_id))
+        columns = {column["id"] for column in self._project_columns(int(project_id))}
+        if task is None or task["project_id"] != int(project_id) or int(column_id) not in columns:
+            return False
+        task["column_id"] = int(column_id)
+        task["position"] = int(position)
+        task["swimlane_id"] = int(swimlane_id)
+        return True
+
+    def rpc_removeTask(self, task_id):
+        return self.tasks.pop(int(task_id), None) is not None
+
+    def rpc_createUser(self, username, password=None, name="", email="", role="app-user"):
+        if not username or any(user["username"] == username for user in self.users.values()):
+            return False
+        user_id = next(self._user_ids)
+        self.users[user_id] = {"id": user_id, "username": username, "password": password, "name": name,
+                               "email": email, "role": role, "is_active": 1}
+        return user_id
+
+    def rpc_getUserByName(self, username):
+        user = next((user for user in self.users.values() if user["username"] == username), None)
+        return {key: value for key, value in user.items() if key != "password"} if user else None
+
+    def rpc_removeUser(self, user_id):
+        return self.users.pop(int(user_id), None) is not None
+
+    def check_password(self, username, password):
+        with self.lock:
+            return any(user["username"] == username and user["password"] == password
+                       for user in self.users.values())
+
+
+class StubKanboardUi:
+    """
+    Minimal HTML front end over a StubKanboardStore. It follows Kanboard's controller routes
+    (/?controller=...&action=...), session cookie and CSRF rules closely enough for protocol-level clients:
+    form tokens are single-use, and the board's save URL carries a reusable token for AJAX moves.
+    Responses are (status, headers, body) tuples.
+    """
+
+    SESSION_COOKIE = "KB_SID"
+
+    def __init__(self, store: StubKanboardStore, username="admin", password="admin"):
+        self.store = store
+        self.username = username
+        self.password = password
+        self.sessions = {}
+        self._lock = threading.Lock()
+
+    # --- Sessions and CSRF tokens ---
+
+    def _session(self, headers, create=False):
+        cookie = SimpleCookie(headers.get("Cookie", ""))
+        session_id = cookie[self.SESSION_COOKIE].value if self.SESSION_COOKIE in cookie else None
+        with self._lock:
+            if session_id in self.sessions:
+                return session_id, self.sessions[session_id], False
+            if not create:
+                return None, None, False
+            session_id = secrets.token_hex(16)
+            self.sessions[session_id] = {"user": None, "tokens": set(), "reusable_token": secrets.token_hex(16)}
+            return session_id, self.sessions[session_id], True
+
+    def _new_token(self, session):
+        token = secrets.token_hex(16)
+        with self._lock:
+            session["tokens"].add(token)
+        return token
+
+    def _consume_token(self, session, token):
+        with self._lock:
+            if token in session["tokens"]:
+                session["tokens"].discard(token)
+                return True
+        return False
+
+    # --- Responses ---
+
+    @staticmethod
+    def _page(status, body, session_id=None):
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        if session_id:
+            headers["Set-Cookie"] = f"{StubKanboardUi.SESSION_COOKIE}={session_id}; Path=/; HttpOnly"
+        return status, headers, f"<html><body>{body}</body></html>".encode("utf-8")
+
+    @staticmethod
+    def _redirect(location, session_id=None):
+        status, headers, body = StubKanboardUi._page(302, "", session_id)
+        headers["Location"] = location
+        return status, headers, body
+
+    def _form(self, session, action_url, fields):
+        inputs = "".join(f'<input type="text" name="{name}">' for name in fields)
+        return (f'<form method="post" action="{html.escape(action_url)}">'
+                f'<input type="hidden" name="csrf_token" value="{self._new_token(session)}">{inputs}'
+                f'<button type="submit">Save</button></form>')
+
+    def _board(self, session, project_id):
+        project = self.store.dispatch("getProjectById", {"project_id": project_id})
+        if project is None:
+            return self._page(404, "Page not found")
+        columns = self.store.dispatch("getColumns", {"project_id": project_id})
+        tasks = self.store.dispatch("getAllTasks", {"project_id": project_id})
+        save_url = (f"/?controller=BoardAjaxController&action=save&project_id={project_id}"
+                    f"&csrf_token={session['reusable_token']}")
+        cells = []
+        for column in columns:
+            cards = "".join(f'<div class="task-board" data-task-id="{task["id"]}">'
+                            f'<a href="/task/{task["id"]}">{html.escape(task["title"])}</a></div>'
+                            for task in tasks if task["column_id"] == column["id"])
+            cells.append(f'<td class="board-column-{column["id"]}" data-column-id="{column["id"]}">'
+                         f'{html.escape(column["title"])}{cards}</td>')
+        return self._page(200, f'<span class="title">{html.escape(project["name"])}</span>'
+                               f'<table id="board" data-project-id="{project_id}" '
+                               f'data-save-url="{html.escape(save_url)}">'
+                               f'<tr data-swimlane-id="1">{"".join(cells)}</tr></table>')
+
+    # --- Routing ---
+
+    @staticmethod
+    def _parse(path, headers, body):
+        """Returns the split URL, the query parameters and the urlencoded form fields of a request."""
+        url = urlsplit(path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        form = {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()} \
+            if headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded") else {}
+        return url, query, form
+
+    def handle(self, method, path, headers, body=b""):
+        url, query, form = self._parse(path, headers, body)
+        route = (query.get("controller", "AuthController" if url.path == "/login" else ""), query.get("action", "login"))
+
+        session_id, session, created = self._session(headers, create=route[0] == "AuthController")
+        new_cookie = session_id if created else None
+
+        if route == ("AuthController", "login"):
+            login_form = self._form(session, "/?controller=AuthController&action=check", ("username", "password"))
+            return self._page(200, login_form, new_cookie)
+        if route == ("AuthController", "check") and method == "POST":
+            if not self._consume_token(session, form.get("csrf_token")):
+                return self._page(403, "Access Forbidden", new_cookie)
+            username, password = form.get("username"), form.get("password")
+            if (username, password) != (self.username, self.password) and \
+                    not self.store.check_password(username, password):
+                login_form = self._form(session, "/?controller=AuthController&action=check", ("username", "password"))
+                return self._page(200, f'<p class="alert alert-error">Bad username or password</p>{login_form}',
+                                  new_cookie)
+            session["user"] = username
+            return self._redirect("/?controller=DashboardController&action=show", new_cookie)
+
+        if session is None or session["user"] is None:
+            return self._redirect("/?controller=AuthController&action=login")
+
+        project_id = int(query.get("project_id", 0) or 0)
+        if route == ("DashboardController", "show"):
+            links = "".join(f'<a href="/board/{project["id"]}">{html.escape(project["name"])}</a>'
+                            for project in self.store.dispatch("getAllProjects", {}))
+            return self._page(200, f'<div class="dashboard">{links}</div>')
+        if route == ("ProjectCreationController", "create"):
+            return self._page(200, self._form(session, "/?controller=ProjectCreationController&action=save", ("name",)))
+        if route == ("ProjectCreationController", "save") and method == "POST":
+            if not self._consume_token(session, form.get("csrf_token")):
+                return self._page(403, "Access Forbidden")
+            new_project_id = self.store.dispatch("createProject", {"name": form.get("name", "")})
+            if not new_project_id:
+                return self._page(200, '<p class="alert alert-error">Unable to create this project.</p>')
+            return self._redirect(f"/?controller=ProjectViewController&action=show&project_id={new_project_id}")
+        if route == ("BoardViewController", "show"):
+            return self._board(session, project_id)
+        if route == ("TaskCreationController", "show"):
+            return self._page(200, self._form(
+                session, f"/?controller=TaskCreationController&action=save&project_id={project_id}", ("title",)))
+        if route == ("TaskCreationController", "save") and method == "POST":
+            if not self._consume_token(session, form.get("csrf_token")):
+                return self._page(403, "Access Forbidden")
+            params = {"title": form.get("title", ""), "project_id": project_id}
+            if form.get("column_id"):
+                params["column_id"] = form["column_id"]
+            if not self.store.dispatch("createTask", params):
+                return self._page(200, '<p class="alert alert-error">Unable to create your task.</p>')
+            return self._redirect(f"/?controller=BoardViewController&action=show&project_id={project_id}")
+        if route == ("BoardAjaxController", "save") and method == "POST":
+            if headers.get("X-Requested-With") != "XMLHttpRequest" \
+                    or query.get("csrf_token") != session["reusable_token"]:
+                return self._page(403, "Access Forbidden")
+            try:
+                values = json.loads(body)
+                moved = self.store.dispatch("moveTaskPosition", {
+                    "project_id": project_id, "task_id": values["task_id"], "column_id": values["column_id"],
+                    "position": values.get("position", 1), "swimlane_id": values.get("swimlane_id", 1)})
+            except (ValueError, KeyError, JsonRpcError):
+                moved = False
+            return self._board(session, project_id) if moved else self._page(400, "Bad Request")
+        if route == ("ProjectStatusController", "confirmRemove"):
+            remove_url = (f"/?controller=ProjectStatusController&action=remove&project_id={project_id}"
+                          f"&csrf_token={self._new_token(session)}")
+            return self._page(200, f'<div class="confirm"><a href="{html.escape(remove_url)}">Yes</a></div>')
+        if route == ("ProjectStatusController", "remove"):
+            if not self._consume_token(session, query.get("csrf_token")):
+                return self._page(403, "Access Forbidden")
+            self.store.dispatch("removeProject", {"project_id": project_id})
+            return self._redirect("/?controller=ProjectListController&action=show")
+        return self._page(404, "Page not found")
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, matching the behaviour of the real endpoint.
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every keep-alive response waits for a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        self.server.stub.logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_ui(self, method, body=b""):
+        status, headers, payload = self.server.stub.ui.handle(method, self.path, self.headers, body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.server.stub.record_request(self.client_address)
+        self._send_ui("GET")
+
+    def _is_authorized(self):
+        expected = base64.b64encode(f"{self.server.stub.username}:{self.server.stub.token}".encode()).decode()
+        return self.headers.get("Authorization") == f"Basic {expected}"
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        stub.record_request(self.client_address)
+
+        if self.path.split("?")[0] != "/jsonrpc.php":
+            self._send_ui("POST", body)
+            return
+        if not self._is_authorized():
+            self._send_json(401, {"error": "Unauthorized"})
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._send_json(200, {"jsonrpc": "2.0", "id": None,
+                                  "error": {"code": -32700, "message": "Parse error"}})
+            return
+
+        if isinstance(payload, list):
+            self._send_json(200, [stub.handle_call(call) for call in payload])
+        else:
+            self._send_json(200, stub.handle_call(payload))
+
+
+class _StubHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 makes bursts of new connections (many virtual users logging in) wait for SYN retries.
+    request_queue_size = 128
+
+
+class StubKanboardServer:
+    """
+    A local, threaded HTTP server that speaks Kanboard's JSON-RPC protocol (single and batch requests,
+    HTTP Basic authentication, keep-alive connections) and serves the controller pages in StubKanboardUi,
+    so API clients and HTTP load generators can be tested offline.
+
+    Usage:
+        with StubKanboardServer() as stub:
+            client = KanboardApiClient(url=stub.api_url, username=stub.username, token=stub.token)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, username="jsonrpc", token="stub-token",
+                 ui_username="admin", ui_password="admin"):
+        self.username = username
+        self.token = token
+        self.store = self._create_store()
+        self.ui = self._create_ui(ui_username, ui_password)
+        self.logger = setup_logger(self.__class__.__name__)
+        self.http_requests = 0
+        self.connections = set()
+        self._stats_lock = threading.Lock()
+        self._server = _StubHttpServer((host, port), _StubRequestHandler)
+        self._server.stub = self
+        self._thread = None
+
+    def _create_store(self):
+        return StubKanboardStore()
+
+    def _create_ui(self, username, password):
+        return StubKanboardUi(self.store, username, password)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}/jsonrpc.php"
+
+    def record_request(self, client_address):
+        with self._stats_lock:
+            self.http_requests += 1
+            self.connections.add(client_address)
+
+    def handle_call(self, call):
+        request_id = call.get("id") if isinstance(call, dict) else None
+        try:
+            if not isinstance(call, dict) or "method" not in call:
+                raise JsonRpcError(-32600, "Invalid Request")
+            result = self.store.dispatch(call["method"], call.get("params"))
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except JsonRpcError as e:
+            return {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": e.message}}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="StubKanboardServer", daemon=True)
+        self._thread.start()
+        self.logger.info("Stub Kanboard server listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self.logger.info("Stub Kanboard server stopped")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
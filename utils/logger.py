@@ -1,43 +1,165 @@
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from config.app_settings import AppSettings
+from utils.workers import get_worker_id
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Argument types whose contents commonly change after the log call; they are rendered when the record is queued.
+MUTABLE_CONTAINER_TYPES = (dict, list, set, bytearray)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line, for later analysis."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, DATETIME_FORMAT),
+            "created": record.created,
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "worker": get_worker_id(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _FrozenArg:
+    """The text of a mutable container argument, taken when the record was queued (str() and repr() agree)."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, value):
+        self.text = repr(value)
+
+    def __str__(self):
+        return self.text
+
+    __repr__ = __str__
+
+
+def _freeze(value):
+    return _FrozenArg(value) if isinstance(value, MUTABLE_CONTAINER_TYPES) else value
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    A QueueHandler that enqueues records without formatting them.
+
+    The standard QueueHandler renders the message on the calling thread; here the %-style
+    arguments are only merged by the listener thread, so the caller pays for creating the record
+    and little else. Only mutable containers (a dict of options, a list of names) are rendered now,
+    since they are commonly changed right after the call; every other argument, e.g. a Playwright
+    Locator, is still formatted by the listener alone. Exception tracebacks are still rendered eagerly, because traceback
+    objects are not safe to format after the frame has moved on.
+    """
+
+    def prepare(self, record):
+        if isinstance(record.args, tuple):
+            if any(isinstance(arg, MUTABLE_CONTAINER_TYPES) for arg in record.args):
+                record.args = tuple(_freeze(arg) for arg in record.args)
+        elif isinstance(record.args, dict):
+            record.args = {key: _freeze(value) for key, value in record.args.items()}
+        if not isinstance(record.msg, str):
+            record.msg = str(record.msg)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        return record
+
+
+class LoggingPipeline:
+    """
+    One queue, one listener thread and one set of output handlers (console, a log file and an
+    optional JSON-lines file) shared by every logger of the run. Loggers only hold a
+    DeferredQueueHandler, so file I/O and formatting happen off the test thread.
+    """
+
+    def __init__(self, log_file, json_file=None, level=logging.INFO, stream=None):
+        self.queue = queue.SimpleQueue()
+        self.handler = DeferredQueueHandler(self.queue)
+        self.level = level
+        self.log_file = log_file
+        self.json_file = json_file
+
+        console_handler = logging.StreamHandler(stream or sys.stdout)
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        text_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATETIME_FORMAT)
+        console_handler.setFormatter(text_formatter)
+        file_handler.setFormatter(text_formatter)
+        handlers = [console_handler, file_handler]
+        if json_file:
+            json_handler = logging.FileHandler(json_file, encoding='utf-8')
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
+        for handler in handlers:
+            handler.setLevel(level)
+
+        self._handlers = handlers
+        self._listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+    def start(self):
+        self._listener.start()
+        return self
+
+    def stop(self):
+        """Flushes every queued record and closes the output files."""
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline() -> LoggingPipeline:
+    """Returns the logging pipeline of the current run, starting it on first use."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            # Create temp directory if it doesn't exist
+            os.makedirs("temp/test_runs", exist_ok=True)
+            timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+            base_name = f"temp/test_runs/test_run_{timestamp}_{get_worker_id()}"
+            _pipeline = LoggingPipeline(
+                log_file=f"{base_name}.log",
+                json_file=f"{base_name}.jsonl" if AppSettings.is_json_logging_enabled() else None,
+                level=AppSettings.get_log_level(),
+            ).start()
+            atexit.register(shutdown_logging)
+        return _pipeline
+
+
+def shutdown_logging():
+    """Stops the pipeline, making sure every queued record has been written."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+            _pipeline = None
 
 
 def setup_logger(name=None):
     """Set up a logger for the given name or configure root logger"""
-    # Create temp directory if it doesn't exist
-    os.makedirs("temp/test_runs", exist_ok=True)
-
     # Get the logger by name or root logger
     logger = logging.getLogger(name) if name else logging.getLogger()
 
     # Only configure if not already configured
     if not logger.handlers:
-        logger.setLevel(logging.INFO)
-
-        # Create handlers
-        c_handler = logging.StreamHandler(sys.stdout)
-        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
-        log_file = f"temp/test_runs/test_run_{timestamp}.log"
-        f_handler = logging.FileHandler(log_file, encoding='utf-8')
-
-        # Set log level for handlers
-        c_handler.setLevel(logging.INFO)
-        f_handler.setLevel(logging.INFO)
-
-        # Create formatters with correct timestamp format
-        datetime_format = '%Y-%m-%d %H:%M:%S'
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        c_format = logging.Formatter(log_format, datefmt=datetime_format)
-        f_format = logging.Formatter(log_format, datefmt=datetime_format)
-
-        c_handler.setFormatter(c_format)
-        f_handler.setFormatter(f_format)
-
-        # Add handlers to logger
-        logger.addHandler(c_handler)
-        logger.addHandler(f_handler)
+        pipeline = get_pipeline()
+        logger.setLevel(pipeline.level)
+        logger.addHandler(pipeline.handler)
 
         # Disable propagation for non-root loggers to prevent duplicate logs
         if name:
@@ -0,0 +1,189 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Pattern
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Route
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+# Minimal bodies used when blocked requests are stubbed instead of aborted.
+_STUB_RESPONSES = {
+    "image": ("image/gif", b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00!\xf9\x04\x01\x00\x00\x00"
+                           b"\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"),
+    "stylesheet": ("text/css", b""),
+    "script": ("application/javascript", b""),
+    "font": ("font/woff2", b""),
+}
+
+# URLs that can carry each resource type, so routes are only installed for URLs a rule might block.
+# Types missing here (e.g. "other") can only be matched by a catch-all route.
+_RESOURCE_TYPE_URLS = {
+    "image": r"\.(png|jpe?g|gif|svg|webp|avif|ico|bmp)(\?|#|$)",
+    "font": r"\.(woff2?|ttf|otf|eot)(\?|#|$)",
+    "media": r"\.(mp4|webm|ogg|mp3|wav|m4a)(\?|#|$)",
+    "stylesheet": r"\.css(\?|#|$)",
+    "script": r"\.m?js(\?|#|$)",
+}
+
+
+class NetworkStats:
+    """
+    Counts the requests (and, when measured, bytes) avoided by a ResourceBlocker. Only requests that match
+    one of its routes are seen, so `requests_allowed` counts routed requests that no rule blocked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_avoided = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def record_allowed(self):
+        with self._lock:
+            self.requests_allowed += 1
+
+    def record_blocked(self, resource_type: str, size: int = 0):
+        with self._lock:
+            self.requests_blocked += 1
+            self.bytes_avoided += size
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def merge(self, other: "NetworkStats"):
+        with self._lock:
+            self.requests_allowed += other.requests_allowed
+            self.requests_blocked += other.requests_blocked
+            self.bytes_avoided += other.bytes_avoided
+            for resource_type, count in other.blocked_by_type.items():
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + count
+
+    def as_dict(self) -> dict:
+        return {
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "bytes_avoided": self.bytes_avoided,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+    def summary(self) -> str:
+        by_type = ", ".join(f"{t}={n}" for t, n in sorted(self.blocked_by_type.items())) or "none"
+        return (f"Network profile blocked {self.requests_blocked} requests ({by_type}), "
+                f"{self.bytes_avoided / 1024:.1f} KiB avoided; {self.requests_allowed} routed requests allowed")
+
+
+class ResourceBlocker:
+    """
+    A routing layer that aborts or stubs requests the page objects never need
+    (images, fonts, media, avatars, third-party assets) and counts what was avoided.
+
+    Rules are matched by Playwright resource type, by URL regular expression, and optionally by host
+    (anything not served from the application's own host). Routes are only installed for the URLs a rule
+    can match (`route_patterns()`), so the application's pages, scripts and stylesheets are never sent
+    through the Python handler. When `measure_bytes` is enabled, the size
+    of each blocked resource is looked up with a HEAD request, which costs a round trip but keeps the
+    page from downloading the body; leave it off for timing runs.
+
+    One blocker serves every context of a worker. Counts go to `stats`, which `begin()` replaces with a
+    fresh object at the start of each test; `end()` folds it into the session-wide `totals`.
+    """
+
+    def __init__(self, resource_types: Iterable[str] = (), url_patterns: Iterable[str] = (),
+                 block_third_party: bool = False, action: str = "abort", measure_bytes: bool = False,
+                 app_host: Optional[str] = None):
+        self.resource_types = {t.strip().lower() for t in resource_types if t.strip()}
+        self.url_patterns = [re.compile(p, re.IGNORECASE) for p in url_patterns if p.strip()]
+        self.block_third_party = block_third_party
+        self.action = action
+        self.measure_bytes = measure_bytes
+        self.app_host = app_host or urlparse(AppSettings.get_base_url()).hostname
+        self.stats = NetworkStats()
+        self.totals = NetworkStats()
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_settings(cls, profile: Optional[str] = None) -> Optional["ResourceBlocker"]:
+        """
+        Builds a blocker from AppSettings, or returns None for the 'full' profile.
+        `profile` overrides NETWORK_PROFILE, e.g. to compare both profiles in one session.
+        """
+        if (profile or AppSettings.get_network_profile()) != "lean":
+            return None
+        return cls(
+            resource_types=AppSettings.get_blocked_resource_types(),
+            url_patterns=AppSettings.get_blocked_url_patterns(),
+            block_third_party=AppSettings.BLOCK_THIRD_PARTY,
+            action=AppSettings.BLOCK_ACTION,
+            measure_bytes=AppSettings.MEASURE_BLOCKED_BYTES,
+        )
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if resource_type in ("document", "xhr", "fetch"):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        if self.block_third_party and urlparse(url).hostname not in (None, self.app_host):
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def route_patterns(self) -> List[Pattern]:
+        """
+        Returns the URL patterns to route: one per blocked resource type, the BLOCKED_URL_PATTERNS and, with
+        `block_third_party`, any URL on another host. A resource type without a known URL shape falls back
+        to a catch-all pattern, which sends every request through the handler again.
+        """
+        patterns = []
+        for resource_type in sorted(self.resource_types):
+            url_pattern = _RESOURCE_TYPE_URLS.get(resource_type)
+            if url_pattern is None:
+                self.logger.warning("Resource type '%s' has no URL pattern; routing every request", resource_type)
+                return [re.compile(".*")]
+            patterns.append(re.compile(url_pattern, re.IGNORECASE))
+        patterns.extend(self.url_patterns)
+        if self.block_third_party and self.app_host:
+            patterns.append(re.compile(rf"^[a-z]+://(?!{re.escape(self.app_host)}(:[0-9]+)?(/|$))", re.IGNORECASE))
+        return patterns
+
+    def _blocked_size(self, route: Route) -> int:
+        try:
+            response = route.fetch(method="HEAD")
+            return int(response.headers.get("content-length", 0))
+        except Exception:
+            return 0
+
+    def begin(self) -> NetworkStats:
+        """Starts counting for a new test and returns the stats object that will be updated."""
+        self.stats = NetworkStats()
+        return self.stats
+
+    def end(self) -> NetworkStats:
+        """Stops counting for the current test, adds its counts to the totals and returns them."""
+        stats = self.stats
+        self.totals.merge(stats)
+        self.stats = NetworkStats()
+        return stats
+
+    def apply(self, context: BrowserContext):
+        """
+        Installs the routing rules on a browser context. A routed URL is still checked against the request's
+        resource type, so an allowed request that merely looks like an asset (e.g. an .svg document) continues.
+        """
+
+        def handle(route: Route):
+            request = route.request
+            if not self.should_block(request.url, request.resource_type):
+                self.stats.record_allowed()
+                route.continue_()
+                return
+            size = self._blocked_size(route) if self.measure_bytes else 0
+            self.stats.record_blocked(request.resource_type, size)
+            stub = _STUB_RESPONSES.get(request.resource_type)
+            if self.action == "stub" and stub is not None:
+                content_type, body = stub
+                route.fulfill(status=200, content_type=content_type, body=body)
+            else:
+                route.abort("blockedbyclient")
+
+        for pattern in self.route_patterns():
+            context.route(pattern, handle)
@@ -0,0 +1,262 @@
+"""
+Persistent store of benchmark results, used as the baseline for regression checks.
+
+Runs are stored in SQLite (PERF_STORE_PATH, default temp/perf/results.sqlite) and keyed by benchmark name,
+dataset size, git revision and an environment fingerprint, so a run is only ever compared with runs that
+measured the same thing on the same kind of machine. A run that fails the comparison is stored as rejected
+and never becomes part of a baseline, so re-running a slow build does not make it pass.
+
+Usage:
+    python -m utils.perf_store benchmarks
+    python -m utils.perf_store trends --benchmark "Retrieve 50 tasks" --limit 20
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from config.app_settings import AppSettings
+from utils.benchmark import BenchmarkResult
+from utils.logger import setup_logger
+from utils.stats import mann_whitney_u
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS benchmark_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    benchmark TEXT NOT NULL,
+    dataset_size INTEGER,
+    git_revision TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    median REAL NOT NULL,
+    p95 REAL NOT NULL,
+    p99 REAL NOT NULL,
+    samples TEXT NOT NULL,
+    accepted INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_benchmark_runs_key ON benchmark_runs (benchmark, dataset_size, fingerprint, id);
+"""
+RUN_COLUMNS = "id, benchmark, dataset_size, git_revision, fingerprint, recorded_at, median, p95, p99, samples, accepted"
+
+
+class StoredRun(NamedTuple):
+    id: int
+    benchmark: str
+    dataset_size: Optional[int]
+    git_revision: str
+    fingerprint: str
+    recorded_at: str
+    median: float
+    p95: float
+    p99: float
+    samples: List[float]
+    accepted: bool = True
+
+
+class Baseline(NamedTuple):
+    """The pooled samples of the latest accepted runs of one benchmark key, oldest run first."""
+    runs: List[StoredRun]
+    samples: List[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def describe(self) -> str:
+        revisions = sorted({run.git_revision for run in self.runs})
+        return (f"baseline of {len(self.runs)} accepted run(s) #{self.runs[0].id}-#{self.runs[-1].id} "
+                f"({', '.join(revisions)}, up to {self.runs[-1].recorded_at})")
+
+    def as_dict(self) -> dict:
+        return {"runs": [{key: value for key, value in run._asdict().items() if key != "samples"} for run in self.runs],
+                "median": self.median, "samples": len(self.samples)}
+
+
+class Comparison(NamedTuple):
+    baseline: Baseline
+    p_value: float
+    slowdown: float  # Relative change of the median: 0.30 means 30% slower than the baseline
+    regression: bool
+
+    def summary(self) -> str:
+        verdict = "REGRESSION" if self.regression else "no significant regression"
+        return f"{verdict}: median {self.slowdown:+.1%} vs {self.baseline.describe()}, Mann-Whitney p={self.p_value:.4g}"
+
+
+def get_git_revision() -> str:
+    """Returns the short git revision of the working tree ('-dirty' when it has local changes), or 'unknown'."""
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                  check=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, check=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return f"{revision}-dirty" if dirty else revision
+
+
+def get_environment() -> dict:
+    """Returns the properties of the machine and target that make timings comparable."""
+    return {
+        "host": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "app_host": urlsplit(AppSettings.get_base_url()).netloc,
+        "db_host": AppSettings.DB_HOST,
+    }
+
+
+def fingerprint(environment: dict) -> str:
+    """Returns a short, stable hash of an environment description."""
+    return hashlib.sha1(json.dumps(environment, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def compare(current: BenchmarkResult, baseline: Baseline, alpha: float = 0.01,
+            min_slowdown: float = 0.05) -> Comparison:
+    """
+    Compares a result with a stored baseline. It is a regression when the samples are significantly
+    slower (one-sided Mann-Whitney U, p < alpha) and the median is at least min_slowdown slower,
+    so statistically significant but negligible differences do not fail a run.
+    """
+    current_samples = [sample / 1e9 for sample in current.samples_ns]
+    _, p_value = mann_whitney_u(current_samples, baseline.samples)
+    slowdown = current.median / baseline.median - 1 if baseline.median else 0.0
+    return Comparison(baseline, p_value, slowdown, p_value < alpha and slowdown >= min_slowdown)
+
+
+class PerfStore:
+    """SQLite-backed store of benchmark runs. Safe to share between pytest-xdist workers."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or AppSettings.get_perf_store_path()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.logger = setup_logger(self.__class__.__name__)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.executescript(SCHEMA)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(benchmark_runs)")]
+        if "accepted" not in columns:  # Stores created before rejected runs were kept out of baselines
+            with self.connection:
+                self.connection.execute("ALTER TABLE benchmark_runs ADD COLUMN accepted INTEGER NOT NULL DEFAULT 1")
+        self.environment = get_environment()
+        self.fingerprint = fingerprint(self.environment)
+        self.git_revision = get_git_revision()
+
+    @staticmethod
+    def _to_run(row) -> StoredRun:
+        return StoredRun(*row[:-2], samples=json.loads(row[-2]), accepted=bool(row[-1]))
+
+    def record(self, result: BenchmarkResult, dataset_size: Optional[int] = None, accepted: bool = True) -> int:
+        """
+        Stores a result under the current git revision and environment fingerprint; returns its ID.
+        Runs recorded with `accepted=False` (failed regression checks) are kept for trends but never used as a baseline.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO benchmark_runs (benchmark, dataset_size, git_revision, fingerprint, environment, "
+                "recorded_at, rounds, median, p95, p99, samples, accepted) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (result.name, dataset_size, self.git_revision, self.fingerprint, json.dumps(self.environment),
+                 datetime.now().isoformat(timespec="seconds"), result.rounds, result.median, result.p95, result.p99,
+                 json.dumps([sample / 1e9 for sample in result.samples_ns]), int(accepted)))
+        self.logger.debug("Recorded benchmark '%s' (size %s) as run #%d%s", result.name, dataset_size,
+                          cursor.lastrowid, "" if accepted else " (rejected)")
+        return cursor.lastrowid
+
+    def baseline(self, benchmark: str, dataset_size: Optional[int] = None, git_revision: Optional[str] = None,
+                 runs: Optional[int] = None) -> Optional[Baseline]:
+        """
+        Returns the pooled samples of the latest `runs` (PERF_BASELINE_RUNS) accepted runs of the benchmark with
+        the same dataset size and environment fingerprint, optionally restricted to one git revision.
+        Pooling several runs keeps a slowdown spread over consecutive runs from moving the baseline along with it.
+        """
+        query = (f"SELECT {RUN_COLUMNS} FROM benchmark_runs "
+                 "WHERE benchmark = ? AND dataset_size IS ? AND fingerprint = ? AND accepted = 1")
+        params = [benchmark, dataset_size, self.fingerprint]
+        if git_revision:
+            query += " AND git_revision = ?"
+            params.append(git_revision)
+        rows = self.connection.execute(query + " ORDER BY id DESC LIMIT ?",
+                                       params + [runs or AppSettings.get_perf_baseline_runs()]).fetchall()
+        if not rows:
+            return None
+        stored = [self._to_run(row) for row in reversed(rows)]
+        return Baseline(stored, [sample for run in stored for sample in run.samples])
+
+    def history(self, benchmark: Optional[str] = None, dataset_size: Optional[int] = None,
+                limit: int = 20) -> List[StoredRun]:
+        """Returns the latest runs (oldest first), optionally filtered by benchmark and dataset size."""
+        query = f"SELECT {RUN_COLUMNS} FROM benchmark_runs WHERE 1 = 1"
+        params = []
+        if benchmark:
+            query += " AND benchmark = ?"
+            params.append(benchmark)
+        if dataset_size is not None:
+            query += " AND dataset_size = ?"
+            params.append(dataset_size)
+        rows = self.connection.execute(query + " ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()
+        return [self._to_run(row) for row in reversed(rows)]
+
+    def benchmarks(self) -> List[tuple]:
+        """Returns (benchmark, dataset_size, runs, last recorded_at) for every stored benchmark."""
+        return self.connection.execute(
+            "SELECT benchmark, dataset_size, COUNT(*), MAX(recorded_at) FROM benchmark_runs "
+            "GROUP BY benchmark, dataset_size ORDER BY benchmark, dataset_size").fetchall()
+
+    def close(self):
+        self.connection.close()
+
+
+def format_trends(runs: List[StoredRun]) -> str:
+    """
+    Renders runs as a table with the median's change relative to the previous accepted run of the same key.
+    Rejected runs (failed regression checks) are marked and never become the reference for the next change.
+    """
+    lines = [f"{'id':>5}  {'recorded_at':<20}{'revision':<16}{'env':<14}{'size':>8}"
+             f"{'median ms':>12}{'p95 ms':>10}{'change':>9}  {'status':<10}benchmark"]
+    previous = {}
+    for run in runs:
+        key = (run.benchmark, run.dataset_size, run.fingerprint)
+        change = f"{run.median / previous[key] - 1:+.1%}" if previous.get(key) else ""
+        if run.accepted:
+            previous[key] = run.median
+        lines.append(f"{run.id:>5}  {run.recorded_at:<20}{run.git_revision:<16}{run.fingerprint:<14}"
+                     f"{run.dataset_size if run.dataset_size is not None else '-':>8}"
+                     f"{run.median * 1000:>12.3f}{run.p95 * 1000:>10.3f}{change:>9}  "
+                     f"{'' if run.accepted else 'rejected':<10}{run.benchmark}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect stored benchmark results.")
+    parser.add_argument("--path", help="results database (defaults to PERF_STORE_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("benchmarks", help="list stored benchmarks")
+    trends = commands.add_parser("trends", help="list runs over time")
+    trends.add_argument("--benchmark")
+    trends.add_argument("--size", type=int)
+    trends.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    store = PerfStore(args.path)
+    try:
+        if args.command == "benchmarks":
+            for benchmark, size, runs, last in store.benchmarks():
+                print(f"{benchmark} (size {size if size is not None else '-'}): {runs} runs, last {last}")
+        else:
+            print(format_trends(store.history(args.benchmark, args.size, args.limit)))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Server-side query statistics for tests: snapshots of pg_stat_statements, pg_stat_user_tables and
+pg_statio_user_tables taken before and after a test (or an Allure step), and the difference between them.
+
+The diff shows which SQL Kanboard ran because of the UI actions in between, how often and how expensively,
+and which tables it scanned. A statement executed many times that returns about one row per call is
+flagged as a possible N+1 pattern.
+
+pg_stat_statements has to be preloaded by the server (see docker-compose.pgstats.yml). Without it the
+collector degrades to the table statistics, which every PostgreSQL server collects.
+"""
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import psycopg2
+from allure_commons import hookimpl
+
+from config.app_settings import AppSettings
+from utils.logger import setup_logger
+
+STATEMENT_COUNTERS = ("calls", "total_time_ms", "rows", "shared_blks_hit", "shared_blks_read")
+TABLE_COUNTERS = ("seq_scan", "seq_tup_read", "idx_scan", "idx_tup_fetch", "n_tup_ins", "n_tup_upd", "n_tup_del",
+                  "heap_blks_read", "heap_blks_hit", "idx_blks_read", "idx_blks_hit")
+
+# Statements about the statistics themselves (the snapshots, EXPLAIN capture lookups) are not reported.
+_INTERNAL_QUERY_MARKERS = ("pg_stat_statements", "pg_stat_user_tables", "pg_statio_user_tables", "pg_class",
+                           "pg_stat_clear_snapshot", "pg_extension")
+
+TABLES_QUERY = """
+SELECT t.relname, t.seq_scan, t.seq_tup_read, COALESCE(t.idx_scan, 0), COALESCE(t.idx_tup_fetch, 0),
+       t.n_tup_ins, t.n_tup_upd, t.n_tup_del,
+       COALESCE(io.heap_blks_read, 0), COALESCE(io.heap_blks_hit, 0),
+       COALESCE(io.idx_blks_read, 0), COALESCE(io.idx_blks_hit, 0)
+FROM pg_stat_user_tables t JOIN pg_statio_user_tables io ON io.relid = t.relid
+"""
+
+
+class PgStatsSnapshot(NamedTuple):
+    taken_at: float
+    statements: Dict[int, dict]  # queryid -> {"query", "calls", "total_time_ms", "rows", ...}
+    tables: Dict[str, dict]  # relname -> {"seq_scan", "idx_scan", ...}
+
+
+class PgStatsDiff:
+    """What happened on the server between two snapshots, with statements ranked by total time."""
+
+    def __init__(self, before: PgStatsSnapshot, after: PgStatsSnapshot, n_plus_one_calls: int = 20,
+                 statements_available: bool = True):
+        self.elapsed_s = after.taken_at - before.taken_at
+        self.statements_available = statements_available
+        self.n_plus_one_calls = n_plus_one_calls
+        self.statements = self._diff(before.statements, after.statements, STATEMENT_COUNTERS, "calls")
+        for statement in self.statements:
+            statement["mean_time_ms"] = statement["total_time_ms"] / statement["calls"] if statement["calls"] else 0.0
+            statement["rows_per_call"] = statement["rows"] / statement["calls"] if statement["calls"] else 0.0
+            statement["possible_n_plus_one"] = (statement["calls"] >= n_plus_one_calls
+                                                and statement["rows_per_call"] <= 1.0)
+        self.statements.sort(key=lambda statement: statement["total_time_ms"], reverse=True)
+        self.tables = self._diff(before.tables, after.tables, TABLE_COUNTERS, None, key_name="table")
+        self.tables.sort(key=lambda table: (table["seq_tup_read"] + table["idx_tup_fetch"], table["seq_scan"]),
+                         reverse=True)
+
+    @staticmethod
+    def _diff(before: dict, after: dict, counters, required: Optional[str], key_name: Optional[str] = None):
+        """
+        Subtracts the counters of every entry; entries that did not change are dropped. An entry missing from
+        `before` (first execution) counts from zero, and so does one whose counters went backwards (evicted from
+        pg_stat_statements and recorded again, or statistics reset in between).
+        """
+        rows = []
+        for key, entry in after.items():
+            previous = before.get(key, {})
+            delta = {counter: entry[counter] - previous.get(counter, 0) for counter in counters}
+            if any(value < 0 for value in delta.values()):
+                delta = {counter: entry[counter] for counter in counters}
+            if required is not None and delta[required] <= 0:
+                continue
+            if required is None and not any(delta.values()):
+                continue
+            row = {key_name: key} if key_name else {"query": entry["query"]}
+            row.update(delta)
+            rows.append(row)
+        return rows
+
+    @property
+    def n_plus_one(self) -> List[dict]:
+        return [statement for statement in self.statements if statement["possible_n_plus_one"]]
+
+    def totals(self) -> dict:
+        return {
+            "statements": len(self.statements),
+            "calls": sum(statement["calls"] for statement in self.statements),
+            "total_time_ms": sum(statement["total_time_ms"] for statement in self.statements),
+            "rows": sum(statement["rows"] for statement in self.statements),
+            "seq_scans": sum(table["seq_scan"] for table in self.tables),
+            "tuples_read": sum(table["seq_tup_read"] + table["idx_tup_fetch"] for table in self.tables),
+            "blocks_read": sum(table["heap_blks_read"] + table["idx_blks_read"] for table in self.tables),
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "elapsed_s": self.elapsed_s,
+            "statements_available": self.statements_available,
+            "totals": self.totals(),
+            "possible_n_plus_one": self.n_plus_one,
+            "statements": self.statements,
+            "tables": self.tables,
+        }
+
+    def summary(self, top: int = 20) -> str:
+        """Renders the top statements by total time, by calls and by rows, and the table activity."""
+        totals = self.totals()
+        lines = [f"{totals['calls']} calls of {totals['statements']} statements, "
+                 f"{totals['total_time_ms']:.1f}ms total, {totals['rows']} rows, "
+                 f"{totals['seq_scans']} sequential scans, {totals['tuples_read']} tuples read"]
+        if not self.statements_available:
+            lines.append("(pg_stat_statements is not available: table statistics only)")
+        if self.statements:
+            header = f"{'calls':>7}{'total ms':>11}{'mean ms':>10}{'rows':>8}  query"
+            lines += ["", "By total time:", header]
+            lines += [self._statement_line(statement) for statement in self.statements[:top]]
+            for title, counter in (("By calls:", "calls"), ("By rows:", "rows")):
+                ranked = sorted(self.statements, key=lambda statement: statement[counter], reverse=True)
+                lines += ["", title, header] + [self._statement_line(statement) for statement in ranked[:top]]
+        if self.tables:
+            lines += ["", f"{'seq scans':>10}{'seq read':>10}{'idx scans':>10}{'idx fetch':>10}"
+                          f"{'ins':>7}{'upd':>7}{'del':>7}{'blks read':>10}  table"]
+            lines += [f"{t['seq_scan']:>10}{t['seq_tup_read']:>10}{t['idx_scan']:>10}{t['idx_tup_fetch']:>10}"
+                      f"{t['n_tup_ins']:>7}{t['n_tup_upd']:>7}{t['n_tup_del']:>7}"
+                      f"{t['heap_blks_read'] + t['idx_blks_read']:>10}  {t['table']}" for t in self.tables[:top]]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _statement_line(statement: dict) -> str:
+        query = " ".join(statement["query"].split())
+        query = query if len(query) <= 100 else f"{query[:97]}..."
+        flag = "  [possible N+1]" if statement["possible_n_plus_one"] else ""
+        return (f"{statement['calls']:>7}{statement['total_time_ms']:>11.2f}{statement['mean_time_ms']:>10.3f}"
+                f"{statement['rows']:>8}  {query}{flag}")
+
+
+class PgStatsCollector:
+    """
+    Takes snapshots of the server's statement and table statistics for the current database.
+
+    The first snapshot checks for pg_stat_statements and tries `CREATE EXTENSION IF NOT EXISTS` once.
+    When the library is not preloaded (or the user may not create extensions) the collector logs why and
+    only reports table statistics from then on.
+
+    Table statistics reach the views asynchronously (backends report them at most every 500ms, and when
+    their connection closes), so `snapshot()` waits `settle_time` seconds before reading them.
+    """
+
+    def __init__(self, db_pool, settle_time: float = 0.6, n_plus_one_calls: int = 20):
+        self.db_pool = db_pool
+        self.settle_time = settle_time
+        self.n_plus_one_calls = n_plus_one_calls
+        self.logger = setup_logger(self.__class__.__name__)
+        self._statements_query: Optional[str] = None
+        self._checked = False
+
+    @classmethod
+    def from_settings(cls, db_pool) -> "PgStatsCollector":
+        return cls(db_pool, settle_time=AppSettings.get_pg_stats_settle_time(),
+                   n_plus_one_calls=AppSettings.get_pg_stats_n_plus_one_calls())
+
+    @property
+    def statements_available(self) -> bool:
+        self._check_extension()
+        return self._statements_query is not None
+
+    def _check_extension(self):
+        if self._checked:
+            return
+        self._checked = True
+        try:
+            with self.db_pool.transaction() as cur:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements")
+        except psycopg2.Error as e:
+            self.logger.info("Could not create the pg_stat_statements extension: %s", str(e).strip())
+        try:
+            with self.db_pool.read_cursor() as cur:
+                # PostgreSQL 13 renamed total_time to total_exec_time.
+                cur.execute("SELECT column_name FROM information_schema.columns "
+                            "WHERE table_name = 'pg_stat_statements' AND column_name IN ('total_exec_time', 'total_time')")
+                columns = {row[0] for row in cur.fetchall()}
+                if not columns:
+                    raise psycopg2.ProgrammingError("the pg_stat_statements view does not exist")
+                time_column = "total_exec_time" if "total_exec_time" in columns else "total_time"
+                query = (f"SELECT queryid, query, calls, {time_column}, rows, shared_blks_hit, shared_blks_read "
+                         "FROM pg_stat_statements WHERE dbid = (SELECT oid FROM pg_database "
+                         "WHERE datname = current_database()) AND queryid IS NOT NULL")
+                cur.execute(query + " LIMIT 1")
+            self._statements_query = query
+        except psycopg2.Error as e:
+            self.logger.warning("pg_stat_statements is not available (%s); reporting table statistics only. "
+                                "Start PostgreSQL with docker-compose.pgstats.yml to enable it.", str(e).strip())
+
+    def snapshot(self) -> PgStatsSnapshot:
+        self._check_extension()
+        if self.settle_time > 0:
+            time.sleep(self.settle_time)
+        statements, tables = {}, {}
+        with self.db_pool.read_cursor() as cur:
+            # Each autocommit statement sees fresh statistics, but clear any cached snapshot to be sure.
+            cur.execute("SELECT pg_stat_clear_snapshot()")
+            if self._statements_query is not None:
+                cur.execute(self._statements_query)
+                for queryid, query, calls, total_time, rows, hit, read in cur.fetchall():
+                    if any(marker in query for marker in _INTERNAL_QUERY_MARKERS):
+                        continue
+                    # The same statement may be recorded once per role; sum them.
+                    entry = statements.setdefault(queryid, {"query": query, **dict.fromkeys(STATEMENT_COUNTERS, 0)})
+                    for counter, value in zip(STATEMENT_COUNTERS, (calls, total_time, rows, hit, read)):
+                        entry[counter] += value
+            cur.execute(TABLES_QUERY)
+            for relname, *counters in cur.fetchall():
+                tables[relname] = dict(zip(TABLE_COUNTERS, counters))
+        return PgStatsSnapshot(time.monotonic(), statements, tables)
+
+    def diff(self, before: PgStatsSnapshot, after: Optional[PgStatsSnapshot] = None) -> PgStatsDiff:
+        """Returns what happened between `before` and `after` (a new snapshot when omitted)."""
+        after = after if after is not None else self.snapshot()
+        return PgStatsDiff(before, after, n_plus_one_calls=self.n_plus_one_calls,
+                           statements_available=self._statements_query is not None)
+
+
+class PgStatsStepTracker:
+    """
+    allure-python plugin that takes a snapshot when an Allure step starts and attaches the diff when it stops.
+    Nested steps each get their own diff. Register it with allure_commons.plugin_manager.
+    The diff is attached before allure-pytest closes the step, so it lands inside the step.
+    """
+
+    def __init__(self, collector: PgStatsCollector, attach: Callable[[PgStatsDiff, str], None]):
+        self.collector = collector
+        self.attach = attach
+        self._started: Dict[str, tuple] = {}
+
+    @hookimpl
+    def start_step(self, uuid, title, params):
+        self._started[uuid] = (title, self.collector.snapshot())
+
+    @hookimpl(tryfirst=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        started = self._started.pop(uuid, None)
+        if started is not None:
+            title, before = started
+            self.attach(self.collector.diff(before), title)
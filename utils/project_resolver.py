@@ -0,0 +1,64 @@
+import threading
+from typing import Callable, Dict, Optional
+
+from utils.logger import setup_logger
+
+
+class ProjectResolver:
+    """
+    Resolves project names to project IDs with an in-process cache, so page objects can open
+    a board directly at /board/{id} instead of walking the paginated dashboard.
+
+    Only successful lookups are cached. Page objects invalidate entries when they create or
+    delete a project, so a reused name never resolves to a project that no longer exists.
+    """
+
+    def __init__(self, lookup: Callable[[str], Optional[int]]):
+        self._lookup = lookup
+        self._cache: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_db(cls, db_pool) -> "ProjectResolver":
+        """Builds a resolver backed by a query on the projects table."""
+        def lookup(name: str) -> Optional[int]:
+            with db_pool.read_cursor() as cur:
+                cur.execute("SELECT id FROM projects WHERE name = %s ORDER BY id DESC LIMIT 1", (name,))
+                row = cur.fetchone()
+            return row[0] if row else None
+        return cls(lookup)
+
+    @classmethod
+    def from_api(cls, api_client) -> "ProjectResolver":
+        """Builds a resolver backed by the getProjectByName JSON-RPC procedure."""
+        def lookup(name: str) -> Optional[int]:
+            project = api_client.get_project_by_name(name)
+            return int(project["id"]) if project else None
+        return cls(lookup)
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Returns the ID of the named project, or None if no such project exists."""
+        with self._lock:
+            if name in self._cache:
+                return self._cache[name]
+        project_id = self._lookup(name)
+        if project_id is not None:
+            with self._lock:
+                self._cache[name] = project_id
+        self.logger.info("Resolved project '%s' to ID %s", name, project_id)
+        return project_id
+
+    def invalidate(self, name: Optional[str] = None, project_id: Optional[int] = None):
+        """
+        Drops cached entries by name and/or by project ID. With no arguments the whole cache is cleared.
+        """
+        with self._lock:
+            if name is None and project_id is None:
+                self._cache.clear()
+                return
+            if name is not None:
+                self._cache.pop(name, None)
+            if project_id is not None:
+                for cached_name in [n for n, i in self._cache.items() if i == project_id]:
+                    del self._cache[cached_name]
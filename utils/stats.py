@@ -0,0 +1,103 @@
+import json
+import math
+import os
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+from utils.workers import get_worker_id
+
+# Upper bounds (milliseconds) of the latency histogram buckets; slower samples fall into an overflow bucket.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Returns the pct-th percentile (0-100) of the samples using linear interpolation
+    between closest ranks (the same definition as numpy's default).
+    """
+    if not samples:
+        raise ValueError("percentile() requires at least one sample")
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[int(rank)]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(samples: Sequence[float]) -> Dict[str, float]:
+    """Returns count, min, mean, p50, p95, p99 and max of latency samples (same unit as the input)."""
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "mean": sum(samples) / len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def histogram(samples: Sequence[float], bounds: Sequence[float] = LATENCY_BUCKETS_MS) -> Dict[str, int]:
+    """
+    Counts samples per bucket: '<=b' for every upper bound b, plus '>last' for the overflow.
+    Empty buckets are included, so histograms of different runs line up.
+    """
+    counts = [0] * (len(bounds) + 1)
+    for sample in samples:
+        for i, bound in enumerate(bounds):
+            if sample <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    labels = [f"<={bound:g}" for bound in bounds] + [f">{bounds[-1]:g}"]
+    return dict(zip(labels, counts))
+
+
+def write_json_report(result: dict, name: str, path: Optional[str] = None) -> str:
+    """Writes a report as JSON (default: temp/load/<name>_<timestamp>_<worker>.json) and returns the path."""
+    if path is None:
+        os.makedirs("temp/load", exist_ok=True)
+        timestamp = datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+        path = f"temp/load/{name}_{timestamp}_{get_worker_id()}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return path
+
+
+def mann_whitney_u(current: Sequence[float], baseline: Sequence[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test of whether `current` tends to be larger (slower) than `baseline`.
+    Returns (U, p-value), using the normal approximation with tie correction and continuity correction,
+    which is accurate for the 10+ samples per side the benchmarks produce.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("mann_whitney_u() requires samples on both sides")
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+
+    # Average ranks for ties, and the tie term of the variance.
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, combined) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
@@ -0,0 +1,210 @@
+"""
+Multi-user UI load test: N virtual users, each in its own browser context, repeatedly run the
+existing workflows (login, create_project, add_task, move_task_to_done, delete_task, delete_project) through
+the async page objects, and every action's latency is recorded. Each iteration removes the project it created,
+so the number of projects stays flat however long the run is.
+
+Usage:
+    python -m utils.ui_load --users 10 --ramp-up 10 --think-time 1 --duration 60
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config.app_settings import AppSettings
+from pages.async_pages import AsyncDashboardPage, AsyncLoginPage, AsyncProjectPage, AsyncTaskPage
+from utils.async_browser import AsyncBrowserRunner
+from utils.data_registry import TestDataRegistry
+from utils.kanboard_api import KanboardApiClient
+from utils.logger import setup_logger
+from utils.stats import summarize_latencies, write_json_report
+from utils.workers import get_worker_id, unique_name
+
+ACTIONS = ("login", "create_project", "add_task", "move_task_to_done", "delete_task", "delete_project")
+
+
+class LoadTestConfig:
+    """Shape of a load test run."""
+
+    def __init__(self, users: int = 5, ramp_up: float = 5.0, think_time: float = 1.0, duration: float = 60.0):
+        self.users = max(1, users)
+        self.ramp_up = max(0.0, ramp_up)
+        self.think_time = max(0.0, think_time)
+        self.duration = max(0.0, duration)
+
+    @classmethod
+    def from_settings(cls) -> "LoadTestConfig":
+        return cls(users=AppSettings.get_load_users(), ramp_up=AppSettings.LOAD_RAMP_UP,
+                   think_time=AppSettings.LOAD_THINK_TIME, duration=AppSettings.LOAD_DURATION)
+
+    def as_dict(self) -> dict:
+        return {"users": self.users, "ramp_up_s": self.ramp_up, "think_time_s": self.think_time,
+                "duration_s": self.duration}
+
+
+class ActionRecorder:
+    """Thread-safe collector of per-action latencies and failures."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.failures: Dict[str, int] = {}
+
+    def record(self, action: str, seconds: float, ok: bool):
+        with self._lock:
+            if ok:
+                self.latencies.setdefault(action, []).append(seconds)
+            else:
+                self.failures[action] = self.failures.get(action, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, dict]:
+        """Returns per-action throughput (successful actions/s) and latency percentiles in milliseconds."""
+        report = {}
+        for action in sorted(set(self.latencies) | set(self.failures)):
+            samples = self.latencies.get(action, [])
+            summary = {key: value * 1000 if key != "count" else value
+                       for key, value in summarize_latencies(samples).items()}
+            report[action] = {
+                "ok": len(samples),
+                "failed": self.failures.get(action, 0),
+                "throughput_per_s": len(samples) / elapsed if elapsed else 0.0,
+                "latency_ms": summary,
+            }
+        return report
+
+
+class UiLoadTest:
+    """
+    Drives `config.users` virtual users on one AsyncBrowserRunner. Users start evenly spread over
+    the ramp-up period, pause for a randomised think time (uniform, mean `think_time`) between actions,
+    and stop starting new iterations once `duration` seconds have passed since the first user started.
+    Virtual user i logs in as credentials[i] (round-robin), or as ADMIN_USER when no credentials are given.
+    Every project name is registered in `registry`, so projects left by failed iterations are removed with
+    the rest of the session's test data.
+    """
+
+    def __init__(self, runner: AsyncBrowserRunner, config: LoadTestConfig, storage_state: Optional[str] = None,
+                 credentials: Optional[Sequence[Tuple[str, str]]] = None, registry: Optional[TestDataRegistry] = None):
+        self.runner = runner
+        self.config = config
+        self.storage_state = storage_state
+        self.credentials = list(credentials or [(AppSettings.ADMIN_USER, AppSettings.get_admin_password())])
+        self.registry = registry or TestDataRegistry()
+        self.recorder = ActionRecorder()
+        self.logger = setup_logger(self.__class__.__name__)
+        self._deadline = 0.0
+
+    async def _timed(self, action: str, coroutine):
+        start = time.perf_counter()
+        try:
+            result = await coroutine
+        except Exception:
+            self.recorder.record(action, time.perf_counter() - start, ok=False)
+            raise
+        self.recorder.record(action, time.perf_counter() - start, ok=True)
+        return result
+
+    async def _think(self):
+        if self.config.think_time:
+            await asyncio.sleep(random.uniform(0, 2 * self.config.think_time))
+
+    async def _login(self, page, index: int):
+        username, password = self.credentials[index % len(self.credentials)]
+        login_page = AsyncLoginPage(page)
+        await login_page.navigate()
+        await login_page.login(username, password)
+        await login_page.verify_login_successful()
+
+    async def _virtual_user(self, index: int, start_delay: float):
+        await asyncio.sleep(start_delay)
+        context, page = await self.runner.new_page(storage_state=self.storage_state)
+        dashboard_page = AsyncDashboardPage(page)
+        project_page = AsyncProjectPage(page)
+        task_page = AsyncTaskPage(page)
+        try:
+            await self._timed("login", self._login(page, index))
+            iteration = 0
+            while time.monotonic() < self._deadline:
+                iteration += 1
+                task_title = f"Load Task {index}-{iteration}"
+                try:
+                    await self._think()
+                    await dashboard_page.navigate()
+                    await dashboard_page.click_new_project()
+                    project_name = self.registry.project_name(unique_name(f"Load Project u{index}"))
+                    await self._timed("create_project", project_page.create_project(project_name))
+                    await self._think()
+                    await self._timed("add_task", project_page.add_task(task_title))
+                    await self._think()
+                    await project_page.navigate_to_task(task_title)
+                    await self._timed("move_task_to_done", task_page.move_task_to_done())
+                    await self._think()
+                    await self._timed("delete_task", task_page.delete_task())
+                    await self._think()
+                    await self._timed("delete_project", project_page.delete_project())
+                except Exception as e:
+                    self.logger.warning("Virtual user %d failed in iteration %d: %s", index, iteration, e)
+        except Exception as e:
+            self.logger.error("Virtual user %d could not log in: %s", index, e)
+        finally:
+            await context.close()
+
+    async def _run(self):
+        users = self.config.users
+        self._deadline = time.monotonic() + self.config.duration
+        await asyncio.gather(*(self._virtual_user(i + 1, self.config.ramp_up * i / users) for i in range(users)))
+
+    def run(self) -> dict:
+        """Runs the load test and returns the report (configuration, elapsed time and per-action statistics)."""
+        self.logger.info("Starting UI load test: %s", self.config.as_dict())
+        start = time.monotonic()
+        self.runner.run(self._run())
+        elapsed = time.monotonic() - start
+        result = {
+            "config": self.config.as_dict(),
+            "elapsed_s": elapsed,
+            "worker": get_worker_id(),
+            "actions": self.recorder.report(elapsed),
+        }
+        self.logger.info("UI load test finished in %.1fs", elapsed)
+        return result
+
+
+def format_report(result: dict) -> str:
+    """Renders a load test result as a fixed-width text table."""
+    lines = [f"{'action':<20}{'ok':>6}{'fail':>6}{'thr/s':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for action, stats in result["actions"].items():
+        latency = stats["latency_ms"]
+        lines.append(f"{action:<20}{stats['ok']:>6}{stats['failed']:>6}{stats['throughput_per_s']:>8.2f}"
+                     f"{latency.get('p50', 0):>10.0f}{latency.get('p95', 0):>10.0f}{latency.get('p99', 0):>10.0f}")
+    return "\n".join(lines)
+
+
+def main():
+    defaults = LoadTestConfig.from_settings()
+    parser = argparse.ArgumentParser(description="Run N concurrent virtual users against the Kanboard UI.")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--ramp-up", type=float, default=defaults.ramp_up, help="seconds until all users started")
+    parser.add_argument("--think-time", type=float, default=defaults.think_time, help="mean pause between actions")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="seconds to keep starting iterations")
+    parser.add_argument("--output", help="path of the JSON report")
+    args = parser.parse_args()
+
+    config = LoadTestConfig(args.users, args.ramp_up, args.think_time, args.duration)
+    runner = AsyncBrowserRunner(headless=AppSettings.is_headless(), slow_mo=AppSettings.get_slow_mo()).start()
+    registry = TestDataRegistry()
+    try:
+        result = UiLoadTest(runner, config, registry=registry).run()
+    finally:
+        runner.stop()
+        with KanboardApiClient() as client:
+            print(f"Test data cleanup: {registry.purge_via_api(client).summary()}")
+    print(format_report(result))
+    print(f"Report written to {write_json_report(result, 'ui_load', args.output)}")
+
+
+if __name__ == "__main__":
+    main()
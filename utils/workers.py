@@ -0,0 +1,37 @@
+import os
+import uuid
+
+# pytest-xdist exports the worker name ("gw0", "gw1", ...) to every worker process.
+# When the suite runs without xdist there is a single process, reported as "master".
+MASTER_WORKER_ID = "master"
+
+# Matches the suffix unique_name() appends (" gw1 <uuid4>"). Valid as a Python and a PostgreSQL regex,
+# so leftover test data can be recognised by name in either place.
+UNIQUE_NAME_SUFFIX_PATTERN = r" (gw[0-9]+|master) [0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+
+def get_worker_id() -> str:
+    """Returns the pytest-xdist worker ID of the current process, or 'master' when not running in parallel."""
+    return os.getenv("PYTEST_XDIST_WORKER", MASTER_WORKER_ID)
+
+
+def is_parallel_run() -> bool:
+    """Returns whether the current process is a pytest-xdist worker."""
+    return get_worker_id() != MASTER_WORKER_ID
+
+
+def worker_file_path(directory: str, prefix: str, extension: str) -> str:
+    """
+    Builds a file path that is private to the current worker, e.g. temp/auth/auth_gw0.json,
+    so parallel workers never read, overwrite or delete each other's files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{prefix}_{get_worker_id()}.{extension}")
+
+
+def unique_name(prefix: str) -> str:
+    """
+    Returns a unique, worker-tagged name such as 'Test Project gw1 3f2a...',
+    so data created by parallel workers can always be told apart.
+    """
+    return f"{prefix} {get_worker_id()} {uuid.uuid4()}"